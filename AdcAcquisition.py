@@ -0,0 +1,189 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: AdcAcquisition.py
+# Опис: Джерела вибірок ADC (напруга 12В, датчик палива). Два взаємозамінні
+#       джерела з однаковим інтерфейсом:
+#       - PollingAdc: звичайний machine.ADC, одне блокуюче перетворення на
+#         кожен read_u16() (як раніше в main.py);
+#       - DmaAdc: ADC RP2040 у безперервному режимі round-robin по всіх
+#         пінах, DMA переносить кожну вибірку з FIFO у кільцевий буфер без
+#         участі інтерпретатора. read_u16() каналу - середнє останніх
+#         average вибірок цього каналу (децимація), без очікування ADC.
+#
+#       Інтерфейс (обидва класи):
+#         channel(pin, average) - об'єкт з read_u16() (0..65535, як machine.ADC);
+#         start() / stop()      - запуск та зупинка вибірки;
+#         service()             - періодичне обслуговування (перезапуск DMA
+#                                 після вичерпання лічильника передач).
+#
+#       Поки працює DmaAdc, machine.ADC.read_u16() викликати не можна: він
+#       перемикає канал ADC і порушує порядок вибірок у буфері.
+# ==============================================================================
+
+from array import array
+from machine import ADC, Pin, mem32
+from micropython import const
+import micropython
+
+try:
+    import rp2
+    import uctypes
+except ImportError:
+    rp2 = None
+
+# Регістри ADC RP2040 (RP2040 datasheet, розділ 4.9).
+_ADC_BASE = const(0x4004C000)
+_ADC_CS = const(0x00)
+_ADC_FCS = const(0x08)
+_ADC_FIFO = const(0x0C)
+_ADC_DIV = const(0x10)
+_CS_EN = const(0x01)
+_CS_START_MANY = const(0x08)
+_CS_READY = const(0x100)
+_FCS_EN = const(0x01)
+_FCS_DREQ_EN = const(0x08)
+_FCS_UNDER_OVER = const(0xC00)    # Прапорці UNDER/OVER (скидаються записом 1).
+_FCS_THRESH_1 = const(0x1000000)  # DREQ при одній вибірці у FIFO.
+_ADC_CLOCK_HZ = const(48000000)
+_ADC_MIN_DIV = const(95)          # Перетворення триває 96 тактів ADC.
+_FIRST_ADC_GPIO = const(26)       # GPIO26..29 = AIN0..3.
+_DREQ_ADC = const(36)
+_DMA_COUNT = const(0x3FFFFFFF)    # Передач до перезапуску (при 2 кГц - понад 6 діб); мале ціле.
+
+try:
+    @micropython.viper
+    def _ring_sum(buf, last: int, step: int, n: int, mask: int) -> int:
+        p = ptr16(buf)
+        total = 0
+        i = last
+        while n > 0:
+            total += p[i]
+            i = (i - step) & mask
+            n -= 1
+        return total
+except AttributeError:
+    # Без viper (ПК): той самий підсумок звичайним Python.
+    def _ring_sum(buf, last, step, n, mask):
+        total = 0
+        i = last
+        while n > 0:
+            total += buf[i]
+            i = (i - step) & mask
+            n -= 1
+        return total
+
+
+class PollingAdc:
+    """Блокуюче зчитування machine.ADC; average ігнорується (одне перетворення)."""
+
+    def __init__(self):
+        self._adcs = {} # Один machine.ADC на пін, скільки б каналів не запитали.
+
+    def channel(self, pin, average=1):
+        adc = self._adcs.get(pin)
+        if adc is None:
+            adc = self._adcs[pin] = ADC(Pin(pin))
+        return adc
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def service(self):
+        pass
+
+
+class _DmaChannel:
+    """Канал DmaAdc з інтерфейсом machine.ADC."""
+
+    def __init__(self, source, slot, average):
+        self._source = source
+        self._slot = slot
+        self._average = average
+
+    def read_u16(self):
+        v = self._source.average(self._slot, self._average)
+        return (v << 4) | (v >> 8) # 12 біт -> 16 біт, як machine.ADC.read_u16().
+
+
+class DmaAdc:
+    """
+    Безперервна вибірка round-robin з DMA у кільцевий буфер.
+    Буфер - depth вибірок на кожен пін, вибірки пінів чергуються в порядку
+    зростання номера каналу. DMA працює в режимі кільця запису (ring_sel),
+    тому буфер вирівнюється на свій розмір (степінь двійки байт, до 32 КБ).
+    """
+
+    def __init__(self, pins, rate_hz, depth):
+        if rp2 is None:
+            raise RuntimeError("rp2 module unavailable")
+        pins = sorted(pins)
+        n = len(pins)
+        size = n * depth
+        if n not in (1, 2, 4) or size & (size - 1) or size * 2 > 32768:
+            raise ValueError("ADC DMA buffer must be a power of two up to 32 KB")
+        self._adcs = [ADC(Pin(pin)) for pin in pins] # Переводить GPIO в аналоговий режим.
+        self._pins = pins
+        self._mask = 0
+        for pin in pins:
+            self._mask |= 1 << (pin - _FIRST_ADC_GPIO)
+        self._first = pins[0] - _FIRST_ADC_GPIO
+        self._div = max(_ADC_MIN_DIV, _ADC_CLOCK_HZ // (rate_hz * n) - 1)
+        self._n = n
+        self._size_mask = size - 1
+        self._ring_bits = 0
+        while (1 << self._ring_bits) < size * 2:
+            self._ring_bits += 1
+
+        # Вирівнювання: виділяємо вдвічі більше і беремо вирівняне вікно.
+        self._raw = array('H', [0] * (size * 2))
+        offset = ((-uctypes.addressof(self._raw)) & (size * 2 - 1)) >> 1
+        self._buf = memoryview(self._raw)[offset:offset + size]
+        self._dma = rp2.DMA()
+
+    def channel(self, pin, average=1):
+        depth = (self._size_mask + 1) // self._n
+        return _DmaChannel(self, self._pins.index(pin), max(1, min(average, depth)))
+
+    def _stop_adc(self):
+        mem32[_ADC_BASE + _ADC_CS] = _CS_EN # Без START_MANY та RROBIN.
+        while not mem32[_ADC_BASE + _ADC_CS] & _CS_READY:
+            pass
+        mem32[_ADC_BASE + _ADC_FCS] = _FCS_UNDER_OVER
+        while (mem32[_ADC_BASE + _ADC_FCS] >> 16) & 0xF: # Вичитуємо залишки FIFO.
+            mem32[_ADC_BASE + _ADC_FIFO]
+
+    def start(self):
+        self._stop_adc()
+        self._dma.active(0)
+        # Буфер заповнюється одним звичайним перетворенням кожного піна, щоб середні
+        # були коректними одразу, ще до того, як DMA заповнить кільце.
+        buf = self._buf
+        for slot in range(self._n):
+            v = self._adcs[slot].read_u16() >> 4
+            for i in range(slot, self._size_mask + 1, self._n):
+                buf[i] = v
+        mem32[_ADC_BASE + _ADC_DIV] = self._div << 8
+        mem32[_ADC_BASE + _ADC_FCS] = _FCS_EN | _FCS_DREQ_EN | _FCS_THRESH_1 | _FCS_UNDER_OVER
+        ctrl = self._dma.pack_ctrl(size=1, inc_read=False, inc_write=True, treq_sel=_DREQ_ADC,
+                                   ring_size=self._ring_bits, ring_sel=True, irq_quiet=True)
+        self._dma.config(read=_ADC_BASE + _ADC_FIFO, write=self._buf, count=_DMA_COUNT, ctrl=ctrl, trigger=True)
+        # Перше перетворення - канал AINSEL (найменший), тож вибірка i належить піну i % n.
+        mem32[_ADC_BASE + _ADC_CS] = _CS_EN | (self._first << 12) | (self._mask << 16) | _CS_START_MANY
+
+    def stop(self):
+        self._stop_adc()
+        self._dma.active(0)
+        mem32[_ADC_BASE + _ADC_FCS] = 0
+
+    def service(self):
+        if not self._dma.active():
+            self.start() # Лічильник передач вичерпано: перезапуск із початку буфера.
+
+    def average(self, slot, count):
+        """Середнє останніх count вибірок каналу slot (12 біт)."""
+        last = (_DMA_COUNT - self._dma.count - 1) & self._size_mask
+        last = (last - (last - slot) % self._n) & self._size_mask # Остання вибірка саме цього каналу.
+        return _ring_sum(self._buf, last, self._n, count, self._size_mask) // count
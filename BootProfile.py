@@ -0,0 +1,59 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: BootProfile.py
+# Опис: Профіль запуску прошивки. mark(name) завершує чергову фазу
+#       ініціалізації і запам'ятовує її тривалість (ticks_us). Мітки часу -
+#       від скидання мікроконтролера (ticks_us() на RP2040 рахує з нуля при
+#       старті; переповнення через ~17 хв на час запуску не впливає).
+#       irq_armed_us - момент, з якого імпульси форсунки та VSS рахуються;
+#       first_injection_us - мітка першого врахованого імпульсу форсунки.
+#       report() - рядок для виводу в консоль.
+# ==============================================================================
+
+import time
+
+
+class BootProfile:
+    """Тривалості фаз запуску (мкс) та ключові моменти від скидання."""
+
+    def __init__(self):
+        self.start_us = time.ticks_us() # Момент створення (імпорт модулів уже позаду).
+        self.phases = []                # (назва, тривалість мкс).
+        self.irq_armed_us = None
+        self.first_injection_us = None
+        self.done_us = None
+        self._last = self.start_us
+
+    def mark(self, name):
+        """Завершує фазу name: тривалість від попередньої мітки."""
+        now = time.ticks_us()
+        self.phases.append((name, time.ticks_diff(now, self._last)))
+        self._last = now
+        return now
+
+    def irq_armed(self):
+        self.irq_armed_us = self.mark('irq')
+
+    def done(self):
+        self.done_us = self._last
+
+    def injection(self, pulse_us):
+        """Фіксує перший врахований імпульс форсунки (мітка його початку). True - якщо він перший."""
+        if self.first_injection_us is not None:
+            return False
+        self.first_injection_us = pulse_us
+        return True
+
+    def report(self):
+        """Рядок: фази з тривалістю та моменти від скидання (мс)."""
+        parts = [f"import {self.start_us // 1000} ms"]
+        for name, us in self.phases:
+            parts.append(f"{name} {us} us")
+        line = ', '.join(parts)
+        if self.done_us is not None:
+            line += f"; ready at {self.done_us // 1000} ms"
+        if self.irq_armed_us is not None:
+            line += f", IRQ armed at {self.irq_armed_us // 1000} ms"
+        if self.first_injection_us is not None:
+            line += f", first injection at {self.first_injection_us // 1000} ms"
+        return line
@@ -0,0 +1,44 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: BrownoutMonitor.py
+# Опис: Раннє попередження про втрату живлення за ADC бортової мережі 12В.
+#       check() викликається з високою частотою (кожні кілька мс), порівнює
+#       сире значення ADC з порогом без перетворення у вольти (без float,
+#       без виділення пам'яті) і після confirm_samples вибірок поспіль нижче
+#       порогу один раз викликає on_brownout() - аварійне збереження даних,
+#       поки конденсатори живлення ще тримають Pico.
+#       Повторне спрацювання можливе лише після відновлення напруги вище
+#       rearm_raw (наприклад, просідання під час прокручування стартером).
+# ==============================================================================
+
+
+class BrownoutMonitor:
+
+    def __init__(self, adc, threshold_raw, rearm_raw, confirm_samples, on_brownout):
+        self.adc = adc
+        self.threshold_raw = threshold_raw
+        self.rearm_raw = rearm_raw
+        self.confirm_samples = confirm_samples
+        self.on_brownout = on_brownout
+        self.tripped = False    # True після спрацювання, доки напруга не відновиться.
+        self.events = 0         # Кількість спрацювань з моменту запуску.
+        self._low = 0           # Вибірок поспіль нижче порогу.
+
+    def check(self):
+        """Одна вибірка ADC. Повертає True, якщо саме зараз виконано аварійне збереження."""
+        raw = self.adc.read_u16()
+        if self.tripped:
+            if raw >= self.rearm_raw:
+                self.tripped = False
+                self._low = 0
+            return False
+        if raw >= self.threshold_raw:
+            self._low = 0
+            return False
+        self._low += 1
+        if self._low < self.confirm_samples:
+            return False
+        self.tripped = True
+        self.events += 1
+        self.on_brownout()
+        return True
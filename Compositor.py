@@ -0,0 +1,165 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: Compositor.py
+# Опис: Шар композиції дисплея поверх драйвера sh1107. Зберігає копію
+#       останнього надісланого кадру, порівнює з нею новий framebuffer і
+#       передає по I2C лише змінені сторінки (по 8 рядків), причому в межах
+#       сторінки - лише діапазон змінених стовпців. Веде статистику трафіку
+#       I2C та часу передачі для кожного кадру.
+# ==============================================================================
+
+import time
+import micropython
+
+# Накладні витрати I2C на одну транзакцію: байт адреси + контрольний байт.
+_I2C_TRANSACTION_OVERHEAD = 2
+
+# Порівняння кадру з копією побайтно на місці: зрізи bytes/bytearray створювали
+# б два нові об'єкти на кожну сторінку кожного кадру.
+try:
+    @micropython.viper
+    def _first_diff(buf, shadow, start: int, n: int) -> int:
+        """Зміщення першого відмінного байта в [start, start + n) або n, якщо однакові."""
+        a = ptr8(buf)
+        b = ptr8(shadow)
+        i = 0
+        while i < n:
+            if a[start + i] != b[start + i]:
+                return i
+            i += 1
+        return n
+
+    @micropython.viper
+    def _last_diff(buf, shadow, start: int, n: int) -> int:
+        """Зміщення за останнім відмінним байтом (у діапазоні вже є відмінність)."""
+        a = ptr8(buf)
+        b = ptr8(shadow)
+        i = n
+        while a[start + i - 1] == b[start + i - 1]:
+            i -= 1
+        return i
+
+    @micropython.viper
+    def _copy(dst, src, start: int, n: int):
+        d = ptr8(dst)
+        s = ptr8(src)
+        end = start + n
+        i = start
+        while i < end:
+            d[i] = s[i]
+            i += 1
+except AttributeError:
+    # Без viper (ПК): ті самі результати звичайним Python.
+    def _first_diff(buf, shadow, start, n):
+        if buf[start:start + n] == shadow[start:start + n]:
+            return n
+        i = 0
+        while buf[start + i] == shadow[start + i]:
+            i += 1
+        return i
+
+    def _last_diff(buf, shadow, start, n):
+        i = n
+        while buf[start + i - 1] == shadow[start + i - 1]:
+            i -= 1
+        return i
+
+    def _copy(dst, src, start, n):
+        dst[start:start + n] = src[start:start + n]
+
+
+class Compositor:
+    """
+    Обгортка над об'єктом SH1107_I2C з частковим оновленням сторінок.
+    Якщо драйвер не надає displaybuf / write_command / write_data,
+    компоновщик працює в режимі повного оновлення через oled.show().
+    """
+
+    def __init__(self, oled):
+        self.oled = oled
+        self.width = oled.width
+        self.pages = oled.height // 8
+
+        buf = getattr(oled, 'displaybuf', None)
+        self.partial = (buf is not None and hasattr(oled, 'write_command')
+                        and hasattr(oled, 'write_data'))
+        if self.partial:
+            self._buf = buf
+            self._buf_mv = memoryview(buf)
+            self._shadow = bytearray(len(buf))
+            self._cmd = bytearray(3) # Сторінка, молодший та старший байт адреси стовпця.
+        self._valid = False # Вміст дисплея невідомий: перший кадр завжди повний.
+
+        # Статистика.
+        self.frames = 0
+        self.last_bytes = 0        # Байт I2C, надісланих за останній кадр.
+        self.last_pages = 0        # Кількість переданих сторінок за останній кадр.
+        self.last_show_us = 0      # Тривалість останнього show() (мкс).
+        self.total_bytes = 0       # Сумарний трафік I2C.
+        self.full_frame_bytes = self.pages * (2 * _I2C_TRANSACTION_OVERHEAD + 3 + self.width)
+
+    def invalidate(self):
+        """Примусово передати наступний кадр повністю (наприклад, після збою I2C)."""
+        self._valid = False
+
+    def _send_page(self, page, col_start, col_end):
+        cmd = self._cmd
+        cmd[0] = 0xB0 | page                # Адреса сторінки.
+        cmd[1] = col_start & 0x0F           # Молодші 4 біти адреси стовпця.
+        cmd[2] = 0x10 | (col_start >> 4)    # Старші 4 біти адреси стовпця.
+        self.oled.write_command(cmd)
+        offset = page * self.width
+        self.oled.write_data(self._buf_mv[offset + col_start:offset + col_end])
+        _copy(self._shadow, self._buf, offset + col_start, col_end - col_start) # Лише передані байти.
+        return 2 * _I2C_TRANSACTION_OVERHEAD + 3 + (col_end - col_start)
+
+    def show(self):
+        """Передає на дисплей лише змінені області кадру."""
+        t0 = time.ticks_us()
+        sent_bytes = 0
+        sent_pages = 0
+
+        if not self.partial:
+            self.oled.show()
+            sent_bytes = self.full_frame_bytes
+            sent_pages = self.pages
+        else:
+            buf = self._buf
+            shadow = self._shadow
+            width = self.width
+            full = not self._valid
+            try:
+                for page in range(self.pages):
+                    start = page * width
+                    if full:
+                        sent_bytes += self._send_page(page, 0, width)
+                        sent_pages += 1
+                        continue
+                    # Діапазон змінених стовпців; сторінка без змін пропускається.
+                    c0 = _first_diff(buf, shadow, start, width)
+                    if c0 == width:
+                        continue
+                    c1 = _last_diff(buf, shadow, start, width)
+                    sent_bytes += self._send_page(page, c0, c1)
+                    sent_pages += 1
+                self._valid = True
+            except Exception as e:
+                # Драйвер не підтримує команди в очікуваному форматі -
+                # переходимо на повне оновлення до кінця роботи.
+                print(f"⚠️ Compositor: часткове оновлення вимкнено ({e})")
+                self.partial = False
+                self.oled.show()
+                sent_bytes = self.full_frame_bytes
+                sent_pages = self.pages
+
+        self.last_show_us = time.ticks_diff(time.ticks_us(), t0)
+        self.last_bytes = sent_bytes
+        self.last_pages = sent_pages
+        self.total_bytes += sent_bytes
+        self.frames += 1
+
+    def report(self):
+        """Повертає рядок зі статистикою останнього кадру та середнім трафіком."""
+        avg = self.total_bytes // self.frames if self.frames else 0
+        return "DISP: {} pages, {} B, {} us; avg {} B/frame (full {} B)".format(
+            self.last_pages, self.last_bytes, self.last_show_us, avg, self.full_frame_bytes)
@@ -0,0 +1,80 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: ErrorRules.py
+# Опис: Таблиця правил попереджень і їх обчислення в цілочисельну маску.
+#       Кожна помилка - один біт (порядок keys; прошивка передає
+#       TripLogger.ERROR_KEYS, тож маска без перетворень іде в журнал
+#       поїздки). Правило - кортеж:
+#         (pin, active_level, min_rpm, stable_only, delay_ms, key, severity)
+#         pin          - об'єкт з value() (machine.Pin); None - стан обчислює
+#                        прошивка (напр. LOW_FUEL з гістерезисом), правило
+#                        задає лише критичність і порядок показу;
+#         active_level - рівень піна, що означає помилку;
+#         min_rpm      - перевіряти лише при RPM вище за це значення (0 - завжди);
+#         stable_only  - лише при стабільній роботі двигуна;
+#         delay_ms     - лише через delay_ms після запуску двигуна (-1 - без умови);
+#         key          - ключ іконки з keys;
+#         severity     - SEVERITY_NOTICE або SEVERITY_CRITICAL.
+#       Кілька правил можуть вмикати один біт (тиск мастила 0.3 та 1.8 бар).
+#       Критичність, порівняння та черга показу в прошивці - операції з
+#       цілими числами, без пошуку за текстом помилки.
+# ==============================================================================
+
+SEVERITY_NONE = 0
+SEVERITY_NOTICE = 1   # Без звуку (напр. "Мало палива").
+SEVERITY_CRITICAL = 3 # Звукова тривога та екран помилок.
+
+
+class ErrorRules:
+
+    def __init__(self, keys, rules):
+        self.keys = keys
+        self.critical_mask = 0
+        self.notice_mask = 0
+        self._rules = [] # (pin, active_level, min_rpm, stable_only, delay_ms, bit) лише з пінами.
+        order = []       # Ключі в порядку показу: за таблицею правил, далі решта keys.
+        for pin, level, min_rpm, stable_only, delay_ms, key, severity in rules:
+            bit = self.bit(key)
+            if severity == SEVERITY_CRITICAL:
+                self.critical_mask |= bit
+            elif severity == SEVERITY_NOTICE:
+                self.notice_mask |= bit
+            if pin is not None:
+                self._rules.append((pin, level, min_rpm, stable_only, delay_ms, bit))
+            if key not in order:
+                order.append(key)
+        for key in keys:
+            if key not in order:
+                order.append(key)
+        self.order = tuple((self.bit(key), key) for key in order)
+
+    def bit(self, key):
+        return 1 << self.keys.index(key)
+
+    def evaluate(self, rpm, stable, run_ms):
+        """
+        Маска активних помилок за правилами з пінами.
+        rpm - поточні оберти; stable - двигун працює стабільно;
+        run_ms - мс від запуску двигуна (-1 - не запущений).
+        """
+        mask = 0
+        for pin, level, min_rpm, stable_only, delay_ms, bit in self._rules:
+            if mask & bit:
+                continue # Біт уже встановлено іншим правилом.
+            if min_rpm and rpm <= min_rpm:
+                continue
+            if stable_only and not stable:
+                continue
+            if delay_ms >= 0 and run_ms <= delay_ms:
+                continue
+            if pin.value() == level:
+                mask |= bit
+        return mask
+
+    def severity(self, mask):
+        """Рівень критичності маски: SEVERITY_CRITICAL, SEVERITY_NOTICE або SEVERITY_NONE."""
+        if mask & self.critical_mask:
+            return SEVERITY_CRITICAL
+        if mask & self.notice_mask:
+            return SEVERITY_NOTICE
+        return SEVERITY_NONE
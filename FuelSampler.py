@@ -0,0 +1,62 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: FuelSampler.py
+# Опис: Потокова медіана / усічене середнє сирих значень ADC датчика палива.
+#       sample() викликається кожні FUEL_SAMPLE_INTERVAL_MS, тож вибірки
+#       рівномірно розподілені за кілька секунд, а не зібрані пачкою за
+#       мікросекунди: хлюпання палива в баку (період ~1-3 с) потрапляє у
+#       вікно цілком і відкидається медіаною.
+#       Вікно - SmoothingFilter.SortedWindow з array('H') на window вибірок.
+#       estimate() - середнє keep центральних значень відсортованого вікна
+#       (keep = 1 - чиста медіана). Без float та без виділення пам'яті.
+# ==============================================================================
+
+from SmoothingFilter import SortedWindow
+
+
+class FuelSampler:
+
+    def __init__(self, adc, window, keep):
+        self.adc = adc
+        self.window = window
+        # Кількість центральних значень для усередження: не більше вікна і тієї ж парності,
+        # щоб центральна ділянка була симетричною.
+        keep = max(1, min(keep, window))
+        if (window - keep) & 1:
+            keep += 1
+        self.keep = keep
+        self._window = SortedWindow(window, 'H')
+        self.samples = 0 # Вибірок з моменту запуску.
+
+    def prime(self):
+        """Заповнює вікно швидкими зчитуваннями (при запуску, до першого estimate())."""
+        self.fill(self.adc.read_u16())
+        for _ in range(self.window):
+            self.sample()
+
+    def fill(self, raw):
+        """Заповнює все вікно значенням raw."""
+        self._window.fill(raw)
+
+    def sample(self):
+        """Одне зчитування ADC у вікно."""
+        self._window.add(self.adc.read_u16())
+        self.samples += 1
+
+    def median(self):
+        s = self._window.sorted
+        mid = self.window >> 1
+        if self.window & 1:
+            return s[mid]
+        return (s[mid - 1] + s[mid]) >> 1
+
+    def estimate(self):
+        """Усічене середнє keep центральних значень вікна (сире значення ADC, ціле)."""
+        if self.keep <= 2:
+            return self.median()
+        s = self._window.sorted
+        start = (self.window - self.keep) >> 1
+        total = 0
+        for i in range(start, start + self.keep):
+            total += s[i]
+        return total // self.keep
@@ -0,0 +1,115 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: GlyphAtlas.py
+# Опис: Кеш (атлас) попередньо відрендерених розтягнутих символів.
+#       Кожна комбінація (символ, size_x, size_y, колір) рендериться один раз
+#       у власний MONO_VLSB FrameBuffer, а далі виводиться одним blit()
+#       замість до 64 викликів fill_rect() на символ у кожному кадрі.
+#       Кеш обмежений бюджетом у байтах; при переповненні витісняється
+#       запис, який найдовше не використовувався (LRU).
+# ==============================================================================
+
+import framebuf
+
+
+class GlyphAtlas:
+    """
+    Атлас розтягнутих гліфів з LRU-витісненням під фіксований бюджет пам'яті.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        # Статистика (для діагностики та бенчмарків).
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # key -> [FrameBuffer, розмір_у_байтах, мітка_останнього_використання]
+        self._entries = {}
+        self._tick = 0
+
+        # Буфер 8x8 для рендерингу вихідного символу стандартним шрифтом.
+        self._src_buf = bytearray(8)
+        self._src_fb = framebuf.FrameBuffer(self._src_buf, 8, 8, framebuf.MONO_VLSB)
+
+    @staticmethod
+    def _key(char, size_x, size_y, c):
+        # Ключ кодується в одне мале ціле число, щоб пошук у кеші не створював
+        # нових об'єктів (кортежів) на кожен символ.
+        return ord(char) | (size_x << 8) | (size_y << 12) | ((1 if c else 0) << 16)
+
+    def _render(self, char, size_x, size_y, c):
+        """Рендерить розтягнутий символ у новий FrameBuffer."""
+        w = 8 * size_x
+        h = 8 * size_y
+        nbytes = w * ((h + 7) // 8)
+        buf = bytearray(nbytes)
+        fb = framebuf.FrameBuffer(buf, w, h, framebuf.MONO_VLSB)
+        # Фон гліфа має колір, протилежний кольору символу: при blit() він
+        # передається як прозорий ключ і не затирає вміст дисплея.
+        if not c:
+            fb.fill(1)
+
+        src = self._src_fb
+        src.fill(0)
+        src.text(char, 0, 0, 1)
+        for dy in range(8):
+            for dx in range(8):
+                if src.pixel(dx, dy):
+                    fb.fill_rect(dx * size_x, dy * size_y, size_x, size_y, c)
+        return fb, nbytes
+
+    def _evict_for(self, nbytes):
+        """Витісняє найдавніше використані записи, доки не звільниться nbytes."""
+        entries = self._entries
+        while entries and self.used_bytes + nbytes > self.budget_bytes:
+            oldest_key = None
+            oldest_tick = None
+            for key in entries:
+                tick = entries[key][2]
+                if oldest_tick is None or tick < oldest_tick:
+                    oldest_tick = tick
+                    oldest_key = key
+            self.used_bytes -= entries[oldest_key][1]
+            del entries[oldest_key]
+            self.evictions += 1
+
+    def glyph(self, char, size_x, size_y, c=1):
+        """
+        Повертає FrameBuffer розтягнутого символу, рендерячи його при першому
+        зверненні. Якщо гліф більший за весь бюджет, він не кешується.
+        """
+        self._tick += 1
+        key = self._key(char, size_x, size_y, c)
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[2] = self._tick
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        fb, nbytes = self._render(char, size_x, size_y, c)
+        if nbytes <= self.budget_bytes:
+            self._evict_for(nbytes)
+            self._entries[key] = [fb, nbytes, self._tick]
+            self.used_bytes += nbytes
+        return fb
+
+    def preload(self, chars, size_x, size_y, c=1):
+        """Попередньо рендерить набір символів (наприклад, при старті системи)."""
+        for char in chars:
+            self.glyph(char, size_x, size_y, c)
+
+    def draw(self, target, char, x, y, size_x, size_y, c=1):
+        """
+        Малює розтягнутий символ на target одним blit().
+        Повертає X-позицію для наступного символу.
+        """
+        target.blit(self.glyph(char, size_x, size_y, c), x, y, 0 if c else 1)
+        return x + 8 * size_x
+
+    def clear(self):
+        """Повністю очищає кеш."""
+        self._entries = {}
+        self.used_bytes = 0
@@ -0,0 +1,267 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: InjectorCapture.py
+# Опис: Вимірювання імпульсів форсунки (тривалість відкриття та період між
+#       початками імпульсів). Два взаємозамінні джерела з однаковим
+#       інтерфейсом:
+#       - IrqCapture: переривання GPIO (Pin.irq) + ticks_us, фронти
+#         складаються в кільцевий буфер, пари фронтів - в drain().
+#       - PioCapture: програма PIO рахує такти між фронтами апаратно
+#         (точність 1 мкс без затримок інтерпретатора), а DMA переносить
+#         слова з RX FIFO у кільцевий буфер без переривань: CPU витрачається
+#         лише на пакетний drain() із задачі двигуна.
+#
+#       Інтерфейс (обидва класи):
+#         start()                       - запуск вимірювання;
+#         stop()                        - зупинка;
+#         drain(widths, periods) -> n   - заповнює масиви array('I') до n
+#                                         імпульсів: сира тривалість ON (мкс,
+#                                         без віднімання dead time) та період
+#                                         між початками імпульсів (мкс,
+#                                         0 - невідомий);
+#         overflow                      - втрачено записів через переповнення;
+#         last_pulse_us                 - ticks_us останнього початку імпульсу.
+# ==============================================================================
+
+import time
+from array import array
+
+from micropython import const
+
+try:
+    import rp2
+    import uctypes
+except ImportError:
+    rp2 = None
+
+# Дебаунс фронтів для IrqCapture (мкс): фронти, ближчі за цей інтервал до
+# попереднього прийнятого, вважаються електричним шумом.
+_IRQ_DEBOUNCE_US = 100
+
+
+class IrqCapture:
+    """
+    Вимірювання через переривання GPIO на обидва фронти.
+    Обробник лише записує мітку часу та рівень піна в кільцевий буфер
+    (без виділення пам'яті), тому реєструється як hard IRQ.
+    """
+
+    def __init__(self, pin, ring_size):
+        # ring_size - степінь двійки (індекс обгортається маскою).
+        self.pin = pin
+        self._mask = ring_size - 1
+        self._ts = array('I', [0] * ring_size) # Мітки часу фронтів (ticks_us).
+        self._level = bytearray(ring_size)  # Рівень піна на фронті (0 - форсунка відкрилась).
+        self._head = 0          # Індекс запису (змінює лише IRQ).
+        self._tail = 0          # Індекс читання (змінює лише drain()).
+        self.overflow = 0
+        self.last_pulse_us = 0
+
+        # Стан складання фронтів у імпульси (лише drain()).
+        self._last_edge_us = 0  # Останній прийнятий фронт (для дебаунсу).
+        self._start_us = 0      # Початок поточного/останнього імпульсу.
+        self._started = False   # Був хоча б один початок імпульсу (період відомий).
+        self._open = False      # Форсунка зараз відкрита (очікуємо RISING).
+        self._period_us = 0     # Період до початку поточного імпульсу.
+
+    def start(self):
+        self.pin.irq(trigger=self.pin.IRQ_RISING | self.pin.IRQ_FALLING, handler=self._irq, hard=True)
+
+    def stop(self):
+        self.pin.irq(handler=None)
+
+    def _irq(self, pin):
+        head = self._head
+        next_head = (head + 1) & self._mask
+        if next_head == self._tail:
+            self.overflow += 1 # Буфер заповнений: споживач не встигає, фронт втрачено.
+            return
+        self._ts[head] = time.ticks_us()
+        self._level[head] = pin.value()
+        self._head = next_head
+
+    def drain(self, widths, periods):
+        head = self._head # Одне зчитування: IRQ може дописувати далі, їх заберемо наступного разу.
+        tail = self._tail
+        mask = self._mask
+        ts = self._ts
+        levels = self._level
+        limit = len(widths)
+        n = 0
+        while tail != head and n < limit:
+            edge_us = ts[tail]
+            level = levels[tail]
+            tail = (tail + 1) & mask
+
+            if time.ticks_diff(edge_us, self._last_edge_us) < _IRQ_DEBOUNCE_US:
+                continue
+            self._last_edge_us = edge_us
+
+            if level == 0:
+                # FALLING: форсунка відкрилась. Період рахуємо від попереднього початку.
+                self._period_us = time.ticks_diff(edge_us, self._start_us) if self._started else 0
+                self._start_us = edge_us
+                self._started = True
+                self._open = True
+                self.last_pulse_us = edge_us
+            elif self._open:
+                # RISING: форсунка закрилась - імпульс завершено.
+                self._open = False
+                widths[n] = time.ticks_diff(edge_us, self._start_us)
+                periods[n] = self._period_us
+                n += 1
+        self._tail = tail
+        return n
+
+
+# --- PIO ---
+# Машина станів тактується частотою 2 МГц; кожен цикл підрахунку займає
+# 2 такти, тобто один відлік X = 1 мкс.
+_PIO_FREQ = 2_000_000
+# Початкове значення лічильника X (таймаут, мкс). Якщо за цей час фронт не
+# надійшов, вважається, що двигун зупинився.
+_PIO_TIMEOUT_COUNTS = 2_000_000
+# Такти поза циклами підрахунку (≈7 для імпульсу та ≈11 для періоду по
+# 0.5 мкс), округлено вгору до мкс.
+_PIO_WIDTH_CORRECTION_US = 4
+_PIO_PERIOD_CORRECTION_US = 6
+# RX FIFO машин станів та їхні DREQ (RP2040 datasheet, розділи 3.7 та 2.5.3.1).
+_PIO0_BASE = const(0x50200000)
+_PIO1_BASE = const(0x50300000)
+_PIO_RXF0 = const(0x20)
+_DREQ_PIO0_RX0 = const(4)
+_DREQ_PIO1_RX0 = const(12)
+_DMA_COUNT = const(0x3FFFFFFF) # Передач до перезапуску (при 400 словах/с - понад 30 діб); мале ціле.
+
+if rp2 is not None:
+    @rp2.asm_pio(in_shiftdir=rp2.PIO.SHIFT_LEFT, fifo_join=rp2.PIO.JOIN_RX)
+    def _injector_pio():
+        # Слова в RX FIFO: (X << 1) | 1 - кінець імпульсу (ON),
+        #                  (X << 1) | 0 - початок наступного імпульсу або таймаут (X = 0).
+        # X рахує вниз від таймауту, тому відліки = таймаут - X.
+        # jmp(x_dec) зменшує X і тоді, коли не переходить: після вичерпання
+        # лічильника X = 0xFFFFFFFF, тому перед записом X явно обнуляється
+        # (велике слово в hard IRQ вимагало б виділення пам'яті).
+        pull(block)                 # Таймаут з TX FIFO -> OSR (один раз).
+        wait(1, pin, 0)             # Синхронізація: чекаємо закриту форсунку.
+        label("idle")
+        wait(0, pin, 0)             # FALLING: форсунка відкрилась.
+        wrap_target()
+        mov(x, osr)
+        label("on")
+        jmp(pin, "on_end")          # RISING: форсунка закрилась.
+        jmp(x_dec, "on")
+        mov(x, null)                # Форсунка відкрита довше за таймаут: X = 0.
+        label("on_end")
+        mov(isr, x)
+        set(y, 1)
+        in_(y, 1)
+        push(noblock)
+        label("off")
+        jmp(pin, "off_dec")
+        jmp("period_end")           # FALLING: почався наступний імпульс.
+        label("off_dec")
+        jmp(x_dec, "off")
+        mov(x, null)                # Таймаут: X = 0, двигун зупинився.
+        mov(isr, x)
+        in_(null, 1)
+        push(noblock)
+        jmp("idle")
+        label("period_end")
+        mov(isr, x)
+        in_(null, 1)
+        push(noblock)
+        wrap()
+
+
+class PioCapture:
+    """
+    Вимірювання програмою PIO. Тривалість і період рахуються апаратно з
+    точністю до такту; канал DMA (DREQ RX FIFO машини станів) переносить
+    кожне слово з RX FIFO (8 слів) у кільцевий буфер, тож FIFO не
+    переповнюється під час довгих операцій головного циклу, а переривань
+    немає зовсім. DMA працює в режимі кільця запису (ring_sel), тому буфер
+    вирівнюється на свій розмір (степінь двійки байт, до 32 КБ).
+    Міток часу слів немає: last_pulse_us - момент drain(), що забрав
+    початок імпульсу (запізнення не більше за інтервал виклику drain()).
+    """
+
+    def __init__(self, pin, ring_size, sm_id=0):
+        if rp2 is None:
+            raise RuntimeError("rp2 module unavailable")
+        if ring_size & (ring_size - 1) or ring_size * 4 > 32768:
+            raise ValueError("PIO DMA ring must be a power of two up to 32 KB")
+        self.pin = pin
+        self._sm = rp2.StateMachine(sm_id, _injector_pio, freq=_PIO_FREQ, in_base=pin, jmp_pin=pin)
+        base = _PIO0_BASE if sm_id < 4 else _PIO1_BASE
+        self._rxf = base + _PIO_RXF0 + 4 * (sm_id & 3)
+        self._dreq = (_DREQ_PIO0_RX0 if sm_id < 4 else _DREQ_PIO1_RX0) + (sm_id & 3)
+        self._mask = ring_size - 1
+        self._ring_bits = 0
+        while (1 << self._ring_bits) < ring_size * 4:
+            self._ring_bits += 1
+        # Вирівнювання: виділяємо вдвічі більше і беремо вирівняне вікно.
+        self._raw = array('I', [0] * (ring_size * 2))
+        offset = ((-uctypes.addressof(self._raw)) & (ring_size * 4 - 1)) >> 2
+        self._words = memoryview(self._raw)[offset:offset + ring_size] # Сирі слова з FIFO.
+        self._dma = rp2.DMA()
+        self._read = 0            # Слів прочитано з моменту запуску DMA.
+        self.overflow = 0
+        self.last_pulse_us = 0
+
+        self._width_us = 0        # Тривалість імпульсу, що очікує на свій період.
+        self._have_width = False
+
+    def _start_dma(self):
+        self._dma.active(0)
+        ctrl = self._dma.pack_ctrl(size=2, inc_read=False, inc_write=True, treq_sel=self._dreq,
+                                   ring_size=self._ring_bits, ring_sel=True, irq_quiet=True)
+        self._dma.config(read=self._rxf, write=self._words, count=_DMA_COUNT, ctrl=ctrl, trigger=True)
+        self._read = 0
+
+    def start(self):
+        sm = self._sm
+        self._start_dma()
+        sm.put(_PIO_TIMEOUT_COUNTS)
+        sm.active(1)
+
+    def stop(self):
+        self._sm.active(0)
+        self._dma.active(0)
+
+    def drain(self, widths, periods):
+        written = _DMA_COUNT - self._dma.count # Одне зчитування: DMA може дописувати далі.
+        read = self._read
+        mask = self._mask
+        if written - read > mask + 1:
+            # Кільце обійшло непрочитані слова: найстаріші вже перезаписані.
+            self.overflow += written - read - mask - 1
+            read = written - mask - 1
+        words = self._words
+        limit = len(widths)
+        n = 0
+        started = False
+        while read != written and n < limit:
+            word = words[read & mask]
+            read += 1
+
+            x = word >> 1
+            if word & 1:
+                self._width_us = _PIO_TIMEOUT_COUNTS - x + _PIO_WIDTH_CORRECTION_US
+                self._have_width = True
+            elif self._have_width:
+                # Період завершує пару: імпульс готовий.
+                self._have_width = False
+                widths[n] = self._width_us
+                if x:
+                    periods[n] = _PIO_TIMEOUT_COUNTS - x + _PIO_PERIOD_CORRECTION_US
+                    started = True # Слово періоду - на початку наступного імпульсу.
+                else:
+                    periods[n] = 0 # Таймаут: останній імпульс перед зупинкою.
+                n += 1
+        self._read = read
+        if started:
+            self.last_pulse_us = time.ticks_us()
+        if read == _DMA_COUNT:
+            self._start_dma() # Лічильник передач вичерпано: перезапуск із початку кільця.
+        return n
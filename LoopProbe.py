@@ -0,0 +1,75 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: LoopProbe.py
+# Опис: Вимірювання виділення пам'яті та пауз збирача сміття в циклі
+#       дисплея. begin()/end() навколо однієї ітерації рахують байти,
+#       виділені за ітерацію (gc.mem_alloc() до і після). Якщо за ітерацію
+#       mem_alloc() зменшився, під час неї відбулося автоматичне збирання
+#       сміття - непередбачувана пауза всередині кадру.
+#       collect() виконує gc.collect() у запланований момент (після
+#       надсилання кадру, поки є запас часу) і вимірює тривалість паузи;
+#       тоді автоматичні збирання посеред кадру практично не трапляються.
+#       Якщо gc.mem_alloc() недоступний (CPython на ПК), вимірювання
+#       виділень вимкнене, а паузи collect() рахуються як і раніше.
+# ==============================================================================
+
+import gc
+import time
+
+_mem_alloc = getattr(gc, 'mem_alloc', None)
+
+
+class LoopProbe:
+    """Статистика байтів на ітерацію та пауз gc.collect() (мкс)."""
+
+    def __init__(self):
+        self.enabled = _mem_alloc is not None
+        self.iterations = 0
+        self.alloc_total = 0      # Виділено за всі виміряні ітерації (байт).
+        self.alloc_last = 0       # Виділено за останню ітерацію (байт).
+        self.alloc_max = 0
+        self.auto_collections = 0 # Ітерацій, під час яких спрацював автоматичний gc.
+        self.collections = 0      # Запланованих gc.collect().
+        self.pause_last_us = 0
+        self.pause_max_us = 0
+        self.pause_total_us = 0
+        self._start = 0
+
+    def begin(self):
+        if self.enabled:
+            self._start = _mem_alloc()
+
+    def end(self):
+        self.iterations += 1
+        if not self.enabled:
+            return
+        used = _mem_alloc() - self._start
+        if used < 0:
+            self.auto_collections += 1 # Збирання посеред ітерації: приріст невідомий.
+            return
+        self.alloc_last = used
+        self.alloc_total += used
+        if used > self.alloc_max:
+            self.alloc_max = used
+
+    def collect(self):
+        """Заплановане збирання сміття з вимірюванням паузи. Повертає паузу (мкс)."""
+        t0 = time.ticks_us()
+        gc.collect()
+        pause = time.ticks_diff(time.ticks_us(), t0)
+        self.collections += 1
+        self.pause_last_us = pause
+        self.pause_total_us += pause
+        if pause > self.pause_max_us:
+            self.pause_max_us = pause
+        return pause
+
+    def report(self):
+        """Рядок статистики для виводу в консоль."""
+        parts = []
+        if self.enabled and self.iterations:
+            parts.append(f"{self.alloc_total // self.iterations} B/loop avg, {self.alloc_max} B max, "
+                         f"{self.auto_collections} auto gc in loop")
+        if self.collections:
+            parts.append(f"gc.collect {self.pause_total_us // self.collections} us avg, {self.pause_max_us} us max")
+        return '; '.join(parts) or 'no data'
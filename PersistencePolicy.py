@@ -0,0 +1,77 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: PersistencePolicy.py
+# Опис: Рішення, коли зберігати TRIP/PERS на Flash. Замість запису за
+#       таймером запис відбувається лише за причиною:
+#       - DELTA: лічильники змінились хоча б на поріг журналу
+#         (PERSISTENT_MIN_DELTA_FUEL_L / _KM, див. TripJournal.changed());
+#       - ENGINE_STOP: двигун заглух (імовірне вимкнення запалювання);
+#       - VOLTAGE_DROP: просідання бортової напруги (імовірна втрата живлення);
+#       - RESET: скидання TRIP кнопкою або автоматичне скидання PERS;
+#       - STALE: незбережені зміни (менші за поріг) старші за max_stale_ms;
+#       - BROWNOUT: аварійний запис BrownoutMonitor (лише облік, рішення
+#         приймає монітор).
+#       Найгірша втрата даних обмежена порогом змін, а для змін, менших за
+#       поріг, - часом max_stale_ms.
+#       Подія без незбережених змін запису не викликає. Кожна перевірка
+#       без запису рахується як уникнений запис (avoided).
+# ==============================================================================
+
+import time
+from micropython import const
+
+REASON_NONE = const(0)
+REASON_DELTA = const(1)
+REASON_ENGINE_STOP = const(2)
+REASON_VOLTAGE_DROP = const(3)
+REASON_RESET = const(4)
+REASON_STALE = const(5)
+REASON_BROWNOUT = const(6)
+
+REASON_NAMES = ('none', 'delta', 'engine stop', 'voltage drop', 'reset', 'stale', 'brownout')
+
+
+class PersistencePolicy:
+    """Політика збереження: decide() -> причина запису, flushed() -> облік."""
+
+    def __init__(self, max_stale_ms):
+        self.max_stale_ms = max_stale_ms
+        self.last_flush_ms = time.ticks_ms()
+        self.pending = REASON_NONE  # Подія, що вимагає запису при наступній перевірці.
+        self.avoided = 0            # Перевірок без запису.
+        self.flushes = [0] * len(REASON_NAMES) # Кількість записів за причинами.
+
+    def request(self, reason):
+        """Позначає подію, після якої дані потрібно зберегти якнайшвидше."""
+        if self.pending == REASON_NONE:
+            self.pending = reason
+
+    def decide(self, now_ms, changed, dirty):
+        """
+        Повертає причину запису або REASON_NONE.
+        changed - зміни досягли порогу журналу; dirty - є хоч якісь незбережені зміни.
+        """
+        if self.pending != REASON_NONE:
+            if dirty:
+                return self.pending
+            self.pending = REASON_NONE # Подія без незбережених змін: записувати нічого.
+        if changed:
+            return REASON_DELTA
+        if dirty and time.ticks_diff(now_ms, self.last_flush_ms) >= self.max_stale_ms:
+            return REASON_STALE
+        self.avoided += 1
+        return REASON_NONE
+
+    def flushed(self, now_ms, reason):
+        """Облік успішного запису."""
+        self.flushes[reason] += 1
+        self.last_flush_ms = now_ms
+        self.pending = REASON_NONE
+
+    def total_flushes(self):
+        return sum(self.flushes)
+
+    def report(self):
+        """Рядок статистики: записи за причинами та уникнені записи."""
+        parts = ', '.join(f"{REASON_NAMES[i]} {self.flushes[i]}" for i in range(1, len(REASON_NAMES)) if self.flushes[i])
+        return f"{self.total_flushes()} flushes ({parts or 'none'}), {self.avoided} avoided"
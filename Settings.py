@@ -58,6 +58,19 @@ INJ_VOLT_SENSITIVITY = 10 # Додаємо/віднімаємо мкс на ко
 # Імпульси, коротші за це значення, ігноруються як електричний шум.
 MIN_INJ_PULSE_WIDTH_FILTER_US = const(500)
 
+# Розмір кільцевого буфера фронтів форсунки (степінь двійки).
+# IRQ (або DMA з RX FIFO PIO) лише записує фронти (слова PIO), а головний цикл обробляє їх пачкою.
+# 1024 фронти = ~1.8 с роботи двигуна на 8500 об/хв (2 фронти на впорскування).
+INJ_EDGE_RING_SIZE = const(1024)
+
+# Джерело вимірювання імпульсів форсунки:
+# 0 - переривання GPIO (Pin.irq + ticks_us, програмний дебаунс 100 мкс);
+# 1 - машина станів PIO (апаратний підрахунок тактів, точність 1 мкс) та DMA з RX FIFO:
+#     без переривань, приблизно вдвічі менше CPU (host/bench_injector_capture.py).
+# Якщо PIO або DMA недоступні, використовується варіант 0.
+INJ_CAPTURE_BACKEND = const(0)
+INJ_PIO_STATE_MACHINE = const(0) # Номер машини станів PIO (0-7) для INJ_CAPTURE_BACKEND = 1.
+
 # Кількість імпульсів датчика швидкості (VSS) на 1 кілометр.
 # Це значення залежить від типу датчика VSS, трансмісії та розміру коліс.
 VSS_IMPULSES_PER_KM = const(4324)
@@ -66,6 +79,18 @@ VSS_IMPULSES_PER_KM = const(4324)
 # Запобігає множинному спрацьовуванню переривання від одного імпульсу через шум.
 VSS_DEBOUNCE_US = const(500)
 
+# Спосіб підрахунку імпульсів VSS:
+# 0 - переривання GPIO на кожен імпульс (з дебаунсом VSS_DEBOUNCE_US);
+# 1 - апаратний лічильник фронтів зрізу PWM (без Python-коду на імпульс, без дебаунсу).
+#     Потребує непарного GPIO (вхід B зрізу PWM); інакше використовується варіант 0.
+VSS_COUNTER_BACKEND = const(0)
+
+# Датчики-вимикачі попереджень (гальмівна рідина, перегрів, тиск мастила) на перериваннях.
+# Рівень приймається, якщо протримався WARNING_DEBOUNCE_MS; коротші імпульси
+# рахуються як завади (WarningInputs.glitches) і не викликають тривогу.
+WARNING_DEBOUNCE_MS = const(30)
+WARNING_EVENT_QUEUE_SIZE = const(32) # Розмір черги фронтів (степінь двійки).
+
 # ------------------------------------------------------------------------------
 # 3. НАЛАШТУВАННЯ ДАТЧИКА ПАЛИВА (ADC)
 #    Параметри для калібрування аналогового датчика рівня палива.
@@ -79,9 +104,22 @@ FUEL_TANK_CAPACITY_L = const(68)  # Об'єм бака Audi 80 B3
 FUEL_ADC_MIN_RAW = const(200) # Мінімальне сире значення ADC для 0% палива (200).
 FUEL_ADC_MAX_RAW = const(1950) # Максимальне сире значення ADC для 100% палива (1950).
 
+# Вибірка ADC датчика палива (FuelSampler): зчитування рівномірно розподілені в часі,
+# щоб хлюпання палива в баку (період ~1-3 с) відкидалось медіаною, а не потрапляло в показ.
+# Інтервал та вікно обрано розгорткою host/bench_fuel_sampler.py: найменша похибка показу
+# серед варіантів, що коштують не більше ~1.5x CPU попередньої пачки з 8 зчитувань раз на секунду.
+FUEL_SAMPLE_INTERVAL_MS = const(500) # Інтервал між зчитуваннями ADC (мс).
+FUEL_SAMPLE_WINDOW = const(6)        # Кількість останніх зчитувань у вікні (6 x 500 мс = 3 с).
+FUEL_SAMPLE_KEEP = const(4)          # Кількість центральних значень вікна для усередження
+                                     # (усічене середнє; 1 - чиста медіана).
+
 # Параметри згладжування та обмеження швидкості зміни рівня палива.
-FUEL_BUFFER_SIZE = const(16) # Кількість останніх значень ADC, що зберігаються в буфері для обчислення середнього
-                             # значення. Більший буфер = сильніше згладжування, повільніша реакція.
+# Тип фільтра (SmoothingFilter): 0 - ковзне середнє, 1 - експоненційне (EMA), 2 - ковзна медіана.
+# Вартість оновлення не залежить від розміру буфера, тож буфер може мати 64-256 значень.
+FUEL_FILTER_TYPE = const(0)
+FUEL_BUFFER_SIZE = const(16) # Кількість останніх значень рівня палива, що зберігаються в буфері для
+                             # згладжування. Більший буфер = сильніше згладжування, повільніша реакція.
+FUEL_EMA_ALPHA = 0.1         # Коефіцієнт EMA (FUEL_FILTER_TYPE = 1): менше значення = сильніше згладжування.
 FUEL_MAX_PERCENT_CHANGE_PER_SEC = const(10) # Максимально дозволена зміна рівня палива в % за секунду.
                                             # Захищає від різких стрибків показань через коливання палива в баку.
 
@@ -104,13 +142,27 @@ I2C_FREQ = const(400000) # Частота шини I2C для OLED диспле
 OLED_ADDR_HEX = const(0x3C) # Адреса OLED дисплея по I2C.
 OLED_CONTRAST = const(0xFF) # Контраст OLED дисплея (0x00 - найменший, 0xFF - найбільший).
 
+# Періодичність (у кадрах) виводу статистики Compositor (трафік I2C та час передачі кадру) в консоль.
+# 0 - статистика не виводиться.
+COMPOSITOR_STATS_INTERVAL_FRAMES = const(0)
+
+# Керування збирачем сміття в циклі дисплея.
+# GC_AFTER_FRAME - виконувати gc.collect() одразу після кадру (у запасі часу до наступного),
+# щоб автоматичне збирання не переривало розрахунки та передачу кадру.
+GC_AFTER_FRAME = True
+# Періодичність (у кадрах) виводу статистики LoopProbe (байт на ітерацію, паузи gc) в консоль.
+# 0 - вимірювання вимкнене.
+LOOP_PROBE_REPORT_INTERVAL_FRAMES = const(0)
+
 # Тривалість відображення початкових екранів при запуску системи.
 STARTUP_OK_SCREEN_DURATION_SEC = const(3) # Тривалість (секунди) відображення екрану "STATUS OK" при запуску (якщо немає критичних помилок).
 STARTUP_ERROR_SCREEN_DURATION_SEC = const(5) # Тривалість (секунди) відображення першої критичної помилки при запуску (якщо такі є).
 
 # Налаштування згладжування миттєвої витрати палива на головному екрані.
+MAIN_VAL_FILTER_TYPE = const(0) # Тип фільтра, як FUEL_FILTER_TYPE (0 - середнє, 1 - EMA, 2 - медіана).
 MAIN_VAL_BUFFER_SIZE = const(3)  # Розмір буфера для згладжування показників L/H або L/100KM.
                                  # Більше значення = плавніші цифри, але повільніша реакція на зміну витрати.
+MAIN_VAL_EMA_ALPHA = 0.5         # Коефіцієнт EMA (MAIN_VAL_FILTER_TYPE = 1).
 
 # Основний показник (миттєва витрата L/H або L/100KM).
 MAIN_VALUE_FONT_SIZE = const(3) # Розмір шрифту основного показника (кожен символ 8x8 пікселів розтягується в 8*SIZE x 8*SIZE).
@@ -133,6 +185,10 @@ MAIN_FRAME_RADIUS_PX = const(2) # Радіус заокруглення куті
 TRIP_STAT_Y_POS = const(74) # Вертикальна позиція для рядка статистики поточної поїздки (TRIP).
 PERS_STAT_Y_POS = const(96) # Вертикальна позиція для рядка загальної персистентної статистики (PERS).
 STAT_TEXT_X_POS = const(9) # Горизонтальна позиція для початку тексту статистики.
+STAT_TEXT_FONT_SIZE_X = const(1) # Горизонтальне розтягування шрифту тексту статистики.
+STAT_TEXT_FONT_SIZE_Y = const(2) # Вертикальне розтягування шрифту тексту статистики.
+BATT_TEXT_FONT_SIZE_X = const(1) # Горизонтальне розтягування шрифту напруги в іконці акумулятора.
+BATT_TEXT_FONT_SIZE_Y = const(2) # Вертикальне розтягування шрифту напруги в іконці акумулятора.
 
 # Ширина числових полів для форматування TRIP та PERS.
 # Використовується для підтримки фіксованої ширини та запобігання "стрибкам" тексту при зміні значень.
@@ -148,6 +204,11 @@ LOOP_ERROR_Y_POS = const(50) # Вертикальна позиція текст
 # Інтервал блимання для попереджень (мс). Використовується для візуальних ефектів.
 BLINK_INTERVAL_MS = const(1000)
 
+# Бюджет пам'яті (байт) для кешу попередньо відрендерених розтягнутих символів (GlyphAtlas).
+# Символ розміром 3 (24x24) займає 72 байти, 2 (16x16) - 32 байти, 1x2 (8x16) - 16 байт.
+# При переповненні витісняються символи, які найдовше не використовувались.
+GLYPH_ATLAS_BUDGET_BYTES = const(3072)
+
 # Максимальне значення L/100KM, яке відображається.
 # Якщо розраховане значення (для PERS або MAIN L/100KM) перевищує це,
 # буде показано "----" або "-.--" замість чисел.
@@ -185,9 +246,18 @@ SP_SCR_FUEL_FONT_SIZE = const(2) # Розмір шрифту для палива
 #    Параметри, що керують поведінкою системи, пов'язаною з двигуном,
 #    діагностикою та сповіщеннями.
 # ------------------------------------------------------------------------------
-# Загальний інтервал оновлення екрану та більшості розрахунків в основному циклі (в секундах).
+# Загальний інтервал оновлення екрану та розрахунків витрати/відстані (в секундах).
 UPDATE_INTERVAL_SEC = const(1)
 
+# Періоди задач планувальника uasyncio (мс). Кожна задача працює незалежно від дисплея.
+BUTTON_POLL_INTERVAL_MS = const(20)       # Опитування кнопки RESET.
+SOUND_TASK_INTERVAL_MS = const(20)        # Найбільший інтервал кроку звуку (фази тонів перемикаються точно за часом).
+ENGINE_TASK_INTERVAL_MS = const(50)       # Обробка імпульсів форсунки та перевірка зупинки двигуна.
+VOLTAGE_TASK_INTERVAL_MS = const(1000)    # Вимірювання напруги та корекція dead time.
+FUEL_TASK_INTERVAL_MS = const(1000)       # Згладжування рівня палива (вибірка ADC - FUEL_SAMPLE_INTERVAL_MS).
+PERSISTENCE_TASK_INTERVAL_MS = const(1000) # Перевірка потреби збереження даних поїздок.
+WATCHDOG_FEED_INTERVAL_MS = const(1000)   # Годування Watchdog.
+
 # Час без імпульсів форсунки (мс), після якого двигун вважається заглушеним.
 ENGINE_STOP_TIMEOUT_MS = const(2000) # 2 секунди.
 
@@ -289,21 +359,52 @@ MIN_PERS_DISPLAY_DISTANCE_KM = const(0.1) # Мінімальна пройден
 # Це значення дозволяє автоматично "обнуляти" довгострокову статистику.
 RESET_PERSISTENT_TRIP_DISTANCE_KM = const(5000)
 
-# Імена файлів для збереження персистентних даних.
-# Використання тимчасових та резервних файлів забезпечує атомарність збереження
-# та захист від пошкодження даних у разі раптового відключення живлення.
-TRIP_DATA_FILE = 'trip_data.txt'    # Основний файл для збереження даних поїздок.
-TRIP_DATA_BACKUP = 'trip_data.bak'  # Резервний файл даних поїздок.
-TRIP_DATA_TEMP = 'trip_data.tmp'    # Тимчасовий файл, що використовується під час збереження.
-
-# Інтервал збереження персистентних даних на Flash пам'ять (мс).
-# Зберігання даних на Flash є операцією з обмеженим терміном служби, тому не варто робити це занадто часто.
-PERSISTENT_SAVE_INTERVAL_MS = const(10000) # Кожні 10 секунд.
+# Журнал персистентних даних (TripJournal.py): кожне збереження дописує
+# бінарний запис з CRC у кінець файлу-сегмента; сегменти використовуються
+# по колу, щоб розподілити записи по Flash. Захист від відключення живлення
+# забезпечують CRC записів та попередні сегменти кільця.
+TRIP_JOURNAL_FILE_FORMAT = 'trip_journal_{}.bin' # Імена сегментів журналу ({} - номер сегмента).
+TRIP_JOURNAL_SEGMENTS = const(4)        # Кількість сегментів у кільці (мінімум 2).
+TRIP_JOURNAL_SEGMENT_BYTES = const(4096) # Розмір сегмента (байт) - один блок Flash.
+# Запис у журнал пропускається, якщо жоден лічильник не змінився хоча б на поріг.
+PERSISTENT_MIN_DELTA_FUEL_L = 0.01      # Поріг зміни палива TRIP/PERS (л).
+PERSISTENT_MIN_DELTA_KM = 0.1           # Поріг зміни відстані TRIP/PERS (км).
+# Текстовий файл попередніх версій прошивки (4 рядки). Зчитується один раз,
+# якщо журналу ще немає, щоб не втратити накопичені TRIP/PERS.
+TRIP_DATA_FILE = 'trip_data.txt'
+
+# Політика збереження (PersistencePolicy.py): запис лише за зміною лічильників
+# (пороги вище), зупинкою двигуна, просіданням напруги чи скиданням лічильників.
+# Перевірка виконується кожні PERSISTENCE_TASK_INTERVAL_MS.
+PERSISTENT_MAX_STALE_MS = const(60000) # Найдовший час (мс) очікування запису для змін, менших за поріг.
+PERSISTENT_VOLTAGE_DROP_V = 11.0       # Падіння напруги нижче цього значення (В) - негайний запис.
+
+# Аварійне збереження при вимкненні запалювання (BrownoutMonitor.py): напруга
+# 12В вимірюється часто, і після падіння нижче порогу дані записуються, поки
+# конденсатори живлення ще тримають Pico.
+BROWNOUT_SAMPLE_INTERVAL_MS = const(2) # Інтервал вибірки напруги (мс).
+BROWNOUT_CONFIRM_SAMPLES = const(2)    # Вибірок поспіль нижче порогу для спрацювання (захист від шуму).
+BROWNOUT_THRESHOLD_V = 9.0             # Поріг падіння напруги (В).
+BROWNOUT_REARM_V = 11.0                # Напруга (В), після відновлення якої монітор знову активний.
+
+# Журнал поїздки високої роздільності (TripLogger.py): кожен інтервал
+# розрахунків (оберти, швидкість, L/H, форсунка, паливо, напруга, помилки)
+# пишеться бінарним записом; на Flash потрапляють лише цілі блоки.
+# Розшифровка на ПК: python host/decode_trip_log.py trip_log_*.bin --csv trip.csv
+TRIP_LOG_ENABLED = True
+TRIP_LOG_FILE_FORMAT = 'trip_log_{}.bin' # Імена файлів журналу ({} - номер файлу).
+TRIP_LOG_FILES = const(4)               # Кількість файлів у кільці (мінімум 2).
+TRIP_LOG_FILE_BYTES = const(65536)      # Розмір файлу (байт): 4 x 64 КБ = ~2.5 год при інтервалі 1 с.
+TRIP_LOG_BLOCK_BYTES = const(4096)      # Блок запису (байт) - один блок стирання Flash, 145 записів.
+TRIP_LOG_BUDGET_KB_PER_HOUR = const(128) # Бюджет запису на Flash (КБ на годину роботи); понад нього блоки відкидаються.
 
 # ------------------------------------------------------------------------------
 # 9. Безпека.
 # ------------------------------------------------------------------------------
 WATCHDOG_TIME_RESET = 8000 # Watchdog перезавантажить мікроконтролер, якщо програма зависне.
+# Якщо будь-яка задача не виконувалась довше за цей час (мс), Watchdog не годується
+# і мікроконтролер перезавантажиться. Має бути меншим за WATCHDOG_TIME_RESET.
+TASK_STALL_TIMEOUT_MS = const(4000)
 
 # ------------------------------------------------------------------------------
 # 10. Налаштування звуку при активації TRIP-вікна (зворотний зв'язок для користувача)
@@ -319,3 +420,15 @@ VOLTAGE_R1 = 10000.0 # 10k Ом
 VOLTAGE_R2 = 2000.0 # 2k Ом
 # Розрахунок коефіцієнта (для переводу одиниць ADC в реальні Вольти)
 VOLTAGE_CALIBRATION = (3.3 / 65535) * ((VOLTAGE_R1 + VOLTAGE_R2) / VOLTAGE_R2)
+
+# Джерело вибірок ADC (напруга 12В та датчик палива):
+# 0 - блокуюче зчитування machine.ADC на кожен запит;
+# 1 - безперервна вибірка round-robin з DMA у кільцевий буфер (AdcAcquisition.DmaAdc),
+#     зчитування - середнє останніх вибірок без очікування ADC та без коду на кожну вибірку.
+# Якщо DMA недоступний, використовується блокуюче зчитування.
+ADC_BACKEND = const(0)
+ADC_DMA_RATE_HZ = const(1000)       # Частота вибірки кожного піна (Гц).
+ADC_DMA_DEPTH = const(256)          # Вибірок кожного піна в буфері (степінь двійки; 2 піни x 256 x 2 байти = 1 КБ).
+ADC_DMA_VOLTAGE_AVERAGE = const(256) # Вибірок у середньому для напруги (256 мс при 1 кГц).
+ADC_DMA_FUEL_AVERAGE = const(250)   # Вибірок у середньому для кожного зчитування FuelSampler (250 мс, не більше ADC_DMA_DEPTH).
+ADC_DMA_BROWNOUT_AVERAGE = const(2) # Вибірок у середньому для монітора падіння напруги (2 мс - без затримки реакції).
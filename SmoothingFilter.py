@@ -0,0 +1,167 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: SmoothingFilter.py
+# Опис: Фільтри згладжування показників (рівень палива, миттєва витрата)
+#       з вартістю оновлення, що не залежить від розміру вікна:
+#       - MeanFilter: ковзне середнє. Кільце array('i') та сума, що
+#         підтримується інкрементально (+нове -найстаріше). Значення
+#         зберігаються як цілі з кроком 1/scale, тому сума точна і не
+#         дрейфує, як дрейфувала б сума float32.
+#       - EmaFilter: експоненційне згладжування (одне значення, без буфера).
+#       - MedianFilter: ковзна медіана на SortedWindow. Стійка до поодиноких
+#         викидів.
+#       SortedWindow - кільце цілих значень та його відсортована копія:
+#       найстаріше значення замінюється новим зсувом лише елементів між
+#       їхніми позиціями (бінарний пошук), тож для повільного сигналу
+#       оновлення коштує O(log n). Відсортований буфер доступний напряму
+#       (FuelSampler рахує по ньому усічене середнє сирих значень ADC).
+#       Усі фільтри: update(x) повертає згладжене значення, reset(x)
+#       заповнює вікно значенням x (наприклад, при перемиканні L/H <-> L/100KM).
+#       Пам'ять виділяється лише в конструкторі.
+# ==============================================================================
+
+from array import array
+from micropython import const
+
+FILTER_MEAN = const(0)
+FILTER_EMA = const(1)
+FILTER_MEDIAN = const(2)
+
+_SCALE = const(1000) # Крок зберігання значень MeanFilter / MedianFilter: 0.001.
+
+
+def _to_fixed(x, scale):
+    """Значення у цілих кроках 1/scale (з округленням до найближчого)."""
+    return int(x * scale + 0.5) if x >= 0 else -int(-x * scale + 0.5)
+
+
+class MeanFilter:
+    """Ковзне середнє size останніх значень."""
+
+    def __init__(self, size, initial=0.0, scale=_SCALE):
+        self.size = size
+        self.scale = scale
+        self._ring = array('i', [0] * size)
+        self._head = 0
+        self._sum = 0
+        self.reset(initial)
+
+    def reset(self, value):
+        v = _to_fixed(value, self.scale)
+        ring = self._ring
+        for i in range(self.size):
+            ring[i] = v
+        self._head = 0
+        self._sum = v * self.size
+        self.value = value
+
+    def update(self, x):
+        v = _to_fixed(x, self.scale)
+        head = self._head
+        self._sum += v - self._ring[head]
+        self._ring[head] = v
+        head += 1
+        self._head = 0 if head == self.size else head
+        self.value = self._sum / (self.size * self.scale)
+        return self.value
+
+
+class EmaFilter:
+    """Експоненційне згладжування: value += alpha * (x - value)."""
+
+    def __init__(self, alpha, initial=0.0):
+        self.alpha = alpha
+        self.value = initial
+
+    def reset(self, value):
+        self.value = value
+
+    def update(self, x):
+        self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class SortedWindow:
+    """Кільце size останніх цілих значень та його відсортована копія (sorted)."""
+
+    def __init__(self, size, typecode='i'):
+        self.size = size
+        self._ring = array(typecode, [0] * size)
+        self.sorted = array(typecode, [0] * size)
+        self._head = 0
+
+    def fill(self, v):
+        """Заповнює все вікно значенням v."""
+        for i in range(self.size):
+            self._ring[i] = v
+            self.sorted[i] = v
+        self._head = 0
+
+    def _find(self, v):
+        """Перша позиція у відсортованому вікні, де значення >= v."""
+        s = self.sorted
+        lo = 0
+        hi = self.size
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if s[mid] < v:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def add(self, v):
+        """Замінює найстаріше значення вікна на v."""
+        head = self._head
+        old = self._ring[head]
+        self._ring[head] = v
+        head += 1
+        self._head = 0 if head == self.size else head
+        if v == old:
+            return
+        # Видаляємо old і вставляємо v одним зсувом елементів між їхніми позиціями.
+        s = self.sorted
+        i = self._find(old)
+        if v > old:
+            last = self.size - 1
+            while i < last and s[i + 1] < v:
+                s[i] = s[i + 1]
+                i += 1
+        else:
+            while i > 0 and s[i - 1] > v:
+                s[i] = s[i - 1]
+                i -= 1
+        s[i] = v
+
+
+class MedianFilter:
+    """Ковзна медіана size останніх значень (для парного size - середнє двох центральних)."""
+
+    def __init__(self, size, initial=0.0, scale=_SCALE):
+        self.size = size
+        self.scale = scale
+        self._window = SortedWindow(size)
+        self.reset(initial)
+
+    def reset(self, value):
+        self._window.fill(_to_fixed(value, self.scale))
+        self.value = value
+
+    def update(self, x):
+        self._window.add(_to_fixed(x, self.scale))
+        s = self._window.sorted
+        mid = self.size >> 1
+        if self.size & 1:
+            self.value = s[mid] / self.scale
+        else:
+            self.value = (s[mid - 1] + s[mid]) / (2 * self.scale)
+        return self.value
+
+
+def create(kind, size, alpha, initial=0.0):
+    """Фільтр за типом із Settings (FILTER_MEAN / FILTER_EMA / FILTER_MEDIAN)."""
+    if kind == FILTER_EMA:
+        return EmaFilter(alpha, initial)
+    if kind == FILTER_MEDIAN:
+        return MedianFilter(size, initial)
+    return MeanFilter(size, initial)
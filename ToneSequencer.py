@@ -0,0 +1,96 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: ToneSequencer.py
+# Опис: Неблокуючий секвенсор звукових сигналів на PWM динаміка.
+#       Відтворює будь-яку послідовність ((тривалість_мс, частота_Гц), ...)
+#       у форматі Settings.ALARM_SEQUENCE (частота 0 - пауза), одноразово
+#       або по колу. Фази перемикаються викликами tick() з головного циклу;
+#       жоден виклик не чекає на завершення звуку.
+#       Пріоритети: послідовність з вищим пріоритетом (тривога) перериває
+#       нижчий (звуки інтерфейсу), запит з нижчим пріоритетом під час
+#       відтворення вищого ігнорується.
+#       Регістри PWM записуються лише при зміні частоти чи шпаруватості.
+# ==============================================================================
+
+import time
+from micropython import const
+
+PRIORITY_UI = const(1)      # Короткі сигнали кнопки.
+PRIORITY_ALARM = const(2)   # Звукова тривога критичних помилок.
+
+_DUTY_ON = const(32768) # 50% шпаруватості.
+
+
+class ToneSequencer:
+    """Секвенсор тонів поверх об'єкта machine.PWM."""
+
+    def __init__(self, pwm):
+        self.pwm = pwm
+        self.freq = 0       # Поточна частота динаміка (остання записана в PWM).
+        self.duty = 0       # Поточна шпаруватість (0 = вимкнено, 32768 = 50%).
+        self.priority = 0   # Пріоритет послідовності, що звучить (0 - тиша).
+        self._pattern = None
+        self._repeat = False
+        self._index = 0
+        self._phase_start_ms = 0
+
+    def play(self, pattern, priority, repeat=False):
+        """
+        Починає відтворення pattern. Перший тон вмикається одразу.
+        Повертає False, якщо зараз звучить послідовність з вищим пріоритетом.
+        """
+        if self._pattern is not None and priority < self.priority:
+            return False
+        self._pattern = pattern
+        self._repeat = repeat
+        self._index = 0
+        self.priority = priority
+        self._phase_start_ms = time.ticks_ms()
+        self._apply(pattern[0][1])
+        return True
+
+    def stop(self, priority=0):
+        """Зупиняє відтворення (якщо priority > 0 - лише послідовність цього пріоритету)."""
+        if priority and priority != self.priority:
+            return
+        self._pattern = None
+        self.priority = 0
+        self._apply(0)
+
+    def tick(self):
+        """
+        Перемикає фази, час яких минув. Повертає кількість мс до наступного
+        перемикання або -1, якщо нічого не звучить.
+        """
+        pattern = self._pattern
+        if pattern is None:
+            return -1
+        elapsed = time.ticks_diff(time.ticks_ms(), self._phase_start_ms)
+        duration = pattern[self._index][0]
+        while elapsed >= duration:
+            index = self._index + 1
+            if index >= len(pattern):
+                if not self._repeat:
+                    self.stop()
+                    return -1
+                index = 0
+            # Початок фази рахується від запланованого моменту, а не від моменту
+            # виклику tick(), щоб запізнення не накопичувалось.
+            self._phase_start_ms = time.ticks_add(self._phase_start_ms, duration)
+            elapsed -= duration
+            self._index = index
+            duration = pattern[index][0]
+        self._apply(pattern[self._index][1])
+        return duration - elapsed
+
+    def _apply(self, freq):
+        if freq > 0:
+            if self.freq != freq:
+                self.pwm.freq(freq)
+                self.freq = freq
+            if self.duty != _DUTY_ON:
+                self.pwm.duty_u16(_DUTY_ON)
+                self.duty = _DUTY_ON
+        elif self.duty != 0:
+            self.pwm.duty_u16(0)
+            self.duty = 0
@@ -0,0 +1,66 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: TripCounter.py
+# Опис: Цілочисельне накопичення палива та відстані (TRIP / PERS).
+#       Замість додавання літрів і кілометрів у float кожен інтервал
+#       накопичуються сирі величини: час відкриття форсунки (мкс) та
+#       імпульси VSS. У літри та кілометри вони переводяться лише для
+#       відображення (fuel_L() / km()); журнал зберігає самі цілі.
+#       На RP2040 float MicroPython - 32-бітний: після сотень літрів крок
+#       float32 (~3e-5 л) порівнянний з паливом за секунду на холостому
+#       ході, тож float-накопичення дрейфує. Цілі значення додаються точно.
+#       Час форсунки зберігається двома малими цілими (старша частина -
+#       кількість порцій по 2^24 мкс, молодша - залишок), щоб не виходити
+#       за межі малих цілих MicroPython (2^30) і не виділяти пам'ять на
+#       додавання: 2^30 мкс - це лише ~14.5 л палива.
+# ==============================================================================
+
+from micropython import const
+
+_CARRY_SHIFT = const(24)
+_CARRY_MASK = const(0xFFFFFF)
+
+
+class TripCounter:
+    """Паливо (мкс відкриття форсунки) та відстань (імпульси VSS) як цілі числа."""
+
+    def __init__(self, l_per_us, pulses_per_km):
+        self.l_per_us = l_per_us
+        self.pulses_per_km = pulses_per_km
+        self._carry_L = (1 << _CARRY_SHIFT) * l_per_us # Літрів в одній порції старшої частини.
+        self.inj_hi = 0   # Порцій по 2^24 мкс.
+        self.inj_lo = 0   # Залишок (мкс), 0..2^24-1.
+        self.pulses = 0   # Імпульсів VSS (мале ціле до ~248 000 км).
+
+    def add(self, inj_us, pulses):
+        """Додає час відкриття форсунки (мкс, ціле) та імпульси VSS за інтервал."""
+        lo = self.inj_lo + inj_us
+        if lo > _CARRY_MASK:
+            self.inj_hi += lo >> _CARRY_SHIFT
+            lo &= _CARRY_MASK
+        self.inj_lo = lo
+        self.pulses += pulses
+
+    def fuel_L(self):
+        return self.inj_hi * self._carry_L + self.inj_lo * self.l_per_us
+
+    def km(self):
+        return self.pulses / self.pulses_per_km
+
+    def restore(self, inj_hi, inj_lo, pulses):
+        """Відновлює лічильники точно, як їх зберіг журнал (TripJournal)."""
+        self.inj_hi = inj_hi
+        self.inj_lo = inj_lo
+        self.pulses = pulses
+
+    def set(self, fuel_L, km):
+        """Встановлює лічильники з літрів і кілометрів (перенесення даних попередніх форматів)."""
+        inj_us = int(fuel_L / self.l_per_us + 0.5)
+        self.inj_hi = inj_us >> _CARRY_SHIFT
+        self.inj_lo = inj_us & _CARRY_MASK
+        self.pulses = int(km * self.pulses_per_km + 0.5)
+
+    def reset(self):
+        self.inj_hi = 0
+        self.inj_lo = 0
+        self.pulses = 0
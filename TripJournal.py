@@ -0,0 +1,326 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: TripJournal.py
+# Опис: Журнал персистентних даних TRIP/PERS з вирівнюванням зносу Flash.
+#       Кожне збереження - один бінарний запис фіксованого розміру
+#       (struct: маркер, номер послідовності, сирі цілі лічильники
+#       TripCounter для PERS і TRIP, CRC32), що дописується у відкритий
+#       файл-сегмент. Немає перезапису, видалення та перейменування файлів
+#       на кожне збереження, немає перетворення float -> str. Лічильники
+#       зберігаються точно (мкс форсунки та імпульси VSS), тож після
+#       перезавантаження накопичення продовжується без округлення до float.
+#
+#       Кільце з N сегментів (файли path_format.format(0..N-1) розміром до
+#       segment_bytes): коли поточний сегмент заповнено, запис продовжується
+#       з початку найстарішого сегмента. Записи розподіляються по всіх
+#       сегментах, а попередні сегменти залишаються цілими, доки кільце не
+#       обійде їх по колу.
+#       Захист від відключення живлення: запис, обірваний на будь-якому
+#       байті, відкидається при завантаженні за CRC, а останній цілий запис
+#       завжди є в поточному або попередньому сегменті.
+#       Запис пропускається, якщо жоден лічильник не змінився хоча б на
+#       поріг (min_delta_inj_us / min_delta_pulses), окрім примусового (force).
+#
+#       Номер послідовності переживає перезавантаження, тому seq - це
+#       загальна кількість записів за весь час роботи; з нього оцінюється
+#       знос Flash (estimated_erases() / remaining_endurance()).
+#
+#       Формат запису (little-endian, RECORD_SIZE байт):
+#         I magic | I seq | I pers_inj_hi | I pers_inj_lo | I pers_pulses |
+#         I trip_inj_hi | I trip_inj_lo | I trip_pulses | I crc32
+#       CRC32 рахується за всіма попередніми полями запису.
+#       Записи попереднього формату (4 x float32 літрів/км, маркер "TRPJ")
+#       читає load_legacy() - один раз для перенесення даних.
+#
+#       Аварійний запис (emergency_append(), при падінні живлення) не виділяє
+#       пам'яті: буфер запису, відкритий файл та місце в сегменті підготовлені
+#       заздалегідь, CRC32 рахується таблицею на 16-бітних половинах (малі
+#       цілі MicroPython, без big int, на відміну від binascii.crc32).
+#       Записані аварійно лічильники зберігаються у заздалегідь виділеному
+#       array('I'), тож emergency_unsaved() перевіряє, чи є що дописувати
+#       після спрацювання, теж без виділення пам'яті.
+# ==============================================================================
+
+import struct
+from array import array
+from micropython import const
+
+_MAGIC = const(0x32505254) # "TRP2" у little-endian.
+_FORMAT = '<IIIIIIII'
+_PAYLOAD_SIZE = const(32)
+RECORD_SIZE = const(36)    # Корисні дані + CRC32.
+_CARRY_SHIFT = const(24)   # Старша частина часу форсунки - порції по 2^24 мкс (як у TripCounter).
+
+# Попередній формат (float32 літри/км), лише для читання.
+_LEGACY_MAGIC = const(0x4A505254) # "TRPJ" у little-endian.
+_LEGACY_FORMAT = '<IIffff'
+_LEGACY_PAYLOAD_SIZE = const(24)
+_LEGACY_RECORD_SIZE = const(28)
+
+# Модель зносу Flash Raspberry Pi Pico (W25Q16JV + littlefs MicroPython).
+# littlefs веде журнали і даних, і метаданих, тому кожен блок стирається
+# приблизно один раз на FLASH_BLOCK_SIZE запрограмованих байтів, а знос
+# розподіляється по всіх блоках файлової системи (block_cycles).
+FLASH_BLOCK_SIZE = const(4096)          # Розмір блоку стирання (байт).
+FLASH_PROG_SIZE = const(256)            # Мінімальна порція програмування (сторінка, байт).
+FLASH_ENDURANCE_CYCLES = const(100000)  # Гарантована кількість циклів стирання блоку.
+FLASH_FS_BLOCKS = const(352)            # Блоків у файловій системі (1408 КБ).
+APPEND_PROG_BYTES = const(512)          # Запис + flush: сторінка даних + сторінка коміту метаданих.
+ROLLOVER_PROG_BYTES = const(768)        # Перехід на новий сегмент: обрізання файлу + 2 коміти метаданих.
+
+
+def _make_crc_tables():
+    """Таблиця CRC32 (поліном 0xEDB88320) як дві половини по 16 біт."""
+    lo_table = array('H', bytes(512))
+    hi_table = array('H', bytes(512))
+    for n in range(256):
+        lo, hi = n, 0
+        for _ in range(8):
+            carry = lo & 1
+            lo = (lo >> 1) | ((hi & 1) << 15)
+            hi >>= 1
+            if carry:
+                lo ^= 0x8320
+                hi ^= 0xEDB8
+        lo_table[n] = lo
+        hi_table[n] = hi
+    return lo_table, hi_table
+
+
+_CRC_LO, _CRC_HI = _make_crc_tables()
+
+
+class TripJournal:
+    """
+    Кільце сегментів зі станом двох лічильників TripCounter (PERS, TRIP).
+    Лічильники передаються об'єктами: читаються лише inj_hi, inj_lo, pulses.
+    """
+
+    def __init__(self, path_format, segments, segment_bytes, min_delta_inj_us=0, min_delta_pulses=0):
+        self.path_format = path_format
+        self.segments = max(2, segments)
+        # Розмір сегмента округлюється до цілої кількості записів (мінімум 2 записи).
+        self.segment_bytes = max(2, segment_bytes // RECORD_SIZE) * RECORD_SIZE
+        self.min_delta_inj_us = min_delta_inj_us
+        self.min_delta_pulses = min_delta_pulses
+        self.seq = 0               # Номер останнього запису = загальна кількість записів.
+        self.segment = self.segments - 1 # Поточний сегмент (перший запис піде в сегмент 0).
+        self.size = self.segment_bytes   # Розмір поточного сегмента (байт).
+        self.records_written = 0   # Записів з моменту запуску.
+        self.records_skipped = 0   # Пропущених записів (зміни менші за поріг) з моменту запуску.
+        self.rollovers = 0         # Переходів на наступний сегмент за весь час (оцінка з seq).
+        self.last = (0, 0, 0, 0, 0, 0) # Останні записані лічильники (PERS, потім TRIP).
+        self._buf = bytearray(RECORD_SIZE) # Буфер запису без виділення пам'яті на кожне збереження.
+        self._emergency = array('I', bytes(24)) # Лічильники останнього аварійного запису (як self.last).
+        self._f = None
+
+    def load(self):
+        """
+        Відновлює запис з найбільшим номером серед усіх сегментів. Повертає
+        кортеж (pers_inj_hi, pers_inj_lo, pers_pulses, trip_inj_hi,
+        trip_inj_lo, trip_pulses) або None, якщо жодного цілого запису немає.
+        Якщо поточний сегмент закінчується обірваним або пошкодженим записом,
+        наступні записи йдуть у новий сегмент.
+        """
+        best = None
+        clean = True
+        for segment in range(self.segments):
+            last, valid, total = self._scan(self.path_format.format(segment), self._buf, self._unpack)
+            if last is not None and (best is None or last[0] > best[0]):
+                best = last
+                self.segment = segment
+                self.size = total
+                clean = valid == total
+        if best is None:
+            return None
+        self.seq = best[0]
+        self.rollovers = self.seq * RECORD_SIZE // self.segment_bytes
+        self.last = best[1:]
+        if not clean:
+            print(f"⚠️ Trip journal: damaged tail in segment {self.segment}")
+            self.size = self.segment_bytes # Не дописуємо після пошкодженого хвоста.
+        return self.last
+
+    def load_legacy(self):
+        """
+        Зчитує останній запис попереднього формату (float32) з тих самих
+        сегментів. Повертає (pers_fuel_L, pers_km, trip_fuel_L, trip_km) або None.
+        Сегменти, куди вже пише новий формат, цих записів не містять.
+        """
+        best = None
+        buf = bytearray(_LEGACY_RECORD_SIZE)
+        for segment in range(self.segments):
+            last = self._scan(self.path_format.format(segment), buf, self._unpack_legacy)[0]
+            if last is not None and (best is None or last[0] > best[0]):
+                best = last
+        return None if best is None else best[1:]
+
+    def append(self, pers, trip, force=False):
+        """
+        Дописує новий запис (переходить на наступний сегмент, якщо поточний
+        повний). Повертає False, якщо запис пропущено, бо зміни менші за поріг.
+        """
+        if not force and not self.changed(pers, trip):
+            self.records_skipped += 1
+            return False
+        try:
+            self.prepare()
+            self._write(pers, trip)
+            self.prepare() # Місце та файл для наступного (можливо, аварійного) запису.
+        except OSError:
+            self.close() # Наступне збереження відкриє файл заново.
+            raise
+        self.last = (pers.inj_hi, pers.inj_lo, pers.pulses, trip.inj_hi, trip.inj_lo, trip.pulses)
+        return True
+
+    def emergency_append(self, pers, trip):
+        """
+        Аварійний запис без виділення пам'яті (падіння живлення). Потребує
+        підготовленого prepare() файлу; якщо файл не відкритий - повертає False.
+        self.last не оновлюється (це виділило б кортеж), тому наступне звичайне
+        збереження може повторити ці ж значення; записані лічильники
+        зберігаються в self._emergency для emergency_unsaved().
+        """
+        if self._f is None or self.size + RECORD_SIZE > self.segment_bytes:
+            return False
+        try:
+            self._write(pers, trip)
+        except OSError:
+            return False
+        e = self._emergency
+        e[0] = pers.inj_hi
+        e[1] = pers.inj_lo
+        e[2] = pers.pulses
+        e[3] = trip.inj_hi
+        e[4] = trip.inj_lo
+        e[5] = trip.pulses
+        return True
+
+    def emergency_unsaved(self, pers, trip):
+        """True, якщо лічильники відрізняються від останнього аварійного запису (без виділення пам'яті)."""
+        e = self._emergency
+        return (pers.inj_lo != e[1] or pers.pulses != e[2] or pers.inj_hi != e[0] or
+                trip.inj_lo != e[4] or trip.pulses != e[5] or trip.inj_hi != e[3])
+
+    def prepare(self):
+        """Відкриває поточний сегмент (або переходить на наступний, якщо він повний)."""
+        if self.size + RECORD_SIZE > self.segment_bytes:
+            self._rollover()
+        elif self._f is None:
+            self._f = open(self.path_format.format(self.segment), 'ab')
+
+    def _write(self, pers, trip):
+        self._pack(pers, trip)
+        self._f.write(self._buf)
+        self._f.flush() # Фіксуємо запис у файловій системі.
+        self.size += RECORD_SIZE
+        self.records_written += 1
+
+    def changed(self, pers, trip):
+        """True, якщо хоча б один лічильник відрізняється від записаного не менше ніж на поріг."""
+        last = self.last
+        return (self._inj_changed(pers, last[0], last[1]) or
+                self._inj_changed(trip, last[3], last[4]) or
+                abs(pers.pulses - last[2]) >= self.min_delta_pulses or
+                abs(trip.pulses - last[5]) >= self.min_delta_pulses)
+
+    def unsaved(self, pers, trip):
+        """True, якщо лічильники відрізняються від записаних (хоч на одиницю)."""
+        last = self.last
+        return (pers.inj_lo != last[1] or pers.pulses != last[2] or pers.inj_hi != last[0] or
+                trip.inj_lo != last[4] or trip.pulses != last[5] or trip.inj_hi != last[3])
+
+    def _inj_changed(self, counter, last_hi, last_lo):
+        dhi = counter.inj_hi - last_hi
+        if dhi > 1 or dhi < -1:
+            return True # Різниця від 2^24 мкс - понад будь-який розумний поріг (і поза малими цілими).
+        return abs((dhi << _CARRY_SHIFT) + counter.inj_lo - last_lo) >= self.min_delta_inj_us
+
+    def close(self):
+        if self._f is not None:
+            try: self._f.close()
+            except OSError: pass
+            self._f = None
+
+    def estimated_erases(self):
+        """Оцінка кількості стирань блоків Flash, спричинених журналом за весь час."""
+        prog_bytes = self.seq * APPEND_PROG_BYTES + self.rollovers * ROLLOVER_PROG_BYTES
+        return prog_bytes // FLASH_BLOCK_SIZE
+
+    def remaining_endurance(self):
+        """Оцінка залишкового ресурсу Flash (частка 0.0..1.0) за витратами журналу."""
+        return max(0.0, 1.0 - self.estimated_erases() / (FLASH_FS_BLOCKS * FLASH_ENDURANCE_CYCLES))
+
+    def _rollover(self):
+        """Починає найстаріший сегмент кільця з початку ('wb' обрізає файл)."""
+        self.close()
+        self.segment = (self.segment + 1) % self.segments
+        self._f = open(self.path_format.format(self.segment), 'wb')
+        self.size = 0
+        self.rollovers += 1
+
+    def _scan(self, path, buf, unpack):
+        """
+        Повертає (останній коректний запис, байтів у коректних записах, розмір файлу).
+        buf - буфер розміру запису формату, unpack() розбирає його.
+        """
+        size = len(buf)
+        last = None
+        valid = 0
+        total = 0
+        try:
+            with open(path, 'rb') as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    total += n
+                    if n < size:
+                        break # Обірваний запис у кінці файлу.
+                    values = unpack(buf)
+                    if values is None:
+                        continue # Пошкоджений запис - пропускаємо.
+                    valid += size
+                    last = values # Записи лише дописуються: останній коректний - найновіший.
+        except OSError:
+            pass # Сегмента ще немає.
+        return last, valid, total
+
+    def _pack(self, pers, trip):
+        self.seq = (self.seq + 1) & 0x3FFFFFFF # 30 біт: мале ціле MicroPython.
+        struct.pack_into(_FORMAT, self._buf, 0, _MAGIC, self.seq, pers.inj_hi, pers.inj_lo, pers.pulses,
+                         trip.inj_hi, trip.inj_lo, trip.pulses)
+        self._crc(self._buf, _PAYLOAD_SIZE, True)
+
+    @staticmethod
+    def _crc(buf, payload_size, store):
+        """
+        CRC32 перших payload_size байтів buf. store=True - записує CRC у
+        кінець запису, інакше повертає True, якщо CRC у записі збігається.
+        """
+        lo = 0xFFFF
+        hi = 0xFFFF
+        for i in range(payload_size):
+            n = (lo ^ buf[i]) & 0xFF
+            lo = ((lo >> 8) | ((hi & 0xFF) << 8)) ^ _CRC_LO[n]
+            hi = (hi >> 8) ^ _CRC_HI[n]
+        lo ^= 0xFFFF
+        hi ^= 0xFFFF
+        if store:
+            struct.pack_into('<HH', buf, payload_size, lo, hi)
+            return True
+        return struct.unpack_from('<HH', buf, payload_size) == (lo, hi)
+
+    def _unpack(self, buf):
+        """Повертає (seq, 6 лічильників) для запису в buf або None, якщо запис пошкоджений."""
+        values = struct.unpack_from(_FORMAT, buf, 0)
+        if values[0] != _MAGIC or not self._crc(buf, _PAYLOAD_SIZE, False):
+            return None
+        return values[1:]
+
+    def _unpack_legacy(self, buf):
+        """Повертає (seq, 4 значення float32) для запису попереднього формату або None."""
+        values = struct.unpack_from(_LEGACY_FORMAT, buf, 0)
+        if values[0] != _LEGACY_MAGIC or not self._crc(buf, _LEGACY_PAYLOAD_SIZE, False):
+            return None
+        return values[1:]
@@ -0,0 +1,195 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: TripLogger.py
+# Опис: Журнал поїздки високої роздільності для аналізу витрати на ПК
+#       (host/decode_trip_log.py -> CSV / масиви NumPy).
+#       Кожен розрахунковий інтервал calculate_and_display() дає один запис
+#       фіксованого розміру (struct.pack_into у заздалегідь виділений буфер):
+#         I t_ms | H rpm | H errors | f speed_kmh | f l_per_h | f inj_us | f fuel_pct | f battery_v
+#       t_ms - time.ticks_ms() (період 2^30 мс), errors - бітова маска
+#       ERROR_KEYS (біт i = ERROR_KEYS[i]). Дробові значення пишуться як
+#       float32 без масштабування, тому log() не створює нових float-об'єктів.
+#
+#       Записи накопичуються в RAM блоками по block_bytes (два буфери по
+#       черзі): log() лише пакує запис, а повний блок записує на Flash
+#       service() з persistence_task() - одним послідовним записом, не з
+#       циклу дисплея. Заголовок блоку (12 байт):
+#         I magic | I seq | H session | H count
+#       seq - номер блоку за весь час (пропуски = відкинуті блоки), session -
+#       номер запуску прошивки (ticks_ms починається спочатку).
+#       Файли path_format.format(0..files-1) розміром до file_bytes
+#       використовуються по колу, як сегменти TripJournal: коли файл
+#       заповнено, найстаріший починається з початку.
+#
+#       Бюджет Flash: не більше budget_kb_per_hour КБ на годину роботи (відро
+#       токенів у блоках, до burst_blocks блоків наперед). Блок понад бюджет
+#       або блок, який не встигли записати до заповнення наступного,
+#       відкидається з обліком (blocks_dropped / records_dropped).
+#       У сталому режимі log() та service() не виділяють пам'яті.
+# ==============================================================================
+
+import struct
+import time
+from micropython import const
+
+_MAGIC = const(0x4C505254)  # "TRPL" у little-endian.
+HEADER_FORMAT = '<IIHH'
+HEADER_SIZE = const(12)
+RECORD_FORMAT = '<IHHfffff'
+RECORD_SIZE = const(28)
+TICKS_PERIOD_MS = const(0x40000000) # Період time.ticks_ms() MicroPython.
+
+# Порядок бітів маски помилок (ключі Icons.ERROR_ICONS).
+ERROR_KEYS = ('LOW_FUEL', '0_3_AND_1_8_PRESSURE_OIL', 'OVERHEAT_AND_LOW_COOLANT', 'BRAKE_FLUID', 'WARNING')
+
+
+class TripLogger:
+    """Запис інтервальних вибірок блоками у кільце файлів з обмеженням запису на Flash."""
+
+    def __init__(self, path_format, files, file_bytes, block_bytes, budget_kb_per_hour, burst_blocks=4):
+        self.path_format = path_format
+        self.files = max(2, files)
+        self.block_bytes = max(HEADER_SIZE + RECORD_SIZE, block_bytes)
+        self.capacity = (self.block_bytes - HEADER_SIZE) // RECORD_SIZE # Записів у блоці.
+        # Розмір файлу округлюється до цілої кількості блоків (мінімум один блок).
+        self.file_bytes = max(1, file_bytes // self.block_bytes) * self.block_bytes
+        self.seq = 0               # Номер останнього блоку за весь час.
+        self.session = 0           # Номер поточного запуску (визначає load()).
+        self.file = self.files - 1 # Поточний файл (перший блок піде у файл 0).
+        self.size = self.file_bytes # Розмір поточного файлу (байт).
+        self.blocks_written = 0    # З моменту запуску.
+        self.blocks_dropped = 0    # Блоків, відкинутих через бюджет або незаписаний попередній блок.
+        self.records_dropped = 0   # Записів у відкинутих блоках.
+        # Бюджет: один блок кожні _ms_per_block мс, не більше _burst блоків наперед.
+        self._ms_per_block = (3600000 // max(1, budget_kb_per_hour)) * self.block_bytes // 1024
+        self._burst = max(1, burst_blocks)
+        self._credit = self._burst
+        self._credit_ms = time.ticks_ms()
+        self._bufs = (bytearray(self.block_bytes), bytearray(self.block_bytes))
+        self._active = 0           # Буфер, що заповнюється log().
+        self._count = 0            # Записів в активному буфері.
+        self._ready = -1           # Буфер, що очікує запису service() (-1 - немає).
+        self._f = None
+
+    def load(self):
+        """
+        Знаходить останній записаний блок серед файлів: запис продовжиться після
+        нього, seq продовжує нумерацію, session = попередній запуск + 1.
+        Файл з обірваним блоком у кінці не дописується - наступний блок піде в
+        новий файл.
+        """
+        hdr = bytearray(HEADER_SIZE)
+        best_seq = -1
+        session = 0
+        for index in range(self.files):
+            try:
+                with open(self.path_format.format(index), 'rb') as f:
+                    total = f.seek(0, 2)
+                    blocks = total // self.block_bytes
+                    if not blocks:
+                        continue
+                    f.seek((blocks - 1) * self.block_bytes)
+                    if f.readinto(hdr) != HEADER_SIZE:
+                        continue
+            except OSError:
+                continue # Файлу ще немає.
+            magic, seq, sess, count = struct.unpack_from(HEADER_FORMAT, hdr, 0)
+            if magic != _MAGIC or count > self.capacity:
+                continue
+            if seq > best_seq:
+                best_seq = seq
+                session = sess
+                self.file = index
+                self.size = total if total % self.block_bytes == 0 else self.file_bytes
+        if best_seq >= 0:
+            self.seq = best_seq
+            self.session = (session + 1) & 0xFFFF
+        return best_seq >= 0
+
+    def log(self, t_ms, rpm, errors, speed_kmh, l_per_h, inj_us, fuel_pct, battery_v):
+        """Додає запис в активний буфер (без звернення до Flash та без виділення пам'яті)."""
+        if self._count >= self.capacity:
+            self._seal()
+        struct.pack_into(RECORD_FORMAT, self._bufs[self._active], HEADER_SIZE + self._count * RECORD_SIZE,
+                         t_ms, rpm, errors, speed_kmh, l_per_h, inj_us, fuel_pct, battery_v)
+        self._count += 1
+
+    def flush(self):
+        """Передає неповний блок на запис (зупинка двигуна): наступний service() його запише."""
+        if self._count and self._ready < 0:
+            self._seal()
+
+    def service(self):
+        """
+        Записує готовий блок у поточний файл, якщо дозволяє бюджет.
+        Повертає True, якщо блок записано. Викликається з persistence_task().
+        """
+        if self._ready < 0:
+            return False
+        buf = self._bufs[self._ready]
+        if not self._take_credit():
+            self._drop(buf)
+            return False
+        try:
+            if self.size + self.block_bytes > self.file_bytes:
+                self._rollover()
+            elif self._f is None:
+                self._f = open(self.path_format.format(self.file), 'ab')
+            self._f.write(buf)
+            self._f.flush()
+        except OSError:
+            self.close() # Наступний блок відкриє файл заново.
+            self._drop(buf)
+            raise
+        self.size += self.block_bytes
+        self.blocks_written += 1
+        self._ready = -1
+        return True
+
+    def close(self):
+        if self._f is not None:
+            try: self._f.close()
+            except OSError: pass
+            self._f = None
+
+    def report(self):
+        """Рядок статистики запису."""
+        return (f"{self.blocks_written} blocks written ({self.blocks_written * self.block_bytes // 1024} KB), "
+                f"{self.blocks_dropped} dropped ({self.records_dropped} records)")
+
+    def _seal(self):
+        """Завершує активний блок (заголовок) і перемикає запис на інший буфер."""
+        if self._ready >= 0:
+            self._drop(self._bufs[self._ready]) # Попередній блок так і не записано.
+        self.seq = (self.seq + 1) & 0x3FFFFFFF # 30 біт: мале ціле MicroPython.
+        struct.pack_into(HEADER_FORMAT, self._bufs[self._active], 0, _MAGIC, self.seq, self.session, self._count)
+        self._ready = self._active
+        self._active ^= 1
+        self._count = 0
+
+    def _drop(self, buf):
+        self.blocks_dropped += 1
+        self.records_dropped += buf[10] | (buf[11] << 8) # count із заголовка блоку.
+        self._ready = -1
+
+    def _take_credit(self):
+        """Відро токенів: True, якщо бюджет дозволяє записати ще один блок."""
+        now = time.ticks_ms()
+        earned = time.ticks_diff(now, self._credit_ms) // self._ms_per_block
+        if earned:
+            self._credit += earned
+            self._credit_ms = time.ticks_add(self._credit_ms, earned * self._ms_per_block)
+            if self._credit >= self._burst:
+                self._credit = self._burst
+                self._credit_ms = now
+        if self._credit <= 0:
+            return False
+        self._credit -= 1
+        return True
+
+    def _rollover(self):
+        """Починає найстаріший файл кільця з початку ('wb' обрізає файл)."""
+        self.close()
+        self.file = (self.file + 1) % self.files
+        self._f = open(self.path_format.format(self.file), 'wb')
+        self.size = 0
@@ -0,0 +1,102 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: VssCounter.py
+# Опис: Підрахунок імпульсів датчика швидкості (VSS). Два взаємозамінні
+#       лічильники з однаковим інтерфейсом:
+#       - IrqCounter: переривання GPIO на кожен імпульс з програмним
+#         дебаунсом (як раніше в main.py);
+#       - PwmCounter: апаратний лічильник фронтів зрізу PWM RP2040 (вхід B),
+#         жодного Python-коду на імпульс.
+#
+#       Інтерфейс (обидва класи):
+#         start()        - запуск підрахунку;
+#         stop()         - зупинка;
+#         take() -> n    - кількість імпульсів з попереднього виклику
+#                          (зчитування та скидання за одну операцію).
+# ==============================================================================
+
+import time
+from machine import Pin, disable_irq, enable_irq, mem32
+from micropython import const
+
+# Регістри RP2040 (RP2040 datasheet, розділи 2.19 IO_BANK0 та 4.5 PWM).
+_IO_BANK0_BASE = const(0x40014000)
+_PWM_BASE = const(0x40050000)
+_PWM_SLICE_STRIDE = const(0x14)
+_PWM_CSR = const(0x00)
+_PWM_DIV = const(0x04)
+_PWM_CTR = const(0x08)
+_PWM_TOP = const(0x10)
+_FUNCSEL_PWM = const(4)
+_DIVMODE_RISE = const(2)    # Лічильник збільшується на кожен RISING фронт входу B.
+_DIVMODE_FALL = const(3)    # Лічильник збільшується на кожен FALLING фронт входу B.
+
+
+class IrqCounter:
+    """
+    Лічильник на перериваннях GPIO (FALLING). Кожен імпульс - виклик
+    обробника з дебаунсом: імпульси, ближчі за debounce_us до попереднього,
+    ігноруються як шум.
+    """
+
+    def __init__(self, pin, debounce_us):
+        self.pin = pin
+        self.debounce_us = debounce_us
+        self._count = 0
+        self._last_us = 0
+
+    def start(self):
+        self.pin.irq(trigger=Pin.IRQ_FALLING, handler=self._irq)
+
+    def stop(self):
+        self.pin.irq(handler=None)
+
+    def _irq(self, pin):
+        now = time.ticks_us()
+        if time.ticks_diff(now, self._last_us) > self.debounce_us:
+            self._count += 1
+            self._last_us = now
+
+    def take(self):
+        state = disable_irq() # 🛡️ Атомарне зчитування та скидання лічильника.
+        n = self._count
+        self._count = 0
+        enable_irq(state)
+        return n
+
+
+class PwmCounter:
+    """
+    Лічильник на зрізі PWM у режимі підрахунку фронтів входу B.
+    Вхід B є лише на непарних GPIO (зріз = (GPIO >> 1) & 7). 16-бітний
+    лічильник переповнюється через 65536 імпульсів (~15 км), тому take()
+    потрібно викликати частіше (кожну секунду - з великим запасом).
+    Апаратного дебаунсу немає: рахується кожен фронт.
+    """
+
+    def __init__(self, pin_id, falling=True):
+        if not pin_id & 1:
+            raise ValueError("PWM edge counting needs an odd GPIO (channel B)")
+        self.pin_id = pin_id
+        self.divmode = _DIVMODE_FALL if falling else _DIVMODE_RISE
+        self._slice_base = _PWM_BASE + ((pin_id >> 1) & 7) * _PWM_SLICE_STRIDE
+        self._last = 0
+
+    def start(self):
+        base = self._slice_base
+        mem32[base + _PWM_CSR] = 0                  # Зупиняємо зріз на час налаштування.
+        mem32[base + _PWM_DIV] = 1 << 4             # Дільник 1.0: кожен фронт = +1.
+        mem32[base + _PWM_TOP] = 0xFFFF
+        mem32[base + _PWM_CTR] = 0
+        self._last = 0
+        mem32[_IO_BANK0_BASE + 4 + 8 * self.pin_id] = _FUNCSEL_PWM # Пін -> функція PWM (підтяжка зберігається).
+        mem32[base + _PWM_CSR] = (self.divmode << 4) | 1           # Режим підрахунку фронтів + EN.
+
+    def stop(self):
+        mem32[self._slice_base + _PWM_CSR] = 0
+
+    def take(self):
+        ctr = mem32[self._slice_base + _PWM_CTR] & 0xFFFF
+        n = (ctr - self._last) & 0xFFFF
+        self._last = ctr
+        return n
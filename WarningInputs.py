@@ -0,0 +1,137 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: WarningInputs.py
+# Опис: Входи датчиків-вимикачів (гальмівна рідина, перегрів/охолоджувальна
+#       рідина, тиск мастила) на перериваннях GPIO замість опитування.
+#       Обробник IRQ (обидва фронти) лише записує номер входу, рівень і
+#       ticks_ms у кільцеву чергу подій і викликає notify (напр.
+#       ThreadSafeFlag.set), без виділення пам'яті. service() у головному
+#       циклі розбирає чергу та застосовує дебаунс за часом: новий рівень
+#       приймається, якщо протримався debounce_ms. Імпульс, коротший за
+#       debounce_ms (рівень повернувся до прийнятого), - завада: лічильник
+#       glitches[i] входу.
+#
+#       input(i) повертає об'єкт з value() - прийнятий (відфільтрований)
+#       рівень входу i, тож його можна підставити замість machine.Pin у
+#       таблицю правил ErrorRules.
+# ==============================================================================
+
+import time
+from array import array
+from machine import Pin
+
+
+class _Input:
+    """Відфільтрований рівень одного входу з інтерфейсом Pin.value()."""
+
+    def __init__(self, owner, index):
+        self._owner = owner
+        self._index = index
+
+    def value(self):
+        return self._owner.stable[self._index]
+
+
+class WarningInputs:
+
+    def __init__(self, pins, debounce_ms, queue_size, notify=None):
+        # queue_size - степінь двійки (індекс обгортається маскою).
+        n = len(pins)
+        self.pins = pins
+        self.debounce_ms = debounce_ms
+        self._notify = notify
+        self.stable = bytearray(n)       # Прийнятий рівень кожного входу.
+        self._pending = bytearray(n)     # Останній рівень з черги (ще може бути завадою).
+        self._deadline = array('i', [0] * n) # ticks_ms, коли _pending стане прийнятим.
+        self._waiting = bytearray(n)     # 1 - очікуємо закінчення дебаунсу.
+        self.glitches = array('I', [0] * n)
+        self.changes = 0                 # Прийнятих змін рівня за весь час.
+        self._mask = queue_size - 1
+        self._index = bytearray(queue_size)
+        self._level = bytearray(queue_size)
+        self._ts = array('i', [0] * queue_size)
+        self._head = 0                   # Індекс запису (змінює лише IRQ).
+        self._tail = 0                   # Індекс читання (змінює лише service()).
+        self.overflow = 0
+        self._resync = False
+        self._handlers = [self._make_handler(i) for i in range(n)] # Створюються один раз.
+        self.inputs = tuple(_Input(self, i) for i in range(n))
+
+    def _make_handler(self, i):
+        return lambda pin: self._irq(i, pin)
+
+    def input(self, i):
+        return self.inputs[i]
+
+    def start(self):
+        for i, pin in enumerate(self.pins):
+            level = pin.value()
+            self.stable[i] = level
+            self._pending[i] = level
+            self._waiting[i] = 0
+            pin.irq(trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING, handler=self._handlers[i], hard=True)
+
+    def stop(self):
+        for pin in self.pins:
+            pin.irq(handler=None)
+
+    def _irq(self, i, pin):
+        head = self._head
+        next_head = (head + 1) & self._mask
+        if next_head == self._tail:
+            self.overflow += 1
+            self._resync = True # Черга заповнена: service() перечитає рівні пінів.
+        else:
+            self._index[head] = i
+            self._level[head] = pin.value()
+            self._ts[head] = time.ticks_ms()
+            self._head = next_head
+        if self._notify is not None:
+            self._notify()
+
+    def _edge(self, i, level, t):
+        if level == self._pending[i]:
+            return
+        self._pending[i] = level
+        if level == self.stable[i]:
+            if self._waiting[i]:
+                self.glitches[i] += 1 # Повернулись до прийнятого рівня раніше за debounce_ms.
+            self._waiting[i] = 0
+        else:
+            self._deadline[i] = time.ticks_add(t, self.debounce_ms)
+            self._waiting[i] = 1
+
+    def service(self, now):
+        """
+        Розбирає чергу подій і приймає рівні, що протрималися debounce_ms.
+        Повертає мс до найближчого закінчення дебаунсу або -1, якщо нічого не очікується.
+        Прийняті зміни додаються до changes.
+        """
+        head = self._head # Одне зчитування: нові події заберемо наступного разу.
+        tail = self._tail
+        mask = self._mask
+        while tail != head:
+            self._edge(self._index[tail], self._level[tail], self._ts[tail])
+            tail = (tail + 1) & mask
+        self._tail = tail
+        if self._resync:
+            self._resync = False
+            for i, pin in enumerate(self.pins):
+                self._edge(i, pin.value(), now)
+
+        wait_ms = -1
+        for i in range(len(self.pins)):
+            if not self._waiting[i]:
+                continue
+            left = time.ticks_diff(self._deadline[i], now)
+            if left <= 0:
+                self.stable[i] = self._pending[i]
+                self._waiting[i] = 0
+                self.changes += 1
+            elif wait_ms < 0 or left < wait_ms:
+                wait_ms = left
+        return wait_ms
+
+    def report(self):
+        """Рядок для консолі: прийняті зміни, завади по входах, переповнення черги."""
+        return f"{self.changes} changes, glitches {list(self.glitches)}, {self.overflow} overflow"
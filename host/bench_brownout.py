@@ -0,0 +1,162 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_brownout.py
+# Опис: Перевірка аварійного збереження при вимкненні запалювання.
+#       Прошивка їде 90 км/год у host/sim.py, потім напруга 12В падає за
+#       кривою (експонента з різною сталою часу або лінійний спад), форсунка
+#       замовкає. Коли напруга опускається нижче PICO_DEAD_V, Pico вважається
+#       вимкненим: симуляція зупиняється, і прошивка запускається заново з
+#       тими самими файлами. Втрата даних = TRIP/PERS у пам'яті в момент
+#       вимкнення мінус відновлені значення.
+#       Для кожної кривої порівнюються монітор увімкнений і вимкнений
+#       (BROWNOUT_THRESHOLD_V = 0). Перевіряються межі втрати:
+#       - з монітором: не більше одного оновлення розрахунків
+#         (UPDATE_INTERVAL_SEC) - страховка; перше оновлення після
+#         спрацювання також записується аварійно (один раз);
+#       - без монітора: пороги PERSISTENT_MIN_DELTA_* політики плюс одне
+#         оновлення (перевірка виконується після накопичення).
+#       Окремо - просідання: двигун на холостому ході, напруга падає нижче
+#       порогу і тримається між BROWNOUT_THRESHOLD_V та BROWNOUT_REARM_V
+#       SAG_HOLD_S секунд. Аварійних записів у журнал за спрацювання - не
+#       більше SAG_MAX_EMERGENCY_RECORDS (різниця з вимкненим монітором).
+# Запуск: python host/bench_brownout.py
+# ==============================================================================
+
+import math
+import os
+import shutil
+import sys
+import tempfile
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+
+import sim as simulator
+
+PICO_DEAD_V = 6.0       # Нижче цієї напруги 12В стабілізатор Pico вже не тримає 3.3В.
+SPEED_KMH = 90.0
+DRIVE_S = 40.35         # Їзда до вимкнення запалювання (не кратна інтервалам задач).
+STEP_US = 250           # Крок оновлення ADC під час спаду напруги.
+SAG_HOLD_S = 60         # Тривалість просідання між порогом і rearm.
+SAG_MAX_EMERGENCY_RECORDS = 2 # Запис при спрацюванні + один додатковий після кадру.
+
+# Криві спаду: назва -> V(t_s) після вимкнення запалювання.
+CURVES = {
+    'exp 15 ms': lambda t: 14.2 * math.exp(-t / 0.015),
+    'exp 50 ms': lambda t: 14.2 * math.exp(-t / 0.050),
+    'exp 200 ms': lambda t: 14.2 * math.exp(-t / 0.200),
+    'linear 40 ms': lambda t: max(0.0, 14.2 * (1 - t / 0.040)),
+    'sag 2 s': lambda t: max(0.0, 14.2 - 4.0 * t),
+}
+
+
+def run_case(curve, monitor):
+    workdir = tempfile.mkdtemp(prefix='brownout_')
+    try:
+        overrides = {} if monitor else {'BROWNOUT_THRESHOLD_V': 0.0}
+        sim = simulator.Simulator(workdir=workdir, settings=overrides, battery_voltage=14.2)
+        settings = sim.settings
+        key_off_s = DRIVE_S
+        sim.drive_engine(lambda t_s: (2500, 3000) if t_s < key_off_s else (0, 0))
+        sim.drive_vehicle(SPEED_KMH)
+        sim.run(DRIVE_S - 10 - sim.clock.now_s())
+        fuel_before_L = sim.fw.trip_fuel_consumed_L
+        sim.run(DRIVE_S - sim.clock.now_s())
+        # Приріст за одне оновлення розрахунків на усталеному режимі (для меж втрати).
+        update_fuel_L = (sim.fw.trip_fuel_consumed_L - fuel_before_L) / 10 * settings.UPDATE_INTERVAL_SEC
+        update_km = SPEED_KMH * settings.UPDATE_INTERVAL_SEC / 3600.0
+
+        # Спад напруги: ADC оновлюється кожні STEP_US до моменту вимкнення Pico.
+        t0 = sim.clock.now_us()
+        t = 0
+        while curve(t / 1e6) >= PICO_DEAD_V:
+            volts = curve(t / 1e6)
+            sim.clock.schedule(t0 + t, lambda v=volts: sim.set_battery_voltage(v))
+            t += STEP_US
+        dead_us = t0 + t
+        sim.run((dead_us - sim.clock.now_us()) / 1e6)
+
+        fw = sim.fw
+        in_ram = (fw.persistent_trip_fuel_L, fw.persistent_trip_distance_km,
+                  fw.trip_fuel_consumed_L, fw.trip_distance_travelled_km)
+        brownouts = fw.brownout_monitor.events
+        fw.trip_journal.close()
+
+        # Повторний запуск з тими самими файлами.
+        reboot = simulator.Simulator(workdir=workdir, settings=overrides, battery_voltage=14.2)
+        fw2 = reboot.fw
+        restored = (fw2.persistent_trip_fuel_L, fw2.persistent_trip_distance_km,
+                    fw2.trip_fuel_consumed_L, fw2.trip_distance_travelled_km)
+        return {
+            'hold_ms': (dead_us - t0) / 1000.0,
+            'brownouts': brownouts,
+            'loss_fuel_L': max(0.0, in_ram[0] - restored[0], in_ram[2] - restored[2]),
+            'loss_km': max(0.0, in_ram[1] - restored[1], in_ram[3] - restored[3]),
+            'update_fuel_L': update_fuel_L,
+            'update_km': update_km,
+            'settings': settings,
+        }
+    finally:
+        shutil.rmtree(workdir)
+
+
+def sag_records(monitor):
+    """Записів у журнал за SAG_HOLD_S просідання між порогом і rearm."""
+    workdir = tempfile.mkdtemp(prefix='brownout_')
+    try:
+        overrides = {} if monitor else {'BROWNOUT_THRESHOLD_V': 0.0}
+        sim = simulator.Simulator(workdir=workdir, settings=overrides, battery_voltage=14.2)
+        settings = sim.settings
+        sim.drive_engine((900, 2500))
+        sim.run(10.0)
+        journal = sim.fw.trip_journal
+        before = journal.records_written
+        sim.set_battery_voltage(settings.BROWNOUT_THRESHOLD_V - 1.0)
+        sim.run(0.05)
+        sim.set_battery_voltage((settings.BROWNOUT_THRESHOLD_V + settings.BROWNOUT_REARM_V) / 2)
+        sim.run(SAG_HOLD_S)
+        records = journal.records_written - before
+        events = sim.fw.brownout_monitor.events
+        journal.close()
+        return records, events
+    finally:
+        shutil.rmtree(workdir)
+
+
+def main():
+    print("{:<13} {:>8} {:>8} {:>10} {:>14} {:>12}".format(
+        'curve', 'hold ms', 'monitor', 'brownouts', 'lost fuel, mL', 'lost dist, m'))
+    failed = False
+    for name, curve in CURVES.items():
+        for monitor in (True, False):
+            r = run_case(curve, monitor)
+            s = r['settings']
+            print("{:<13} {:>8.1f} {:>8} {:>10} {:>14.2f} {:>12.1f}".format(
+                name, r['hold_ms'], 'on' if monitor else 'off', r['brownouts'],
+                r['loss_fuel_L'] * 1000, r['loss_km'] * 1000))
+            # Невелика допустима похибка: значення в журналі зберігаються як float32.
+            if monitor:
+                bound_fuel_L, bound_km = r['update_fuel_L'], r['update_km']
+            else:
+                bound_fuel_L = s.PERSISTENT_MIN_DELTA_FUEL_L + r['update_fuel_L']
+                bound_km = s.PERSISTENT_MIN_DELTA_KM + r['update_km']
+            ok = r['loss_fuel_L'] <= bound_fuel_L * 1.001 and r['loss_km'] <= bound_km * 1.001
+            if monitor and r['brownouts'] != 1:
+                ok = False
+            if not ok:
+                print("  FAIL: data loss above bound")
+                failed = True
+
+    records_on, events = sag_records(True)
+    records_off = sag_records(False)[0]
+    emergency = records_on - records_off
+    print("sag {} s between trip and rearm: {} brownout(s), {} journal records ({} without monitor) -> {} emergency".format(
+        SAG_HOLD_S, events, records_on, records_off, emergency))
+    if events != 1 or emergency > SAG_MAX_EMERGENCY_RECORDS:
+        print("  FAIL: emergency writes must not repeat while the supply stays low")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_compositor.py
+# Опис: Бенчмарк на ПК: трафік I2C та час передачі кадру для повного
+#       oled.show() проти часткового оновлення через Compositor на типовій
+#       послідовності кадрів головного екрану (змінюються лише цифри L/H,
+#       зрідка TRIP) з перемиканням на іконку помилки.
+#       Час на шині оцінюється для 400 кГц (9 біт на байт з ACK).
+# Запуск: python host/bench_compositor.py
+# ==============================================================================
+
+import os
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import ticks
+ticks.install()
+
+import sh1107
+import Settings
+import Icons
+import GlyphAtlas
+import Compositor
+
+Icons.load()
+
+FRAMES = 60
+
+
+def wire_ms(nbytes):
+    return nbytes * 9 * 1000.0 / Settings.I2C_FREQ
+
+
+def draw_frame(oled, atlas, n):
+    """Кадр n: головний екран; кожен 20-й кадр - іконка помилки."""
+    oled.fill(0)
+    if n % 20 == 19:
+        fd = Icons.ERROR_ICONS['WARNING']
+        Icons.draw(oled, fd, fd['icon_pos'][0], fd['icon_pos'][1])
+        return
+    value = "{: >4.2f}".format(0.8 + (n % 7) * 0.11)
+    trip = "{:>4.1f}L  {:>3}KM".format(12.3 + n // 10 * 0.1, 456)
+    x = 14
+    for ch in value:
+        x = atlas.draw(oled, ch, x, 8, 3, 3)
+    x = 50
+    for ch in "L/H":
+        x = atlas.draw(oled, ch, x, 50, 1, 2)
+    x = 9
+    for ch in trip:
+        x = atlas.draw(oled, ch, x, 74, 1, 2)
+    x = 9
+    for ch in " 7.9 L/100KM":
+        x = atlas.draw(oled, ch, x, 96, 1, 2)
+
+
+def run(partial):
+    oled = sh1107.SH1107_I2C(128, 128, None, address=Settings.OLED_ADDR_HEX)
+    atlas = GlyphAtlas.GlyphAtlas(Settings.GLYPH_ATLAS_BUDGET_BYTES)
+    comp = Compositor.Compositor(oled) if partial else None
+    total_bytes = 0
+    total_cpu = 0.0
+    for n in range(FRAMES):
+        draw_frame(oled, atlas, n)
+        before = oled.i2c_bytes
+        t0 = time.perf_counter()
+        if comp is not None:
+            comp.show()
+        else:
+            oled.show()
+        total_cpu += time.perf_counter() - t0
+        total_bytes += oled.i2c_bytes - before
+        assert oled.gddram == oled.displaybuf, "panel content differs from framebuffer"
+    per_frame = total_bytes / FRAMES
+    print("  {:<8} {:>7.0f} B/frame  bus {:>6.2f} ms/frame  host cpu {:>6.3f} ms/frame".format(
+        "partial" if partial else "full", per_frame, wire_ms(per_frame), total_cpu * 1000 / FRAMES))
+    if comp is not None:
+        print("  last: " + comp.report())
+    return per_frame
+
+
+def main():
+    print("I2C @ {} Hz, {} frames".format(Settings.I2C_FREQ, FRAMES))
+    full = run(False)
+    part = run(True)
+    print("  I2C traffic reduced x{:.1f}".format(full / part))
+
+
+if __name__ == "__main__":
+    main()
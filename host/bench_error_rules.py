@@ -0,0 +1,207 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_error_rules.py
+# Опис: Бенчмарк і перевірка на ПК таблиці правил попереджень (ErrorRules).
+#       Попередня перевірка помилок (умови в коді check_errors(), список
+#       іконок, критичність і порівняння за 'text') проти
+#       ErrorRules.evaluate() з маскою, критичністю та порівнянням цілих
+#       чисел. На випадкових станах пінів, RPM, стабільності та часу від
+#       запуску двигуна обидва способи мають давати ті самі помилки (множину
+#       ключів) та ту саму критичність. Час - на кадр: перевірка датчиків,
+#       помилки до показу, критичність активних і нових, порівняння з
+#       активними та чергою, маска журналу поїздки (як у calculate_and_display).
+#       Таблиця правил - така сама, як error_rules у main.py.
+# Запуск: python host/bench_error_rules.py
+# ==============================================================================
+
+import os
+import random
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import ErrorRules
+import Icons
+import Settings
+import TripLogger
+
+CASES = 20000
+
+
+class FakePin:
+    def __init__(self):
+        self.level = 1
+
+    def value(self):
+        return self.level
+
+
+BRAKE, OVERHEAT, OIL_0_3, OIL_1_8 = FakePin(), FakePin(), FakePin(), FakePin()
+PINS = (BRAKE, OVERHEAT, OIL_0_3, OIL_1_8)
+
+RULES = ErrorRules.ErrorRules(TripLogger.ERROR_KEYS, (
+    (BRAKE, 0, 0, False, -1, 'BRAKE_FLUID', ErrorRules.SEVERITY_CRITICAL),
+    (OVERHEAT, 0, 0, False, -1, 'OVERHEAT_AND_LOW_COOLANT', ErrorRules.SEVERITY_CRITICAL),
+    (OIL_1_8, 0, Settings.MIN_RPM_FOR_HIGH_PRESSURE_CHECK, False, -1,
+     '0_3_AND_1_8_PRESSURE_OIL', ErrorRules.SEVERITY_CRITICAL),
+    (OIL_0_3, 0, 0, True, Settings.OIL_CHECK_DELAY_MS,
+     '0_3_AND_1_8_PRESSURE_OIL', ErrorRules.SEVERITY_CRITICAL),
+    (None, 0, 0, False, -1, 'LOW_FUEL', ErrorRules.SEVERITY_NOTICE),
+))
+LOW_FUEL_BIT = RULES.bit('LOW_FUEL')
+
+# --- Попередня реалізація (тексти помилок) ---
+E = Icons.ERROR_ICONS
+SOUND_TEXTS = [E['0_3_AND_1_8_PRESSURE_OIL']['text'], E['OVERHEAT_AND_LOW_COOLANT']['text'],
+               E['BRAKE_FLUID']['text'], E['0_3_AND_1_8_PRESSURE_OIL']['text']]
+NO_ERRORS = [E['NONE']]
+
+
+def legacy_check(rpm, stable, run_ms, low_fuel):
+    found = []
+    if BRAKE.value() == 0:
+        found.append(E['BRAKE_FLUID'])
+    if OVERHEAT.value() == 0:
+        found.append(E['OVERHEAT_AND_LOW_COOLANT'])
+    if rpm > Settings.MIN_RPM_FOR_HIGH_PRESSURE_CHECK:
+        if OIL_1_8.value() == 0:
+            found.append(E['0_3_AND_1_8_PRESSURE_OIL'])
+    if OIL_0_3.value() == 0:
+        if stable and run_ms >= 0:
+            if run_ms > Settings.OIL_CHECK_DELAY_MS:
+                found.append(E['0_3_AND_1_8_PRESSURE_OIL'])
+    if low_fuel:
+        found.append(E['LOW_FUEL'])
+    return found or NO_ERRORS
+
+
+def legacy_severity(errors):
+    if not errors or errors == NO_ERRORS:
+        return 0
+    for err in errors:
+        if err['text'] in SOUND_TEXTS:
+            return 3
+    for err in errors:
+        if err['text'] == E['LOW_FUEL']['text']:
+            return 1
+    return 0
+
+
+def rules_check(rpm, stable, run_ms, low_fuel):
+    mask = RULES.evaluate(rpm, stable, run_ms)
+    if low_fuel:
+        mask |= LOW_FUEL_BIT
+    return mask
+
+
+def _keys(errors):
+    return {key for key, icon in E.items() if key != 'NONE' and any(icon is err for err in errors)}
+
+
+def _mask_keys(mask):
+    return {key for bit, key in RULES.order if mask & bit}
+
+
+def _random_states(rnd):
+    states = []
+    for _ in range(CASES):
+        levels = [0 if rnd.random() < 0.15 else 1 for _ in PINS]
+        rpm = rnd.choice((0, 600, 900, Settings.MIN_RPM_FOR_HIGH_PRESSURE_CHECK, 2500, 4500))
+        stable = rnd.random() < 0.7
+        run_ms = rnd.choice((-1, 0, Settings.OIL_CHECK_DELAY_MS // 2, Settings.OIL_CHECK_DELAY_MS,
+                             Settings.OIL_CHECK_DELAY_MS + 1, 600000))
+        states.append((levels, rpm, stable, run_ms, rnd.random() < 0.1))
+    return states
+
+
+TRIP_LOG_BITS = {E[key]['text']: 1 << bit for bit, key in enumerate(TripLogger.ERROR_KEYS)}
+
+
+def legacy_frame(rpm, stable, run_ms, low_fuel, state):
+    """Кадр попередньої реалізації; state = [активні, черга, показ]."""
+    active, queued, show = state
+    errors = legacy_check(rpm, stable, run_ms, low_fuel)
+    show.clear()
+    critical = False
+    for err in errors:
+        if err['text'] in SOUND_TEXTS:
+            critical = True
+            break
+    if critical:
+        for err in errors:
+            if err['text'] in SOUND_TEXTS:
+                show.append(err)
+        show.append(E['WARNING'])
+    else:
+        for err in errors:
+            if err['text'] == E['LOW_FUEL']['text']:
+                show.append(E['LOW_FUEL'])
+                break
+        else:
+            show.append(E['NONE'])
+    if legacy_severity(show) > legacy_severity(active):
+        if active != show:
+            active[:] = show
+            queued.clear()
+    elif active != show and show != queued:
+        queued[:] = show
+    mask = 0
+    for err in active:
+        mask |= TRIP_LOG_BITS.get(err['text'], 0)
+    return mask
+
+
+def rules_frame(rpm, stable, run_ms, low_fuel, state):
+    """Той самий кадр з масками; state = [активна маска, черга]."""
+    mask = rules_check(rpm, stable, run_ms, low_fuel)
+    critical = mask & RULES.critical_mask
+    show = critical | RULES.bit('WARNING') if critical else mask & LOW_FUEL_BIT
+    if RULES.severity(show) > RULES.severity(state[0]):
+        if state[0] != show:
+            state[0] = show
+            state[1] = -1
+    elif state[0] != show:
+        state[1] = show
+    return state[0]
+
+
+def _time(states, frame, state):
+    t0 = time.perf_counter()
+    for levels, rpm, stable, run_ms, low_fuel in states:
+        for pin, level in zip(PINS, levels):
+            pin.level = level
+        frame(rpm, stable, run_ms, low_fuel, state)
+    return (time.perf_counter() - t0) / len(states) * 1e6
+
+
+def main():
+    states = _random_states(random.Random(1))
+    ok = True
+    mismatches = 0
+    for levels, rpm, stable, run_ms, low_fuel in states:
+        for pin, level in zip(PINS, levels):
+            pin.level = level
+        old = legacy_check(rpm, stable, run_ms, low_fuel)
+        mask = rules_check(rpm, stable, run_ms, low_fuel)
+        if _keys(old) != _mask_keys(mask) or legacy_severity(old) != RULES.severity(mask):
+            mismatches += 1
+            if mismatches <= 5:
+                print("FAIL: levels={} rpm={} stable={} run_ms={} low_fuel={}: {} vs {}".format(
+                    levels, rpm, stable, run_ms, low_fuel, sorted(_keys(old)), sorted(_mask_keys(mask))))
+    if mismatches:
+        ok = False
+
+    old_us = _time(states, legacy_frame, [list(NO_ERRORS), [], []])
+    new_us = _time(states, rules_frame, [0, -1])
+    print("{:<34} {:>12}".format('error handling per frame (host)', 'us/frame'))
+    print("{:<34} {:>12.2f}".format('text lists (old)', old_us))
+    print("{:<34} {:>12.2f}".format('ErrorRules bitmask', new_us))
+    print("{} states, {} mismatches".format(len(states), mismatches))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
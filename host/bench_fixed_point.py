@@ -0,0 +1,150 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_fixed_point.py
+# Опис: Дрейф накопичення PERS за довгий пробіг (за замовчуванням 5000 км):
+#       старе накопичення літрів/кілометрів у float32 (як float MicroPython
+#       на RP2040) проти цілочисельного TripCounter.py. Інтервали по 1 с
+#       будуються з моделі двигуна host/replay.py (WLTC + NEDC по колу):
+#       цілі мкс відкриття форсунки та цілі імпульси VSS, як їх отримує
+#       calculate_and_display(). Еталон - точна сума цілих, переведена в
+#       літри/км у double.
+#       Перевіряється, що TripCounter відхиляється від еталону не більше
+#       ніж на похибку одного перетворення у float32.
+#       Збереження та завантаження: кожні --reboot-km кілометрів прошивка
+#       "перезавантажується". Лічильник зберігається справжнім TripJournal
+#       (сирі цілі) і відновлюється з нього - має точно дорівнювати
+#       еталону. Для порівняння - збереження літрів/км у float32 і
+#       перерахунок у цілі при завантаженні (TripCounter.set()): округлення
+#       повертається на кожному перезавантаженні.
+# Запуск: python host/bench_fixed_point.py --km 5000 --reboot-km 20
+# ==============================================================================
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time as real_time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import replay
+import Settings
+import TripCounter
+import TripJournal
+
+_F32 = struct.Struct('<f')
+FLOAT32_EPS = 2.0 ** -23
+
+
+def f32(x):
+    """Округлення до float32, як кожна float-операція MicroPython на RP2040."""
+    return _F32.unpack(_F32.pack(x))[0]
+
+
+def intervals(km_target):
+    """Інтервали 1 с до пробігу km_target: (мкс форсунки, імпульси VSS, швидкість км/год)."""
+    model = replay.EngineModel(Settings)
+    ppk = Settings.VSS_IMPULSES_PER_KM
+    inj_carry = vss_carry = 0.0
+    pulses_total = 0
+    while pulses_total < km_target * ppk:
+        for cycle in (replay.WLTC, replay.NEDC):
+            prev_v = 0.0
+            for t in range(int(cycle.duration_s)):
+                v = cycle.speed_at(t + 1)
+                rpm, pulse_us = model.state(v, (v - prev_v) / 3.6)
+                injections_per_s = rpm * Settings.RPM_PULSES_PER_ENGINE_REVOLUTION / 60.0
+                inj_carry += injections_per_s * max(0.0, pulse_us - model.dead_time_us)
+                vss_carry += (v + prev_v) / 2 * ppk / 3600.0
+                inj_us, pulses = int(inj_carry), int(vss_carry)
+                inj_carry -= inj_us
+                vss_carry -= pulses
+                pulses_total += pulses
+                prev_v = v
+                yield inj_us, pulses, v
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare float32 and integer PERS accumulation over a long run.")
+    parser.add_argument('--km', type=float, default=5000.0)
+    parser.add_argument('--reboot-km', type=float, default=20.0, help="distance between simulated power cycles")
+    args = parser.parse_args()
+
+    rate = Settings.INJ_FLOW_RATE_ML_PER_MIN / (1000 * 60 * 1_000_000)
+    rate32 = f32(rate)
+    ppk = Settings.VSS_IMPULSES_PER_KM
+    counter = TripCounter.TripCounter(rate32, ppk)         # Цілі лише в RAM, без перезавантажень.
+    saved = TripCounter.TripCounter(rate32, ppk)           # Цілі, що переживають перезавантаження через журнал.
+    float_saved = TripCounter.TripCounter(rate32, ppk)     # Цілі, збережені як float32 літри/км.
+    unused = TripCounter.TripCounter(rate32, ppk)          # TRIP у записі журналу (тут не перевіряється).
+    float_fuel = float_km = 0.0
+    exact_us = exact_pulses = 0
+    count = reboots = 0
+    reboot_pulses = int(args.reboot_km * ppk)
+    next_reboot = reboot_pulses
+    workdir = tempfile.mkdtemp(prefix='fixed_point_')
+    path_format = os.path.join(workdir, 'trip_journal_{}.bin')
+    journal = TripJournal.TripJournal(path_format, Settings.TRIP_JOURNAL_SEGMENTS, Settings.TRIP_JOURNAL_SEGMENT_BYTES)
+    t0 = real_time.perf_counter()
+    try:
+        for inj_us, pulses, v in intervals(args.km):
+            if v < Settings.MIN_SPEED_FOR_PERS_COUNT_KMH:
+                continue # PERS накопичується лише в русі.
+            # Старий шлях calculate_and_display(): кожен доданок і сума - float32.
+            float_fuel = f32(float_fuel + f32(inj_us * rate32))
+            float_km = f32(float_km + f32(pulses / ppk))
+            counter.add(inj_us, pulses)
+            saved.add(inj_us, pulses)
+            float_saved.add(inj_us, pulses)
+            exact_us += inj_us
+            exact_pulses += pulses
+            count += 1
+            if exact_pulses >= next_reboot:
+                # Вимкнення запалювання: запис у журнал і відновлення при наступному запуску.
+                next_reboot += reboot_pulses
+                reboots += 1
+                journal.append(saved, unused, force=True)
+                journal.close()
+                journal = TripJournal.TripJournal(path_format, Settings.TRIP_JOURNAL_SEGMENTS,
+                                                  Settings.TRIP_JOURNAL_SEGMENT_BYTES)
+                state = journal.load()
+                saved = TripCounter.TripCounter(rate32, ppk)
+                saved.restore(state[0], state[1], state[2])
+                float_saved.set(f32(float_saved.fuel_L()), f32(float_saved.km()))
+        journal.close()
+    finally:
+        shutil.rmtree(workdir)
+    wall = real_time.perf_counter() - t0
+
+    exact_fuel = exact_us * rate
+    exact_km = exact_pulses / ppk
+    int_fuel = f32(counter.fuel_L())
+    int_km = f32(counter.km())
+    print("{} intervals ({:.0f} h driving), {} power cycles, {:.2f} s".format(count, count / 3600.0, reboots, wall))
+    print("{:<22} {:>12} {:>12} {:>14} {:>14}".format('path', 'fuel, L', 'dist, km', 'fuel err, mL', 'dist err, m'))
+    rows = (('exact', exact_fuel, exact_km), ('float32', float_fuel, float_km), ('integer (RAM)', int_fuel, int_km),
+            ('integer, float32 save', f32(float_saved.fuel_L()), f32(float_saved.km())),
+            ('integer, journal', f32(saved.fuel_L()), f32(saved.km())))
+    for name, fuel, km in rows:
+        print("{:<22} {:>12.4f} {:>12.4f} {:>14.3f} {:>14.2f}".format(
+            name, fuel, km, (fuel - exact_fuel) * 1000, (km - exact_km) * 1000))
+    print("counters after journal round trips: {} us / {} pulses (exact {} us / {} pulses)".format(
+        saved.inj_hi * 2 ** 24 + saved.inj_lo, saved.pulses, exact_us, exact_pulses))
+    # Цілі додаються точно: похибка - лише округлення коефіцієнта та результату до float32.
+    ok = abs(int_fuel - exact_fuel) <= 2 * FLOAT32_EPS * exact_fuel + abs(rate32 - rate) * exact_us and \
+         abs(int_km - exact_km) <= FLOAT32_EPS * exact_km
+    if not ok:
+        print("FAIL: integer accumulation drifted")
+    # Збереження сирих цілих у журналі не вносить жодної похибки.
+    if saved.inj_hi * 2 ** 24 + saved.inj_lo != exact_us or saved.pulses != exact_pulses:
+        print("FAIL: journal save/load changed the counters")
+        ok = False
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_flash_wear.py
+# Опис: Прогноз зносу Flash персистентним збереженням TRIP/PERS за 10 років
+#       щоденної їзди. Типовий день: WLTC (30 хв) + NEDC (20 хв) та
+#       запалювання увімкнене з заглушеним двигуном (--parked-min).
+#       Лічильники палива/відстані будуються з моделі двигуна host/replay.py
+#       з кроком 1 с.
+#       Схеми:
+#         legacy  - старий запис 4 рядків кожні 10 с (tmp + remove + rename x2);
+#         journal - TripJournal кожну секунду без порогу змін;
+#         ring    - TripJournal з порогами PERSISTENT_MIN_DELTA_* з Settings.
+#       Знос рахується за моделлю TripJournal.py: кожен блок стирається
+#       приблизно раз на FLASH_BLOCK_SIZE запрограмованих байтів, знос
+#       розподіляється на FLASH_FS_BLOCKS блоків.
+# Запуск: python host/bench_flash_wear.py --years 10 --parked-min 10
+# ==============================================================================
+
+import os
+import shutil
+import sys
+import tempfile
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import replay
+import Settings
+import TripCounter
+import TripJournal
+
+# Старий запис: створення tmp, закриття з даними, remove, rename, rename -
+# п'ять комітів метаданих littlefs по одній сторінці.
+LEGACY_SAVE_PROG_BYTES = 5 * TripJournal.FLASH_PROG_SIZE
+LEGACY_SAVE_INTERVAL_S = 10
+
+
+def day_counters(parked_min):
+    """Значення (паливо_л, відстань_км) щосекунди, поки увімкнене запалювання."""
+    model = replay.EngineModel(Settings)
+    samples = []
+    fuel = dist = 0.0
+    for cycle in (replay.WLTC, replay.NEDC):
+        prev_v = 0.0
+        for t in range(int(cycle.duration_s)):
+            v = cycle.speed_at(t + 1)
+            rpm, pulse_us = model.state(v, (v - prev_v) / 3.6)
+            injections_per_s = rpm * Settings.RPM_PULSES_PER_ENGINE_REVOLUTION / 60.0
+            fuel += injections_per_s * max(0.0, pulse_us - model.dead_time_us) * model.flow_l_per_us
+            dist += (v + prev_v) / 2 / 3600.0
+            prev_v = v
+            samples.append((fuel, dist))
+    samples.extend([(fuel, dist)] * int(parked_min * 60)) # Двигун заглушено, запалювання увімкнене.
+    return samples
+
+
+def legacy_day(samples):
+    saves = len(samples) // LEGACY_SAVE_INTERVAL_S
+    return saves, saves * LEGACY_SAVE_PROG_BYTES
+
+
+def journal_day(samples, min_fuel, min_km):
+    """Проганяє справжній TripJournal на тимчасових файлах; повертає (записи, запрограмовані байти)."""
+    workdir = tempfile.mkdtemp(prefix='flash_wear_')
+    rate = Settings.INJ_FLOW_RATE_ML_PER_MIN / (1000 * 60 * 1_000_000)
+    ppk = Settings.VSS_IMPULSES_PER_KM
+    pers = TripCounter.TripCounter(rate, ppk)
+    trip = TripCounter.TripCounter(rate, ppk)
+    try:
+        # Пороги в одиницях лічильників, як у main.py.
+        journal = TripJournal.TripJournal(os.path.join(workdir, 'trip_journal_{}.bin'), Settings.TRIP_JOURNAL_SEGMENTS,
+                                          Settings.TRIP_JOURNAL_SEGMENT_BYTES, int(min_fuel / rate), int(min_km * ppk))
+        journal.load()
+        pers_fuel, pers_km = 1000.0, 4000.0 # PERS вже накопичений.
+        for fuel, dist in samples:
+            pers.set(pers_fuel + fuel, pers_km + dist)
+            trip.set(fuel, dist)
+            journal.append(pers, trip)
+        journal.close()
+    finally:
+        shutil.rmtree(workdir)
+    prog = journal.seq * TripJournal.APPEND_PROG_BYTES + journal.rollovers * TripJournal.ROLLOVER_PROG_BYTES
+    return journal.seq, prog
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Project flash wear of trip persistence over years of daily driving.")
+    parser.add_argument('--years', type=float, default=10.0)
+    parser.add_argument('--parked-min', type=float, default=10.0, help="ignition on, engine off, per day")
+    args = parser.parse_args()
+
+    samples = day_counters(args.parked_min)
+    days = args.years * 365
+    budget = TripJournal.FLASH_FS_BLOCKS * TripJournal.FLASH_ENDURANCE_CYCLES
+    print("day: {:.0f} min ignition on, {:.3f} L / {:.2f} km; {:.0f} years; erase budget {} block erases".format(
+        len(samples) / 60.0, samples[-1][0], samples[-1][1], args.years, budget))
+    print("{:<8} {:>12} {:>14} {:>14} {:>14} {:>12}".format(
+        'scheme', 'writes/day', 'erases/year', 'used in period', 'endurance left', 'wear-out, y'))
+    rows = (
+        ('legacy', legacy_day(samples)),
+        ('journal', journal_day(samples, 0.0, 0.0)),
+        ('ring', journal_day(samples, Settings.PERSISTENT_MIN_DELTA_FUEL_L, Settings.PERSISTENT_MIN_DELTA_KM)),
+    )
+    for name, (writes, prog_bytes) in rows:
+        erases_per_day = prog_bytes / TripJournal.FLASH_BLOCK_SIZE
+        used = erases_per_day * days / budget
+        wear_out_years = budget / (erases_per_day * 365) if erases_per_day else float('inf')
+        print("{:<8} {:>12} {:>14.0f} {:>13.2f}% {:>13.2f}% {:>12.0f}".format(
+            name, writes, erases_per_day * 365, used * 100, max(0.0, 1 - used) * 100, wear_out_years))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_fuel_sampler.py
+# Опис: Бенчмарк на ПК: похибка показу рівня палива при хлюпанні в баку.
+#       Попередній спосіб - 8 швидких зчитувань ADC раз на секунду та їх
+#       медіана - проти FuelSampler (зчитування кожні FUEL_SAMPLE_INTERVAL_MS,
+#       усічене середнє вікна). Після обох - те саме згладжування, що й у
+#       прошивці (фільтр FUEL_FILTER_TYPE та обмеження швидкості зміни).
+#       Траси (сире значення ADC з кроком 1 мс):
+#         - city: розгони/гальмування кожні 10-20 с (поздовжнє хлюпання);
+#         - rough: погана дорога - часті поштовхи та відскоки повзунка реостата;
+#         - corner: серпантин - довгі бічні нахили рівня на 5-8 с.
+#       Трасу можна записати у CSV (--record) та відтворити записану з авто
+#       (--trace, стовпці t_ms,raw,true_raw; true_raw - необов'язковий).
+#       Вартість CPU - найменша з CPU_REPEATS повторів (менше шуму ПК).
+#       Перевіряється, що FuelSampler на кожній трасі дає меншу RMS-похибку
+#       показу, ніж попередній спосіб, і коштує не більше CPU_BUDGET x його
+#       CPU - тобто менше шуму на одиницю CPU.
+#       Окремо - розгортка інтервалу вибірки при тій самій тривалості вікна
+#       (FUEL_SAMPLE_INTERVAL_MS x FUEL_SAMPLE_WINDOW): середня RMS-похибка,
+#       відношення CPU до попереднього способу та виграш у шумі на 1 мс CPU.
+#       Перевіряється, що серед інтервалів, які вкладаються в CPU_BUDGET і
+#       кращі за попередній спосіб на кожній трасі, налаштований дає
+#       найменшу похибку (з допуском SWEEP_RMS_TOLERANCE).
+# Запуск: python host/bench_fuel_sampler.py [--record city.csv] [--trace drive.csv]
+# ==============================================================================
+
+import csv
+import math
+import os
+import random
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import FuelSampler
+import Settings
+import SmoothingFilter
+
+DURATION_S = 600
+SLOSH_PERIOD_S = 1.8   # Власний період поздовжнього хлюпання в баку.
+SLOSH_DAMPING_S = 2.5  # Постійна загасання коливань.
+
+CPU_REPEATS = 3
+CPU_BUDGET = 1.5 # Допустима вартість CPU відносно попереднього способу (пачка з 8 зчитувань).
+SWEEP_INTERVALS_MS = (100, 200, 250, 500, 1000) # Дільники FUEL_TASK_INTERVAL_MS.
+# Допустиме погіршення середньої RMS-похибки (%) проти найкращого інтервалу: показ
+# палива - цілі літри (1 л = 100 / FUEL_TANK_CAPACITY_L ~ 1.5 %), тож 0.05 % непомітні.
+SWEEP_RMS_TOLERANCE = 0.05
+
+
+class Trace:
+    """Сире значення ADC (raw) та справжній рівень (true_raw) з кроком 1 мс."""
+
+    def __init__(self, name, raw, true_raw):
+        self.name = name
+        self.raw = raw
+        self.true_raw = true_raw
+
+    def save(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('t_ms', 'raw', 'true_raw'))
+            for t, (r, tr) in enumerate(zip(self.raw, self.true_raw)):
+                writer.writerow((t, r, tr))
+
+    @classmethod
+    def load(cls, path):
+        """Записана траса: вибірки з довільним кроком переводяться на сітку 1 мс."""
+        rows = []
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                rows.append((int(float(row['t_ms'])), int(float(row['raw'])),
+                             int(float(row['true_raw'])) if row.get('true_raw') else None))
+        raw, true_raw = [], []
+        for i, (t, r, tr) in enumerate(rows):
+            t_next = rows[i + 1][0] if i + 1 < len(rows) else t + 1
+            for _ in range(max(1, t_next - t)):
+                raw.append(r)
+                true_raw.append(tr)
+        if true_raw[0] is None:
+            # Без еталону - медіана 10 с як наближення справжнього рівня.
+            true_raw = _rolling_median(raw, 10000)
+        return cls(os.path.basename(path), raw, true_raw)
+
+
+def _rolling_median(values, window):
+    out = []
+    step = 100
+    for i in range(0, len(values), step):
+        lo = max(0, i - window // 2)
+        chunk = sorted(values[lo:lo + window:10])
+        out.extend([chunk[len(chunk) // 2]] * min(step, len(values) - i))
+    return out
+
+
+def _raw(percent):
+    return Settings.FUEL_ADC_MIN_RAW + (Settings.FUEL_ADC_MAX_RAW - Settings.FUEL_ADC_MIN_RAW) * percent / 100.0
+
+
+def synthesize(name, seed=1):
+    """Синтетична траса: рівень повільно падає, події збуджують загасаючі коливання."""
+    rnd = random.Random(seed)
+    n = DURATION_S * 1000
+    level = 55.0
+    drain_per_ms = 3.0 / (DURATION_S * 1000) # ~3% бака за трасу.
+    omega = 2 * math.pi / SLOSH_PERIOD_S
+    raw, true_raw = [], []
+    amp = 0.0       # Амплітуда хлюпання (%).
+    phase_t = 0.0   # Час від останнього поштовху (с).
+    tilt = 0.0      # Бічний нахил рівня (%).
+    tilt_left_ms = 0
+    next_event_ms = 0
+    bounce_left_ms = 0
+    for t in range(n):
+        if t >= next_event_ms:
+            if name == 'city':
+                amp = rnd.uniform(6.0, 14.0) * rnd.choice((-1, 1))
+                next_event_ms = t + rnd.randint(10000, 20000)
+            elif name == 'rough':
+                amp = rnd.uniform(2.0, 6.0) * rnd.choice((-1, 1))
+                next_event_ms = t + rnd.randint(400, 1500)
+                if rnd.random() < 0.3:
+                    bounce_left_ms = rnd.randint(5, 40) # Повзунок реостата відскакує від доріжки.
+            else: # corner
+                amp = rnd.uniform(2.0, 5.0) * rnd.choice((-1, 1))
+                tilt = rnd.uniform(3.0, 8.0) * rnd.choice((-1, 1))
+                tilt_left_ms = rnd.randint(5000, 8000)
+                next_event_ms = t + tilt_left_ms + rnd.randint(1000, 4000)
+            phase_t = 0.0
+        level -= drain_per_ms
+        phase_t += 0.001
+        slosh = amp * math.exp(-phase_t / SLOSH_DAMPING_S) * math.sin(omega * phase_t)
+        if tilt_left_ms > 0:
+            tilt_left_ms -= 1
+            side = tilt
+        else:
+            side = 0.0
+        value = _raw(level + slosh + side) + rnd.gauss(0.0, 6.0)
+        if bounce_left_ms > 0:
+            bounce_left_ms -= 1
+            value = Settings.FUEL_ADC_MAX_RAW if rnd.random() < 0.5 else Settings.FUEL_ADC_MIN_RAW
+        raw.append(max(0, min(65535, int(value))))
+        true_raw.append(int(_raw(level)))
+    return Trace(name, raw, true_raw)
+
+
+class TraceADC:
+    """ADC, що повертає значення траси на поточну мілісекунду."""
+
+    def __init__(self, trace):
+        self.trace = trace
+        self.t_ms = 0
+        self.reads = 0
+
+    def read_u16(self):
+        self.reads += 1
+        return self.trace.raw[min(self.t_ms, len(self.trace.raw) - 1)]
+
+
+def _percent(raw):
+    p = (raw - Settings.FUEL_ADC_MIN_RAW) / (Settings.FUEL_ADC_MAX_RAW - Settings.FUEL_ADC_MIN_RAW)
+    return max(0.0, min(1.0, p)) * 100.0
+
+
+class Display:
+    """Згладжування як у process_fuel_smoothing(): фільтр та обмеження швидкості зміни."""
+
+    def __init__(self, initial):
+        self.filter = SmoothingFilter.create(Settings.FUEL_FILTER_TYPE, Settings.FUEL_BUFFER_SIZE,
+                                             Settings.FUEL_EMA_ALPHA, initial)
+        self.value = initial
+
+    def update(self, percent):
+        smoothed = self.filter.update(percent)
+        max_change = Settings.FUEL_MAX_PERCENT_CHANGE_PER_SEC * Settings.FUEL_TASK_INTERVAL_MS / 1000.0
+        self.value = max(self.value - max_change, min(self.value + max_change, smoothed))
+        return self.value
+
+
+def run_burst(trace):
+    """Попередній спосіб: 8 зчитувань поспіль раз на FUEL_TASK_INTERVAL_MS, 4-те відсортоване."""
+    adc = TraceADC(trace)
+    display = Display(_percent(trace.true_raw[0]))
+    errors = []
+    cpu = 0.0
+    for t in range(0, len(trace.raw), Settings.FUEL_TASK_INTERVAL_MS):
+        adc.t_ms = t
+        t0 = time.perf_counter()
+        raw = sorted([adc.read_u16() for _ in range(8)])[3]
+        cpu += time.perf_counter() - t0
+        errors.append(display.update(_percent(raw)) - _percent(trace.true_raw[t]))
+    return errors, adc.reads, cpu
+
+
+def run_sampler(trace, interval_ms=Settings.FUEL_SAMPLE_INTERVAL_MS,
+                window=Settings.FUEL_SAMPLE_WINDOW, keep=Settings.FUEL_SAMPLE_KEEP):
+    """FuelSampler: зчитування кожні interval_ms, оцінка раз на FUEL_TASK_INTERVAL_MS."""
+    adc = TraceADC(trace)
+    sampler = FuelSampler.FuelSampler(adc, window, keep)
+    sampler.prime()
+    display = Display(_percent(trace.true_raw[0]))
+    errors = []
+    cpu = 0.0
+    for t in range(0, len(trace.raw), interval_ms):
+        adc.t_ms = t
+        t0 = time.perf_counter()
+        sampler.sample()
+        if t % Settings.FUEL_TASK_INTERVAL_MS == 0:
+            raw = sampler.estimate()
+        cpu += time.perf_counter() - t0
+        if t % Settings.FUEL_TASK_INTERVAL_MS == 0:
+            errors.append(display.update(_percent(raw)) - _percent(trace.true_raw[t]))
+    return errors, adc.reads, cpu
+
+
+def _timed(run, trace, *args):
+    """run(trace, ...) CPU_REPEATS разів: (похибки, зчитування, найменший час CPU)."""
+    errors, reads, cpu = run(trace, *args)
+    for _ in range(CPU_REPEATS - 1):
+        cpu = min(cpu, run(trace, *args)[2])
+    return errors, reads, cpu
+
+
+def _stats(errors):
+    errors = errors[Settings.FUEL_BUFFER_SIZE:] # Без перехідного процесу заповнення буфера.
+    rms = math.sqrt(sum(e * e for e in errors) / len(errors))
+    return rms, max(abs(e) for e in errors)
+
+
+def sweep(traces, burst):
+    """Інтервали вибірки при незмінній тривалості вікна; burst - [(rms, cpu)] попереднього способу."""
+    window_ms = Settings.FUEL_SAMPLE_INTERVAL_MS * Settings.FUEL_SAMPLE_WINDOW
+    seconds = sum(len(trace.raw) for trace in traces) / 1000.0
+    burst_rms = sum(rms for rms, _ in burst) / len(burst)
+    burst_cpu = sum(cpu for _, cpu in burst) / seconds * 1e6
+    print()
+    print("interval sweep at a {:.1f} s window (burst: mean rms {:.3f} %, cpu {:.1f} us/s)".format(
+        window_ms / 1000.0, burst_rms, burst_cpu))
+    print("{:>10} {:>7} {:>5} {:>10} {:>12} {:>14} {:>12} {:>10} {:>16}".format(
+        'interval', 'window', 'keep', 'reads/s', 'mean rms, %', 'beats burst', 'cpu, us/s', 'x burst',
+        'gain/cpu, %/ms'))
+    usable = []
+    configured = None
+    for interval_ms in SWEEP_INTERVALS_MS:
+        window = max(1, (window_ms + interval_ms // 2) // interval_ms)
+        keep = max(1, Settings.FUEL_SAMPLE_KEEP * window // Settings.FUEL_SAMPLE_WINDOW)
+        rms = []
+        cpu = 0.0
+        for trace in traces:
+            errors, _, trace_cpu = _timed(run_sampler, trace, interval_ms, window, keep)
+            rms.append(_stats(errors)[0])
+            cpu += trace_cpu
+        mean_rms = sum(rms) / len(rms)
+        cpu_us = cpu / seconds * 1e6
+        beats = sum(1 for r, (b, _) in zip(rms, burst) if r < b)
+        if beats == len(traces) and cpu_us <= burst_cpu * CPU_BUDGET:
+            usable.append(mean_rms)
+        if interval_ms == Settings.FUEL_SAMPLE_INTERVAL_MS:
+            configured = mean_rms
+        # Зменшення середньої похибки відносно пачки на 1 мс CPU за секунду.
+        gain = (burst_rms - mean_rms) / cpu_us * 1000.0
+        print("{:>10} {:>7} {:>5} {:>10.1f} {:>12.3f} {:>14} {:>12.1f} {:>10.2f} {:>16.1f}{}".format(
+            interval_ms, window, keep, 1000.0 / interval_ms, mean_rms, "{}/{}".format(beats, len(traces)),
+            cpu_us, cpu_us / burst_cpu, gain,
+            '  <- Settings' if interval_ms == Settings.FUEL_SAMPLE_INTERVAL_MS else ''))
+    if configured is None or not usable or configured > min(usable) + SWEEP_RMS_TOLERANCE:
+        print("FAIL: FUEL_SAMPLE_INTERVAL_MS is not the lowest-noise interval within {} x burst CPU".format(CPU_BUDGET))
+        return False
+    return True
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Fuel gauge error under tank slosh: burst median vs FuelSampler.")
+    parser.add_argument('--trace', action='append', help="recorded CSV trace (t_ms,raw[,true_raw])")
+    parser.add_argument('--record', help="write the synthetic 'city' trace to this CSV file")
+    args = parser.parse_args()
+
+    traces = [Trace.load(path) for path in args.trace] if args.trace else \
+             [synthesize(name, seed) for seed, name in enumerate(('city', 'rough', 'corner'), 1)]
+    if args.record and not args.trace:
+        traces[0].save(args.record)
+
+    ok = True
+    burst = []
+    print("{:<8} {:<8} {:>10} {:>10} {:>10} {:>12}".format('trace', 'method', 'rms, %', 'max, %', 'reads/s', 'cpu, us/s'))
+    for trace in traces:
+        seconds = len(trace.raw) / 1000.0
+        results = []
+        cpus = []
+        for method, run in (('burst', run_burst), ('sampler', run_sampler)):
+            errors, reads, cpu = _timed(run, trace)
+            rms, worst = _stats(errors)
+            results.append(rms)
+            cpus.append(cpu)
+            if method == 'burst':
+                burst.append((rms, cpu))
+            print("{:<8} {:<8} {:>10.2f} {:>10.2f} {:>10.1f} {:>12.1f}".format(
+                trace.name, method, rms, worst, reads / seconds, cpu / seconds * 1e6))
+        if results[1] >= results[0]:
+            print("FAIL: FuelSampler is not better on trace {}".format(trace.name))
+            ok = False
+        if cpus[1] > cpus[0] * CPU_BUDGET:
+            print("FAIL: FuelSampler costs more than {} x burst CPU on trace {}".format(CPU_BUDGET, trace.name))
+            ok = False
+    if not args.trace:
+        ok = sweep(traces, burst) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_glyph_atlas.py
+# Опис: Бенчмарк на ПК: кількість викликів FrameBuffer та час на кадр при
+#       виводі розтягнутого тексту - попіксельний метод (до GlyphAtlas)
+#       проти виводу готових гліфів з атласу.
+# Запуск: python host/bench_glyph_atlas.py
+# ==============================================================================
+
+import os
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import framebuf
+import GlyphAtlas
+
+FRAMES = 50
+
+# Текстові елементи одного кадру: (рядок, size_x, size_y, колір).
+MAIN_SCREEN_FRAME = (
+    ("12.3", 3, 3, 1),          # Основний показник
+    ("L/100KM", 1, 2, 1),       # Одиниці
+    (" 7.9 L/100KM", 1, 2, 1),  # PERS
+    ("12.3L  456KM", 1, 2, 1),  # TRIP
+    ("13.8", 1, 2, 1),          # Акумулятор
+)
+SPECIAL_SCREEN_FRAME = (
+    ("123KMH", 2, 2, 1),
+    ("14.1V", 2, 2, 1),
+    ("3200RPM", 2, 2, 1),
+    ("2.45MS", 2, 2, 1),
+    ("45L", 2, 2, 1),
+)
+
+
+class CountingFrameBuffer(framebuf.FrameBuffer):
+    """FrameBuffer, що рахує виклики методів малювання (як Python-рівневі виклики на Pico)."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.calls = 0
+
+    def fill_rect(self, *args):
+        self.calls += 1
+        return super().fill_rect(*args)
+
+    def blit(self, *args):
+        self.calls += 1
+        return super().blit(*args)
+
+    def text(self, *args):
+        self.calls += 1
+        return super().text(*args)
+
+    def pixel(self, *args):
+        self.calls += 1
+        return super().pixel(*args)
+
+
+_tmp_fb = CountingFrameBuffer(bytearray(8), 8, 8, framebuf.MONO_VLSB)
+
+
+def legacy_draw(target, s, x, y, size_x, size_y, c):
+    """Попіксельне розтягування - алгоритм _draw_stretched_char до атласу."""
+    for char in s:
+        _tmp_fb.fill(0)
+        _tmp_fb.text(char, 0, 0, 1)
+        for dy in range(8):
+            for dx in range(8):
+                if _tmp_fb.pixel(dx, dy):
+                    target.fill_rect(x + dx * size_x, y + dy * size_y, size_x, size_y, c)
+        x += 8 * size_x
+
+
+def atlas_draw(atlas, target, s, x, y, size_x, size_y, c):
+    for char in s:
+        x = atlas.draw(target, char, x, y, size_x, size_y, c)
+
+
+def run(name, frame, draw):
+    target = CountingFrameBuffer(bytearray(128 * 16), 128, 128, framebuf.MONO_VLSB)
+    _tmp_fb.calls = 0
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        target.fill(0)
+        for s, sx, sy, c in frame:
+            draw(target, s, 0, 0, sx, sy, c)
+    elapsed = time.perf_counter() - t0
+    calls = (target.calls + _tmp_fb.calls) / FRAMES
+    print("  {:<8} {:>8.0f} calls/frame {:>9.2f} ms/frame".format(name, calls, elapsed * 1000 / FRAMES))
+    return calls, bytes(target.buffer)
+
+
+def main():
+    for title, frame in (("MAIN screen", MAIN_SCREEN_FRAME), ("SPECIAL screen", SPECIAL_SCREEN_FRAME)):
+        atlas = GlyphAtlas.GlyphAtlas(3072)
+        print(title)
+        legacy_calls, legacy_pixels = run("legacy", frame, legacy_draw)
+        atlas_calls, atlas_pixels = run("atlas", frame, lambda t, *a: atlas_draw(atlas, t, *a))
+        assert legacy_pixels == atlas_pixels, "atlas output differs from legacy rendering"
+        print("  reduction x{:.1f}; atlas {} B used, {} hits / {} misses".format(
+            legacy_calls / atlas_calls, atlas.used_bytes, atlas.hits, atlas.misses))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_icon_rle.py
+# Опис: Бенчмарк на ПК: іконки без стиснення (Icons.ENCODING_RAW, один blit)
+#       проти PackBits (Icons.ENCODING_PACKBITS, розпакування рядок за рядком
+#       прямо в буфер дисплея). Для кожної іконки - розмір даних і час
+#       Icons.draw(); скільки іконок такого розміру вміщається в той самий
+#       обсяг. Перевіряється, що пікселі на дисплеї однакові для обох
+#       кодувань (у тому числі поверх заповненого фону та зі зсувом за край).
+#       Час на ПК - з моделлю framebuf з host/, тож важливе співвідношення,
+#       а не абсолютні значення.
+# Запуск: python host/bench_icon_rle.py
+# ==============================================================================
+
+import os
+import struct
+import sys
+import tempfile
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import ticks
+ticks.install()
+
+import framebuf
+import Icons
+import build_icons
+
+REPEATS = 20
+POSITIONS = ((3, 3), (20, 40), (-10, -5)) # Звичайна позиція, зсув та вихід за край.
+
+
+def _load(blob):
+    """Завантажує blob в Icons.ERROR_ICONS через тимчасовий файл."""
+    fd, path = tempfile.mkstemp(suffix='.bin')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(blob)
+        Icons.load(path)
+    finally:
+        os.remove(path)
+    if Icons.load_error:
+        raise RuntimeError(Icons.load_error)
+
+
+def _entries(blob):
+    """Ключ -> розмір даних іконки в blob."""
+    count = struct.unpack_from(Icons.HEADER_FORMAT, blob, 0)[2]
+    sizes = {}
+    for i in range(count):
+        name, _, _, _, size, _ = struct.unpack_from(Icons.ENTRY_FORMAT, blob, Icons.HEADER_SIZE + i * Icons.ENTRY_SIZE)
+        sizes[name.rstrip(b'\0').decode()] = size
+    return sizes
+
+
+def _render(icon, x, y, background):
+    buf = bytearray(128 * 128 // 8)
+    fb = framebuf.FrameBuffer(buf, 128, 128, framebuf.MONO_VLSB)
+    fb.fill(background)
+    Icons.draw(fb, icon, x, y)
+    return bytes(buf)
+
+
+def _measure(blob):
+    """Для кожної іконки: (розмір, час draw() у мс, зображення для всіх POSITIONS)."""
+    _load(blob)
+    sizes = _entries(blob)
+    buf = bytearray(128 * 128 // 8)
+    fb = framebuf.FrameBuffer(buf, 128, 128, framebuf.MONO_VLSB)
+    result = {}
+    for key, icon in Icons.ERROR_ICONS.items():
+        if icon['icon'] is None:
+            continue
+        x, y = icon['icon_pos']
+        t0 = time.perf_counter()
+        for _ in range(REPEATS):
+            Icons.draw(fb, icon, x, y)
+        draw_ms = (time.perf_counter() - t0) / REPEATS * 1000
+        images = [_render(icon, px, py, bg) for px, py in POSITIONS for bg in (0, 1)]
+        result[key] = (sizes[key], draw_ms, images)
+    return result
+
+
+def main():
+    bitmaps = build_icons.bitmaps_from_source()
+    raw_blob = build_icons.build(bitmaps, Icons.ENCODING_RAW)
+    rle_blob = build_icons.build(bitmaps, Icons.ENCODING_PACKBITS)
+    raw = _measure(raw_blob)
+    rle = _measure(rle_blob)
+
+    ok = True
+    print("{:<26} {:>8} {:>8} {:>7} {:>10} {:>10}".format('icon', 'raw, B', 'rle, B', 'ratio', 'raw, ms', 'rle, ms'))
+    for key in raw:
+        raw_size, raw_ms, raw_images = raw[key]
+        rle_size, rle_ms, rle_images = rle[key]
+        print("{:<26} {:>8} {:>8} {:>7.2f} {:>10.2f} {:>10.2f}".format(
+            key, raw_size, rle_size, rle_size / raw_size, raw_ms, rle_ms))
+        if raw_images != rle_images:
+            print("FAIL: {} renders differently from the raw bitmap".format(key))
+            ok = False
+    raw_total = sum(v[0] for v in raw.values())
+    rle_total = sum(v[0] for v in rle.values())
+    print("{:<26} {:>8} {:>8} {:>7.2f}".format('total', raw_total, rle_total, rle_total / raw_total))
+    print("icons.bin: raw {} B, packbits {} B; icons per {} B: raw {}, packbits ~{}".format(
+        len(raw_blob), len(rle_blob), raw_total, len(raw), raw_total * len(rle) // rle_total))
+    print("decode buffer: one {}-byte row (no full-size icon buffer)".format(len(Icons._row)))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_injector_capture.py
+# Опис: Бенчмарк на ПК: джерела вимірювання імпульсів форсунки
+#       InjectorCapture.IrqCapture (переривання GPIO) проти PioCapture (PIO з
+#       симульованими RX FIFO та DMA, host/rp2.py). Для 1000 впорскувань рахує:
+#       - кількість входів у Python-обробники переривань (для PIO - 0:
+#         слова з FIFO забирає DMA);
+#       - CPU-час прошивки (обробники IRQ + drain()) без часу моделі заліза;
+#       - похибку тривалості та періоду відносно заданих значень.
+#       Затримка входу в переривання GPIO моделюється випадковою величиною
+#       (--irq-latency-us, рівномірно 0..N мкс), бо на реальному Pico вона
+#       залежить від інтерпретатора; PIO фіксує фронти апаратно.
+# Запуск: python host/bench_injector_capture.py --rpm 3000 --pulse-us 2500
+# ==============================================================================
+
+import os
+import random
+import sys
+import time as real_time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import machine
+import rp2
+from array import array
+from sim import VirtualClock
+
+INJECTIONS = 1000
+RING_SIZE = 1024
+
+
+def _load_capture_module(clock):
+    """Імпортує InjectorCapture з віртуальним time (мітки ticks_us із симульованого часу)."""
+    real_module = sys.modules['time']
+    sys.modules['time'] = clock.make_time_module()
+    sys.modules.pop('InjectorCapture', None)
+    try:
+        import InjectorCapture
+    finally:
+        sys.modules['time'] = real_module
+    return InjectorCapture
+
+
+class _Timed:
+    """Обгортка обробника, що накопичує CPU-час та кількість викликів."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __call__(self, *args):
+        t0 = real_time.perf_counter()
+        self.func(*args)
+        self.seconds += real_time.perf_counter() - t0
+        self.calls += 1
+
+
+def run(backend, rpm, pulse_us, latency_us, seed=1):
+    machine.reset_registry()
+    rp2.state_machines.clear()
+    clock = VirtualClock()
+    machine.set_clock(clock)
+    module = _load_capture_module(clock)
+    rng = random.Random(seed)
+
+    pin = machine.Pin(0, machine.Pin.IN, machine.Pin.PULL_UP)
+    if backend == 'pio':
+        capture = module.PioCapture(pin, RING_SIZE)
+        capture.start()
+        handler = _Timed(None) # Переривань немає.
+    else:
+        capture = module.IrqCapture(pin, RING_SIZE)
+        capture.start()
+        handler = _Timed(pin._irq.handler)
+        if latency_us > 0:
+            # Обробник виконується із затримкою: мітка ticks_us зсувається на випадкову величину.
+            pin._irq.handler = lambda p: clock.schedule_in(rng.randint(0, latency_us), lambda: handler(p))
+        else:
+            pin._irq.handler = handler
+
+    period_us = 60000000 // (rpm * 2)
+    t_us = clock.now_us() + 1000
+    for i in range(INJECTIONS + 1):
+        clock.schedule(t_us, lambda: pin.drive(0))
+        clock.schedule(t_us + pulse_us, lambda: pin.drive(1))
+        t_us += period_us
+
+    widths = array('I', [0] * 32)
+    periods = array('I', [0] * 32)
+    drain_seconds = 0.0
+    pulses = 0
+    width_err = period_err = 0
+    period_samples = 0
+    # Головний цикл забирає імпульси кожні 10 мс віртуального часу.
+    while pulses < INJECTIONS and clock.now_us() < t_us + 10000:
+        clock.advance_us(10000)
+        while True:
+            t0 = real_time.perf_counter()
+            n = capture.drain(widths, periods)
+            drain_seconds += real_time.perf_counter() - t0
+            for i in range(n):
+                width_err += abs(widths[i] - pulse_us)
+                if periods[i]:
+                    period_err += abs(periods[i] - period_us)
+                    period_samples += 1
+            pulses += n
+            if n < len(widths):
+                break
+
+    return {
+        'backend': backend,
+        'pulses': pulses,
+        'irq_calls': handler.calls,
+        'cpu_us_per_1000': (handler.seconds + drain_seconds) * 1e6 * 1000 / max(pulses, 1),
+        'irq_us_per_1000': handler.seconds * 1e6 * 1000 / max(pulses, 1),
+        'width_err_us': width_err / max(pulses, 1),
+        'period_err_us': period_err / max(period_samples, 1),
+        'overflow': capture.overflow,
+    }
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare IRQ and PIO injector capture backends.")
+    parser.add_argument('--rpm', type=int, default=3000)
+    parser.add_argument('--pulse-us', type=int, default=2500)
+    parser.add_argument('--irq-latency-us', type=int, default=40,
+                        help="max modelled GPIO interrupt entry latency (uniform 0..N)")
+    args = parser.parse_args()
+
+    print("{} injections at {} rpm, {} us pulse".format(INJECTIONS, args.rpm, args.pulse_us))
+    print("{:<5} {:>7} {:>10} {:>16} {:>16} {:>12} {:>12}".format(
+        'mode', 'pulses', 'IRQ calls', 'CPU us/1000 inj', 'IRQ us/1000 inj', 'width err', 'period err'))
+    results = {}
+    for backend in ('irq', 'pio'):
+        r = run(backend, args.rpm, args.pulse_us, args.irq_latency_us)
+        print("{backend:<5} {pulses:>7} {irq_calls:>10} {cpu_us_per_1000:>16.0f} {irq_us_per_1000:>16.0f} "
+              "{width_err_us:>9.1f} us {period_err_us:>9.1f} us".format(**r))
+        assert r['pulses'] == INJECTIONS and r['overflow'] == 0
+        results[backend] = r
+    if results['pio']['cpu_us_per_1000'] >= results['irq']['cpu_us_per_1000']:
+        print("FAIL: PIO capture must cost less CPU than GPIO interrupts")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
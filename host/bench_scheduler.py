@@ -0,0 +1,183 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_scheduler.py
+# Опис: Перевірка планувальника задач прошивки (uasyncio) на віртуальному
+#       годиннику host/sim.py. Виводить для кожної задачі гістограму
+#       запізнення пробудження відносно запланованого моменту, а також
+#       затримки реакції, видимі водієві:
+#       - натискання кнопки -> сигнал готовності скидання TRIP (мета: 2000 мс);
+#       - тривалість фаз звукової тривоги відносно ALARM_SEQUENCE.
+#       --cpu-scale N: кожен крок задачі займає N x реальний час виконання
+#       на ПК (наближення повільнішого CPU Pico; 0 - миттєве виконання,
+#       тоді всі гістограми нульові). За замовчуванням DEFAULT_CPU_SCALE.
+#       Примітиви framebuf на Pico написані на C, а на ПК - на Python, тож
+#       їхній час зараховується 1:1, без N (--python-framebuf - з N, як
+#       решта коду). gc.collect() - теж C на обох, і теж 1:1. Передача по I2C на Pico блокує CPU, а на ПК миттєва,
+#       тож до кроку додається час шини (9 біт на байт при I2C_FREQ).
+#       Для кожної задачі виводиться також середній та найдовший крок:
+#       найдовший крок визначає найбільше запізнення решти задач.
+# Запуск: python host/bench_scheduler.py --minutes 5 [--cpu-scale 5] [--python-framebuf]
+# ==============================================================================
+
+import gc
+import os
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+
+import framebuf
+import machine
+import sim as simulator
+import uasyncio
+
+# Інтерпретатор MicroPython на Pico у десятки разів повільніший за CPython,
+# але framebuf/sh1107 на Pico - це C, а на ПК - Python, тож крок display_task
+# тут і так дорожчий. 5 - компроміс: прикладний код задач отримує реалістичну
+# вартість, а малювання кадру не домінує над усіма іншими затримками.
+DEFAULT_CPU_SCALE = 5.0
+
+
+def _histogram_row(st):
+    cells = ' '.join('{:>7}'.format(n) for n in st.histogram)
+    mean_us = st.total_late_us / st.wakeups if st.wakeups else 0
+    step_us = st.total_step_us / st.wakeups if st.wakeups else 0
+    return "{:<20} {:>7} {} {:>9.0f} {:>9.1f} {:>9.2f} {:>9.1f}".format(
+        st.name, st.wakeups, cells, mean_us, st.max_late_us / 1000.0, step_us / 1000.0, st.max_step_us / 1000.0)
+
+
+def _native(framebuf_too):
+    """
+    Час gc.collect() (і примітивів framebuf, якщо framebuf_too) зараховується
+    в uasyncio.native_s (вкладені виклики - один раз).
+    """
+    depth = [0]
+
+    def wrap(method):
+        def timed(*args, **kwargs):
+            if depth[0]:
+                return method(*args, **kwargs)
+            depth[0] += 1
+            t0 = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                uasyncio.native_s += time.perf_counter() - t0
+                depth[0] -= 1
+        return timed
+
+    gc.collect = wrap(gc.collect)
+    if framebuf_too:
+        for name in ('pixel', 'fill', 'fill_rect', 'hline', 'vline', 'rect', 'line', 'text', 'blit', 'scroll'):
+            setattr(framebuf.FrameBuffer, name, wrap(getattr(framebuf.FrameBuffer, name)))
+
+
+def _blocking_i2c():
+    """Час шини кожної транзакції I2C зараховується в uasyncio.blocking_us."""
+    def wrap(method):
+        def timed(self, *args, **kwargs):
+            before = self.bytes_written
+            result = method(self, *args, **kwargs)
+            uasyncio.blocking_us += (self.bytes_written - before) * 9 * 1000000 // self.freq
+            return result
+        return timed
+
+    machine.I2C.writeto = wrap(machine.I2C.writeto)
+    machine.I2C.writevto = wrap(machine.I2C.writevto)
+
+
+def _speaker_edges(pwm, since_us):
+    """Моменти увімкнення/вимкнення звуку: [(час_мкс, звучить)]."""
+    edges = []
+    sounding = False
+    for t_us, freq, duty in pwm.history:
+        now = duty > 0 and freq > 0
+        if t_us >= since_us and now != sounding:
+            edges.append((t_us, now))
+        sounding = now
+    return edges
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Per-task latency histograms of the firmware scheduler.")
+    parser.add_argument('--minutes', type=float, default=5.0)
+    parser.add_argument('--cpu-scale', type=float, default=DEFAULT_CPU_SCALE,
+                        help="virtual time charged per task step = real CPU time x scale "
+                             "(default {}; 0 = instant steps)".format(DEFAULT_CPU_SCALE))
+    parser.add_argument('--python-framebuf', action='store_true',
+                        help="charge host framebuf primitives x scale too (they are C on the Pico)")
+    args = parser.parse_args()
+
+    _native(not args.python_framebuf)
+    _blocking_i2c()
+
+    sim = simulator.Simulator()
+    settings = sim.settings
+    sim.drive_engine((2500, 3000))
+    sim.drive_vehicle(90)
+    uasyncio.cpu_scale = args.cpu_scale
+
+    # Кнопка: натискання на 3 с кожні 20 с (скидання TRIP).
+    presses = []
+    duration_s = args.minutes * 60
+    t = 5.0
+    while t < duration_s - 10:
+        presses.append(sim.clock.now_us() + int(t * 1000000))
+        sim.press_button(3000, delay_ms=int(t * 1000))
+        t += 20.0
+    sim.run(duration_s)
+
+    # Тривога: датчик гальмівної рідини на 60 с.
+    alarm_start_us = sim.clock.now_us()
+    sim.set_sensor(settings.PIN_SENSOR_BRAKE_FLUID, 0)
+    sim.run(60)
+    sim.set_sensor(settings.PIN_SENSOR_BRAKE_FLUID, 1)
+    sim.run(5)
+    uasyncio.cpu_scale = 0.0
+
+    print("simulated {:.1f} min, cpu scale {:g}{}".format(
+        duration_s / 60 + 65 / 60.0, args.cpu_scale,
+        " (default)" if args.cpu_scale == DEFAULT_CPU_SCALE else ""))
+    print("gc.collect charged 1:1, framebuf {}, I2C bus time charged as blocking".format(
+        "x scale (Python on host)" if args.python_framebuf else "1:1 (C on the Pico)"))
+    if args.cpu_scale <= 0:
+        print("note: cpu scale 0 charges no time per step, lateness below is queueing only")
+    bounds = uasyncio.TaskStats.BUCKETS_US
+    header = ' '.join('{:>7}'.format('<{}ms'.format(b / 1000) if b < 1000000 else '<1s') for b in bounds) + ' {:>7}'.format('>=1s')
+    print("{:<20} {:>7} {} {:>9} {:>9} {:>9}".format('task', 'wakeups', header, 'mean us', 'max ms', 'step ms', 'max step'))
+    for name in sorted(uasyncio.stats):
+        print(_histogram_row(uasyncio.stats[name]))
+    if args.cpu_scale > 0:
+        # Найдовший крок затримує всі інші задачі: він визначає max ms у таблиці.
+        worst = max(uasyncio.stats.values(), key=lambda st: st.max_step_us)
+        print("longest step: {} {:.1f} ms".format(worst.name, worst.max_step_us / 1000.0))
+
+    # Реакція на кнопку: перший звук після натискання проти ідеального моменту (утримання 2000 мс).
+    edges = _speaker_edges(sim.speaker, 0)
+    delays = []
+    for press_us in presses:
+        target = press_us + settings.BUTTON_TRIP_RESET_HOLD_MS * 1000
+        later = [t_us for t_us, on in edges if on and t_us >= target]
+        if later:
+            delays.append((later[0] - target) / 1000.0)
+    if delays:
+        print("button hold -> TRIP-ready beep: n={} mean {:.1f} ms max {:.1f} ms (legacy 1 s loop: up to 1000 ms)".format(
+            len(delays), sum(delays) / len(delays), max(delays)))
+
+    # Тривога: тривалість фаз відносно ALARM_SEQUENCE.
+    sequence = settings.ALARM_SEQUENCE
+    alarm_edges = _speaker_edges(sim.speaker, alarm_start_us)
+    errors = []
+    for (t0, _), (t1, _) in zip(alarm_edges, alarm_edges[1:]):
+        actual_ms = (t1 - t0) / 1000.0
+        expected = min((d for d, _ in sequence), key=lambda d: abs(d - actual_ms))
+        errors.append(abs(actual_ms - expected))
+    if errors:
+        print("alarm phase timing: {} transitions, mean error {:.1f} ms, max {:.1f} ms".format(
+            len(errors), sum(errors) / len(errors), max(errors)))
+
+
+if __name__ == "__main__":
+    main()
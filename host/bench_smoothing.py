@@ -0,0 +1,75 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_smoothing.py
+# Опис: Бенчмарк на ПК: час одного оновлення згладжування рівня палива
+#       залежно від розміру буфера - попередній спосіб (pop(0)/append та
+#       sum() усього списку) проти фільтрів SmoothingFilter.
+#       Сигнал - рівень палива з коливаннями в баку та шумом ADC.
+#       Перевіряється, що MeanFilter дає те саме середнє, що й sum().
+# Запуск: python host/bench_smoothing.py
+# ==============================================================================
+
+import math
+import os
+import random
+import sys
+import time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import SmoothingFilter
+
+UPDATES = 20000
+SIZES = (16, 64, 256)
+
+
+def fuel_signal(n, seed=1):
+    """Рівень палива (%): повільне зниження, хлюпання палива в баку та шум ADC."""
+    rnd = random.Random(seed)
+    return [60.0 - i * 0.0005 + 4.0 * math.sin(i * 0.7) + rnd.gauss(0.0, 0.8) for i in range(n)]
+
+
+def list_mean(size, samples):
+    """Попередній спосіб: FIFO-список та sum() на кожне оновлення."""
+    buf = [samples[0]] * size
+    out = 0.0
+    for x in samples:
+        buf.pop(0)
+        buf.append(x)
+        out = sum(buf) / len(buf)
+    return out
+
+
+def run_filter(flt, samples):
+    out = 0.0
+    for x in samples:
+        out = flt.update(x)
+    return out
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - t0) / UPDATES * 1e6
+
+
+def main():
+    samples = fuel_signal(UPDATES)
+    ok = True
+    print("{:>5} {:>12} {:>12} {:>12} {:>12}".format('size', 'list, us', 'mean, us', 'ema, us', 'median, us'))
+    for size in SIZES:
+        ref, t_list = timed(list_mean, size, samples)
+        mean, t_mean = timed(run_filter, SmoothingFilter.MeanFilter(size, samples[0]), samples)
+        _, t_ema = timed(run_filter, SmoothingFilter.EmaFilter(2.0 / (size + 1), samples[0]), samples)
+        _, t_median = timed(run_filter, SmoothingFilter.MedianFilter(size, samples[0]), samples)
+        print("{:>5} {:>12.2f} {:>12.2f} {:>12.2f} {:>12.2f}".format(size, t_list, t_mean, t_ema, t_median))
+        if abs(mean - ref) > 0.001:
+            print("FAIL: MeanFilter {:.4f} != list mean {:.4f}".format(mean, ref))
+            ok = False
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
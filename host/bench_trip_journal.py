@@ -0,0 +1,189 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_trip_journal.py
+# Опис: Порівняння на ПК старого збереження TRIP/PERS (4 рядки str(float) у
+#       тимчасовий файл + remove + rename + rename) з журналом
+#       TripJournal.py (кожне збереження примусове, без порогу змін). Рахує
+#       коміти метаданих файлової системи за однією моделлю для обох схем
+#       (як TripJournal.estimated_erases() та host/bench_flash_wear.py):
+#       - старий запис: створення tmp, закриття з даними, remove, rename,
+#         rename - п'ять комітів;
+#       - журнал: кожен append() з flush() - один коміт (розмір файлу), кожен
+#         перехід на новий сегмент - ще два (обрізання та перший запис).
+#       Також байти даних, запрограмовані сторінки (KB) та час виклику.
+#       Журнал зменшує кількість комітів на збереження приблизно в 5 разів;
+#       частота записів визначається політикою збереження
+#       (PersistencePolicy, пороги змін), а не журналом.
+#       Додатково перевіряє відновлення після відключення живлення: журнал
+#       обрізається на кожному байті останнього запису, load() має
+#       повернути попередній цілий запис, а наступні записи - читатися.
+# Запуск: python host/bench_trip_journal.py --saves 10000
+# ==============================================================================
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time as real_time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import TripCounter
+import TripJournal
+
+
+# Комітів метаданих littlefs на перехід журналу на новий сегмент.
+ROLLOVER_META_COMMITS = 2
+
+
+class _FsCounter:
+    """Лічильник комітів метаданих (створення/закриття, os.remove/os.rename) та байтів даних."""
+
+    def __init__(self):
+        self.meta_ops = 0
+        self.bytes_written = 0
+
+    def remove(self, path):
+        self.meta_ops += 1
+        os.remove(path)
+
+    def rename(self, src, dst):
+        self.meta_ops += 1
+        os.rename(src, dst)
+
+
+def legacy_save(fs, values):
+    """Копія старого save_persistent_data() (без перевірки інтервалу)."""
+    with open('trip_data.tmp', 'w') as f:
+        for v in values:
+            line = str(v) + '\n'
+            f.write(line)
+            fs.bytes_written += len(line)
+    fs.meta_ops += 2 # Створення trip_data.tmp та закриття з даними.
+    try: fs.remove('trip_data.bak')
+    except OSError: pass
+    try: fs.rename('trip_data.txt', 'trip_data.bak')
+    except OSError: pass
+    fs.rename('trip_data.tmp', 'trip_data.txt')
+
+
+def run_legacy(saves):
+    fs = _FsCounter()
+    t0 = real_time.perf_counter()
+    for i in range(saves):
+        legacy_save(fs, (i * 0.001, i * 0.01, i * 0.0005, i * 0.005))
+    elapsed = real_time.perf_counter() - t0
+    # Кожен коміт програмує щонайменше одну сторінку Flash.
+    return fs.meta_ops, fs.bytes_written, elapsed, 0, fs.meta_ops * TripJournal.FLASH_PROG_SIZE
+
+
+def _counters():
+    """Лічильники PERS і TRIP (коефіцієнти перетворення на запис цілих не впливають)."""
+    return TripCounter.TripCounter(1e-8, 5000), TripCounter.TripCounter(1e-8, 5000)
+
+
+def run_journal(saves):
+    journal = TripJournal.TripJournal('trip_journal_{}.bin', 4, 4096)
+    journal.load()
+    pers, trip = _counters()
+    t0 = real_time.perf_counter()
+    for i in range(saves):
+        pers.add(100000, 50)
+        trip.add(50000, 25)
+        journal.append(pers, trip, force=True)
+    elapsed = real_time.perf_counter() - t0
+    journal.close()
+    # Коміт на кожен записаний append() + коміти переходів кільця.
+    meta = journal.records_written + journal.rollovers * ROLLOVER_META_COMMITS
+    prog = journal.records_written * TripJournal.APPEND_PROG_BYTES + journal.rollovers * TripJournal.ROLLOVER_PROG_BYTES
+    return meta, journal.records_written * TripJournal.RECORD_SIZE, elapsed, journal.rollovers, prog
+
+
+def check_power_loss():
+    """Обрізає журнал на кожному байті останнього запису та перевіряє відновлення."""
+    size = TripJournal.RECORD_SIZE
+    journal = TripJournal.TripJournal('cut_{}.bin', 2, 4096)
+    pers, trip = _counters()
+    for i in range(5):
+        pers.restore(i, i * 1000, i * 10)
+        trip.restore(0, i * 500, i * 5)
+        journal.append(pers, trip, force=True)
+    journal.close()
+    with open('cut_0.bin', 'rb') as f:
+        data = f.read()
+    for cut in range(4 * size, 5 * size):
+        for name in ('cut_0.bin', 'cut_1.bin'):
+            if os.path.exists(name):
+                os.remove(name)
+        with open('cut_0.bin', 'wb') as f:
+            f.write(data[:cut])
+        journal = TripJournal.TripJournal('cut_{}.bin', 2, 4096)
+        assert journal.load() == (3, 3000, 30, 0, 1500, 15), cut
+        pers.restore(7, 7000, 70)
+        trip.restore(0, 3500, 35)
+        journal.append(pers, trip)
+        journal.close()
+        assert TripJournal.TripJournal('cut_{}.bin', 2, 4096).load() == (7, 7000, 70, 0, 3500, 35), cut
+    # Пошкоджений байт у середині: запис пропускається, останній цілий - відновлюється.
+    os.remove('cut_1.bin')
+    corrupted = bytearray(data)
+    corrupted[4 * size + 10] ^= 0xFF
+    with open('cut_0.bin', 'wb') as f:
+        f.write(corrupted)
+    assert TripJournal.TripJournal('cut_{}.bin', 2, 4096).load() == (3, 3000, 30, 0, 1500, 15)
+    return size
+
+
+def check_legacy():
+    """Записи попереднього формату (float32) читає лише load_legacy(); новий запис їх витісняє."""
+    import struct
+    journal = TripJournal.TripJournal('old_{}.bin', 2, 4096)
+    buf = bytearray(28)
+    struct.pack_into('<IIffff', buf, 0, 0x4A505254, 9, 12.5, 250.0, 1.5, 20.0)
+    journal._crc(buf, 24, True)
+    with open('old_0.bin', 'wb') as f:
+        f.write(buf)
+    assert journal.load() is None
+    assert journal.load_legacy() == (12.5, 250.0, 1.5, 20.0)
+    pers, trip = _counters()
+    pers.set(12.5, 250.0)
+    trip.set(1.5, 20.0)
+    journal.append(pers, trip, force=True)
+    journal.close()
+    reloaded = TripJournal.TripJournal('old_{}.bin', 2, 4096)
+    assert reloaded.load() == (pers.inj_hi, pers.inj_lo, pers.pulses, trip.inj_hi, trip.inj_lo, trip.pulses)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Legacy text save vs append-only trip journal.")
+    parser.add_argument('--saves', type=int, default=10000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='trip_journal_')
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        print("{} saves".format(args.saves))
+        print("{:<8} {:>16} {:>12} {:>10} {:>12} {:>10}".format(
+            'mode', 'fs meta commits', 'data bytes', 'prog KB', 'us per save', 'rollovers'))
+        for name, func in (('legacy', run_legacy), ('journal', run_journal)):
+            meta, data_bytes, elapsed, rollovers, prog = func(args.saves)
+            print("{:<8} {:>16} {:>12} {:>10} {:>12.1f} {:>10}".format(
+                name, meta, data_bytes, prog // 1024, elapsed * 1e6 / args.saves, rollovers))
+        with contextlib.redirect_stdout(io.StringIO()): # Попередження load() про відкинутий хвіст.
+            record_size = check_power_loss()
+        print("power-loss recovery: journal cut at every byte of the last {}-byte record -> OK".format(record_size))
+        check_legacy()
+        print("previous float32 record format: migrated by load_legacy() -> OK")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_vss_counter.py
+# Опис: Бенчмарк на ПК: підрахунок імпульсів VSS перериваннями GPIO
+#       (VssCounter.IrqCounter) проти апаратного лічильника зрізу PWM
+#       (VssCounter.PwmCounter, модель регістрів у host/machine.py).
+#       Рахує входи в Python-обробники, CPU-час прошивки (обробник IRQ +
+#       take() раз на секунду) та пройдену відстань.
+# Запуск: python host/bench_vss_counter.py --speed 180 --seconds 60
+# ==============================================================================
+
+import os
+import sys
+import time as real_time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import machine
+from sim import VirtualClock
+
+import Settings
+
+
+def _load_counter_module(clock):
+    """Імпортує VssCounter з віртуальним time."""
+    real_module = sys.modules['time']
+    sys.modules['time'] = clock.make_time_module()
+    sys.modules.pop('VssCounter', None)
+    try:
+        import VssCounter
+    finally:
+        sys.modules['time'] = real_module
+    return VssCounter
+
+
+class _Timed:
+    """Обгортка обробника, що накопичує CPU-час та кількість викликів."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __call__(self, *args):
+        t0 = real_time.perf_counter()
+        self.func(*args)
+        self.seconds += real_time.perf_counter() - t0
+        self.calls += 1
+
+
+def run(backend, speed_kmh, seconds):
+    machine.reset_registry()
+    clock = VirtualClock()
+    machine.set_clock(clock)
+    module = _load_counter_module(clock)
+
+    pin = machine.Pin(Settings.PIN_VSS, machine.Pin.IN, machine.Pin.PULL_UP)
+    handler = None
+    if backend == 'pwm':
+        counter = module.PwmCounter(Settings.PIN_VSS)
+        counter.start()
+    else:
+        counter = module.IrqCounter(pin, Settings.VSS_DEBOUNCE_US)
+        counter.start()
+        handler = _Timed(pin._irq.handler)
+        pin._irq.handler = handler
+
+    period_us = 3600e6 / (speed_kmh * Settings.VSS_IMPULSES_PER_KM)
+    t_us = float(clock.now_us())
+    end_us = clock.now_us() + seconds * 1000000
+    pulses = 0
+    while t_us < end_us:
+        at = int(t_us)
+        clock.schedule(at, lambda: pin.drive(0))
+        clock.schedule(at + int(min(period_us / 2, 1000)), lambda: pin.drive(1))
+        pulses += 1
+        t_us += period_us
+
+    counted = 0
+    take_seconds = 0.0
+    for _ in range(seconds + 1):
+        clock.advance_us(1000000)
+        t0 = real_time.perf_counter()
+        counted += counter.take()
+        take_seconds += real_time.perf_counter() - t0
+
+    irq_seconds = handler.seconds if handler else 0.0
+    return {
+        'backend': backend,
+        'pulses': pulses,
+        'counted': counted,
+        'irq_calls': handler.calls if handler else 0,
+        'cpu_us_per_s': (irq_seconds + take_seconds) * 1e6 / seconds,
+        'distance_km': counted / Settings.VSS_IMPULSES_PER_KM,
+    }
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare IRQ and PWM-counter VSS backends.")
+    parser.add_argument('--speed', type=float, default=180, help="km/h")
+    parser.add_argument('--seconds', type=int, default=60)
+    args = parser.parse_args()
+
+    print("{:.0f} km/h for {} s ({:.0f} VSS pulses/s)".format(
+        args.speed, args.seconds, args.speed * Settings.VSS_IMPULSES_PER_KM / 3600))
+    print("{:<5} {:>8} {:>8} {:>10} {:>14} {:>12}".format(
+        'mode', 'pulses', 'counted', 'IRQ calls', 'CPU us per s', 'distance'))
+    for backend in ('irq', 'pwm'):
+        r = run(backend, args.speed, args.seconds)
+        print("{backend:<5} {pulses:>8} {counted:>8} {irq_calls:>10} {cpu_us_per_s:>14.1f} "
+              "{distance_km:>9.3f} km".format(**r))
+        assert r['counted'] == r['pulses']
+
+
+if __name__ == "__main__":
+    main()
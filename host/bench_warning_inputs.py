@@ -0,0 +1,135 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/bench_warning_inputs.py
+# Опис: Перевірка датчиків попереджень на перериваннях (WarningInputs) у
+#       host/sim.py. Двигун працює на холостому ході, датчики вмикаються в
+#       моменти, не кратні кадру display_task():
+#       - затримка від фронту датчика до звукової тривоги
+#         (sensor_alarm_active) та режиму ERROR_CYCLE; раніше пін читався
+#         раз на кадр, тож затримка була до UPDATE_INTERVAL_SEC;
+#       - короткі імпульси (коротші за WARNING_DEBOUNCE_MS) рахуються як
+#         завади і не вмикають тривогу;
+#       - критична помилка закриває спеціальний екран одразу;
+#       - поки подій немає, warning_task() не відмічається в
+#         task_heartbeat_ms і watchdog годується.
+# Запуск: python host/bench_warning_inputs.py
+# ==============================================================================
+
+import os
+import sys
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HOST_DIR)
+
+import sim as simulator
+
+EDGE_OFFSETS_MS = (137, 401, 733, 999) # Моменти фронту відносно секунди (не кратні кадру).
+GLITCH_COUNT = 20
+GLITCH_MS = 10
+STEP_S = 0.001
+
+
+def _start(**settings):
+    sim = simulator.Simulator(settings=settings)
+    sim.drive_engine((900, 2500))
+    sim.run(3.0)
+    return sim
+
+
+def _wait_for(sim, condition, limit_s):
+    """Крокує по 1 мс, доки condition() не стане істинним; повертає мс або None."""
+    t0 = sim.clock.now_us()
+    while sim.clock.now_us() - t0 < limit_s * 1000000:
+        if condition():
+            return (sim.clock.now_us() - t0) / 1000.0
+        sim.run(STEP_S)
+    return None
+
+
+def alarm_latency(offset_ms):
+    sim = _start()
+    pin = sim.settings.PIN_SENSOR_BRAKE_FLUID
+    sim.run((1000 - sim.clock.now_us() // 1000 % 1000 + offset_ms) / 1000.0)
+    sim.set_sensor(pin, 0)
+    fw = sim.fw
+    alarm_ms = _wait_for(sim, lambda: fw.sensor_alarm_active, 2.0)
+    mode = fw.current_display_mode
+    return alarm_ms, mode, sim
+
+
+def glitches():
+    sim = _start()
+    pin = sim.settings.PIN_SENSOR_OVERHEAT_AND_LOW_COOLANT
+    fw = sim.fw
+    alarm = False
+    for _ in range(GLITCH_COUNT):
+        sim.set_sensor(pin, 0)
+        sim.run(GLITCH_MS / 1000.0)
+        sim.set_sensor(pin, 1)
+        sim.run(0.09)
+        alarm = alarm or fw.sensor_alarm_active
+    sim.run(2.0)
+    alarm = alarm or fw.sensor_alarm_active
+    return fw.warning_inputs.glitches[1], alarm, fw.current_display_mode
+
+
+def special_screen():
+    sim = _start()
+    fw = sim.fw
+    sim.press_button(sim.settings.BUTTON_SPECIAL_SCREEN_HOLD_MS + 200)
+    sim.run(sim.settings.BUTTON_SPECIAL_SCREEN_HOLD_MS / 1000.0 + 1.0)
+    opened = fw.current_display_mode == "SPECIAL_SCREEN"
+    sim.set_sensor(sim.settings.PIN_SENSOR_OIL_PRESSURE_1_8, 0) # Не критично на холостому ході.
+    sim.run(0.5)
+    kept = fw.current_display_mode == "SPECIAL_SCREEN"
+    sim.set_sensor(sim.settings.PIN_SENSOR_BRAKE_FLUID, 0)
+    left_ms = _wait_for(sim, lambda: fw.current_display_mode == "ERROR_CYCLE", 2.0)
+    return opened, kept, left_ms
+
+
+def idle_heartbeat():
+    sim = _start()
+    sim.run(10.0)
+    fw = sim.fw
+    return 'warning' in fw.task_heartbeat_ms, fw.warning_inputs.changes
+
+
+def main():
+    ok = True
+    settings = None
+    print("{:<28} {:>12} {:>16}".format('edge at (ms into second)', 'alarm, ms', 'mode'))
+    for offset in EDGE_OFFSETS_MS:
+        alarm_ms, mode, sim = alarm_latency(offset)
+        settings = sim.settings
+        debounce_ms = settings.WARNING_DEBOUNCE_MS
+        print("{:<28} {:>12} {:>16}".format(offset, 'none' if alarm_ms is None else "{:.0f}".format(alarm_ms), mode))
+        if alarm_ms is None or alarm_ms > debounce_ms + 5 or mode != "ERROR_CYCLE":
+            print("FAIL: alarm must follow the debounce time, not the display frame")
+            ok = False
+    print("debounce {} ms; polled once per frame before: up to {:.0f} ms".format(
+        debounce_ms, settings.UPDATE_INTERVAL_SEC * 1000))
+
+    count, alarm, mode = glitches()
+    print("{} x {} ms pulses: {} glitches counted, alarm {}, mode {}".format(
+        GLITCH_COUNT, GLITCH_MS, count, 'on' if alarm else 'off', mode))
+    if count != GLITCH_COUNT or alarm or mode != "MAIN":
+        print("FAIL: short pulses must be rejected")
+        ok = False
+
+    opened, kept, left_ms = special_screen()
+    print("special screen: opened {}, kept on non-critical {}, left on brake fluid after {} ms".format(
+        opened, kept, 'never' if left_ms is None else "{:.0f}".format(left_ms)))
+    if not (opened and kept) or left_ms is None or left_ms > debounce_ms + 5:
+        print("FAIL: critical warning must close the special screen")
+        ok = False
+
+    in_heartbeat, changes = idle_heartbeat()
+    print("idle 10 s: {} changes, warning task in heartbeat: {}".format(changes, in_heartbeat))
+    if in_heartbeat or changes:
+        print("FAIL: idle warning task must sleep outside the watchdog heartbeat")
+        ok = False
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
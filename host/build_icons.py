@@ -0,0 +1,194 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/build_icons.py
+# Опис: Збирає icons.bin для Icons.py з бітових мап host/icon_bitmaps.py
+#       (ICON_<КЛЮЧ>) або з PNG (<каталог>/<КЛЮЧ>.png, потрібен Pillow;
+#       світлі пікселі - увімкнені). Розміри кожної іконки перевіряються за
+#       Icons.ERROR_ICONS.
+#       За замовчуванням іконки стискаються PackBits порядково
+#       (Icons.ENCODING_PACKBITS, див. Icons.draw()); --encoding raw - без
+#       стиснення.
+#       Звіт порівнює на ПК завантаження іконок: компіляція та виконання
+#       Python-джерела з літералами bytearray([...]) (як раніше робив
+#       MicroPython при кожному запуску з Icons.py) проти Icons.load() з
+#       icons.bin - час і пікова пам'ять (tracemalloc).
+# Запуск: python host/build_icons.py [--png-dir icons/] [--out icons.bin] [--encoding raw|packbits]
+#         Після збирання: mpremote cp icons.bin :icons.bin
+# ==============================================================================
+
+import os
+import struct
+import sys
+import time
+import tracemalloc
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(HOST_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, HOST_DIR)
+
+import ticks
+ticks.install()
+
+import Icons
+
+SOURCE_FILE = os.path.join(HOST_DIR, 'icon_bitmaps.py')
+
+
+def _stride_size(width, height):
+    return (width + 7) // 8 * height
+
+
+def bitmaps_from_source(path=SOURCE_FILE):
+    """Бітові мапи ICON_<КЛЮЧ> з Python-джерела."""
+    namespace = {}
+    with open(path, encoding='utf-8') as f:
+        exec(compile(f.read(), path, 'exec'), namespace)
+    return {key: bytes(namespace['ICON_' + key]) for key in Icons.ERROR_ICONS if 'ICON_' + key in namespace}
+
+
+def bitmaps_from_png(directory):
+    """Бітові мапи з <каталог>/<КЛЮЧ>.png у форматі MONO_HLSB."""
+    from PIL import Image
+    result = {}
+    for key, icon in Icons.ERROR_ICONS.items():
+        path = os.path.join(directory, key + '.png')
+        if not os.path.exists(path):
+            continue
+        image = Image.open(path).convert('L')
+        if image.size != (icon['width'], icon['height']):
+            raise ValueError("{}: {}x{} expected, got {}x{}".format(path, icon['width'], icon['height'], *image.size))
+        stride = (icon['width'] + 7) // 8
+        data = bytearray(stride * icon['height'])
+        pixels = image.load()
+        for y in range(icon['height']):
+            for x in range(icon['width']):
+                if pixels[x, y] >= 128:
+                    data[y * stride + (x >> 3)] |= 0x80 >> (x & 7)
+        result[key] = bytes(data)
+    return result
+
+
+def packbits_row(row):
+    """Один рядок PackBits: повтори від 2 байтів (n > 128), решта - літерали (n < 128)."""
+    out = bytearray()
+    literal = bytearray()
+    i = 0
+    while i < len(row):
+        run = 1
+        while i + run < len(row) and run < 128 and row[i + run] == row[i]:
+            run += 1
+        # Повтор із 2 байтів усередині літерала не вигідніший за літерал.
+        if run >= 3 or (run == 2 and not literal):
+            if literal:
+                out.append(len(literal) - 1)
+                out += literal
+                literal = bytearray()
+            out.append(257 - run)
+            out.append(row[i])
+            i += run
+            continue
+        literal += row[i:i + run]
+        i += run
+        if len(literal) >= 128:
+            out.append(127)
+            out += literal[:128]
+            literal = literal[128:]
+    if literal:
+        out.append(len(literal) - 1)
+        out += literal
+    return bytes(out)
+
+
+def packbits(data, width, height):
+    """Бітова мапа MONO_HLSB, кожен рядок стиснутий окремо."""
+    stride = (width + 7) // 8
+    return b''.join(packbits_row(data[y * stride:(y + 1) * stride]) for y in range(height))
+
+
+def unpackbits(data, width, height):
+    """Зворотне перетворення (перевірка кодера)."""
+    stride = (width + 7) // 8
+    out = bytearray()
+    p = 0
+    while len(out) < stride * height:
+        n = data[p]
+        p += 1
+        if n < 128:
+            out += data[p:p + n + 1]
+            p += n + 1
+        elif n > 128:
+            out += bytes([data[p]]) * (257 - n)
+            p += 1
+    return bytes(out)
+
+
+def build(bitmaps, encoding=Icons.ENCODING_PACKBITS):
+    """Вміст icons.bin для словника ключ -> бітова мапа."""
+    entries = []
+    for key, icon in Icons.ERROR_ICONS.items():
+        if key not in bitmaps:
+            continue
+        data = bitmaps[key]
+        if len(data) != _stride_size(icon['width'], icon['height']):
+            raise ValueError("{}: {} bytes, expected {} for {}x{}".format(
+                key, len(data), _stride_size(icon['width'], icon['height']), icon['width'], icon['height']))
+        if encoding == Icons.ENCODING_PACKBITS:
+            data = packbits(data, icon['width'], icon['height'])
+            if unpackbits(data, icon['width'], icon['height']) != bitmaps[key]:
+                raise AssertionError("{}: PackBits round trip mismatch".format(key))
+        entries.append((key, icon['width'], icon['height'], data))
+    offset = Icons.HEADER_SIZE + len(entries) * Icons.ENTRY_SIZE
+    out = bytearray(struct.pack(Icons.HEADER_FORMAT, Icons.MAGIC, Icons.VERSION, len(entries)))
+    for key, width, height, data in entries:
+        out += struct.pack(Icons.ENTRY_FORMAT, key.encode(), width, height, offset, len(data), encoding)
+        offset += len(data)
+    for entry in entries:
+        out += entry[3]
+    return bytes(out)
+
+
+def _measure(func):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def report(blob_path):
+    with open(SOURCE_FILE, encoding='utf-8') as f:
+        source = f.read()
+    old_s, old_peak = _measure(lambda: exec(compile(source, SOURCE_FILE, 'exec'), {}))
+    new_s, new_peak = _measure(lambda: Icons.load(blob_path))
+    if Icons.load_error:
+        raise RuntimeError(Icons.load_error)
+    print("{:<28} {:>10} {:>10} {:>12}".format('icon loading (host)', 'file, B', 'time, ms', 'peak RAM, B'))
+    print("{:<28} {:>10} {:>10.2f} {:>12}".format('source literals (old)', len(source.encode()), old_s * 1000, old_peak))
+    print("{:<28} {:>10} {:>10.2f} {:>12}".format('icons.bin + Icons.load()', os.path.getsize(blob_path),
+                                                   new_s * 1000, new_peak))
+    print("{} icons loaded".format(Icons.loaded))
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Build icons.bin for Icons.py from icon_bitmaps.py or PNG files.")
+    parser.add_argument('--png-dir', help="read <KEY>.png from this directory instead of icon_bitmaps.py")
+    parser.add_argument('--out', default=os.path.join(ROOT_DIR, Icons.BLOB_FILE))
+    parser.add_argument('--encoding', choices=('raw', 'packbits'), default='packbits')
+    args = parser.parse_args()
+
+    bitmaps = bitmaps_from_png(args.png_dir) if args.png_dir else bitmaps_from_source()
+    encoding = Icons.ENCODING_RAW if args.encoding == 'raw' else Icons.ENCODING_PACKBITS
+    blob = build(bitmaps, encoding)
+    with open(args.out, 'wb') as f:
+        f.write(blob)
+    print("{}: {} icons, {} bytes ({}; raw bitmaps {} bytes)".format(
+        args.out, len(bitmaps), len(blob), args.encoding, sum(len(b) for b in bitmaps.values())))
+    report(args.out)
+
+
+if __name__ == "__main__":
+    main()
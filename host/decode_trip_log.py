@@ -0,0 +1,115 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/decode_trip_log.py
+# Опис: Розшифровка журналу поїздки TripLogger.py (файли trip_log_*.bin,
+#       скопійовані з Pico, наприклад: mpremote cp :trip_log_0.bin .).
+#       Блоки з усіх файлів упорядковуються за seq; блоки з пошкодженим
+#       заголовком та обірвані блоки в кінці файлу пропускаються. Час
+#       ticks_ms розгортається в межах кожного запуску прошивки (session).
+#       Результат - CSV або масиви NumPy (.npz, стовпці як у CSV).
+#       Пропуски seq (блоки, відкинуті через бюджет Flash) виводяться у звіті.
+# Запуск: python host/decode_trip_log.py trip_log_*.bin --csv trip.csv [--npz trip.npz]
+# ==============================================================================
+
+import csv
+import os
+import struct
+import sys
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import TripLogger
+
+COLUMNS = ('session', 'seq', 't_s', 'rpm', 'speed_kmh', 'l_per_h', 'inj_ms', 'fuel_pct', 'battery_v', 'errors')
+_MAGIC = struct.unpack('<I', b'TRPL')[0]
+
+
+def read_blocks(paths, block_bytes):
+    """Повертає список (seq, session, записи) з усіх файлів, упорядкований за seq."""
+    capacity = (block_bytes - TripLogger.HEADER_SIZE) // TripLogger.RECORD_SIZE
+    blocks = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            data = f.read()
+        for offset in range(0, len(data) - block_bytes + 1, block_bytes):
+            magic, seq, session, count = struct.unpack_from(TripLogger.HEADER_FORMAT, data, offset)
+            if magic != _MAGIC or count > capacity:
+                continue
+            records = [struct.unpack_from(TripLogger.RECORD_FORMAT, data,
+                                          offset + TripLogger.HEADER_SIZE + i * TripLogger.RECORD_SIZE)
+                       for i in range(count)]
+            blocks[seq] = (seq, session, records) # Кільце не містить двох блоків з одним seq.
+    return [blocks[seq] for seq in sorted(blocks)]
+
+
+def decode(paths, block_bytes):
+    """Повертає (рядки за COLUMNS, пропущені seq)."""
+    rows = []
+    missing = []
+    prev_seq = None
+    session = None
+    for seq, block_session, records in read_blocks(paths, block_bytes):
+        if prev_seq is not None and seq > prev_seq + 1:
+            missing.extend(range(prev_seq + 1, seq))
+        prev_seq = seq
+        for t_ms, rpm, errors, speed, l_per_h, inj_us, fuel_pct, volts in records:
+            if block_session != session:
+                session = block_session
+                t_unwrapped = 0
+                t_prev = t_ms
+            # ticks_ms має період 2^30 мс: розгортаємо час у межах запуску.
+            t_unwrapped += (t_ms - t_prev) % TripLogger.TICKS_PERIOD_MS
+            t_prev = t_ms
+            rows.append((session, seq, t_unwrapped / 1000.0, rpm, speed, l_per_h,
+                         inj_us / 1000.0, fuel_pct, volts, errors))
+    return rows, missing
+
+
+def error_names(mask):
+    return '|'.join(key for bit, key in enumerate(TripLogger.ERROR_KEYS) if mask & (1 << bit))
+
+
+def write_csv(rows, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS + ('error_names',))
+        for row in rows:
+            writer.writerow(row[:2] + ('{:.3f}'.format(row[2]), row[3]) +
+                            tuple('{:.4g}'.format(v) for v in row[4:9]) + (row[9], error_names(row[9])))
+
+
+def to_arrays(rows):
+    """Словник стовпців як масиви NumPy (імпорт лише за потреби)."""
+    import numpy as np
+    columns = list(zip(*rows)) if rows else [()] * len(COLUMNS)
+    dtypes = ('u2', 'u4', 'f8', 'u2', 'f4', 'f4', 'f4', 'f4', 'f4', 'u2')
+    return {name: np.array(col, dtype=dtype) for name, col, dtype in zip(COLUMNS, columns, dtypes)}
+
+
+def main():
+    import argparse
+    import Settings
+    parser = argparse.ArgumentParser(description="Decode TripLogger binary files into CSV / NumPy arrays.")
+    parser.add_argument('files', nargs='+', help="trip_log_*.bin files copied from the device")
+    parser.add_argument('--csv', help="write rows to this CSV file")
+    parser.add_argument('--npz', help="write columns to this NumPy .npz file")
+    parser.add_argument('--block-bytes', type=int, default=Settings.TRIP_LOG_BLOCK_BYTES)
+    args = parser.parse_args()
+
+    rows, missing = decode(args.files, args.block_bytes)
+    duration_s = {}
+    for row in rows:
+        duration_s[row[0]] = row[2]
+    print("{} records, {} sessions, {:.1f} min logged, {} blocks missing".format(
+        len(rows), len(duration_s), sum(duration_s.values()) / 60.0, len(missing)))
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.npz:
+        import numpy as np
+        np.savez(args.npz, **to_arrays(rows))
+
+
+if __name__ == "__main__":
+    main()
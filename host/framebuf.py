@@ -0,0 +1,221 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/framebuf.py
+# Опис: Заміна модуля MicroPython `framebuf` для запуску на ПК (CPython).
+#       Реалізує підмножину API FrameBuffer, яку використовує прошивка:
+#       fill, pixel, fill_rect, hline, vline, rect, line, text, blit, scroll.
+#       Шрифт - 8x8 (5x7 гліф у клітинці 8x8), наближення до вбудованого
+#       шрифту MicroPython; для бенчмарків і симуляції цього достатньо.
+# ==============================================================================
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+# 5x7 гліфи ASCII 32..127, по стовпцях (молодший біт - верхній рядок).
+_FONT_5X7 = (
+    (0x00, 0x00, 0x00, 0x00, 0x00), (0x00, 0x00, 0x5F, 0x00, 0x00),  # ' ' '!'
+    (0x00, 0x07, 0x00, 0x07, 0x00), (0x14, 0x7F, 0x14, 0x7F, 0x14),  # '"' '#'
+    (0x24, 0x2A, 0x7F, 0x2A, 0x12), (0x23, 0x13, 0x08, 0x64, 0x62),  # '$' '%'
+    (0x36, 0x49, 0x56, 0x20, 0x50), (0x00, 0x05, 0x03, 0x00, 0x00),  # '&' "'"
+    (0x00, 0x1C, 0x22, 0x41, 0x00), (0x00, 0x41, 0x22, 0x1C, 0x00),  # '(' ')'
+    (0x2A, 0x1C, 0x7F, 0x1C, 0x2A), (0x08, 0x08, 0x3E, 0x08, 0x08),  # '*' '+'
+    (0x00, 0x50, 0x30, 0x00, 0x00), (0x08, 0x08, 0x08, 0x08, 0x08),  # ',' '-'
+    (0x00, 0x60, 0x60, 0x00, 0x00), (0x20, 0x10, 0x08, 0x04, 0x02),  # '.' '/'
+    (0x3E, 0x51, 0x49, 0x45, 0x3E), (0x00, 0x42, 0x7F, 0x40, 0x00),  # '0' '1'
+    (0x42, 0x61, 0x51, 0x49, 0x46), (0x21, 0x41, 0x45, 0x4B, 0x31),  # '2' '3'
+    (0x18, 0x14, 0x12, 0x7F, 0x10), (0x27, 0x45, 0x45, 0x45, 0x39),  # '4' '5'
+    (0x3C, 0x4A, 0x49, 0x49, 0x30), (0x01, 0x71, 0x09, 0x05, 0x03),  # '6' '7'
+    (0x36, 0x49, 0x49, 0x49, 0x36), (0x06, 0x49, 0x49, 0x29, 0x1E),  # '8' '9'
+    (0x00, 0x36, 0x36, 0x00, 0x00), (0x00, 0x56, 0x36, 0x00, 0x00),  # ':' ';'
+    (0x08, 0x14, 0x22, 0x41, 0x00), (0x14, 0x14, 0x14, 0x14, 0x14),  # '<' '='
+    (0x00, 0x41, 0x22, 0x14, 0x08), (0x02, 0x01, 0x51, 0x09, 0x06),  # '>' '?'
+    (0x32, 0x49, 0x79, 0x41, 0x3E), (0x7E, 0x11, 0x11, 0x11, 0x7E),  # '@' 'A'
+    (0x7F, 0x49, 0x49, 0x49, 0x36), (0x3E, 0x41, 0x41, 0x41, 0x22),  # 'B' 'C'
+    (0x7F, 0x41, 0x41, 0x22, 0x1C), (0x7F, 0x49, 0x49, 0x49, 0x41),  # 'D' 'E'
+    (0x7F, 0x09, 0x09, 0x09, 0x01), (0x3E, 0x41, 0x49, 0x49, 0x7A),  # 'F' 'G'
+    (0x7F, 0x08, 0x08, 0x08, 0x7F), (0x00, 0x41, 0x7F, 0x41, 0x00),  # 'H' 'I'
+    (0x20, 0x40, 0x41, 0x3F, 0x01), (0x7F, 0x08, 0x14, 0x22, 0x41),  # 'J' 'K'
+    (0x7F, 0x40, 0x40, 0x40, 0x40), (0x7F, 0x02, 0x0C, 0x02, 0x7F),  # 'L' 'M'
+    (0x7F, 0x04, 0x08, 0x10, 0x7F), (0x3E, 0x41, 0x41, 0x41, 0x3E),  # 'N' 'O'
+    (0x7F, 0x09, 0x09, 0x09, 0x06), (0x3E, 0x41, 0x51, 0x21, 0x5E),  # 'P' 'Q'
+    (0x7F, 0x09, 0x19, 0x29, 0x46), (0x46, 0x49, 0x49, 0x49, 0x31),  # 'R' 'S'
+    (0x01, 0x01, 0x7F, 0x01, 0x01), (0x3F, 0x40, 0x40, 0x40, 0x3F),  # 'T' 'U'
+    (0x1F, 0x20, 0x40, 0x20, 0x1F), (0x3F, 0x40, 0x38, 0x40, 0x3F),  # 'V' 'W'
+    (0x63, 0x14, 0x08, 0x14, 0x63), (0x07, 0x08, 0x70, 0x08, 0x07),  # 'X' 'Y'
+    (0x61, 0x51, 0x49, 0x45, 0x43), (0x00, 0x7F, 0x41, 0x41, 0x00),  # 'Z' '['
+    (0x02, 0x04, 0x08, 0x10, 0x20), (0x00, 0x41, 0x41, 0x7F, 0x00),  # '\' ']'
+    (0x04, 0x02, 0x01, 0x02, 0x04), (0x40, 0x40, 0x40, 0x40, 0x40),  # '^' '_'
+    (0x00, 0x01, 0x02, 0x04, 0x00), (0x20, 0x54, 0x54, 0x54, 0x78),  # '`' 'a'
+    (0x7F, 0x48, 0x44, 0x44, 0x38), (0x38, 0x44, 0x44, 0x44, 0x20),  # 'b' 'c'
+    (0x38, 0x44, 0x44, 0x48, 0x7F), (0x38, 0x54, 0x54, 0x54, 0x18),  # 'd' 'e'
+    (0x08, 0x7E, 0x09, 0x01, 0x02), (0x0C, 0x52, 0x52, 0x52, 0x3E),  # 'f' 'g'
+    (0x7F, 0x08, 0x04, 0x04, 0x78), (0x00, 0x44, 0x7D, 0x40, 0x00),  # 'h' 'i'
+    (0x20, 0x40, 0x44, 0x3D, 0x00), (0x7F, 0x10, 0x28, 0x44, 0x00),  # 'j' 'k'
+    (0x00, 0x41, 0x7F, 0x40, 0x00), (0x7C, 0x04, 0x18, 0x04, 0x78),  # 'l' 'm'
+    (0x7C, 0x08, 0x04, 0x04, 0x78), (0x38, 0x44, 0x44, 0x44, 0x38),  # 'n' 'o'
+    (0x7C, 0x14, 0x14, 0x14, 0x08), (0x08, 0x14, 0x14, 0x18, 0x7C),  # 'p' 'q'
+    (0x7C, 0x08, 0x04, 0x04, 0x08), (0x48, 0x54, 0x54, 0x54, 0x20),  # 'r' 's'
+    (0x04, 0x3F, 0x44, 0x40, 0x20), (0x3C, 0x40, 0x40, 0x20, 0x7C),  # 't' 'u'
+    (0x1C, 0x20, 0x40, 0x20, 0x1C), (0x3C, 0x40, 0x30, 0x40, 0x3C),  # 'v' 'w'
+    (0x44, 0x28, 0x10, 0x28, 0x44), (0x0C, 0x50, 0x50, 0x50, 0x3C),  # 'x' 'y'
+    (0x44, 0x64, 0x54, 0x4C, 0x44), (0x00, 0x08, 0x36, 0x41, 0x00),  # 'z' '{'
+    (0x00, 0x00, 0x7F, 0x00, 0x00), (0x00, 0x41, 0x36, 0x08, 0x00),  # '|' '}'
+    (0x08, 0x08, 0x2A, 0x1C, 0x08), (0x08, 0x1C, 0x2A, 0x08, 0x08),  # '~' DEL
+)
+
+
+class FrameBuffer:
+    """
+    Монохромний FrameBuffer поверх bytearray, сумісний за розкладкою пам'яті
+    з MicroPython (MONO_VLSB / MONO_HLSB / MONO_HMSB).
+    """
+
+    def __init__(self, buffer, width, height, fmt, stride=None):
+        if fmt not in (MONO_VLSB, MONO_HLSB, MONO_HMSB):
+            raise ValueError("invalid format")
+        if stride is None:
+            stride = width
+        if fmt in (MONO_HLSB, MONO_HMSB):
+            stride = (stride + 7) & ~7
+            need = (stride * height) // 8
+        else:
+            need = stride * ((height + 7) // 8)
+        if len(buffer) < need:
+            raise ValueError("buffer too small")
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.format = fmt
+        self.stride = stride
+
+    # --- Доступ до окремих пікселів ---
+    def _get(self, x, y):
+        buf = self.buffer
+        if self.format == MONO_VLSB:
+            return (buf[(y >> 3) * self.stride + x] >> (y & 7)) & 1
+        idx = (y * self.stride + x) >> 3
+        if self.format == MONO_HLSB:
+            return (buf[idx] >> (7 - (x & 7))) & 1
+        return (buf[idx] >> (x & 7)) & 1
+
+    def _set(self, x, y, c):
+        buf = self.buffer
+        if self.format == MONO_VLSB:
+            idx = (y >> 3) * self.stride + x
+            mask = 1 << (y & 7)
+        else:
+            idx = (y * self.stride + x) >> 3
+            mask = 1 << (7 - (x & 7)) if self.format == MONO_HLSB else 1 << (x & 7)
+        if c:
+            buf[idx] |= mask
+        else:
+            buf[idx] &= ~mask & 0xFF
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+        return None
+
+    # --- Примітиви ---
+    def fill(self, c):
+        if self.format == MONO_VLSB or (self.width == self.stride):
+            v = 0xFF if c else 0x00
+            buf = self.buffer
+            for i in range(len(buf)):
+                buf[i] = v
+        else:
+            self.fill_rect(0, 0, self.width, self.height, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        s = self._set
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                s(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def text(self, s, x0, y0, c=1):
+        for ch in s:
+            code = ord(ch)
+            if code < 32 or code > 127:
+                code = 127
+            cols = _FONT_5X7[code - 32]
+            for i in range(5):
+                xx = x0 + 1 + i
+                if 0 <= xx < self.width:
+                    line = cols[i]
+                    for j in range(8):
+                        if line & (1 << j):
+                            yy = y0 + j
+                            if 0 <= yy < self.height:
+                                self._set(xx, yy, c)
+            x0 += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + fbuf.width)
+        y1 = min(self.height, y + fbuf.height)
+        g = fbuf._get
+        s = self._set
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                c = g(xx - x, yy - y)
+                if palette is not None:
+                    c = palette.pixel(c, 0)
+                if c != key:
+                    s(xx, yy, c)
+
+    def scroll(self, xstep, ystep):
+        # Як у MicroPython: вміст зсувається, звільнені пікселі лишаються без змін.
+        # Обхід назустріч зсуву, щоб джерело читалося до перезапису.
+        xs = range(self.width - 1, xstep - 1, -1) if xstep >= 0 else range(0, self.width + xstep)
+        ys = range(self.height - 1, ystep - 1, -1) if ystep >= 0 else range(0, self.height + ystep)
+        g = self._get
+        s = self._set
+        for y in ys:
+            for x in xs:
+                s(x, y, g(x - xstep, y - ystep))
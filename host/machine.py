@@ -0,0 +1,340 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/machine.py
+# Опис: Заміна модуля MicroPython `machine` для симуляції прошивки на ПК.
+#       Pin, ADC, PWM, I2C, WDT, disable_irq/enable_irq, mem32 (з моделлю
+#       лічильника фронтів зрізів PWM). Усі створені об'єкти
+#       реєструються за номером GPIO, щоб симулятор (host/sim.py) міг
+#       керувати рівнями входів, значеннями ADC та читати стан виходів.
+#       Джерело часу підключається симулятором через set_clock().
+# ==============================================================================
+
+# Реєстри об'єктів за номером GPIO.
+pins = {}
+adcs = {}
+pwms = {}
+i2cs = []
+wdts = []
+
+# Початкові стани, які симулятор задає ще до імпорту прошивки
+# (прошивка створює об'єкти Pin/ADC самостійно при ініціалізації).
+pin_levels = {}  # GPIO -> 0/1
+adc_levels = {}  # GPIO -> 0..65535
+
+_clock = None # Об'єкт з методом now_us(); встановлюється симулятором.
+
+
+def set_clock(clock):
+    global _clock
+    _clock = clock
+
+
+def _now_us():
+    return _clock.now_us() if _clock is not None else 0
+
+
+def reset_registry():
+    """Очищає реєстри перед новим запуском прошивки."""
+    mem32.regs.clear()
+    pins.clear()
+    adcs.clear()
+    pin_levels.clear()
+    adc_levels.clear()
+    pwms.clear()
+    del i2cs[:]
+    del wdts[:]
+
+
+# --- Переривання ---
+_irq_depth = 0
+irq_disabled_count = 0 # Скільки разів викликали disable_irq() (для профілювання).
+
+
+def disable_irq():
+    global _irq_depth, irq_disabled_count
+    _irq_depth += 1
+    irq_disabled_count += 1
+    return _irq_depth - 1
+
+
+def enable_irq(state):
+    global _irq_depth
+    _irq_depth = state
+
+
+def irqs_enabled():
+    return _irq_depth == 0
+
+
+def freq(hz=None):
+    return 125000000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def unique_id():
+    return b'\x00\x11\x22\x33\x44\x55\x66\x77'
+
+
+# --- GPIO ---
+class _IRQ:
+    def __init__(self, handler, trigger):
+        self.handler = handler
+        self.trigger = trigger
+        self.count = 0
+
+    def flags(self):
+        return self.trigger
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    ALT = 3
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self.pull = pull
+        existing = pins.get(id)
+        if existing is not None and value is None:
+            self._level = existing._level
+        elif value is not None:
+            self._level = 1 if value else 0
+        elif id in pin_levels:
+            self._level = pin_levels[id]
+        else:
+            self._level = 0 if pull == Pin.PULL_DOWN else 1
+        self._irq = None
+        self._watchers = [] # Симульовані периферійні блоки (PIO), що стежать за фронтами.
+        pins[id] = self
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if mode != -1:
+            self.mode = mode
+        if pull != -1:
+            self.pull = pull
+        if value is not None:
+            self._level = 1 if value else 0
+
+    def value(self, v=None):
+        if v is None:
+            return self._level
+        self._level = 1 if v else 0
+        return None
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self._level = 1
+
+    def off(self):
+        self._level = 0
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        if handler is None:
+            self._irq = None
+        else:
+            self._irq = _IRQ(handler, trigger)
+        return self._irq
+
+    # --- Методи симулятора ---
+    def drive(self, level):
+        """Змінює рівень на вході та викликає обробник IRQ, якщо фронт відповідає тригеру."""
+        level = 1 if level else 0
+        if level == self._level:
+            return
+        self._level = level
+        for watcher in self._watchers:
+            watcher(self, level)
+        _pwm_count_edge(self.id, level)
+        irq = self._irq
+        if irq is None:
+            return
+        edge = Pin.IRQ_RISING if level else Pin.IRQ_FALLING
+        if irq.trigger & edge:
+            irq.count += 1
+            irq.handler(self)
+
+
+# --- Регістри (mem32) ---
+_IO_BANK0_BASE = 0x40014000
+_PWM_BASE = 0x40050000
+_FUNCSEL_PWM = 4
+_ADC_CS = 0x4004C000
+_ADC_CS_READY = 0x100
+
+
+class _Mem32:
+    """
+    Пам'ять регістрів: запис/читання 32-бітних слів за адресою.
+    Лічильник CTR зрізу PWM у режимі підрахунку фронтів входу B
+    (DIVMODE 2/3) збільшується моделлю при фронтах на відповідному піні.
+    ADC завжди готовий (CS.READY): перетворення в моделі миттєві, а FIFO
+    порожній - вибірки доставляє модель DMA (rp2.DMA).
+    """
+
+    def __init__(self):
+        self.regs = {}
+        self.reads = 0
+        self.writes = 0
+
+    def __getitem__(self, addr):
+        self.reads += 1
+        if addr == _ADC_CS:
+            return self.regs.get(addr, 0) | _ADC_CS_READY
+        return self.regs.get(addr, 0)
+
+    def __setitem__(self, addr, value):
+        self.writes += 1
+        self.regs[addr] = value & 0xFFFFFFFF
+
+
+mem32 = _Mem32()
+
+
+def _pwm_count_edge(pin_id, level):
+    if not pin_id & 1 or not mem32.regs:
+        return
+    if mem32.regs.get(_IO_BANK0_BASE + 4 + 8 * pin_id, 0) & 0x1F != _FUNCSEL_PWM:
+        return
+    base = _PWM_BASE + ((pin_id >> 1) & 7) * 0x14
+    csr = mem32.regs.get(base, 0)
+    divmode = (csr >> 4) & 3
+    if not csr & 1 or divmode != (2 if level else 3):
+        return
+    top = mem32.regs.get(base + 0x10, 0xFFFF)
+    ctr = mem32.regs.get(base + 0x08, 0)
+    mem32.regs[base + 0x08] = 0 if ctr >= top else ctr + 1
+
+
+# --- ADC ---
+class ADC:
+    CORE_TEMP = 4
+
+    def __init__(self, pin):
+        self.id = pin.id if isinstance(pin, Pin) else pin
+        self.level_u16 = adc_levels.get(self.id, 0)
+        self.source = None # Необов'язкова функція source(now_us) -> значення 0..65535.
+        self.reads = 0
+        adcs[self.id] = self
+
+    def read_u16(self):
+        self.reads += 1
+        return self._level(_now_us())
+
+    def _level(self, now_us):
+        """Рівень входу в момент now_us (без підрахунку зчитувань; для моделі DMA у rp2.py)."""
+        if self.source is not None:
+            v = int(self.source(now_us))
+        else:
+            v = self.level_u16
+        return max(0, min(65535, v))
+
+
+# --- PWM ---
+class PWM:
+
+    def __init__(self, pin, freq=None, duty_u16=None):
+        self.id = pin.id if isinstance(pin, Pin) else pin
+        self._freq = 0
+        self._duty = 0
+        self.register_writes = 0
+        self.history = [] # (час_мкс, частота, шпаруватість) при кожній зміні стану.
+        pwms[self.id] = self
+        if freq is not None:
+            self.freq(freq)
+        if duty_u16 is not None:
+            self.duty_u16(duty_u16)
+
+    def _log(self):
+        self.history.append((_now_us(), self._freq, self._duty))
+
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        self.register_writes += 1
+        self._freq = int(value)
+        self._log()
+        return None
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        self.register_writes += 1
+        self._duty = int(value)
+        self._log()
+        return None
+
+    def deinit(self):
+        self._duty = 0
+        self._log()
+
+    def is_sounding(self):
+        return self._duty > 0 and self._freq > 0
+
+
+# --- I2C ---
+class I2C:
+    devices = [0x3C] # Адреси пристроїв, що "відповідають" на scan().
+
+    def __init__(self, id, scl=None, sda=None, freq=400000):
+        self.id = id
+        self.freq = freq
+        self.bytes_written = 0
+        self.transactions = 0
+        i2cs.append(self)
+
+    def scan(self):
+        return list(I2C.devices)
+
+    def writeto(self, addr, buf, stop=True):
+        self.transactions += 1
+        self.bytes_written += len(buf) + 1
+        return len(buf)
+
+    def writevto(self, addr, vector, stop=True):
+        self.transactions += 1
+        n = 0
+        for buf in vector:
+            n += len(buf)
+        self.bytes_written += n + 1
+        return n
+
+    def readfrom(self, addr, nbytes, stop=True):
+        return bytes(nbytes)
+
+    def bus_time_us(self):
+        """Оцінка часу передачі всіх записаних байтів (9 біт на байт з ACK)."""
+        return self.bytes_written * 9 * 1000000 // self.freq
+
+
+# --- Watchdog ---
+class WDT:
+
+    def __init__(self, id=0, timeout=5000):
+        self.timeout_ms = timeout
+        self.feeds = 0
+        self.last_feed_us = _now_us()
+        self.max_gap_us = 0
+        wdts.append(self)
+
+    def feed(self):
+        now = _now_us()
+        gap = now - self.last_feed_us
+        if gap > self.max_gap_us:
+            self.max_gap_us = gap
+        self.last_feed_us = now
+        self.feeds += 1
+
+    def expired(self):
+        """True, якщо реальний watchdog уже перезавантажив би мікроконтролер."""
+        return (_now_us() - self.last_feed_us) > self.timeout_ms * 1000
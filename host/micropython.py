@@ -0,0 +1,15 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/micropython.py
+# Опис: Заміна модуля `micropython` для запуску модулів прошивки на ПК.
+# ==============================================================================
+
+
+def const(value):
+    """На ПК const() просто повертає значення (без оптимізації компілятора)."""
+    return value
+
+
+def alloc_emergency_exception_buf(size):
+    """На ПК резервний буфер винятків для IRQ не потрібен."""
+    return None
@@ -0,0 +1,405 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/replay.py
+# Опис: Відтворення їздових циклів через прошивку швидше за реальний час.
+#       Потік подій (фронти форсунки, імпульси VSS, вибірки ADC палива та
+#       напруги, стани пінів датчиків) подається у віртуальну машину
+#       host/sim.py і проходить через InjectorCapture, vss_irq_handler,
+#       process_fuel_smoothing, check_errors та calculate_and_display.
+#       Звіт: подій/с, прискорення відносно реального часу, фінальні TRIP/PERS
+#       та відхилення від "істинних" значень моделі.
+#
+#       Вбудовані сценарії: NEDC та WLTC-подібний цикл (наближення за
+#       опорними точками) з моделлю 4-тактного 4-циліндрового двигуна з
+#       одноточковим впорскуванням (2 впорскування на оберт колінвалу).
+#
+#       Формат запису (CSV): t_us,kind,channel,value
+#         kind: inj | vss (рівень піна), fuel | volt (сире значення ADC),
+#               pin (channel = GPIO, value = рівень)
+# Запуск:
+#   python host/replay.py --cycle nedc
+#   python host/replay.py --cycle wltc --record wltc.csv
+#   python host/replay.py --trace wltc.csv --check 2.0
+# ==============================================================================
+
+import os
+import sys
+import time as real_time
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+if HOST_DIR not in sys.path:
+    sys.path.insert(0, HOST_DIR)
+
+import machine
+import sim as simulator
+
+
+# ------------------------------------------------------------------------------
+# 1. ПРОФІЛІ ШВИДКОСТІ
+# ------------------------------------------------------------------------------
+class DriveCycle:
+    """Кусково-лінійний профіль швидкості: список опорних точок (t_s, км/год)."""
+
+    def __init__(self, name, points):
+        self.name = name
+        self.points = points
+        self.duration_s = points[-1][0]
+
+    def speed_at(self, t_s):
+        pts = self.points
+        if t_s <= pts[0][0]:
+            return pts[0][1]
+        for i in range(1, len(pts)):
+            t1, v1 = pts[i]
+            if t_s <= t1:
+                t0, v0 = pts[i - 1]
+                return v0 + (v1 - v0) * (t_s - t0) / (t1 - t0)
+        return pts[-1][1]
+
+
+# Міський цикл ECE-15 (195 с).
+_ECE15 = [
+    (0, 0), (11, 0), (15, 15), (23, 15), (28, 0), (49, 0), (54, 15), (56, 15), (61, 32),
+    (85, 32), (96, 0), (117, 0), (122, 15), (124, 15), (133, 35), (135, 35), (143, 50),
+    (155, 50), (163, 35), (176, 35), (188, 0), (195, 0),
+]
+# Заміський цикл EUDC (400 с).
+_EUDC = [
+    (0, 0), (20, 0), (25, 15), (27, 15), (36, 35), (38, 35), (46, 50), (48, 50), (61, 70),
+    (111, 70), (119, 50), (188, 50), (201, 70), (251, 70), (286, 100), (316, 100),
+    (336, 120), (346, 120), (362, 80), (370, 50), (380, 0), (400, 0),
+]
+
+
+def _concat(*segments):
+    points = []
+    offset = 0
+    for seg in segments:
+        for t, v in seg:
+            if points and t == 0:
+                continue
+            points.append((offset + t, v))
+        offset = points[-1][0]
+    return points
+
+
+NEDC = DriveCycle("NEDC", _concat(_ECE15, _ECE15, _ECE15, _ECE15, _EUDC))
+
+# WLTC клас 3 - наближення опорними точками по фазах Low / Medium / High / Extra-High
+# (тривалість 589 / 433 / 455 / 323 с, максимальні швидкості 56.5 / 76.6 / 97.4 / 131.3 км/год).
+WLTC = DriveCycle("WLTC", [
+    (0, 0), (11, 0), (25, 18), (40, 0), (60, 0), (80, 30), (110, 26), (130, 0), (175, 0),
+    (200, 40), (240, 45), (270, 20), (300, 0), (330, 0), (360, 56.5), (400, 30), (430, 50),
+    (470, 0), (500, 0), (530, 35), (560, 20), (589, 0),
+    (610, 0), (640, 50), (700, 60), (740, 35), (760, 0), (785, 0), (815, 55), (860, 76.6),
+    (900, 60), (940, 70), (985, 30), (1000, 0), (1022, 0),
+    (1040, 0), (1070, 60), (1110, 85), (1160, 70), (1200, 97.4), (1260, 80), (1300, 90),
+    (1350, 60), (1400, 75), (1460, 40), (1477, 0),
+    (1490, 0), (1520, 70), (1560, 100), (1610, 115), (1660, 131.3), (1700, 120),
+    (1750, 100), (1780, 60), (1795, 0), (1800, 0),
+])
+
+CYCLES = {'nedc': NEDC, 'wltc': WLTC}
+
+
+# ------------------------------------------------------------------------------
+# 2. МОДЕЛЬ ДВИГУНА ТА АВТОМОБІЛЯ
+# ------------------------------------------------------------------------------
+class EngineModel:
+    """
+    4-тактний 4-циліндровий двигун з одноточковим впорскуванням (Mono Motronic):
+    на кожен такт впуску (2 на оберт колінвалу) - одне впорскування.
+    Витрата палива оцінюється з потужності опору руху та ККД двигуна.
+    """
+
+    GEAR_RATIOS = (3.55, 2.11, 1.43, 1.03, 0.84)
+    FINAL_DRIVE = 4.11
+    WHEEL_CIRCUMFERENCE_M = 1.89
+    SHIFT_UP_KMH = (15, 32, 50, 70) # Швидкості перемикання на 2-у..5-у передачу.
+    IDLE_RPM = 850
+    IDLE_FUEL_L_PER_H = 0.8
+    MASS_KG = 1150
+    CDA_M2 = 0.65           # Cx * площа.
+    ROLLING_COEF = 0.012
+    EFFICIENCY = 0.24        # Ефективний ККД двигуна.
+    FUEL_ENERGY_J_PER_L = 32.0e6
+
+    def __init__(self, settings, battery_voltage=14.2):
+        self.settings = settings
+        self.flow_l_per_us = settings.INJ_FLOW_RATE_ML_PER_MIN / (1000 * 60 * 1000000)
+        v_diff = 14.0 - battery_voltage
+        self.dead_time_us = int(max(0, min(500, settings.INJ_DEAD_TIME_US + v_diff * settings.INJ_VOLT_SENSITIVITY)))
+
+    def gear(self, speed_kmh):
+        g = 0
+        while g < len(self.SHIFT_UP_KMH) and speed_kmh >= self.SHIFT_UP_KMH[g]:
+            g += 1
+        return g
+
+    def state(self, speed_kmh, accel_ms2):
+        """Повертає (rpm, ширина_електричного_імпульсу_мкс) для поточного стану руху."""
+        s = self.settings
+        v = speed_kmh / 3.6
+        if speed_kmh < 3:
+            rpm = self.IDLE_RPM
+            fuel_l_per_s = self.IDLE_FUEL_L_PER_H / 3600.0
+        else:
+            ratio = self.GEAR_RATIOS[self.gear(speed_kmh)] * self.FINAL_DRIVE
+            rpm = max(self.IDLE_RPM, v / self.WHEEL_CIRCUMFERENCE_M * 60 * ratio)
+            force = self.MASS_KG * accel_ms2 + self.MASS_KG * 9.81 * self.ROLLING_COEF + 0.6 * self.CDA_M2 * v * v
+            power_w = force * v
+            if power_w <= 0 and rpm > 1200:
+                # Режим примусового холостого ходу: відсічка палива.
+                # Короткий імпульс нижче фільтра MIN_INJ_PULSE_WIDTH_FILTER_US зберігає сигнал RPM.
+                return rpm, self.dead_time_us + s.MIN_INJ_PULSE_WIDTH_FILTER_US // 2
+            fuel_l_per_s = max(self.IDLE_FUEL_L_PER_H / 3600.0,
+                               power_w / (self.EFFICIENCY * self.FUEL_ENERGY_J_PER_L))
+        injections_per_s = rpm * s.RPM_PULSES_PER_ENGINE_REVOLUTION / 60.0
+        open_us = fuel_l_per_s / injections_per_s / self.flow_l_per_us
+        open_us = max(open_us, s.MIN_INJ_PULSE_WIDTH_FILTER_US)
+        return rpm, open_us + self.dead_time_us
+
+
+# ------------------------------------------------------------------------------
+# 3. СИНТЕЗ ПОТОКУ ПОДІЙ
+# ------------------------------------------------------------------------------
+class Trace:
+    """Відсортований за часом список подій (t_us, kind, channel, value) та еталонні підсумки."""
+
+    def __init__(self, name, events, duration_s, truth=None):
+        self.name = name
+        self.events = events
+        self.duration_s = duration_s
+        self.truth = truth or {}
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            f.write("t_us,kind,channel,value\n")
+            for t_us, kind, channel, value in self.events:
+                f.write("{},{},{},{}\n".format(t_us, kind, channel, value))
+
+    @classmethod
+    def load(cls, path):
+        events = []
+        with open(path) as f:
+            f.readline()
+            for line in f:
+                t_us, kind, channel, value = line.rstrip('\n').split(',')
+                events.append((int(t_us), kind, int(channel), int(value)))
+        events.sort(key=lambda e: e[0])
+        duration_s = events[-1][0] / 1000000.0 if events else 0.0
+        return cls(os.path.basename(path), events, duration_s)
+
+
+def synthesize(cycle, settings, fuel_percent=60.0, battery_voltage=14.2):
+    """Генерує потік подій для їздового циклу за моделлю EngineModel."""
+    engine = EngineModel(settings, battery_voltage)
+    events = []
+    duration_us = int(cycle.duration_s * 1000000)
+
+    # Форсунка.
+    fuel_true_l = 0.0
+    t = 0.0
+    while t < duration_us:
+        t_s = t / 1000000.0
+        speed = cycle.speed_at(t_s)
+        accel = (cycle.speed_at(t_s + 0.5) - cycle.speed_at(t_s - 0.5)) / 3.6
+        rpm, pulse_us = engine.state(speed, accel)
+        period_us = 60000000.0 / (rpm * settings.RPM_PULSES_PER_ENGINE_REVOLUTION)
+        pulse_us = int(min(pulse_us, period_us * 0.9))
+        events.append((int(t), 'inj', 0, 0))
+        events.append((int(t) + pulse_us, 'inj', 0, 1))
+        open_us = pulse_us - engine.dead_time_us
+        if open_us >= settings.MIN_INJ_PULSE_WIDTH_FILTER_US:
+            fuel_true_l += open_us * engine.flow_l_per_us
+        t += period_us
+
+    # Датчик швидкості.
+    vss_pulses = 0
+    t = 0.0
+    while t < duration_us:
+        speed = cycle.speed_at(t / 1000000.0)
+        if speed <= 0.5:
+            t += 100000.0
+            continue
+        period_us = 3600000000.0 / (speed * settings.VSS_IMPULSES_PER_KM)
+        events.append((int(t), 'vss', 0, 0))
+        events.append((int(t + min(period_us / 2, 1000)), 'vss', 0, 1))
+        vss_pulses += 1
+        t += period_us
+
+    # ADC палива та напруги раз на секунду; датчик тиску масла 0.3 замкнений без обертів.
+    consumed_l = 0.0
+    for second in range(int(cycle.duration_s) + 1):
+        pct = max(0.0, fuel_percent - consumed_l / settings.FUEL_TANK_CAPACITY_L * 100.0)
+        raw_fuel = int(settings.FUEL_ADC_MIN_RAW + (settings.FUEL_ADC_MAX_RAW - settings.FUEL_ADC_MIN_RAW) * pct / 100.0)
+        events.append((second * 1000000, 'fuel', 0, raw_fuel))
+        events.append((second * 1000000, 'volt', 0, int(battery_voltage / settings.VOLTAGE_CALIBRATION)))
+        consumed_l = fuel_true_l * second / max(1.0, cycle.duration_s)
+    events.append((0, 'pin', settings.PIN_SENSOR_OIL_PRESSURE_0_3, 1))
+
+    events.sort(key=lambda e: e[0])
+    truth = {
+        'fuel_L': fuel_true_l,
+        'distance_km': vss_pulses / settings.VSS_IMPULSES_PER_KM,
+    }
+    return Trace(cycle.name, events, cycle.duration_s, truth)
+
+
+# ------------------------------------------------------------------------------
+# 4. ВІДТВОРЕННЯ
+# ------------------------------------------------------------------------------
+class Replayer:
+    """Подає події трасування у віртуальну машину ланцюжком (у черзі завжди одна подія)."""
+
+    def __init__(self, sim, trace):
+        self.sim = sim
+        self.trace = trace
+        self.events_applied = 0
+        s = sim.settings
+        self._inj = machine.pins[s.PIN_INJ]
+        self._vss = machine.pins[s.PIN_VSS]
+        self._fuel = machine.adcs[s.PIN_FUEL_LEVEL_ADC]
+        self._volt = machine.adcs[s.PIN_ADC]
+        self._base_us = sim.clock.now_us()
+        self._index = 0
+        self._schedule_next()
+
+    def _schedule_next(self):
+        if self._index < len(self.trace.events):
+            self.sim.clock.schedule(self._base_us + self.trace.events[self._index][0], self._apply)
+
+    def _apply(self):
+        events = self.trace.events
+        clock_now = self.sim.clock.now_us()
+        # Застосовуємо всі події з однаковою міткою часу за один виклик.
+        while self._index < len(events) and self._base_us + events[self._index][0] <= clock_now:
+            _, kind, channel, value = events[self._index]
+            if kind == 'inj':
+                self._inj.drive(value)
+            elif kind == 'vss':
+                self._vss.drive(value)
+            elif kind == 'fuel':
+                self._fuel.level_u16 = value
+            elif kind == 'volt':
+                self._volt.level_u16 = value
+            elif kind == 'pin':
+                machine.pins[channel].drive(value)
+            self._index += 1
+            self.events_applied += 1
+        self._schedule_next()
+
+
+def replay(trace, settings_overrides=None, tail_s=3.0):
+    """
+    Відтворює trace у свіжому екземплярі прошивки. Повертає словник зі звітом.
+    tail_s - додатковий час після останньої події, щоб прошивка обробила залишки.
+    """
+    sim = simulator.Simulator(settings=settings_overrides)
+    fw = sim.fw
+    # Прошивка стартує з порожніми лічильниками незалежно від файлів попередніх запусків.
+    fw.trip_counter.reset()
+    fw.pers_counter.reset()
+    fw.sync_trip_values()
+
+    player = Replayer(sim, trace)
+    t0 = real_time.perf_counter()
+    sim.run(trace.duration_s + tail_s)
+    wall = real_time.perf_counter() - t0
+
+    report = {
+        'name': trace.name,
+        'duration_s': trace.duration_s,
+        'wall_s': wall,
+        'events': player.events_applied,
+        'events_per_s': player.events_applied / wall if wall > 0 else 0.0,
+        'speedup': (trace.duration_s + tail_s) / wall if wall > 0 else 0.0,
+        'trip_fuel_L': fw.trip_fuel_consumed_L,
+        'trip_distance_km': fw.trip_distance_travelled_km,
+        'pers_fuel_L': fw.persistent_trip_fuel_L,
+        'pers_distance_km': fw.persistent_trip_distance_km,
+        'persistence': fw.persistence_policy.report(),
+        'trip_log': fw.trip_logger.report() if fw.trip_logger else 'off',
+        'gc': fw.loop_probe.report(),
+        'boot': fw.boot_profile.report(),
+    }
+    report.update({'true_' + k: v for k, v in trace.truth.items()})
+    return report
+
+
+def _pct_error(measured, truth):
+    return (measured - truth) / truth * 100.0 if truth else 0.0
+
+
+def format_report(r):
+    lines = [
+        "{name}: {duration_s:.0f} s simulated in {wall_s:.2f} s (x{speedup:.0f}), "
+        "{events} events, {events_per_s:,.0f} events/s".format(**r),
+        "  TRIP {trip_fuel_L:.3f} L / {trip_distance_km:.3f} km   "
+        "PERS {pers_fuel_L:.3f} L / {pers_distance_km:.3f} km".format(**r),
+        "  persistence: {persistence}".format(**r),
+        "  trip log: {trip_log}".format(**r),
+        "  gc: {gc}".format(**r),
+        "  boot: {boot}".format(**r),
+    ]
+    if 'true_fuel_L' in r:
+        lines.append("  model {:.3f} L / {:.3f} km   TRIP error fuel {:+.2f}% distance {:+.2f}%".format(
+            r['true_fuel_L'], r['true_distance_km'],
+            _pct_error(r['trip_fuel_L'], r['true_fuel_L']),
+            _pct_error(r['trip_distance_km'], r['true_distance_km'])))
+        if r['trip_distance_km'] > 0:
+            lines.append("  TRIP average {:.2f} L/100km (model {:.2f})".format(
+                r['trip_fuel_L'] / r['trip_distance_km'] * 100, r['true_fuel_L'] / r['true_distance_km'] * 100))
+    return '\n'.join(lines)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Replay drive cycles through the firmware faster than real time.")
+    parser.add_argument('--cycle', choices=sorted(CYCLES), default=None, help="built-in synthetic cycle")
+    parser.add_argument('--trace', help="recorded CSV trace to replay")
+    parser.add_argument('--record', help="write the synthetic trace (with --cycle) to this CSV file")
+    parser.add_argument('--check', type=float, default=None,
+                        help="fail if TRIP fuel/distance error exceeds this many percent")
+    parser.add_argument('--adc-dma', action='store_true', help="sample fuel and battery ADC with the DMA backend")
+    parser.add_argument('--gc', action='store_true', help="run the scheduled gc.collect() after every frame")
+    parser.add_argument('--pio', action='store_true', help="measure injector pulses with the PIO backend")
+    parser.add_argument('--pwm-vss', action='store_true', help="count VSS pulses with the PWM slice counter")
+    args = parser.parse_args()
+
+    # Settings потрібен для синтезу ще до завантаження прошивки.
+    import Settings as settings
+
+    traces = []
+    if args.trace:
+        traces.append(Trace.load(args.trace))
+    else:
+        names = [args.cycle] if args.cycle else sorted(CYCLES)
+        for name in names:
+            trace = synthesize(CYCLES[name], settings)
+            if args.record and args.cycle:
+                trace.save(args.record)
+            traces.append(trace)
+
+    # gc.collect() CPython після кожного кадру не моделює купу MicroPython, лише сповільнює прогін.
+    overrides = {'GC_AFTER_FRAME': args.gc}
+    if args.pio:
+        overrides['INJ_CAPTURE_BACKEND'] = 1
+    if args.pwm_vss:
+        overrides['VSS_COUNTER_BACKEND'] = 1
+    if args.adc_dma:
+        overrides['ADC_BACKEND'] = 1
+    failed = False
+    for trace in traces:
+        r = replay(trace, overrides)
+        print(format_report(r))
+        if args.check is not None and 'true_fuel_L' in r:
+            if abs(_pct_error(r['trip_fuel_L'], r['true_fuel_L'])) > args.check or \
+               abs(_pct_error(r['trip_distance_km'], r['true_distance_km'])) > args.check:
+                print("  FAIL: error above {}%".format(args.check))
+                failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/rp2.py
+# Опис: Заміна модуля MicroPython `rp2` для симуляції прошивки на ПК.
+#       Програми PIO не інтерпретуються потактово: для кожної програми
+#       прошивки є поведінкова модель, що за фронтами на піні (machine.Pin)
+#       обчислює ті самі слова, які поклала б у RX FIFO реальна машина станів.
+#       RX FIFO (4 або 8 слів при JOIN_RX) та переривання машини станів
+#       моделюються точно: push(noblock) відкидає слово при повному FIFO,
+#       irq() викликає обробник StateMachine.irq() синхронно. Якщо активний
+#       канал DMA з DREQ RX FIFO цієї машини станів, слово одразу йде в його
+#       буфер (DMA встигає за PIO: FIFO не заповнюється).
+# ==============================================================================
+
+import machine
+
+
+def asm_pio(*args, **kwargs):
+    """Декоратор програми PIO: тіло функції на ПК не виконується."""
+    def decorator(func):
+        func.pio_kwargs = kwargs
+        return func
+    return decorator
+
+
+class PIO:
+    IN_LOW = 0
+    IN_HIGH = 1
+    OUT_LOW = 2
+    OUT_HIGH = 3
+    SHIFT_LEFT = 0
+    SHIFT_RIGHT = 1
+    JOIN_NONE = 0
+    JOIN_TX = 1
+    JOIN_RX = 2
+
+
+class _InjectorPioModel:
+    """
+    Модель програми InjectorCapture._injector_pio.
+    Цикли підрахунку займають 2 такти на відлік X; решта інструкцій між
+    фронтами - фіксовані накладні такти (7 до початку підрахунку імпульсу,
+    11 за повний період), як у програмі. Слова складаються з регістра X так
+    само, як у програмі: (X << 1) | біт, 32 біти. Коли лічильник вичерпано
+    (таймаут періоду або форсунка відкрита довше за таймаут), jmp(x_dec)
+    залишає X = 0xFFFFFFFF, і програма обнуляє його (mov(x, null)) перед
+    записом - EXHAUSTED_X.
+    """
+
+    EXHAUSTED_X = 0 # X після вичерпання лічильника та mov(x, null).
+
+    ON_OVERHEAD_CYCLES = 7
+    PERIOD_OVERHEAD_CYCLES = 11
+
+    def __init__(self, sm, pin):
+        self.sm = sm
+        self.pin = pin
+        self.state = 'pull'    # pull -> sync -> idle -> on -> off -> ...
+        self.start_us = 0
+        self.generation = 0    # Номер поточного періоду (для застарілих таймаутів).
+        pin._watchers.append(self._edge)
+
+    def _cycles(self, from_us, to_us):
+        return (to_us - from_us) * self.sm.freq_hz // 1000000
+
+    def _x(self, cycles, overhead):
+        """Залишок X після cycles тактів підрахунку (лічильник ще не вичерпано)."""
+        count = (cycles - overhead) // 2
+        return self.sm.osr - min(max(count, 0), self.sm.osr)
+
+    @staticmethod
+    def _word(x, bit):
+        return ((x << 1) | bit) & 0xFFFFFFFF
+
+    def activate(self):
+        if self.state == 'pull':
+            self.state = 'sync' if self.pin.value() == 0 else 'idle'
+
+    def _begin(self, now_us):
+        self.start_us = now_us
+        self.state = 'on'
+        self.generation += 1
+        clock = machine._clock
+        if clock is not None and hasattr(clock, 'schedule'):
+            generation = self.generation
+            # Одна подія на період: спершу межа фази ON, звідти - таймаут періоду.
+            on_cycles = self.sm.osr * 2 + self.ON_OVERHEAD_CYCLES
+            clock.schedule(now_us + on_cycles * 1000000 // self.sm.freq_hz + 1,
+                           lambda: self._on_timeout(generation))
+
+    def _on_timeout(self, generation):
+        if generation != self.generation or not self.sm.running:
+            return
+        if self.state == 'off':
+            timeout_cycles = self.sm.osr * 2 + self.PERIOD_OVERHEAD_CYCLES
+            at_us = self.start_us + timeout_cycles * 1000000 // self.sm.freq_hz + 1
+            machine._clock.schedule(at_us, lambda: self._timeout(generation))
+            return
+        if self.state != 'on':
+            return
+        # Форсунка відкрита довше за таймаут: кінець імпульсу з вичерпаним X,
+        # далі фаза OFF з X = 0 одразу завершується записом періоду.
+        self.sm._push(self._word(self.EXHAUSTED_X, 1))
+        self.sm._push(self._word(self.EXHAUSTED_X, 0))
+        if self.pin.value() == 0:
+            self._begin(machine._now_us()) # Все ще відкрита: wrap і новий підрахунок ON.
+        else:
+            self.state = 'idle'
+
+    def _timeout(self, generation):
+        if generation != self.generation or self.state != 'off' or not self.sm.running:
+            return
+        self.state = 'idle'
+        self.sm._push(self._word(self.EXHAUSTED_X, 0))
+
+    def _edge(self, pin, level):
+        if not self.sm.running:
+            return
+        now_us = machine._now_us()
+        state = self.state
+        if state == 'sync':
+            if level:
+                self.state = 'idle'
+        elif state == 'idle':
+            if level == 0:
+                self._begin(now_us)
+        elif state == 'on':
+            if level:
+                x = self._x(self._cycles(self.start_us, now_us), self.ON_OVERHEAD_CYCLES)
+                self.sm._push(self._word(x, 1))
+                self.state = 'off'
+        elif state == 'off':
+            if level == 0:
+                x = self._x(self._cycles(self.start_us, now_us), self.PERIOD_OVERHEAD_CYCLES)
+                self.sm._push(self._word(x, 0))
+                self._begin(now_us)
+
+
+# Поведінкові моделі програм прошивки за іменем функції програми.
+MODELS = {
+    '_injector_pio': _InjectorPioModel,
+}
+
+_SMALL_INT_MAX = 0x3FFFFFFF # Найбільше small int MicroPython на RP2040 (31 біт зі знаком).
+
+state_machines = {} # Реєстр машин станів за номером (для симулятора та бенчмарків).
+
+
+class StateMachine:
+
+    def __init__(self, id, prog=None, freq=125000000, in_base=None, jmp_pin=None, **kwargs):
+        self.id = id
+        self.freq_hz = freq
+        self.running = False
+        self.osr = 0
+        self._tx = []
+        self._rx = []
+        self._handler = None
+        self.pushes = 0         # Усього слів, записаних програмою в RX FIFO.
+        self.dropped = 0        # Слів, відкинутих через повний RX FIFO.
+        self.irqs = 0           # Переривань машини станів.
+        self._hard = False
+        self._in_irq = False    # Виконується обробник irq().
+        join = getattr(prog, 'pio_kwargs', {}).get('fifo_join', PIO.JOIN_NONE)
+        self.rx_depth = 8 if join == PIO.JOIN_RX else 4
+        model = MODELS.get(getattr(prog, '__name__', None))
+        self.model = model(self, jmp_pin or in_base) if model is not None else None
+        state_machines[id] = self
+
+    def active(self, value=None):
+        if value is None:
+            return 1 if self.running else 0
+        self.running = bool(value)
+        if self.running and self._tx:
+            self.osr = self._tx.pop(0)
+        if self.running and self.model is not None:
+            self.model.activate()
+        return None
+
+    def put(self, value, shift=0):
+        self._tx.append(value >> shift)
+
+    def get(self, buf=None, shift=0):
+        word = self._rx.pop(0) >> shift
+        if self._in_irq and self._hard and word > _SMALL_INT_MAX:
+            # MicroPython: слово поза small int - об'єкт у купі, а в hard IRQ купа заблокована.
+            raise MemoryError("memory allocation failed, heap is locked")
+        return word
+
+    def rx_fifo(self):
+        return len(self._rx)
+
+    def tx_fifo(self):
+        return len(self._tx)
+
+    def irq(self, handler=None, trigger=0, hard=False):
+        self._handler = handler
+        self._hard = hard
+
+    # --- Методи моделі ---
+    def _push(self, word):
+        self.pushes += 1
+        dreq = (_DREQ_PIO0_RX0 if self.id < 4 else _DREQ_PIO1_RX0) + (self.id & 3)
+        for dma in dmas:
+            if dma._active and (dma.ctrl >> 15) & 0x3F == dreq:
+                dma._put(word & 0xFFFFFFFF)
+                return
+        if len(self._rx) >= self.rx_depth:
+            self.dropped += 1
+            return
+        self._rx.append(word & 0xFFFFFFFF)
+
+    def _raise_irq(self):
+        self.irqs += 1
+        if self._handler is not None:
+            self._in_irq = True
+            try:
+                self._handler(self)
+            finally:
+                self._in_irq = False
+
+
+# --- DMA ---
+_ADC_BASE = 0x4004C000
+_ADC_CLOCK_HZ = 48000000
+_DREQ_ADC = 36
+_DREQ_PIO0_RX0 = 4
+_DREQ_PIO1_RX0 = 12
+_FIRST_ADC_GPIO = 26
+
+dmas = [] # Реєстр каналів DMA (для симулятора та бенчмарків).
+
+
+class DMA:
+    """
+    Модель каналу DMA. Моделюються передачі ADC FIFO -> буфер (TREQ ADC),
+    якою працює AdcAcquisition.DmaAdc, та RX FIFO PIO -> буфер (TREQ PIO RX,
+    InjectorCapture.PioCapture): слово машини станів записується в буфер
+    у момент push. Для ADC: поки ADC у режимі START_MANY (регістри
+    machine.mem32), вибірки надходять з періодом (1 + DIV.INT) тактів 48 МГц
+    по черзі з каналів маски RROBIN, починаючи з AINSEL. Значення - рівень
+    machine.adcs відповідного піна на момент вибірки (12 біт). Вибірки
+    доставляються ліниво - при зчитуванні count або active(); запис іде у
+    кільце 2^ring_size байт від адреси write, як у режимі ring_sel.
+    """
+
+    def __init__(self):
+        self.channel = len(dmas)
+        self.read = 0
+        self.write = None
+        self._count = 0
+        self.ctrl = 0
+        self._active = False
+        self._start_us = 0
+        self._delivered = 0 # Вибірок, записаних з моменту запуску.
+        self.transfers = 0  # Усього переданих слів.
+        dmas.append(self)
+
+    def pack_ctrl(self, enable=True, high_pri=False, size=2, inc_read=True, inc_write=True, ring_size=0,
+                  ring_sel=False, chain_to=None, treq_sel=0x3F, irq_quiet=True, bswap=False, sniff_en=False):
+        chain = self.channel if chain_to is None else chain_to
+        return (int(enable) | int(high_pri) << 1 | size << 2 | int(inc_read) << 4 | int(inc_write) << 5 |
+                ring_size << 6 | int(ring_sel) << 10 | chain << 11 | treq_sel << 15 | int(irq_quiet) << 21 |
+                int(bswap) << 22 | int(sniff_en) << 23)
+
+    def config(self, read=None, write=None, count=None, ctrl=None, trigger=False):
+        if read is not None:
+            self.read = read
+        if write is not None:
+            self.write = write
+        if count is not None:
+            self._count = count
+        if ctrl is not None:
+            self.ctrl = ctrl
+        if trigger:
+            self._active = True
+            self._start_us = machine._now_us()
+            self._delivered = 0
+
+    def active(self, value=None):
+        if value is None:
+            self._advance()
+            return 1 if self._active else 0
+        if not value:
+            self._advance()
+        self._active = bool(value)
+        return None
+
+    @property
+    def count(self):
+        self._advance()
+        return self._count
+
+    def close(self):
+        self._active = False
+
+    def _ring(self):
+        """Кількість елементів буфера в кільці запису (або весь буфер без ring_sel)."""
+        if (self.ctrl >> 10) & 1:
+            return (1 << ((self.ctrl >> 6) & 0xF)) >> ((self.ctrl >> 2) & 3)
+        return len(self.write)
+
+    def _put(self, word):
+        """Одна передача за DREQ периферії (RX FIFO PIO)."""
+        self.write[self._delivered % self._ring()] = word
+        self._delivered += 1
+        self._count -= 1
+        self.transfers += 1
+        if self._count == 0:
+            self._active = False
+
+    def _advance(self):
+        if not self._active or (self.ctrl >> 15) & 0x3F != _DREQ_ADC:
+            return
+        regs = machine.mem32.regs
+        cs = regs.get(_ADC_BASE, 0)
+        if cs & 0x09 != 0x09: # EN та START_MANY.
+            return
+        period_cycles = 1 + ((regs.get(_ADC_BASE + 0x10, 0) >> 8) & 0xFFFF)
+        due = (machine._now_us() - self._start_us) * _ADC_CLOCK_HZ // (1000000 * period_cycles) + 1
+        due = min(due, self._delivered + self._count)
+        new = due - self._delivered
+        if new <= 0:
+            return
+        mask = (cs >> 16) & 0x1F
+        order = [ch for ch in range(5) if mask & (1 << ch)] or [(cs >> 12) & 7]
+        first = order.index((cs >> 12) & 7) if (cs >> 12) & 7 in order else 0
+        ring = self._ring()
+        # Старіші за одне кільце вибірки все одно були б перезаписані.
+        for k in range(max(self._delivered, due - ring), due):
+            ch = order[(first + k) % len(order)]
+            adc = machine.adcs.get(_FIRST_ADC_GPIO + ch)
+            sample_us = self._start_us + k * period_cycles * 1000000 // _ADC_CLOCK_HZ
+            self.write[k % ring] = (adc._level(sample_us) >> 4) if adc is not None else 0
+        self._delivered = due
+        self._count -= new
+        self.transfers += new
+        if self._count == 0:
+            self._active = False
@@ -0,0 +1,97 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/sh1107.py
+# Опис: Заміна драйвера SH1107 для ПК. Інтерфейс сумісний з драйвером, що
+#       використовується на Pico (SH1107_I2C: displaybuf, write_command,
+#       write_data, show, contrast). Додатково моделює пам'ять панелі (GDDRAM):
+#       команди адресації сторінки/стовпця та дані розбираються так само, як
+#       це робить контролер, тож можна перевірити, що часткові оновлення
+#       дають на "екрані" той самий результат, що й повні.
+# ==============================================================================
+
+import framebuf
+
+_I2C_TRANSACTION_OVERHEAD = 2 # Байт адреси + контрольний байт.
+
+
+class SH1107_I2C(framebuf.FrameBuffer):
+
+    def __init__(self, width, height, i2c, res=None, address=0x3D, rotate=0, external_vcc=False, delay_ms=200):
+        self.width = width
+        self.height = height
+        self.i2c = i2c
+        self.address = address
+        self.rotate = rotate
+        self.pages = height // 8
+        self.displaybuf = bytearray(self.pages * width)
+        self.displaybuf_mv = memoryview(self.displaybuf)
+        super().__init__(self.displaybuf, width, height, framebuf.MONO_VLSB)
+
+        # Модель контролера.
+        self.gddram = bytearray(self.pages * width)
+        self._page = 0
+        self._col = 0
+        self.contrast_value = 0x80
+        self.powered = True
+
+        # Статистика шини.
+        self.i2c_bytes = 0
+        self.i2c_transactions = 0
+
+    # --- Рівень шини ---
+    def _bus(self, nbytes):
+        self.i2c_bytes += nbytes + _I2C_TRANSACTION_OVERHEAD
+        self.i2c_transactions += 1
+
+    def write_command(self, command_list):
+        cmds = bytes(command_list)
+        self._bus(len(cmds))
+        if self.i2c is not None and hasattr(self.i2c, 'writeto'):
+            self.i2c.writeto(self.address, b'\x00' + cmds)
+        skip = 0
+        for cmd in cmds:
+            if skip:
+                skip -= 1 # Аргумент двобайтової команди.
+            elif cmd in (0x81, 0xA8, 0xD3, 0xD5, 0xD9, 0xDB, 0xDC, 0xAD):
+                skip = 1
+            elif 0xB0 <= cmd <= 0xBF:
+                self._page = cmd & 0x0F
+            elif cmd <= 0x0F:
+                self._col = (self._col & 0xF0) | cmd
+            elif 0x10 <= cmd <= 0x17:
+                self._col = (self._col & 0x0F) | ((cmd & 0x07) << 4)
+
+    def write_data(self, buf):
+        data = bytes(buf)
+        self._bus(len(data))
+        if self.i2c is not None and hasattr(self.i2c, 'writevto'):
+            self.i2c.writevto(self.address, (b'\x40', data))
+        base = self._page * self.width
+        for b in data:
+            if self._col < self.width:
+                self.gddram[base + self._col] = b
+            self._col += 1
+
+    # --- API драйвера ---
+    def show(self, start=None, end=None):
+        if start is None:
+            start = 0
+        if end is None:
+            end = self.pages - 1
+        for page in range(start, end + 1):
+            self.write_command(bytes((0xB0 | page, 0x00, 0x10)))
+            self.write_data(self.displaybuf_mv[page * self.width:(page + 1) * self.width])
+
+    def contrast(self, value):
+        self.contrast_value = value
+        self.write_command(bytes((0x81, value)))
+
+    def poweron(self):
+        self.powered = True
+
+    def poweroff(self):
+        self.powered = False
+
+    def panel_pixel(self, x, y):
+        """Стан пікселя на "панелі" (у моделі GDDRAM), а не у framebuffer."""
+        return (self.gddram[(y >> 3) * self.width + x] >> (y & 7)) & 1
@@ -0,0 +1,363 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/sim.py
+# Опис: Симулятор апаратури для запуску main.py на ПК (CPython).
+#       - VirtualClock: віртуальний час за time.ticks_ms/ticks_us/sleep та
+#         черга подій; time.sleep() у прошивці просуває віртуальний час і
+#         доставляє всі заплановані за цей проміжок фронти сигналів.
+#       - InjectorGenerator / VssGenerator: скриптові генератори фронтів на
+#         пінах форсунки та VSS (викликають обробники Pin.irq або модель
+#         PIO з host/rp2.py, як на реальному залізі).
+#       - Simulator: завантажує прошивку з замінниками machine / framebuf /
+#         sh1107 / time / uasyncio, виконує задачі прошивки на віртуальному
+#         годиннику, керує датчиками, кнопкою, ADC та показує екран.
+# Запуск: python host/sim.py --hours 1 --rpm 2500 --speed 90 --profile
+# ==============================================================================
+
+import contextlib
+import heapq
+import importlib
+import io
+import os
+import sys
+import tempfile
+import types
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(HOST_DIR)
+if HOST_DIR not in sys.path:
+    sys.path.insert(0, HOST_DIR)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(1, ROOT_DIR)
+
+import machine
+import rp2
+import ticks
+import uasyncio
+
+_TICKS_MAX = ticks.TICKS_PERIOD - 1
+
+
+class VirtualClock:
+    """
+    Віртуальний годинник з чергою подій. Абсолютний час зберігається в мкс
+    без переповнення; ticks_ms/ticks_us повертають значення з переповненням,
+    як на RP2040.
+    """
+
+    def __init__(self, start_us=500000):
+        self._now = start_us
+        self._queue = []
+        self._seq = 0
+        self.events_run = 0
+
+    def now_us(self):
+        return self._now
+
+    def now_s(self):
+        return self._now / 1000000.0
+
+    def schedule(self, at_us, callback):
+        """Планує виклик callback() на абсолютний момент at_us."""
+        self._seq += 1
+        heapq.heappush(self._queue, (int(at_us), self._seq, callback))
+
+    def schedule_in(self, delay_us, callback):
+        self.schedule(self._now + delay_us, callback)
+
+    def advance_to(self, target_us):
+        """Просуває час до target_us, виконуючи всі події, що настають до нього."""
+        queue = self._queue
+        while queue and queue[0][0] <= target_us:
+            at_us, _, callback = heapq.heappop(queue)
+            if at_us > self._now:
+                self._now = at_us
+            self.events_run += 1
+            callback()
+        if target_us > self._now:
+            self._now = target_us
+
+    def advance_us(self, delta_us):
+        self.advance_to(self._now + int(delta_us))
+
+    def make_time_module(self):
+        """Створює замінник модуля time, прив'язаний до цього годинника."""
+        m = types.ModuleType('time')
+        m.ticks_us = lambda: self._now & _TICKS_MAX
+        m.ticks_ms = lambda: (self._now // 1000) & _TICKS_MAX
+        m.ticks_cpu = m.ticks_us
+        m.ticks_add = ticks.ticks_add
+        m.ticks_diff = ticks.ticks_diff
+        m.sleep = lambda seconds: self.advance_us(seconds * 1000000)
+        m.sleep_ms = lambda ms: self.advance_us(ms * 1000)
+        m.sleep_us = lambda us: self.advance_us(us)
+        m.time = lambda: self._now // 1000000
+        m.time_ns = lambda: self._now * 1000
+        return m
+
+
+def _as_profile(value):
+    """Перетворює константу на функцію профілю f(t_s) -> value."""
+    if callable(value):
+        return value
+    return lambda t_s: value
+
+
+class InjectorGenerator:
+    """
+    Генератор імпульсів форсунки. profile(t_s) -> (rpm, ширина_імпульсу_мкс).
+    Імпульс - активний низький рівень на PIN_INJ: FALLING (відкриття), RISING (закриття).
+    """
+
+    def __init__(self, sim, profile):
+        self.sim = sim
+        self.clock = sim.clock
+        self.profile = _as_profile(profile)
+        self.pin = machine.pins[sim.settings.PIN_INJ]
+        self.pulses_per_rev = sim.settings.RPM_PULSES_PER_ENGINE_REVOLUTION
+        self.injections = 0
+        self.on_time_us = 0     # Сумарний електричний час відкриття (без віднімання dead time).
+        self._next_us = float(self.clock.now_us())
+        self.clock.schedule(self._next_us, self._open)
+
+    def _close(self):
+        self.pin.drive(1)
+
+    def _open(self):
+        rpm, pulse_us = self.profile(self.clock.now_s())
+        if rpm <= 0:
+            self._next_us = self.clock.now_us() + 100000.0 # Двигун не працює: перевіряємо знову через 100 мс.
+            self.clock.schedule(self._next_us, self._open)
+            return
+        period_us = 60000000.0 / (rpm * self.pulses_per_rev)
+        pulse_us = int(min(pulse_us, period_us * 0.9))
+        self.pin.drive(0)
+        self.injections += 1
+        self.on_time_us += pulse_us
+        self.clock.schedule_in(pulse_us, self._close)
+        self._next_us += period_us
+        if self._next_us < self.clock.now_us():
+            self._next_us = float(self.clock.now_us()) + period_us
+        self.clock.schedule(self._next_us, self._open)
+
+
+class VssGenerator:
+    """Генератор імпульсів датчика швидкості. profile(t_s) -> швидкість км/год."""
+
+    def __init__(self, sim, profile):
+        self.sim = sim
+        self.clock = sim.clock
+        self.profile = _as_profile(profile)
+        self.pin = machine.pins[sim.settings.PIN_VSS]
+        self.impulses_per_km = sim.settings.VSS_IMPULSES_PER_KM
+        self.pulses = 0
+        self._next_us = float(self.clock.now_us())
+        self.clock.schedule(self._next_us, self._pulse)
+
+    def _release(self):
+        self.pin.drive(1)
+
+    def _pulse(self):
+        speed_kmh = self.profile(self.clock.now_s())
+        if speed_kmh <= 0:
+            self._next_us = self.clock.now_us() + 100000.0
+            self.clock.schedule(self._next_us, self._pulse)
+            return
+        period_us = 3600000000.0 / (speed_kmh * self.impulses_per_km)
+        self.pin.drive(0)
+        self.pulses += 1
+        self.clock.schedule_in(int(min(period_us / 2, 1000)), self._release)
+        self._next_us += period_us
+        if self._next_us < self.clock.now_us():
+            self._next_us = float(self.clock.now_us()) + period_us
+        self.clock.schedule(self._next_us, self._pulse)
+
+
+def _firmware_module_names():
+    names = []
+    for fname in os.listdir(ROOT_DIR):
+        if fname.endswith('.py'):
+            names.append(fname[:-3])
+    return names
+
+
+class Simulator:
+    """
+    Завантажує main.py з замінниками апаратних модулів та керує віртуальною машиною.
+
+    settings: словник перевизначень Settings (застосовуються до імпорту main).
+    fuel_percent / battery_voltage: початкові значення ADC.
+    sensors: словник {GPIO: рівень} для датчиків при старті (0 = активна помилка).
+    """
+
+    def __init__(self, workdir=None, start_us=500000, settings=None, fuel_percent=50.0,
+                 battery_voltage=14.0, sensors=None, quiet=True):
+        self.clock = VirtualClock(start_us)
+        self.quiet = quiet
+        self.workdir = workdir or tempfile.mkdtemp(prefix='pico_sim_')
+        self.log = io.StringIO()
+        self._time_module = self.clock.make_time_module()
+
+        machine.reset_registry()
+        machine.set_clock(self.clock)
+        rp2.state_machines.clear()
+        del rp2.dmas[:]
+        uasyncio.new_event_loop()
+
+        for name in _firmware_module_names():
+            sys.modules.pop(name, None)
+        with self._firmware_context():
+            self.settings = importlib.import_module('Settings')
+            for key, value in (settings or {}).items():
+                setattr(self.settings, key, value)
+            machine.adc_levels[self.settings.PIN_FUEL_LEVEL_ADC] = self.fuel_raw(fuel_percent)
+            machine.adc_levels[self.settings.PIN_ADC] = self.voltage_raw(battery_voltage)
+            for pin_id, level in (sensors or {}).items():
+                machine.pin_levels[pin_id] = level
+            self.fw = importlib.import_module('main')
+
+        self.injector = None
+        self.vss = None
+        self._tasks = None # Задача run_tasks() прошивки, створюється при першому запуску.
+
+    # --- Оточення прошивки ---
+    @contextlib.contextmanager
+    def _firmware_context(self):
+        """Підміняє time та робочий каталог на час виконання коду прошивки."""
+        real_time = sys.modules['time']
+        cwd = os.getcwd()
+        sys.modules['time'] = self._time_module
+        os.chdir(self.workdir)
+        try:
+            if self.quiet:
+                with contextlib.redirect_stdout(self.log):
+                    yield
+            else:
+                yield
+        finally:
+            sys.modules['time'] = real_time
+            os.chdir(cwd)
+
+    # --- Перетворення фізичних величин у сирі значення ADC ---
+    def fuel_raw(self, percent):
+        s = self.settings
+        return int(s.FUEL_ADC_MIN_RAW + (s.FUEL_ADC_MAX_RAW - s.FUEL_ADC_MIN_RAW) * percent / 100.0)
+
+    def voltage_raw(self, volts):
+        return int(volts / self.settings.VOLTAGE_CALIBRATION)
+
+    # --- Керування входами ---
+    def set_fuel_percent(self, percent):
+        machine.adcs[self.settings.PIN_FUEL_LEVEL_ADC].level_u16 = self.fuel_raw(percent)
+
+    def set_battery_voltage(self, volts):
+        machine.adcs[self.settings.PIN_ADC].level_u16 = self.voltage_raw(volts)
+
+    def set_sensor(self, pin_id, level):
+        machine.pins[pin_id].drive(level)
+
+    def drive_engine(self, profile):
+        """Запускає генератор форсунки: profile = (rpm, pulse_us) або f(t_s)."""
+        self.injector = InjectorGenerator(self, profile)
+        return self.injector
+
+    def drive_vehicle(self, profile):
+        """Запускає генератор VSS: profile = км/год або f(t_s)."""
+        self.vss = VssGenerator(self, profile)
+        return self.vss
+
+    def press_button(self, hold_ms, delay_ms=0):
+        """Натискання кнопки RESET: утримання hold_ms, починаючи через delay_ms."""
+        pin = machine.pins[self.settings.PIN_BUTTON_RESET]
+        start = self.clock.now_us() + delay_ms * 1000
+        self.clock.schedule(start, lambda: pin.drive(0))
+        self.clock.schedule(start + hold_ms * 1000, lambda: pin.drive(1))
+
+    # --- Виконання ---
+    def _start_tasks(self):
+        if self._tasks is None:
+            self._tasks = uasyncio.create_task(self.fw.run_tasks())
+
+    def step(self):
+        """Виконує всі задачі прошивки, готові на поточний момент віртуального часу."""
+        with self._firmware_context():
+            self._start_tasks()
+            uasyncio.run_until(self.clock.now_us())
+
+    def run(self, seconds):
+        """Виконує задачі прошивки, доки віртуальний час не просунеться на seconds."""
+        end_us = self.clock.now_us() + int(seconds * 1000000)
+        with self._firmware_context():
+            self._start_tasks()
+            uasyncio.run_until(end_us)
+
+    # --- Вихідні пристрої ---
+    @property
+    def speaker(self):
+        return machine.pwms.get(self.settings.PIN_SPEAKER)
+
+    @property
+    def oled(self):
+        return self.fw.oled
+
+    def screen_ascii(self, scale=2):
+        """Повертає вміст панелі (GDDRAM) як ASCII-графіку; scale - крок вибірки пікселів."""
+        oled = self.fw.oled
+        if oled is None:
+            return "<display off>"
+        rows = []
+        for y in range(0, oled.height, scale):
+            rows.append(''.join('#' if oled.panel_pixel(x, y) else '.' for x in range(0, oled.width, scale)))
+        return '\n'.join(rows)
+
+    def save_pbm(self, path):
+        """Зберігає вміст панелі у файл PBM (P1)."""
+        oled = self.fw.oled
+        with open(path, 'w') as f:
+            f.write("P1\n{} {}\n".format(oled.width, oled.height))
+            for y in range(oled.height):
+                f.write(' '.join(str(oled.panel_pixel(x, y)) for x in range(oled.width)) + '\n')
+
+
+def main():
+    import argparse
+    import cProfile
+    import pstats
+    import time as real_time
+
+    parser = argparse.ArgumentParser(description="Run main.py on a simulated Pico faster than real time.")
+    parser.add_argument('--hours', type=float, default=1.0, help="simulated driving time")
+    parser.add_argument('--rpm', type=float, default=2500)
+    parser.add_argument('--pulse-us', type=float, default=3000, help="injector pulse width")
+    parser.add_argument('--speed', type=float, default=90, help="vehicle speed, km/h")
+    parser.add_argument('--profile', action='store_true', help="print cProfile hot spots")
+    parser.add_argument('--screen', action='store_true', help="print the final screen")
+    args = parser.parse_args()
+
+    sim = Simulator()
+    sim.drive_engine((args.rpm, args.pulse_us))
+    sim.drive_vehicle(args.speed)
+
+    profiler = cProfile.Profile() if args.profile else None
+    t0 = real_time.perf_counter()
+    if profiler:
+        profiler.enable()
+    sim.run(args.hours * 3600)
+    if profiler:
+        profiler.disable()
+    wall = real_time.perf_counter() - t0
+
+    fw = sim.fw
+    print("simulated {:.2f} h in {:.1f} s ({:.0f}x real time), {} events".format(
+        args.hours, wall, args.hours * 3600 / wall, sim.clock.events_run))
+    print("TRIP {:.2f} L / {:.2f} km, PERS {:.2f} L / {:.2f} km".format(
+        fw.trip_fuel_consumed_L, fw.trip_distance_travelled_km,
+        fw.persistent_trip_fuel_L, fw.persistent_trip_distance_km))
+    if args.screen:
+        print(sim.screen_ascii())
+    if profiler:
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+
+
+if __name__ == "__main__":
+    main()
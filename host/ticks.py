@@ -0,0 +1,34 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/ticks.py
+# Опис: Додає до модуля CPython `time` функції MicroPython ticks_ms, ticks_us,
+#       ticks_add, ticks_diff, sleep_ms, sleep_us (реальний годинник ПК).
+#       Лічильники переповнюються з тим самим періодом, що й на RP2040 (2^30).
+# ==============================================================================
+
+import time
+
+TICKS_PERIOD = 1 << 30
+_TICKS_MAX = TICKS_PERIOD - 1
+_TICKS_HALF = TICKS_PERIOD // 2
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(end, start):
+    return ((end - start + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
+
+
+def install():
+    """Встановлює ticks-функції у модуль time (ідемпотентно)."""
+    if getattr(time, 'ticks_us', None) is not None:
+        return
+    time.ticks_us = lambda: (time.perf_counter_ns() // 1000) & _TICKS_MAX
+    time.ticks_ms = lambda: (time.perf_counter_ns() // 1000000) & _TICKS_MAX
+    time.ticks_cpu = time.ticks_us
+    time.ticks_add = ticks_add
+    time.ticks_diff = ticks_diff
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000.0)
+    time.sleep_us = lambda us: time.sleep(us / 1000000.0)
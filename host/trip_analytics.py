@@ -0,0 +1,266 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/trip_analytics.py
+# Опис: Аналіз журналу поїздки (TripLogger.py) на ПК засобами NumPy:
+#       - карта витрати L/100KM за діапазонами швидкості x обертів;
+#       - частка палива, спаленого на холостому ходу;
+#       - підсумки за кожну поїздку (запуск прошивки = одна поїздка);
+#       - перекалібрування INJ_FLOW_RATE_ML_PER_MIN за чеками заправок
+#         (метод найменших квадратів, заправка "до повного").
+#       Файли trip_log_*.bin відкриваються через np.memmap як масив блоків
+#       (структурований dtype: заголовок + записи), тому всі обчислення -
+#       векторні операції над стовпцями без циклів по рядках. Стовпці можна
+#       зберегти як .npy (--save DIR) і відкривати повторно з mmap_mode='r'.
+#       Паливо та відстань рахуються тими самими формулами, що й
+#       calculate_and_display() (FUEL_RATE_L_PER_US, VSS_IMPULSES_PER_KM).
+#       Потрібен NumPy (pip install numpy).
+# Запуск: python host/trip_analytics.py trip_log_*.bin [--receipts fills.csv] [--save DIR]
+#         python host/trip_analytics.py --load DIR
+#       fills.csv: рядки "session,litres" - заправка до повного перед
+#       запуском session; перший рядок лише відмічає початок.
+# ==============================================================================
+
+import csv
+import os
+import sys
+
+import numpy as np
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HOST_DIR))
+sys.path.insert(0, HOST_DIR)
+
+import Settings
+import TripLogger
+
+RECORD_DTYPE = np.dtype([
+    ('t_ms', '<u4'), ('rpm', '<u2'), ('errors', '<u2'), ('speed_kmh', '<f4'),
+    ('l_per_h', '<f4'), ('inj_us', '<f4'), ('fuel_pct', '<f4'), ('battery_v', '<f4'),
+])
+COLUMNS = ('session', 't_s', 'dt_s', 'rpm', 'errors', 'speed_kmh', 'l_per_h', 'inj_us', 'fuel_pct', 'battery_v')
+_MAGIC = int(np.frombuffer(b'TRPL', '<u4')[0])
+
+SPEED_EDGES_KMH = np.arange(0, 170, 10)
+RPM_EDGES = np.arange(0, 7000, 500)
+
+
+# --- Формули прошивки (calculate_and_display(), розділ 2) ---
+def fuel_rate_l_per_us(flow_ml_per_min):
+    """ML_PER_MIN -> L_PER_US, як FUEL_RATE_L_PER_US у main.py."""
+    return flow_ml_per_min / (1000 * 60 * 1_000_000)
+
+
+def interval_fuel_l(cols):
+    """Об'єм палива за кожен інтервал (л): прошивка логує volume / interval як L/H."""
+    return cols['l_per_h'].astype(np.float64) * cols['dt_s'] / 3600.0
+
+
+def interval_distance_km(cols):
+    """Відстань за кожен інтервал (км): speed = distance / interval."""
+    return cols['speed_kmh'].astype(np.float64) * cols['dt_s'] / 3600.0
+
+
+def vss_pulses(cols):
+    """Імпульси VSS за інтервал (distance = pulses / VSS_IMPULSES_PER_KM) - цілі для кожного запису."""
+    return np.rint(interval_distance_km(cols) * Settings.VSS_IMPULSES_PER_KM).astype(np.int64)
+
+
+def injector_open_us(cols, flow_ml_per_min=Settings.INJ_FLOW_RATE_ML_PER_MIN):
+    """Сумарний час відкриття форсунки за інтервал (мкс): volume = pulse_time * FUEL_RATE_L_PER_US."""
+    return interval_fuel_l(cols) / fuel_rate_l_per_us(flow_ml_per_min)
+
+
+# --- Завантаження ---
+def block_dtype(block_bytes):
+    """dtype одного блоку TripLogger: заголовок, записи, вирівнювання до block_bytes."""
+    capacity = (block_bytes - TripLogger.HEADER_SIZE) // TripLogger.RECORD_SIZE
+    return np.dtype({
+        'names': ['magic', 'seq', 'session', 'count', 'records'],
+        'formats': ['<u4', '<u4', '<u2', '<u2', (RECORD_DTYPE, capacity)],
+        'offsets': [0, 4, 8, 10, TripLogger.HEADER_SIZE],
+        'itemsize': block_bytes,
+    })
+
+
+def load_log(paths, block_bytes=Settings.TRIP_LOG_BLOCK_BYTES):
+    """Стовпці COLUMNS з файлів журналу, впорядковані за seq блоків."""
+    dtype = block_dtype(block_bytes)
+    capacity = dtype['records'].shape[0]
+    seqs, sessions, parts = [], [], []
+    for path in paths:
+        blocks_in_file = os.path.getsize(path) // block_bytes # Обірваний блок у кінці відкидається.
+        if not blocks_in_file:
+            continue
+        blocks = np.memmap(path, dtype=dtype, mode='r', shape=(blocks_in_file,))
+        valid = (blocks['magic'] == _MAGIC) & (blocks['count'] <= capacity)
+        counts = blocks['count'][valid].astype(np.int64)
+        used = np.arange(capacity) < counts[:, None] # Маска заповнених записів кожного блоку.
+        parts.append(blocks['records'][valid][used])
+        seqs.append(np.repeat(blocks['seq'][valid], counts))
+        sessions.append(np.repeat(blocks['session'][valid], counts))
+    if not sum(len(seq) for seq in seqs):
+        return {name: np.zeros(0) for name in COLUMNS}
+    # Стабільне сортування зберігає порядок записів усередині блоку.
+    order = np.argsort(np.concatenate(seqs), kind='stable')
+    records = np.concatenate(parts)[order]
+    session = np.concatenate(sessions)[order]
+
+    # ticks_ms має період 2^30 мс: інтервали рахуються за модулем, перший запис
+    # кожного запуску отримує номінальний інтервал UPDATE_INTERVAL_SEC.
+    t_ms = records['t_ms'].astype(np.int64)
+    dt_ms = np.diff(t_ms, prepend=t_ms[:1]) % TripLogger.TICKS_PERIOD_MS
+    starts = np.r_[True, session[1:] != session[:-1]]
+    dt_ms[starts] = 0
+    t_s = np.cumsum(dt_ms) / 1000.0
+    start_index = np.flatnonzero(starts)
+    t_s -= np.repeat(t_s[start_index], np.diff(np.r_[start_index, len(t_s)]))
+    dt_ms[starts] = int(Settings.UPDATE_INTERVAL_SEC * 1000)
+
+    cols = {'session': session, 't_s': t_s, 'dt_s': dt_ms / 1000.0}
+    for name in RECORD_DTYPE.names:
+        if name != 't_ms':
+            cols[name] = records[name]
+    return cols
+
+
+def save_columns(cols, directory):
+    os.makedirs(directory, exist_ok=True)
+    for name in COLUMNS:
+        np.save(os.path.join(directory, name + '.npy'), cols[name])
+
+
+def load_columns(directory):
+    """Стовпці, збережені save_columns(), відкриті як memory-mapped масиви."""
+    return {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode='r') for name in COLUMNS}
+
+
+# --- Аналіз ---
+def consumption_map(cols, speed_edges=SPEED_EDGES_KMH, rpm_edges=RPM_EDGES):
+    """
+    Повертає (L/100KM, паливо_л, відстань_км) - масиви [швидкість x оберти].
+    Клітинки без пройденої відстані - NaN.
+    """
+    speed = cols['speed_kmh']
+    rpm = cols['rpm']
+    fuel, _, _ = np.histogram2d(speed, rpm, bins=(speed_edges, rpm_edges), weights=interval_fuel_l(cols))
+    dist, _, _ = np.histogram2d(speed, rpm, bins=(speed_edges, rpm_edges), weights=interval_distance_km(cols))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        l100 = np.where(dist > 0, fuel / dist * 100.0, np.nan)
+    return l100, fuel, dist
+
+
+def idle_fuel_share(cols):
+    """Частка палива, спаленого без руху (швидкість нижче MIN_SPEED_FOR_PERS_COUNT_KMH, двигун працює)."""
+    fuel = interval_fuel_l(cols)
+    idle = (cols['speed_kmh'] < Settings.MIN_SPEED_FOR_PERS_COUNT_KMH) & (cols['rpm'] > 0)
+    total = fuel.sum()
+    return float(fuel[idle].sum() / total) if total > 0 else 0.0
+
+
+_TRIP_DTYPE = np.dtype([
+    ('session', '<u2'), ('duration_s', '<f8'), ('distance_km', '<f8'), ('fuel_l', '<f8'),
+    ('l_per_100km', '<f8'), ('avg_speed_kmh', '<f8'), ('idle_fuel_l', '<f8'), ('max_rpm', '<u2'),
+    ('max_speed_kmh', '<f4'), ('fuel_pct_start', '<f4'), ('fuel_pct_end', '<f4'), ('injector_open_s', '<f8'),
+])
+
+
+def trip_summaries(cols):
+    """Структурований масив з підсумками кожної поїздки (запуску прошивки)."""
+    session = np.asarray(cols['session'])
+    if not len(session):
+        return np.zeros(0, dtype=_TRIP_DTYPE)
+    starts = np.flatnonzero(np.r_[True, session[1:] != session[:-1]])
+    ends = np.r_[starts[1:], len(session)] - 1
+    fuel = interval_fuel_l(cols)
+    dist = interval_distance_km(cols)
+    idle = (cols['speed_kmh'] < Settings.MIN_SPEED_FOR_PERS_COUNT_KMH) & (cols['rpm'] > 0)
+
+    out = np.zeros(len(starts), dtype=_TRIP_DTYPE)
+    out['session'] = session[starts]
+    out['duration_s'] = np.add.reduceat(cols['dt_s'], starts)
+    out['fuel_l'] = np.add.reduceat(fuel, starts)
+    out['distance_km'] = np.add.reduceat(dist, starts)
+    out['idle_fuel_l'] = np.add.reduceat(np.where(idle, fuel, 0.0), starts)
+    out['max_rpm'] = np.maximum.reduceat(cols['rpm'], starts)
+    out['max_speed_kmh'] = np.maximum.reduceat(cols['speed_kmh'], starts)
+    out['fuel_pct_start'] = cols['fuel_pct'][starts]
+    out['fuel_pct_end'] = cols['fuel_pct'][ends]
+    out['injector_open_s'] = np.add.reduceat(injector_open_us(cols), starts) / 1e6
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out['l_per_100km'] = np.where(out['distance_km'] > 0, out['fuel_l'] / out['distance_km'] * 100.0, np.nan)
+        out['avg_speed_kmh'] = np.where(out['duration_s'] > 0, out['distance_km'] / out['duration_s'] * 3600.0, 0.0)
+    return out
+
+
+def load_receipts(path):
+    """Масиви (session, litres) з CSV чеків заправок."""
+    sessions, litres = [], []
+    with open(path, newline='') as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip().isdigit():
+                continue # Заголовок або порожній рядок.
+            sessions.append(int(row[0]))
+            litres.append(float(row[1]))
+    return np.array(sessions), np.array(litres)
+
+
+def recalibrate_flow(trips, receipt_sessions, receipt_litres):
+    """
+    Нове значення INJ_FLOW_RATE_ML_PER_MIN за чеками заправок "до повного":
+    літри заправки k = паливо поїздок між заправками k-1 та k. Паливо
+    пропорційне часу відкриття форсунки, тому
+        litres_k = open_us_k * FUEL_RATE_L_PER_US(flow)
+    розв'язується відносно flow методом найменших квадратів.
+    Повертає (flow_ml_per_min, залишки_л за кожним інтервалом заправок).
+    """
+    open_us = trips['injector_open_s'] * 1e6
+    # Інтервал заправок для кожної поїздки: заправка k - перед запуском receipt_sessions[k].
+    span = np.searchsorted(receipt_sessions, trips['session'], side='right') - 1
+    inside = (span >= 0) & (span < len(receipt_sessions) - 1)
+    open_per_span = np.bincount(span[inside], weights=open_us[inside], minlength=len(receipt_sessions) - 1)
+    litres = receipt_litres[1:]
+    slope, _, _, _ = np.linalg.lstsq(open_per_span[:, None], litres, rcond=None)
+    flow = float(slope[0]) / fuel_rate_l_per_us(1.0)
+    return flow, litres - open_per_span * fuel_rate_l_per_us(flow)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Vectorized analytics over TripLogger files.")
+    parser.add_argument('files', nargs='*', help="trip_log_*.bin files copied from the device")
+    parser.add_argument('--load', help="open columns saved with --save (memory-mapped)")
+    parser.add_argument('--save', help="save decoded columns as .npy files into this directory")
+    parser.add_argument('--receipts', help="CSV of full fill-ups: session,litres")
+    parser.add_argument('--block-bytes', type=int, default=Settings.TRIP_LOG_BLOCK_BYTES)
+    args = parser.parse_args()
+
+    cols = load_columns(args.load) if args.load else load_log(args.files, args.block_bytes)
+    if args.save:
+        save_columns(cols, args.save)
+    print("{} samples".format(len(cols['session'])))
+
+    trips = trip_summaries(cols)
+    print("{:>7} {:>8} {:>9} {:>8} {:>10} {:>9} {:>8} {:>8}".format(
+        'session', 'min', 'km', 'L', 'L/100km', 'km/h', 'idle L', 'max rpm'))
+    for t in trips:
+        print("{:>7} {:>8.1f} {:>9.2f} {:>8.3f} {:>10.2f} {:>9.1f} {:>8.3f} {:>8}".format(
+            t['session'], t['duration_s'] / 60, t['distance_km'], t['fuel_l'], t['l_per_100km'],
+            t['avg_speed_kmh'], t['idle_fuel_l'], t['max_rpm']))
+    print("idle fuel share: {:.1%}".format(idle_fuel_share(cols)))
+
+    l100, _, dist = consumption_map(cols)
+    print("L/100km by speed (rows, km/h) x rpm (columns); cells with < 0.1 km are blank")
+    print("{:>8}".format('') + ''.join("{:>6}".format(int(r)) for r in RPM_EDGES[:-1]))
+    for i, v in enumerate(SPEED_EDGES_KMH[:-1]):
+        cells = ''.join("{:>6.1f}".format(l100[i, j]) if dist[i, j] >= 0.1 else "{:>6}".format('')
+                        for j in range(len(RPM_EDGES) - 1))
+        print("{:>8}".format(int(v)) + cells)
+
+    if args.receipts:
+        flow, residuals = recalibrate_flow(trips, *load_receipts(args.receipts))
+        print("INJ_FLOW_RATE_ML_PER_MIN: {} -> {:.0f} (residuals, L: {})".format(
+            Settings.INJ_FLOW_RATE_ML_PER_MIN, flow, ' '.join('{:+.2f}'.format(r) for r in residuals)))
+
+
+if __name__ == "__main__":
+    main()
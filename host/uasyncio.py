@@ -0,0 +1,317 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/uasyncio.py
+# Опис: Заміна модуля MicroPython `uasyncio` для симуляції прошивки на ПК.
+#       Кооперативний планувальник на віртуальному годиннику симулятора
+#       (machine.set_clock): sleep()/sleep_ms() не чекають реального часу,
+#       а просувають віртуальний час до моменту пробудження найближчої
+#       задачі, доставляючи за цей проміжок усі фронти сигналів.
+#
+#       Додатково до API MicroPython:
+#         run_until(end_us)   - виконати задачі до моменту end_us;
+#         stats               - статистика запізнення пробудження задач
+#                               (TaskStats за іменем coroutine-функції);
+#         cpu_scale           - якщо > 0, кожен крок задачі займає у
+#                               віртуальному часі реальний_час * cpu_scale
+#                               (наближення повільнішого CPU Pico);
+#         native_s            - реальний час (с) у коді, що на Pico нативний
+#                               (framebuf на C): зараховується без cpu_scale;
+#         blocking_us         - час (мкс) блокуючих операцій без реального
+#                               очікування на ПК (передача по I2C): додається
+#                               до кроку як є.
+#       native_s та blocking_us накопичують обгортки бенчмарку, планувальник
+#       лише читає їхній приріст за крок.
+# ==============================================================================
+
+import heapq
+import sys
+import time as _real_time
+
+import machine
+
+cpu_scale = 0.0
+native_s = 0.0
+blocking_us = 0
+stats = {}
+
+
+class CancelledError(BaseException):
+    pass
+
+
+class TimeoutError(Exception):
+    pass
+
+
+class TaskStats:
+    """
+    Запізнення пробудження задачі (мкс) відносно запланованого моменту та
+    віртуальний час, зарахований її крокам при cpu_scale > 0.
+    """
+
+    BUCKETS_US = (100, 1000, 5000, 20000, 100000, 1000000)
+
+    def __init__(self, name):
+        self.name = name
+        self.wakeups = 0
+        self.max_late_us = 0
+        self.total_late_us = 0
+        self.histogram = [0] * (len(self.BUCKETS_US) + 1)
+        self.total_step_us = 0
+        self.max_step_us = 0
+
+    def add(self, late_us):
+        self.wakeups += 1
+        self.total_late_us += late_us
+        if late_us > self.max_late_us:
+            self.max_late_us = late_us
+        for i, bound in enumerate(self.BUCKETS_US):
+            if late_us < bound:
+                self.histogram[i] += 1
+                return
+        self.histogram[-1] += 1
+
+    def charge(self, step_us):
+        self.total_step_us += step_us
+        if step_us > self.max_step_us:
+            self.max_step_us = step_us
+
+
+class _Sleep:
+    def __init__(self, delay_us):
+        self.delay_us = max(0, int(delay_us))
+
+    def __await__(self):
+        yield self
+
+
+class _Wait:
+    """Очікування завершення задачі або події."""
+
+    def __init__(self, waitable):
+        self.waitable = waitable
+
+    def __await__(self):
+        yield self
+
+
+def _clock():
+    return machine._clock
+
+
+def _now_us():
+    return machine._now_us()
+
+
+class Task:
+
+    def __init__(self, coro):
+        self.coro = coro
+        self.name = getattr(coro, '__qualname__', None) or getattr(coro, '__name__', 'task')
+        self.done_flag = False
+        self.result = None
+        self.exception = None
+        self.waiters = []
+        self._cancel = False
+
+    def done(self):
+        return self.done_flag
+
+    def cancel(self):
+        if self.done_flag:
+            return False
+        self._cancel = True
+        _loop.reschedule(self, _now_us())
+        return True
+
+    def __await__(self):
+        if not self.done_flag:
+            yield _Wait(self)
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+    def _finish(self, result=None, exception=None):
+        self.done_flag = True
+        self.result = result
+        self.exception = exception
+        for waiter in self.waiters:
+            _loop.reschedule(waiter, _now_us())
+        self.waiters = []
+
+
+class Event:
+
+    def __init__(self):
+        self.state = False
+        self.waiters = []
+
+    def is_set(self):
+        return self.state
+
+    def set(self):
+        self.state = True
+        for waiter in self.waiters:
+            _loop.reschedule(waiter, _now_us())
+        self.waiters = []
+
+    def clear(self):
+        self.state = False
+
+    async def wait(self):
+        if not self.state:
+            await _Wait(self)
+        return True
+
+
+ThreadSafeFlag = Event
+
+
+class _Loop:
+
+    def __init__(self):
+        self._queue = []
+        self._seq = 0
+        self._current = None
+
+    def reschedule(self, task, at_us):
+        self._seq += 1
+        heapq.heappush(self._queue, (at_us, self._seq, task))
+
+    def create_task(self, coro):
+        task = Task(coro)
+        self.reschedule(task, _now_us())
+        return task
+
+    def _step(self, task, scheduled_us):
+        now = _now_us()
+        if task.name not in stats:
+            stats[task.name] = TaskStats(task.name)
+        task_stats = stats[task.name]
+        task_stats.add(now - scheduled_us)
+        self._current = task
+        native0 = native_s
+        blocking0 = blocking_us
+        t0 = _real_time.perf_counter()
+        try:
+            if task._cancel:
+                task._cancel = False
+                request = task.coro.throw(CancelledError())
+            else:
+                request = task.coro.send(None)
+        except StopIteration as e:
+            task._finish(result=e.value)
+            return
+        except CancelledError as e:
+            task._finish(exception=e)
+            return
+        except Exception as e:
+            task._finish(exception=e)
+            if not task.waiters:
+                print("Task exception wasn't retrieved: {!r} in {}".format(e, task.name), file=sys.stderr)
+            return
+        finally:
+            self._current = None
+            if cpu_scale > 0:
+                native = native_s - native0
+                real = _real_time.perf_counter() - t0 - native
+                elapsed_us = int((real * cpu_scale + native) * 1000000) + blocking_us - blocking0
+                if elapsed_us:
+                    task_stats.charge(elapsed_us)
+                    _clock().advance_us(elapsed_us)
+
+        if isinstance(request, _Sleep):
+            self.reschedule(task, _now_us() + request.delay_us)
+        elif isinstance(request, _Wait):
+            request.waitable.waiters.append(task)
+        else:
+            self.reschedule(task, _now_us()) # Звичайний yield: повернутися якнайшвидше.
+
+    def run_until(self, end_us):
+        clock = _clock()
+        queue = self._queue
+        while queue and queue[0][0] <= end_us:
+            at_us, _, task = heapq.heappop(queue)
+            if task.done_flag:
+                continue
+            if at_us > clock.now_us():
+                clock.advance_to(at_us)
+            self._step(task, at_us)
+        if end_us > clock.now_us():
+            clock.advance_to(end_us)
+
+    def run_until_complete(self, task):
+        clock = _clock()
+        while not task.done_flag and self._queue:
+            self.run_until(self._queue[0][0])
+        return task.result
+
+    def run_forever(self):
+        while self._queue:
+            self.run_until(self._queue[0][0])
+
+
+_loop = _Loop()
+
+
+def new_event_loop():
+    global _loop
+    _loop = _Loop()
+    stats.clear()
+    return _loop
+
+
+def get_event_loop():
+    return _loop
+
+
+def current_task():
+    return _loop._current
+
+
+def create_task(coro):
+    return _loop.create_task(coro)
+
+
+def sleep(seconds):
+    return _Sleep(seconds * 1000000)
+
+
+def sleep_ms(ms):
+    return _Sleep(ms * 1000)
+
+
+def run_until(end_us):
+    _loop.run_until(end_us)
+
+
+def run(coro):
+    return _loop.run_until_complete(create_task(coro))
+
+
+async def gather(*aws, return_exceptions=False):
+    tasks = [aw if isinstance(aw, Task) else create_task(aw) for aw in aws]
+    results = []
+    for task in tasks:
+        try:
+            results.append(await task)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+async def wait_for(aw, timeout):
+    task = aw if isinstance(aw, Task) else create_task(aw)
+    end_us = _now_us() + int(timeout * 1000000)
+    while not task.done():
+        if _now_us() >= end_us:
+            task.cancel()
+            raise TimeoutError()
+        await _Sleep(min(1000, end_us - _now_us()))
+    return await task
+
+
+def wait_for_ms(aw, timeout_ms):
+    return wait_for(aw, timeout_ms / 1000.0)
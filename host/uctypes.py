@@ -0,0 +1,10 @@
+# ==============================================================================
+# Проект: Бортовий Комп'ютер для Audi 80 B3 Mono Motronic на Raspberry Pi Pico
+# Файл: host/uctypes.py
+# Опис: Заміна модуля MicroPython `uctypes` для запуску прошивки на ПК.
+# ==============================================================================
+
+
+def addressof(obj):
+    """На ПК адреса буфера не має значення: 0 - вирівняна на будь-яку степінь двійки."""
+    return 0
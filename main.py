@@ -15,14 +15,37 @@
 #    Імпорт необхідних бібліотек для роботи з апаратним забезпеченням
 #    (піни, I2C, PWM, ADC), часом, файловою системою та графікою.
 # -------------------------------------------------------------------------
-from machine import Pin, I2C, disable_irq, enable_irq, PWM, ADC
+from machine import Pin, I2C, PWM
 import time
 import framebuf
 import os
+import micropython
+import uasyncio as asyncio
+from array import array
+
+# Резервний буфер для повідомлень про винятки в "жорстких" (hard) перериваннях.
+micropython.alloc_emergency_exception_buf(100)
 
 # Імпорт кастомних модулів для налаштувань та іконок.
 import Settings # Містить всі калібрувальні константи та налаштування.
 import Icons    # Містить бітові мапи іконок для дисплея.
+import GlyphAtlas # Кеш попередньо відрендерених розтягнутих символів.
+import Compositor # Часткове оновлення дисплея (лише змінені сторінки).
+import InjectorCapture # Вимірювання імпульсів форсунки (IRQ або PIO).
+import VssCounter # Підрахунок імпульсів VSS (IRQ або апаратний лічильник PWM).
+import ToneSequencer # Неблокуючі звукові сигнали та тривога з пріоритетами.
+import TripJournal # Журнал персистентних даних TRIP/PERS (бінарні записи з CRC).
+import PersistencePolicy # Рішення, коли зберігати TRIP/PERS (за змінами та подіями).
+import BrownoutMonitor # Раннє попередження про втрату живлення 12В.
+import TripLogger # Журнал поїздки високої роздільності (бінарні блоки у кільці файлів).
+import TripCounter # Цілочисельне накопичення палива та відстані TRIP/PERS.
+import LoopProbe # Виділення пам'яті за ітерацію циклу дисплея та паузи gc.
+import SmoothingFilter # Згладжування рівня палива та миттєвої витрати (середнє / EMA / медіана).
+import FuelSampler # Потокова медіана зчитувань ADC датчика палива.
+import AdcAcquisition # Вибірки ADC: блокуюче зчитування або безперервна вибірка з DMA.
+import BootProfile # Тривалості фаз запуску (ticks_us) для звіту в консоль.
+import ErrorRules # Таблиця правил попереджень, обчислення в бітову маску.
+import WarningInputs # Датчики-вимикачі попереджень на перериваннях з дебаунсом.
 
 # Спроба імпорту бібліотеки для OLED дисплея SH1107.
 # Якщо бібліотека не знайдена, дисплей буде вимкнено, і система продовжить працювати без нього.
@@ -32,6 +55,8 @@ except ImportError:
     print("Бібліотека sh1107 не знайдена. Дисплей буде вимкнено.")
     sh1107 = None
 
+boot_profile = BootProfile.BootProfile() # Мітки фаз запуску: далі кожен етап ініціалізації викликає mark().
+
 # -------------------------------------------------------------------------
 # 1. ФУНКЦІЇ ДЛЯ ГРАФІКИ (SH1107 EXTENSIONS)
 #    Розширення функціоналу бібліотеки sh1107 для підтримки розтягнутого
@@ -41,6 +66,9 @@ except ImportError:
 # Тимчасовий буфер для рендерингу окремих символів (8x8 пікселів).
 # Використовується для ефективного розтягування тексту на OLED.
 _temp_fb_char = None
+# Атлас розтягнутих символів: кожен (символ, size_x, size_y, колір) рендериться
+# один раз і надалі виводиться одним blit().
+_glyph_atlas = None
 if sh1107: # Ініціалізуємо, тільки якщо драйвер дисплея доступний.
     try:
         # Буфер 8 байт для 8x8 монохромного символу (8*8/8=8 байт).
@@ -50,13 +78,36 @@ if sh1107: # Ініціалізуємо, тільки якщо драйвер д
     except Exception as e:
         print(f"Помилка ініціалізації _temp_fb_char: {e}")
         _temp_fb_char = None
+    try:
+        _glyph_atlas = GlyphAtlas.GlyphAtlas(Settings.GLYPH_ATLAS_BUDGET_BYTES)
+    except Exception as e:
+        print(f"Помилка ініціалізації GlyphAtlas: {e}")
+        _glyph_atlas = None
+
+# Набори символів, які попередньо рендеряться в атлас при ініціалізації дисплея:
+# (символи, size_x, size_y) для draw_main_screen, draw_batt_icon та draw_special_screen.
+_GLYPH_ATLAS_PRELOAD = (
+    ("0123456789.-E", Settings.MAIN_VALUE_FONT_SIZE, Settings.MAIN_VALUE_FONT_SIZE), # Основний показник
+    ("LHKM/10 ", Settings.MAIN_UNIT_FONT_SIZE_X, Settings.MAIN_UNIT_FONT_SIZE_Y),     # Одиниці
+    ("0123456789.-LHKM/ ", Settings.STAT_TEXT_FONT_SIZE_X, Settings.STAT_TEXT_FONT_SIZE_Y), # TRIP/PERS
+    ("0123456789.", Settings.BATT_TEXT_FONT_SIZE_X, Settings.BATT_TEXT_FONT_SIZE_Y),  # Акумулятор
+    ("0123456789.-KMHVRPSL ", Settings.SP_SCR_SPEED_FONT_SIZE, Settings.SP_SCR_SPEED_FONT_SIZE), # Спец. екран
+)
 
 def _draw_stretched_char(oled_obj, char, start_x, y, size_x, size_y, c=1):
     """
     Малює один символ, розтягнутий до заданих розмірів (size_x, size_y).
-    Використовує _temp_fb_char для рендерингу символу, а потім малює розтягнуті
-    пікселі на основному OLED-буфері.
+    Основний шлях - готовий гліф з _glyph_atlas (один blit на символ).
+    Резервний шлях - рендеринг у _temp_fb_char і попіксельне розтягування.
     """
+    if size_x == 1 and size_y == 1:
+        # Без розтягування стандартний text() дає ідентичний результат.
+        oled_obj.text(char, start_x, y, c)
+        return start_x + 8
+
+    if _glyph_atlas is not None:
+        return _glyph_atlas.draw(oled_obj, char, start_x, y, size_x, size_y, c)
+
     if _temp_fb_char is None:
         # Fallback: якщо тимчасовий буфер не ініціалізовано, малюємо стандартний текст.
         oled_obj.text(char, start_x, y, c)
@@ -124,17 +175,14 @@ if sh1107 and _temp_fb_char:
 
 # -------------------------------------------------------------------------
 # 2. ВИЗНАЧЕННЯ ГРУП ПОМИЛОК
-#    Список текстів помилок, які мають викликати звуковий сигнал
-#    та вважатися критичними.
+#    Кожна помилка - біт цілочисельної маски (порядок TripLogger.ERROR_KEYS,
+#    тож маска без перетворень записується в журнал поїздки). Правила
+#    датчиків (пін, рівень, умови, критичність) - таблиця error_rules у
+#    розділі 4, після ініціалізації пінів.
 # -------------------------------------------------------------------------
-# Всі активні помилки, тексти яких є в цьому списку, викликають звуковий сигнал
-# та відображаються як критичні попередження.
-ALL_SOUND_TRIGGERING_ERROR_TEXTS = [
-    Icons.ERROR_ICONS['0_3_AND_1_8_PRESSURE_OIL']['text'],           # Низький тиск мастила (0.3 бар)
-    Icons.ERROR_ICONS['OVERHEAT_AND_LOW_COOLANT']['text'],          # Перегрів двигуна / Низький рівень охолоджувальної рідини
-    Icons.ERROR_ICONS['BRAKE_FLUID']['text'],       # Низький рівень гальмівної рідини
-    Icons.ERROR_ICONS['0_3_AND_1_8_PRESSURE_OIL']['text'], # Низький тиск мастила (1.8 бар)
-]
+ERROR_BIT_LOW_FUEL = 1 << TripLogger.ERROR_KEYS.index('LOW_FUEL') # "Мало палива" (гістерезис у check_errors()).
+ERROR_BIT_WARNING = 1 << TripLogger.ERROR_KEYS.index('WARNING')   # Загальна іконка, що супроводжує критичні помилки.
+_ERROR_QUEUE_EMPTY = -1 # Черга показу порожня (маска 0 - це стан "помилок немає", а не порожня черга).
 
 # -------------------------------------------------------------------------
 # 3. ГЛОБАЛЬНІ ЗМІННІ СТАНУ
@@ -149,17 +197,18 @@ blink_state = True # Змінна для блимання іконки напр
 
 # Змінні для керування DEAD TIME.
 dynamic_dead_time_us = Settings.INJ_DEAD_TIME_US # Присвоюємо змінній корекції базове значення з Settings.
-last_voltage_update_time_ms = time.ticks_ms() # Час останнього оновлення напруги (у мілісекундах).
 
-# Змінні для обробки сигналів форсунки та швидкості (оновлюються в IRQ).
+# Змінні для обробки сигналів форсунки та швидкості.
 rpm = 0                    # Оберти двигуна (RPM), розраховані з імпульсів форсунки.
 total_pulse_time_us = 0    # Загальний час відкриття форсунки за інтервал (мкс). Використовується для розрахунку витрати палива.
 current_inj_period_us = 0  # Тривалість останнього імпульсу форсунки (мкс), щойно розрахована.
-vss_pulse_count = 0        # Кількість імпульсів датчика швидкості (VSS) за інтервал.
-last_pulse_edge_us = 0     # Час останнього фронту сигналу форсунки (для розрахунку тривалості імпульсу).
-last_vss_pulse_us = 0      # Час останнього імпульсу VSS (для дебаунсингу).
-last_inj_start_us = 0      # Час початку останнього імпульсу форсунки (для розрахунку RPM).
-last_inj_irq_time_us = 0   # Час останнього спрацювання IRQ форсунки (для дебаунсу IRQ).
+vss_counter = None         # Лічильник імпульсів VSS (VssCounter.IrqCounter або PwmCounter), розділ 7.
+
+# Джерело вимірювання імпульсів форсунки (InjectorCapture.IrqCapture або PioCapture),
+# створюється в розділі 7. Імпульси забираються пачками в ці масиви.
+inj_capture = None
+inj_width_buf = array('I', [0] * 32)   # Сира тривалість імпульсів (мкс).
+inj_period_buf = array('I', [0] * 32)  # Період між початками імпульсів (мкс).
 avg_inj_ms = 0.0  # Змінна для збереження згладженого значення для часу впорскування на спец екрані
 
 # Змінні для керування станом двигуна.
@@ -171,11 +220,27 @@ is_engine_running_stable = False # Прапорець: True, якщо двигу
 last_stable_rpm_time_ms = 0 # Час (мс), коли RPM востаннє був вище порогу стабільної роботи.
 
 # Змінні для статистики поїздок (TRIP та PERS).
+# Коефіцієнт перетворення часу імпульсу форсунки в літри (ML_PER_MIN -> L_PER_US).
+FUEL_RATE_L_PER_US = Settings.INJ_FLOW_RATE_ML_PER_MIN / (1000 * 60 * 1_000_000)
+# Накопичення ведеться в цілих (мкс форсунки, імпульси VSS); значення в літрах
+# та кілометрах нижче лише перераховуються з них (sync_trip_values()).
+trip_counter = TripCounter.TripCounter(FUEL_RATE_L_PER_US, Settings.VSS_IMPULSES_PER_KM) # TRIP.
+pers_counter = TripCounter.TripCounter(FUEL_RATE_L_PER_US, Settings.VSS_IMPULSES_PER_KM) # PERS.
 trip_fuel_consumed_L = 0.0          # Накопичене паливо за поточну поїздку (TRIP).
 trip_distance_travelled_km = 0.0    # Пройдена відстань за поточну поїздку (TRIP).
 persistent_trip_fuel_L = 0.0        # Накопичене паливо за всю історію (PERS).
 persistent_trip_distance_km = 0.0   # Пройдена відстань за всю історію (PERS).
-last_persistent_save_time_ms = time.ticks_ms() # Час останнього збереження персистентних даних на Flash.
+# Журнал зберігає самі цілі лічильники; пороги змін переводяться в їх одиниці.
+trip_journal = TripJournal.TripJournal(Settings.TRIP_JOURNAL_FILE_FORMAT, Settings.TRIP_JOURNAL_SEGMENTS,
+                                       Settings.TRIP_JOURNAL_SEGMENT_BYTES,
+                                       int(Settings.PERSISTENT_MIN_DELTA_FUEL_L / FUEL_RATE_L_PER_US),
+                                       int(Settings.PERSISTENT_MIN_DELTA_KM * Settings.VSS_IMPULSES_PER_KM))
+persistence_policy = PersistencePolicy.PersistencePolicy(Settings.PERSISTENT_MAX_STALE_MS)
+trip_logger = None # Журнал поїздки (TripLogger.TripLogger), якщо TRIP_LOG_ENABLED.
+if Settings.TRIP_LOG_ENABLED:
+    trip_logger = TripLogger.TripLogger(Settings.TRIP_LOG_FILE_FORMAT, Settings.TRIP_LOG_FILES, Settings.TRIP_LOG_FILE_BYTES,
+                                        Settings.TRIP_LOG_BLOCK_BYTES, Settings.TRIP_LOG_BUDGET_KB_PER_HOUR)
+loop_probe = LoopProbe.LoopProbe() # Байти на ітерацію циклу дисплея та паузи gc.collect().
 
 # Змінні для керування дисплеєм та інтерфейсом.
 current_display_mode = "MAIN"   # Поточний режим відображення: "MAIN", "ERROR_CYCLE", "LOW_FUEL_CYCLE", "SPECIAL_SCREEN".
@@ -191,22 +256,20 @@ button_special_screen_triggered = False # Прапорець, що актива
 button_special_screen_beep_played = False # Прапорець, що подвійний сигнал для спец-екрану вже пролунав.
 
 # Змінні для обробки помилок та звукової сигналізації.
-active_errors = []              # Список активних помилок для відображення на екрані.
+active_error_mask = 0           # Маска помилок, що зараз показуються на екрані.
+active_errors = [Icons.ERROR_ICONS['NONE']] # Іконки active_error_mask у порядку показу (перебудовується лише при зміні маски).
 current_error_display_index = 0 # Поточний індекс помилки в циклі відображення (якщо кілька помилок активні).
 last_error_cycle_time_ms = time.ticks_ms() # Час останнього перемикання іконки помилки на екрані.
 sensor_alarm_active = False     # Прапорець: True, якщо активний звуковий сигнал тривоги.
-alarm_phase = 0                 # Поточна фаза звукового сигналу (індекс у ALARM_SEQUENCE).
-alarm_phase_start_time_ms = 0   # Час початку поточної фази звукового сигналу.
-_queued_errors_for_next_cycle = [] # Черга помилок для перемикання після завершення поточного циклу відображення.
+_queued_error_mask = _ERROR_QUEUE_EMPTY # Маска для перемикання після завершення поточного циклу показу.
 file_error_count = 0            # Лічильник помилок файлової системи (для відображення на екрані).
-
-# Змінні для динаміка/зумера.
-current_speaker_freq = 0 # Поточна частота динаміка.
-current_speaker_duty = 0 # Поточна шпаруватість динаміка (0 = вимкнено, 32768 = 50%).
+brownout_followup_event = 0     # Номер спрацювання brownout_monitor, для якого вже був додатковий аварійний запис.
 
 # Змінні для датчика палива та його логіки.
 fuel_level_adc = None           # Об'єкт ADC для палива (ініціалізується пізніше).
-fuel_buffer = [0] * Settings.FUEL_BUFFER_SIZE # Буфер для згладжування значень рівня палива.
+fuel_filter = SmoothingFilter.create(Settings.FUEL_FILTER_TYPE, Settings.FUEL_BUFFER_SIZE,
+                                     Settings.FUEL_EMA_ALPHA) # Згладжування рівня палива.
+fuel_sampler = None             # Вікно зчитувань ADC палива (FuelSampler.FuelSampler), якщо є ADC.
 last_smoothed_fuel_percent = 0.0 # Останнє згладжене значення палива (у відсотках).
 last_fuel_update_time_ms = time.ticks_ms() # Час останнього оновлення значення палива.
 is_low_fuel_active_by_hysteresis = False # Стан активації "Мало палива" з урахуванням гістерезису.
@@ -214,7 +277,8 @@ low_fuel_display_state = 0      # 0: Відображаємо LOW_FUEL, 1: Ві
 low_fuel_last_state_change_time_ms = time.ticks_ms() # Час останньої зміни стану відображення "Мало палива".
 
 # Змінні для згладжування головного показника (L/H або L/100KM).
-main_val_buffer = [0.0] * Settings.MAIN_VAL_BUFFER_SIZE # Буфер для згладжування миттєвої витрати.
+main_val_filter = SmoothingFilter.create(Settings.MAIN_VAL_FILTER_TYPE, Settings.MAIN_VAL_BUFFER_SIZE,
+                                         Settings.MAIN_VAL_EMA_ALPHA) # Згладжування миттєвої витрати.
 last_display_unit = "L/H" # Для відстеження моменту перемикання режимів відображення L/H / L/100KM.
 
 # Змінні для спеціального екрану.
@@ -232,14 +296,81 @@ wdt = None  # Об'єкт Watchdog (сторожовий таймер), ініц
 # Це типово для датчиків, які "закорочують" пін на землю при спрацюванні (активний низький сигнал).
 INJ_PIN = Pin(Settings.PIN_INJ, Pin.IN, Pin.PULL_UP)
 VSS_PIN = Pin(Settings.PIN_VSS, Pin.IN, Pin.PULL_UP)
+
+# Вимірювання форсунки та VSS запускається першим, до решти ініціалізації:
+# імпульси під час запуску (двигун заводять одразу після ввімкнення
+# запалювання) складаються в буфери і враховуються першим кадром.
+# PIO - за налаштуванням; якщо машина станів або канал DMA недоступні, використовуються
+# переривання GPIO на обидва фронти.
+if Settings.INJ_CAPTURE_BACKEND == 1:
+    try:
+        inj_capture = InjectorCapture.PioCapture(INJ_PIN, Settings.INJ_EDGE_RING_SIZE, Settings.INJ_PIO_STATE_MACHINE)
+    except Exception as e:
+        print(f"⚠️ PIO capture init error: {e}")
+if inj_capture is None:
+    inj_capture = InjectorCapture.IrqCapture(INJ_PIN, Settings.INJ_EDGE_RING_SIZE)
+inj_capture.start()
+
+# Підрахунок імпульсів VSS (FALLING фронти). Апаратний лічильник PWM -
+# за налаштуванням; якщо пін не підтримує режим лічильника, використовується IRQ.
+if Settings.VSS_COUNTER_BACKEND == 1:
+    try:
+        vss_counter = VssCounter.PwmCounter(Settings.PIN_VSS)
+    except Exception as e:
+        print(f"⚠️ PWM VSS counter init error: {e}")
+if vss_counter is None:
+    vss_counter = VssCounter.IrqCounter(VSS_PIN, Settings.VSS_DEBOUNCE_US)
+vss_counter.start()
+
 RESET_BUTTON_PIN = Pin(Settings.PIN_BUTTON_RESET, Pin.IN, Pin.PULL_UP)
 BRAKE_FLUID_SENSOR_PIN = Pin(Settings.PIN_SENSOR_BRAKE_FLUID, Pin.IN, Pin.PULL_UP)
 OIL_PRESSURE_0_3_SENSOR_PIN = Pin(Settings.PIN_SENSOR_OIL_PRESSURE_0_3, Pin.IN, Pin.PULL_UP)
 OVERHEAT_AND_LOW_COOLANT_SENSOR_PIN = Pin(Settings.PIN_SENSOR_OVERHEAT_AND_LOW_COOLANT, Pin.IN, Pin.PULL_UP)
 OIL_PRESSURE_1_8_SENSOR_PIN = Pin(Settings.PIN_SENSOR_OIL_PRESSURE_1_8, Pin.IN, Pin.PULL_UP)
 
+# Датчики попереджень на перериваннях обох фронтів: події в черзі, дебаунс та
+# реакція - у warning_task(), яку будить warning_event (без опитування пінів).
+warning_event = asyncio.ThreadSafeFlag()
+warning_inputs = WarningInputs.WarningInputs(
+    (BRAKE_FLUID_SENSOR_PIN, OVERHEAT_AND_LOW_COOLANT_SENSOR_PIN, OIL_PRESSURE_1_8_SENSOR_PIN, OIL_PRESSURE_0_3_SENSOR_PIN),
+    Settings.WARNING_DEBOUNCE_MS, Settings.WARNING_EVENT_QUEUE_SIZE, warning_event.set)
+warning_inputs.start()
+boot_profile.irq_armed()
+
+# Правила попереджень датчиків (див. ErrorRules.py). Порядок рядків - порядок показу іконок.
+# Новий датчик - ще один рядок; перевірка в циклі лишається одним проходом по таблиці.
+# Рівні - відфільтровані warning_inputs (дебаунс), а не миттєві значення пінів.
+#  (вхід, рівень помилки, мін. RPM, лише стабільна робота, затримка після запуску мс, іконка, критичність)
+error_rules = ErrorRules.ErrorRules(TripLogger.ERROR_KEYS, (
+    (warning_inputs.input(0), 0, 0, False, -1, 'BRAKE_FLUID', ErrorRules.SEVERITY_CRITICAL),
+    (warning_inputs.input(1), 0, 0, False, -1, 'OVERHEAT_AND_LOW_COOLANT', ErrorRules.SEVERITY_CRITICAL),
+    # Тиск мастила 1.8 бар - лише на високих обертах.
+    (warning_inputs.input(2), 0, Settings.MIN_RPM_FOR_HIGH_PRESSURE_CHECK, False, -1,
+     '0_3_AND_1_8_PRESSURE_OIL', ErrorRules.SEVERITY_CRITICAL),
+    # Тиск мастила 0.3 бар - при стабільній роботі і не раніше OIL_CHECK_DELAY_MS після запуску.
+    (warning_inputs.input(3), 0, 0, True, Settings.OIL_CHECK_DELAY_MS,
+     '0_3_AND_1_8_PRESSURE_OIL', ErrorRules.SEVERITY_CRITICAL),
+    # "Мало палива" обчислює check_errors() з гістерезисом; тут - лише критичність.
+    (None, 0, 0, False, -1, 'LOW_FUEL', ErrorRules.SEVERITY_NOTICE),
+))
+
+# Джерело вибірок ADC (напруга 12В та датчик палива). DMA - за налаштуванням;
+# якщо він недоступний, використовується блокуюче зчитування machine.ADC.
+adc_source = None
+if Settings.ADC_BACKEND == 1:
+    try:
+        adc_source = AdcAcquisition.DmaAdc((Settings.PIN_ADC, Settings.PIN_FUEL_LEVEL_ADC),
+                                           Settings.ADC_DMA_RATE_HZ, Settings.ADC_DMA_DEPTH)
+        adc_source.start()
+    except Exception as e:
+        adc_source = None
+        print(f"⚠️ DMA ADC init error: {e}")
+if adc_source is None:
+    adc_source = AdcAcquisition.PollingAdc()
+
 # Ініціалізація піна ADC 12V
-voltage_adc = ADC(Pin(Settings.PIN_ADC))
+voltage_adc = adc_source.channel(Settings.PIN_ADC, Settings.ADC_DMA_VOLTAGE_AVERAGE)
+boot_profile.mark('adc')
 
 # Ініціалізація PWM для динаміка.
 # Динамік підключається до вихідного піна SPEAKE_PIN.
@@ -247,10 +378,12 @@ try:
     pwm_speaker = PWM(Pin(Settings.PIN_SPEAKER, Pin.OUT))
     pwm_speaker.freq(1000) # Початкова частота 1000 Гц.
     pwm_speaker.duty_u16(0) # Динамік вимкнено (0% шпаруватості).
-    current_speaker_duty = 0
+    tone_sequencer = ToneSequencer.ToneSequencer(pwm_speaker) # Єдиний власник регістрів PWM динаміка.
 except Exception as e:
     pwm_speaker = None
+    tone_sequencer = None
     print(f"Помилка ініціалізації динаміка: {e}")
+boot_profile.mark('speaker')
 
 # Ініціалізація Watchdog (сторожового таймера).
 # Watchdog перезавантажить мікроконтролер, якщо програма зависне (не "годуватиме" його).
@@ -260,20 +393,49 @@ try:
     print(f"✅ Watchdog активовано ({Settings.WATCHDOG_TIME_RESET} ms)")
 except Exception as e:
     print(f"⚠️ Watchdog помилка: {e}")
+boot_profile.mark('wdt')
 
 # Ініціалізація ADC для датчика палива.
 # Аналоговий датчик рівня палива підключається до відповідного ADC піна.
 try:
-    fuel_level_adc = ADC(Pin(Settings.PIN_FUEL_LEVEL_ADC))
+    fuel_level_adc = adc_source.channel(Settings.PIN_FUEL_LEVEL_ADC, Settings.ADC_DMA_FUEL_AVERAGE)
+    fuel_sampler = FuelSampler.FuelSampler(fuel_level_adc, Settings.FUEL_SAMPLE_WINDOW, Settings.FUEL_SAMPLE_KEEP)
+    fuel_sampler.prime() # Початкове вікно зі швидких зчитувань; далі - по одному кожні FUEL_SAMPLE_INTERVAL_MS.
 except Exception as e:
     fuel_level_adc = None
+    fuel_sampler = None
     print(f"Помилка ініціалізації ADC для палива: {e}")
+boot_profile.mark('fuel adc')
+
+# Бітові мапи іконок з icons.bin (після запуску вимірювань - файлова система не затримує IRQ).
+Icons.load()
+boot_profile.mark('icons')
+if Icons.load_error:
+    print(f"⚠️ Icons load error: {Icons.load_error}")
+    file_error_count += 1
+else:
+    print(f"🖼️ Icons: {Icons.loaded} loaded from {Icons.BLOB_FILE} ({len(Icons.blob)} B) in {Icons.load_us} us")
 
 # -------------------------------------------------------------------------
 # 5. СИСТЕМНІ ФУНКЦІЇ ТА ЛОГІКА
 #    Функції, що реалізують основну логіку роботи бортового комп'ютера.
 # -------------------------------------------------------------------------
 
+# Кеш рядків екрану: [ключ, текст]. Ключ - ціле значення з точністю відображення;
+# рядок форматується лише тоді, коли ключ змінився.
+_main_value_text = [None, ""]
+_pers_text = [None, ""]
+_trip_text = [None, ""]
+_file_error_text = [None, ""]
+_batt_text = [None, ""]
+
+def _file_error_label():
+    """Текст лічильника файлових помилок ("FE" скорочено від "File Error")."""
+    if _file_error_text[0] != file_error_count:
+        _file_error_text[0] = file_error_count
+        _file_error_text[1] = f"FE:{file_error_count}"
+    return _file_error_text[1]
+
 def draw_batt_icon(oled, x, y, v_val, current_time_ms):
     """
     Відображення стану акумулятора.
@@ -288,9 +450,12 @@ def draw_batt_icon(oled, x, y, v_val, current_time_ms):
     oled.fill_rect(x + 5, y - 2, 4, 2, 1) # Клема
     oled.fill_rect(x + 27, y - 2, 4, 2, 1) # Клема
 
-    # 3. Напруга всередині
-    v_str = "{:.1f}".format(v_val)
-    oled.stretched_text(v_str, x + 3, y + 6, 1, 2, 1)
+    # 3. Напруга всередині (рядок форматується лише при зміні десятих вольта).
+    key = int(v_val * 10 + 0.5)
+    if _batt_text[0] != key:
+        _batt_text[0] = key
+        _batt_text[1] = "{:.1f}".format(key / 10)
+    oled.stretched_text(_batt_text[1], x + 3, y + 6, Settings.BATT_TEXT_FONT_SIZE_X, Settings.BATT_TEXT_FONT_SIZE_Y, 1)
 
 def update_voltage_correction():
     global current_battery_voltage, dynamic_dead_time_us
@@ -298,11 +463,19 @@ def update_voltage_correction():
     Корекція DEAD TIME та розрахунок для відображення
     """
     # 1. Читаємо ADC (0-65535)
+    adc_source.service() # Перезапуск DMA після вичерпання лічильника передач (раз на кілька діб).
     raw_v = voltage_adc.read_u16()
 
     # Множимо на готовий коефіцієнт із Settings
+    previous_voltage = current_battery_voltage
     current_battery_voltage = raw_v * Settings.VOLTAGE_CALIBRATION
 
+    # Просідання напруги - імовірна втрата живлення: зберігаємо дані одразу,
+    # не чекаючи persistence_task().
+    if previous_voltage >= Settings.PERSISTENT_VOLTAGE_DROP_V > current_battery_voltage:
+        persistence_policy.request(PersistencePolicy.REASON_VOLTAGE_DROP)
+        save_persistent_data()
+
     # Корекція часу відкриття форсунки (Dead Time)
     # Якщо напруга занадто мала (машина вимкнена), беремо 14В як базу
     v_for_corr = current_battery_voltage if current_battery_voltage > 8.0 else 14.0
@@ -314,135 +487,93 @@ def update_voltage_correction():
 
 def get_current_rpm_atomic():
     """
-    Безпечно (атомарно) зчитує поточні оберти двигуна (rpm) з глобальної змінної.
-    Використання disable_irq/enable_irq запобігає race conditions, коли IRQ
-    може оновлювати змінну під час її зчитування головним циклом.
+    Зчитує поточні оберти двигуна (rpm).
+    rpm оновлюється лише в задачі engine_task (process_injector_pulses),
+    тому блокування переривань тут не потрібне.
     """
-    global rpm
-    irq_state = disable_irq() # Тимчасово відключаємо переривання.
-    current_rpm_value = rpm
-    enable_irq(irq_state)     # Знову вмикаємо переривання.
-    return current_rpm_value
+    return rpm
 
 def get_current_inj_period_atomic():
     """
-    Безпечно (атомарно) зчитує поточну тривалість імпульсу форсунки (current_inj_period_us).
-    Захист від race conditions під час доступу до змінної, що оновлюється в IRQ.
+    Зчитує поточну тривалість імпульсу форсунки (current_inj_period_us).
+    Оновлюється лише в задачі engine_task (process_injector_pulses).
     """
-    global current_inj_period_us
-    irq_state = disable_irq() # Тимчасово відключаємо переривання.
-    current_period_value = current_inj_period_us
-    enable_irq(irq_state)     # Знову вмикаємо переривання.
-    return current_period_value
+    return current_inj_period_us
+
+# Подвійний сигнал активації спец-екрану у форматі ALARM_SEQUENCE ((тривалість_мс, частота_Гц), ...).
+_SPECIAL_SCREEN_BEEPS = (
+    (int(Settings.BUTTON_SPECIAL_SCREEN_BEEP_DURATION_1 * 1000), Settings.BUTTON_SPECIAL_SCREEN_BEEP_FREQ_1),
+    (int(Settings.BUTTON_SPECIAL_SCREEN_BEEP_PAUSE_BETWEEN_SEC * 1000), 0),
+    (int(Settings.BUTTON_SPECIAL_SCREEN_BEEP_DURATION_2 * 1000), Settings.BUTTON_SPECIAL_SCREEN_BEEP_FREQ_2),
+)
 
 def play_single_beep(freq, duration_sec):
-    """Відтворює один звуковий сигнал заданої частоти та тривалості."""
-    global pwm_speaker, current_speaker_freq, current_speaker_duty
-    if pwm_speaker:
-        pwm_speaker.freq(freq)
-        pwm_speaker.duty_u16(32768) # 50% шпаруватості.
-        time.sleep(duration_sec)
-        pwm_speaker.duty_u16(0)
-        current_speaker_duty = 0
-        current_speaker_freq = 0
+    """Відтворює один звуковий сигнал заданої частоти та тривалості (не блокує; тривога має пріоритет)."""
+    if tone_sequencer:
+        tone_sequencer.play(((int(duration_sec * 1000), freq),), ToneSequencer.PRIORITY_UI)
 
 def play_special_screen_beeps():
-    """Відтворює подвійний звуковий сигнал для активації спеціального екрану."""
-    global pwm_speaker
-    if pwm_speaker:
-        play_single_beep(Settings.BUTTON_SPECIAL_SCREEN_BEEP_FREQ_1, Settings.BUTTON_SPECIAL_SCREEN_BEEP_DURATION_1)
-        time.sleep(Settings.BUTTON_SPECIAL_SCREEN_BEEP_PAUSE_BETWEEN_SEC)
-        play_single_beep(Settings.BUTTON_SPECIAL_SCREEN_BEEP_FREQ_2, Settings.BUTTON_SPECIAL_SCREEN_BEEP_DURATION_2)
+    """Відтворює подвійний звуковий сигнал для активації спеціального екрану (не блокує)."""
+    if tone_sequencer:
+        tone_sequencer.play(_SPECIAL_SCREEN_BEEPS, ToneSequencer.PRIORITY_UI)
 
 
-def _get_error_severity_level(error_list):
+def _errors_to_show(sensor_mask):
     """
-    Визначає рівень критичності списку помилок.
-    Рівні:
-    0: Немає помилок.
-    1: Некритична помилка (наприклад, "Мало палива"), без звукового сигналу.
-    3: Критична помилка (вимагає негайної уваги), зі звуковим сигналом.
+    Маска до показу за маскою датчиків: критичні помилки разом з іконкою WARNING;
+    якщо критичних немає - лише "Мало палива"; інакше 0 (помилок немає).
     """
-    if not error_list or error_list == [Icons.ERROR_ICONS['NONE']]:
-        return 0 # Немає помилок.
-
-    # Якщо є будь-яка критична помилка (текст якої є у ALL_SOUND_TRIGGERING_ERROR_TEXTS).
-    if any(err['text'] in ALL_SOUND_TRIGGERING_ERROR_TEXTS for err in error_list):
-        return 3 # Критична помилка.
-
-    # Якщо є тільки "Мало палива" (і немає критичних).
-    if any(err['text'] == Icons.ERROR_ICONS['LOW_FUEL']['text'] for err in error_list):
-        return 1 # Некритична помилка.
-
-    return 0 # Дефолт, якщо не підійшло жодне визначення.
+    critical = sensor_mask & error_rules.critical_mask
+    if critical:
+        return critical | ERROR_BIT_WARNING
+    return sensor_mask & ERROR_BIT_LOW_FUEL
+
+def _set_active_errors(mask):
+    """Встановлює маску помилок на екрані та перебудовує список іконок (лише при зміні маски)."""
+    global active_error_mask
+    active_error_mask = mask
+    active_errors.clear()
+    for bit, key in error_rules.order:
+        if mask & bit:
+            active_errors.append(Icons.ERROR_ICONS[key])
+    if not active_errors:
+        active_errors.append(Icons.ERROR_ICONS['NONE'])
 
 def manage_sensor_alarm():
     """
-    Керує послідовністю звукової тривоги відповідно до ALARM_SEQUENCE,
-    визначеної в Settings.py.
+    Узгоджує звукову тривогу з прапорцем sensor_alarm_active: запускає
+    циклічну послідовність ALARM_SEQUENCE (Settings.py) з найвищим пріоритетом
+    або зупиняє її. Фази перемикає tone_sequencer.tick() у sound_task().
     """
-    global sensor_alarm_active, alarm_phase, alarm_phase_start_time_ms
-    global pwm_speaker, current_speaker_freq, current_speaker_duty
-
-    if pwm_speaker is None:
+    if tone_sequencer is None:
         return # Якщо динамік не ініціалізовано, нічого не робимо.
 
-    if not sensor_alarm_active:
-        # Якщо тривога не активна, вимикаємо динамік і скидаємо фази.
-        if current_speaker_duty != 0:
-            pwm_speaker.duty_u16(0)
-            current_speaker_duty = 0
-        alarm_phase = 0
-        alarm_phase_start_time_ms = 0
-        return
+    if sensor_alarm_active:
+        if tone_sequencer.priority != ToneSequencer.PRIORITY_ALARM:
+            tone_sequencer.play(Settings.ALARM_SEQUENCE, ToneSequencer.PRIORITY_ALARM, repeat=True)
+    else:
+        tone_sequencer.stop(ToneSequencer.PRIORITY_ALARM)
 
-    current_time_ms = time.ticks_ms()
-    if alarm_phase_start_time_ms == 0:
-        alarm_phase_start_time_ms = current_time_ms # Ініціалізація часу початку першої фази.
-
-    # Отримуємо тривалість та частоту поточної фази з ALARM_SEQUENCE.
-    phase_duration, phase_freq = Settings.ALARM_SEQUENCE[alarm_phase]
-
-    # Перевіряємо, чи потрібно перейти до наступної фази.
-    if time.ticks_diff(current_time_ms, alarm_phase_start_time_ms) >= phase_duration:
-        alarm_phase = (alarm_phase + 1) % len(Settings.ALARM_SEQUENCE) # Перехід до наступної фази (циклічно).
-        alarm_phase_start_time_ms = current_time_ms # Оновлюємо час початку нової фази.
-
-        # Встановлюємо динамік відповідно до нової фази.
-        next_phase_duration, next_phase_freq = Settings.ALARM_SEQUENCE[alarm_phase]
-        if next_phase_freq > 0:
-            if current_speaker_freq != next_phase_freq:
-                pwm_speaker.freq(next_phase_freq)
-                current_speaker_freq = next_phase_freq
-            if current_speaker_duty != 32768: # 50% шпаруватості для звуку.
-                pwm_speaker.duty_u16(32768)
-                current_speaker_duty = 32768
-        else: # Якщо частота 0, вимикаємо динамік.
-            if current_speaker_duty != 0:
-                pwm_speaker.duty_u16(0)
-                current_speaker_duty = 0
-    elif phase_freq > 0:
-        # Якщо поточна фаза ще не завершилася і має звук, переконаємося,
-        # що динамік увімкнений з правильною частотою.
-        if current_speaker_freq != phase_freq:
-            pwm_speaker.freq(phase_freq)
-            current_speaker_freq = phase_freq
-        if current_speaker_duty != 32768:
-            pwm_speaker.duty_u16(32768)
-            current_speaker_duty = 32768
+def update_sound():
+    """
+    Крок звукової підсистеми. Повертає кількість мс до наступної зміни тону
+    (-1, якщо динамік мовчить).
+    """
+    if tone_sequencer is None:
+        return -1
+    manage_sensor_alarm()
+    return tone_sequencer.tick()
 
 def get_raw_fuel_percent():
     """
-    Зчитує сирі дані з ADC датчика палива та перетворює їх на відсотки рівня палива (0-100%).
-    Використовує медіанний фільтр для підвищення стабільності показань.
+    Перетворює сире значення ADC датчика палива на відсотки рівня палива (0-100%).
+    Сире значення - усічене середнє/медіана вікна зчитувань FuelSampler
+    (зчитування рівномірно розподілені за останні секунди, див. fuel_sample_task).
     """
-    if fuel_level_adc is None:
+    if fuel_sampler is None:
         return 0.0 # Якщо ADC не ініціалізовано, повертаємо 0%.
 
-    # Виконуємо кілька швидких зчитувань ADC для отримання більш стабільного значення
-    # та застосовуємо медіанний фільтр (беремо 4-те значення відсортованого списку).
-    readings = [fuel_level_adc.read_u16() for _ in range(8)]
-    raw_adc_value = sorted(readings)[3] # 4-те значення = медіана для 8 зчитувань.
+    raw_adc_value = fuel_sampler.estimate()
 
     # Перетворюємо сире значення ADC на відсотки за допомогою калібрувальних значень.
     # Пропорція: (поточне_значення - мінімум) / (максимум - мінімум)
@@ -459,7 +590,7 @@ def process_fuel_smoothing():
     Зчитує та згладжує рівень палива, застосовуючи обмеження швидкості зміни
     для запобігання різким стрибкам показань.
     """
-    global fuel_buffer, last_smoothed_fuel_percent, last_fuel_update_time_ms
+    global last_smoothed_fuel_percent, last_fuel_update_time_ms
 
     current_time_ms = time.ticks_ms()
     time_diff_sec = time.ticks_diff(current_time_ms, last_fuel_update_time_ms) / 1000.0
@@ -474,12 +605,8 @@ def process_fuel_smoothing():
 
     new_raw_percent = get_raw_fuel_percent()
 
-    # 1. Додаємо нове значення до буфера та видаляємо найстаріше (FIFO).
-    fuel_buffer.pop(0)
-    fuel_buffer.append(new_raw_percent)
-
-    # 2. Обчислюємо середнє значення з буфера (згладжування).
-    current_smoothed_percent = sum(fuel_buffer) / len(fuel_buffer)
+    # 1-2. Нове значення потрапляє у фільтр (середнє, EMA або медіана - за Settings.FUEL_FILTER_TYPE).
+    current_smoothed_percent = fuel_filter.update(new_raw_percent)
 
     # 3. Обмежуємо швидкість зміни значення, тільки якщо пройшов достатній час.
     if time_diff_sec > 0:
@@ -496,16 +623,15 @@ def process_fuel_smoothing():
 
 def check_errors():
     """
-    Перевіряє стан всіх підключених датчиків та рівень палива,
-    повертаючи список усіх АКТИВНИХ помилок.
-    Включає логіку затримки перевірки тиску масла та гістерезис для палива.
+    Перевіряє стан всіх підключених датчиків (таблиця error_rules) та рівень
+    палива, повертаючи маску всіх АКТИВНИХ помилок (0 - помилок немає).
+    Включає стан стабільної роботи двигуна для умов правил та гістерезис для палива.
     """
     global engine_start_time_ms
     global is_low_fuel_active_by_hysteresis, last_smoothed_fuel_percent
     global is_engine_running_stable
     global last_stable_rpm_time_ms
 
-    found_errors = [] # Список для збору всіх знайдених помилок (критичних та некритичних).
     current_time_ms = time.ticks_ms()
 
     # Зчитуємо оберти двигуна атомарно, щоб уникнути race conditions з IRQ.
@@ -525,24 +651,9 @@ def check_errors():
             is_engine_running_stable = False
             # engine_start_time_ms скидається в головному циклі при тривалій відсутності імпульсів форсунки.
 
-    # --- 1. Критичні помилки (датчики) ---
-    # Датчики, які зазвичай активні низьким сигналом (0V) при проблемі.
-    if BRAKE_FLUID_SENSOR_PIN.value() == 0:
-        found_errors.append(Icons.ERROR_ICONS['BRAKE_FLUID'])
-    if OVERHEAT_AND_LOW_COOLANT_SENSOR_PIN.value() == 0:
-        found_errors.append(Icons.ERROR_ICONS['OVERHEAT_AND_LOW_COOLANT'])
-
-    # Датчик низького тиску масла (1.8 бар) перевіряється лише при певних RPM.
-    if current_rpm_safe > Settings.MIN_RPM_FOR_HIGH_PRESSURE_CHECK:
-        if OIL_PRESSURE_1_8_SENSOR_PIN.value() == 0:
-            found_errors.append(Icons.ERROR_ICONS['0_3_AND_1_8_PRESSURE_OIL'])
-
-    # Датчик низького тиску масла перевіряється лише після затримки після запуску двигуна
-    # та коли двигун працює стабільно.
-    if OIL_PRESSURE_0_3_SENSOR_PIN.value() == 0:
-        if is_engine_running_stable and engine_start_time_ms != 0:
-            if time.ticks_diff(current_time_ms, engine_start_time_ms) > Settings.OIL_CHECK_DELAY_MS:
-                found_errors.append(Icons.ERROR_ICONS['0_3_AND_1_8_PRESSURE_OIL'])
+    # --- 1. Датчики за таблицею правил (умови RPM, стабільності та затримки - в правилах) ---
+    run_ms = time.ticks_diff(current_time_ms, engine_start_time_ms) if engine_start_time_ms != 0 else -1
+    mask = error_rules.evaluate(current_rpm_safe, is_engine_running_stable, run_ms)
 
     # --- 2. Некритична помилка "Мало палива" (з гістерезисом) ---
     # Використовуємо гістерезис для стабільної активації/деактивації попередження.
@@ -556,217 +667,213 @@ def check_errors():
             is_low_fuel_active_by_hysteresis = True
 
     if is_low_fuel_active_by_hysteresis:
-        found_errors.append(Icons.ERROR_ICONS['LOW_FUEL'])
+        mask |= ERROR_BIT_LOW_FUEL
 
-    # Якщо знайдені помилки, повертаємо їх список.
-    if found_errors:
-        return found_errors
+    return mask
 
-    # Якщо помилок не знайдено, повертаємо спеціальну іконку "NONE".
-    return [Icons.ERROR_ICONS['NONE']]
+def _load_legacy_trip_data():
+    """
+    Зчитує текстовий файл попередніх версій прошивки (4 рядки: PERS паливо,
+    PERS відстань, TRIP паливо, TRIP відстань). Повертає кортеж або None.
+    """
+    try:
+        with open(Settings.TRIP_DATA_FILE, 'r') as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    if len(lines) < 4:
+        print("⚠️ Legacy trip data file incomplete, ignored.")
+        return None
+    return tuple(float(line.strip()) for line in lines[:4])
 
 def load_persistent_data():
     """
-    Завантажує персистентні дані TRIP та PERS з файлу на Flash пам'яті.
+    Завантажує персистентні дані TRIP та PERS з журналу на Flash пам'яті
+    (останній запис з правильним CRC): цілі лічильники відновлюються точно.
+    Якщо журналу ще немає, переносить дані (літри/км) із записів попереднього
+    формату журналу або з текстового файлу попередніх версій прошивки.
     Дані включають накопичене паливо та відстань для загального пробігу та поточної поїздки.
     """
-    global persistent_trip_fuel_L, persistent_trip_distance_km, trip_fuel_consumed_L, trip_distance_travelled_km, file_error_count
+    global file_error_count
+    pers_counter.reset()
+    trip_counter.reset()
     try:
-        with open(Settings.TRIP_DATA_FILE, 'r') as f:
-            lines = f.readlines()
-            # Очікуємо 4 рядки: persistent fuel, persistent distance, trip fuel, trip distance.
-            if len(lines) >= 4:
-                persistent_trip_fuel_L = float(lines[0].strip())
-                persistent_trip_distance_km = float(lines[1].strip())
-                trip_fuel_consumed_L = float(lines[2].strip())
-                trip_distance_travelled_km = float(lines[3].strip())
-            else:
-                # Якщо файл пошкоджений або неповний, ініціалізуємо нулями.
-                print("⚠️ Persistent data file incomplete, initializing with 0.")
-                persistent_trip_fuel_L = 0.0
-                persistent_trip_distance_km = 0.0
-                trip_fuel_consumed_L = 0.0
-                trip_distance_travelled_km = 0.0
+        counters = trip_journal.load()
+        if counters is not None:
+            pers_counter.restore(counters[0], counters[1], counters[2])
+            trip_counter.restore(counters[3], counters[4], counters[5])
+        else:
+            values = trip_journal.load_legacy()
+            legacy_file = values is None
+            if legacy_file:
+                values = _load_legacy_trip_data()
+            if values is not None:
+                pers_counter.set(values[0], values[1])
+                trip_counter.set(values[2], values[3])
+                trip_journal.append(pers_counter, trip_counter, force=True) # Перший запис - перенесені дані.
+                if legacy_file:
+                    try: os.remove(Settings.TRIP_DATA_FILE)
+                    except OSError: pass
+        trip_journal.prepare() # Відкритий файл і місце для аварійного запису.
     except Exception as e:
-        # У випадку помилки при читанні файлу, ініціалізуємо нулями та збільшуємо лічильник помилок.
+        # У випадку помилки при читанні, ініціалізуємо нулями та збільшуємо лічильник помилок.
         print(f"⚠️ Load persistent data error: {e}. Initializing with 0.")
-        persistent_trip_fuel_L = 0.0
-        persistent_trip_distance_km = 0.0
-        trip_fuel_consumed_L = 0.0
-        trip_distance_travelled_km = 0.0
+        pers_counter.reset()
+        trip_counter.reset()
         file_error_count += 1
+    sync_trip_values()
+
+def sync_trip_values():
+    """Перераховує цілочисельні лічильники TRIP/PERS у літри та кілометри (дисплей, журнал)."""
+    global persistent_trip_fuel_L, persistent_trip_distance_km, trip_fuel_consumed_L, trip_distance_travelled_km
+    trip_fuel_consumed_L = trip_counter.fuel_L()
+    trip_distance_travelled_km = trip_counter.km()
+    persistent_trip_fuel_L = pers_counter.fuel_L()
+    persistent_trip_distance_km = pers_counter.km()
 
 def save_persistent_data():
     """
-    Зберігає персистентні дані TRIP та PERS до файлу на Flash пам'яті
-    через певний інтервал часу, використовуючи атомарний механізм
-    (тимчасовий файл -> перейменування). Це запобігає пошкодженню файлу
-    у разі відключення живлення під час запису.
+    Зберігає персистентні дані TRIP та PERS на Flash пам'ять, якщо цього
+    вимагає persistence_policy (зміни понад поріг, подія або застарілі
+    незбережені зміни): один бінарний запис дописується в журнал.
+    Відключення живлення під час запису залишає попередні записи цілими,
+    а обірваний запис відкидається при завантаженні за CRC.
     """
-    global last_persistent_save_time_ms, file_error_count
+    global file_error_count
     now = time.ticks_ms()
-    # Зберігаємо дані лише якщо минув достатній інтервал часу.
-    if time.ticks_diff(now, last_persistent_save_time_ms) >= Settings.PERSISTENT_SAVE_INTERVAL_MS:
-        try:
-            # 1. Записуємо дані в тимчасовий файл.
-            with open(Settings.TRIP_DATA_TEMP, 'w') as f:
-                f.write(str(persistent_trip_fuel_L) + '\n')
-                f.write(str(persistent_trip_distance_km) + '\n')
-                f.write(str(trip_fuel_consumed_L) + '\n')
-                f.write(str(trip_distance_travelled_km) + '\n')
-
-            # 2. Видаляємо старий резервний файл (якщо існує).
-            try: os.remove(Settings.TRIP_DATA_BACKUP)
-            except OSError: pass # Ігноруємо, якщо файлу немає.
-
-            # 3. Перейменовуємо поточний файл даних в резервний.
-            try: os.rename(Settings.TRIP_DATA_FILE, Settings.TRIP_DATA_BACKUP)
-            except OSError: pass # Ігноруємо, якщо файлу немає.
-
-            # 4. Перейменовуємо тимчасовий файл в основний файл даних.
-            os.rename(Settings.TRIP_DATA_TEMP, Settings.TRIP_DATA_FILE)
-            last_persistent_save_time_ms = now # Оновлюємо час останнього збереження.
-        except Exception as e:
-            # Обробка помилок файлової системи.
-            print(f"⚠️ Save persistent data error: {e}")
-            file_error_count += 1 # Збільшуємо лічильник помилок.
+    reason = persistence_policy.decide(now, trip_journal.changed(pers_counter, trip_counter),
+                                       trip_journal.unsaved(pers_counter, trip_counter))
+    if reason == PersistencePolicy.REASON_NONE:
+        return
+    try:
+        trip_journal.append(pers_counter, trip_counter, force=True)
+        persistence_policy.flushed(now, reason)
+    except Exception as e:
+        # Обробка помилок файлової системи.
+        print(f"⚠️ Save persistent data error: {e}")
+        file_error_count += 1 # Збільшуємо лічильник помилок.
+
+def emergency_flush():
+    """
+    Аварійне збереження при падінні напруги (викликає brownout_monitor).
+    Без виділення пам'яті: поточні значення пишуться в заздалегідь відкритий
+    журнал з підготовленим буфером; оцінка та форматування не виконуються.
+    """
+    if trip_journal.emergency_append(pers_counter, trip_counter):
+        persistence_policy.flushed(time.ticks_ms(), PersistencePolicy.REASON_BROWNOUT)
+
+def emergency_followup():
+    """
+    Один додатковий аварійний запис на кожне спрацювання brownout_monitor:
+    після першого кадру розрахунків, лише якщо лічильники змінилися з
+    моменту аварійного запису. Поки напруга тримається між порогом та
+    BROWNOUT_REARM_V, повторних записів немає (знос Flash, місце в сегменті).
+    """
+    global brownout_followup_event
+    if brownout_followup_event == brownout_monitor.events:
+        return
+    brownout_followup_event = brownout_monitor.events
+    if trip_journal.emergency_unsaved(pers_counter, trip_counter):
+        emergency_flush()
 
 def reset_persistent_trip():
     """
     Автоматично скидає лічильники PERS (довгострокового пробігу та витрати),
     якщо досягнуто ліміту відстані, визначеного в Settings.
-    Використовує атомарний механізм збереження.
+    Нульові значення PERS одразу записуються в журнал.
     """
-    global persistent_trip_fuel_L, persistent_trip_distance_km, file_error_count
     # Перевіряємо, чи досягнуто порогової відстані для скидання.
     if persistent_trip_distance_km >= Settings.RESET_PERSISTENT_TRIP_DISTANCE_KM:
         print(f"🔄 Reset persistent trip at {persistent_trip_fuel_L:.2f}L / {persistent_trip_distance_km:.2f}km")
-        # Скидаємо значення PERS.
-        persistent_trip_fuel_L = 0.0
-        persistent_trip_distance_km = 0.0
-        try:
-            # Використовуємо той самий атомарний механізм збереження,
-            # щоб оновити файл з нульовими значеннями PERS.
-            with open(Settings.TRIP_DATA_TEMP, 'w') as f:
-                f.write(str(persistent_trip_fuel_L) + '\n')
-                f.write(str(persistent_trip_distance_km) + '\n')
-                # Важливо: також записуємо поточні значення TRIP, щоб їх не втратити.
-                f.write(str(trip_fuel_consumed_L) + '\n')
-                f.write(str(trip_distance_travelled_km) + '\n')
-
-            try: os.remove(Settings.TRIP_DATA_BACKUP)
-            except OSError: pass
-            try: os.rename(Settings.TRIP_DATA_FILE, Settings.TRIP_DATA_BACKUP)
-            except OSError: pass
-            os.rename(Settings.TRIP_DATA_TEMP, Settings.TRIP_DATA_FILE)
-        except OSError as e:
-            print(f"⚠️ Reset persistent trip file error: {e}")
-            file_error_count += 1
+        # Скидаємо значення PERS. Запис містить і поточні значення TRIP, щоб їх не втратити.
+        pers_counter.reset()
+        sync_trip_values()
+        persistence_policy.request(PersistencePolicy.REASON_RESET)
+        save_persistent_data()
+
+def write_trip_log():
+    """Записує на Flash готовий блок журналу поїздки (поза циклом дисплея)."""
+    global file_error_count
+    if trip_logger is None:
+        return
+    try:
+        trip_logger.service()
+    except Exception as e:
+        print(f"⚠️ Trip log write error: {e}")
+        file_error_count += 1
+
+def update_persistence():
+    """Перевірка автоматичного скидання PERS, збереження даних поїздок за політикою та запис журналу поїздки."""
+    reset_persistent_trip()
+    save_persistent_data()
+    write_trip_log()
 
 # -------------------------------------------------------------------------
-# 6. ОБРОБНИКИ ПЕРЕРИВАНЬ (IRQ - INTERRUPT REQUEST)
-#    Функції, які викликаються автоматично апаратним забезпеченням
-#    при зміні стану на вхідних пінах. Використовуються для точного
-#    та своєчасного збору даних.
+# 6. ОБРОБКА ІМПУЛЬСІВ ДАТЧИКІВ (ФОРСУНКА, VSS)
+#    Переривання та апаратні лічильники живуть у модулях InjectorCapture
+#    та VssCounter; тут - обробка зібраних даних у головному циклі.
 # -------------------------------------------------------------------------
 
-def injector_irq_handler(pin):
+def process_injector_pulses():
     """
-    Обробник переривання для сигналу форсунки.
-    Визначає тривалість імпульсів форсунки для розрахунку витрати палива
-    та період між імпульсами для розрахунку обертів двигуна (RPM).
+    Пакетний споживач імпульсів форсунки від inj_capture (головний цикл).
+    Тривалість імпульсів використовується для розрахунку витрати палива,
+    період між імпульсами - для розрахунку обертів двигуна (RPM).
+    Повертає кількість оброблених імпульсів.
     """
-    global last_pulse_edge_us, total_pulse_time_us, rpm, current_inj_period_us
+    global total_pulse_time_us, rpm, current_inj_period_us
     global is_engine_running, last_inj_activity_time_ms
-    global last_inj_irq_time_us, last_inj_start_us
-    global dynamic_dead_time_us
 
-    # 🛡️ Атомарний блок: тимчасово відключаємо всі переривання,
-    # щоб забезпечити безпечний доступ до глобальних змінних, які
-    # також можуть бути використані в головному циклі.
-    irq_state = disable_irq()
-    try:
-        current_time_us = time.ticks_us()
-        pin_state = pin.value()
-
-        # Дебаунс: ігноруємо спрацювання IRQ, якщо воно відбулося занадто швидко
-        # після попереднього, щоб фільтрувати електричний шум.
-        if time.ticks_diff(current_time_us, last_inj_irq_time_us) < 100:
-            return
-        last_inj_irq_time_us = current_time_us
-
-        # --- ОБРОБКА FALLING EDGE (імпульс форсунки ВКЛЮЧИВСЯ) ---
-        if pin_state == 0:
-            # 1. Розрахунок RPM (оберти двигуна).
-            # RPM розраховується з періоду між *початками* послідовних імпульсів форсунки.
-            if last_inj_start_us != 0: # Переконуємось, що це не перший імпульс після запуску/скидання.
-                period_between_pulses_us = time.ticks_diff(current_time_us, last_inj_start_us)
-
-                # Фільтруємо період, щоб уникнути нереалістичних RPM (шум, дуже високі/низькі оберти).
-                if Settings.MIN_INJ_PERIOD_FOR_RPM_US < period_between_pulses_us < Settings.MAX_INJ_PERIOD_FOR_RPM_US:
-                    # Формула RPM: (мікросекунд_в_хвилині / період_мкс) / імпульсів_на_оберт.
-                    rpm_calculated = (Settings.RPM_BASE_FACTOR // period_between_pulses_us) // Settings.RPM_PULSES_PER_ENGINE_REVOLUTION
-
-                    # Додатковий фільтр для відображення RPM.
-                    if Settings.MIN_DISPLAY_RPM <= rpm_calculated <= Settings.MAX_DISPLAY_RPM:
-                        rpm = rpm_calculated
-                    else:
-                        rpm = 0 # Відкидаємо RPM, які виходять за межі очікуваного діапазону.
+    processed = 0
+    dead_time_us = dynamic_dead_time_us
+    while True:
+        count = inj_capture.drain(inj_width_buf, inj_period_buf)
+        for i in range(count):
+            # 1. Розрахунок RPM (оберти двигуна) з періоду між *початками* імпульсів.
+            period_between_pulses_us = inj_period_buf[i]
+
+            # Фільтруємо період, щоб уникнути нереалістичних RPM (шум, дуже високі/низькі оберти).
+            # Період 0 - перший імпульс після запуску: RPM ще не можна розрахувати.
+            if Settings.MIN_INJ_PERIOD_FOR_RPM_US < period_between_pulses_us < Settings.MAX_INJ_PERIOD_FOR_RPM_US:
+                # Формула RPM: (мікросекунд_в_хвилині / період_мкс) / імпульсів_на_оберт.
+                rpm_calculated = (Settings.RPM_BASE_FACTOR // period_between_pulses_us) // Settings.RPM_PULSES_PER_ENGINE_REVOLUTION
+
+                # Додатковий фільтр для відображення RPM.
+                if Settings.MIN_DISPLAY_RPM <= rpm_calculated <= Settings.MAX_DISPLAY_RPM:
+                    rpm = rpm_calculated
                 else:
-                    rpm = 0 # Період виходить за межі допустимого діапазону (може бути шум або зупинка).
+                    rpm = 0 # Відкидаємо RPM, які виходять за межі очікуваного діапазону.
             else:
-                rpm = 0 # Якщо це перший імпульс, RPM ще не можна розрахувати.
-
-            last_inj_start_us = current_time_us # Зберігаємо час початку цього імпульсу для наступного розрахунку RPM.
-
-            # 2. Підготовка для розрахунку тривалості імпульсу.
-            last_pulse_edge_us = current_time_us # Зберігаємо час початку імпульсу.
-
-            # 3. Оновлення стану двигуна.
-            last_inj_activity_time_ms = time.ticks_ms() # Фіксуємо останню активність форсунки.
-            is_engine_running = True # Вказуємо, що двигун активно працює.
-
-        # --- ОБРОБКА RISING EDGE (імпульс форсунки ВИМКНУВСЯ) ---
-        elif pin_state == 1 and last_pulse_edge_us > 0:
-            # 1. Розрахунок тривалості імпульсу (ON-час форсунки).
-            raw_duration = time.ticks_diff(current_time_us, last_pulse_edge_us)
+                rpm = 0 # Період виходить за межі допустимого діапазону (може бути шум або зупинка).
 
+            # 2. Тривалість імпульсу (ON-час форсунки).
             # Віднімаємо "мертву зону" форсунки та забезпечуємо мінімальну тривалість.
             # Це коригує фактичний час, коли форсунка була фізично відкритою.
-            actual_duration = max(0, raw_duration - dynamic_dead_time_us)
+            actual_duration = max(0, inj_width_buf[i] - dead_time_us)
 
             # Фільтруємо занадто короткі/шумові імпульси за шириною (ON-час).
             if actual_duration < Settings.MIN_INJ_PULSE_WIDTH_FILTER_US:
-                last_pulse_edge_us = 0 # Скидаємо, щоб уникнути подальших некоректних розрахунків.
-                return
+                continue
 
-            # 2. Накопичення часу відкриття форсунок для розрахунку витрати палива.
+            # 3. Накопичення часу відкриття форсунок для розрахунку витрати палива.
             total_pulse_time_us += actual_duration # Додаємо до загального часу відкриття форсунок.
             current_inj_period_us = actual_duration # Зберігаємо тривалість останнього імпульсу (по суті, його ширину).
-
-            last_pulse_edge_us = 0 # Скидаємо для наступного розрахунку тривалості імпульсу.
-    finally:
-        enable_irq(irq_state) # 🛡️ Завершення атомарного блоку: знову вмикаємо переривання.
-
-def vss_irq_handler(pin):
-    """
-    Обробник переривання для датчика швидкості (VSS).
-    Підраховує імпульси VSS для розрахунку пройденої відстані та швидкості.
-    """
-    global vss_pulse_count, last_vss_pulse_us, last_vss_activity_time_ms
-
-    # 🛡️ Атомарний блок: захист спільних змінних.
-    irq_state = disable_irq()
-    try:
-        now = time.ticks_us()
-
-        # Дебаунс: ігноруємо спрацювання IRQ, якщо воно відбулося занадто швидко.
-        if time.ticks_diff(now, last_vss_pulse_us) > Settings.VSS_DEBOUNCE_US:
-            vss_pulse_count += 1
-            last_vss_activity_time_ms = time.ticks_ms() # Фіксуємо останню активність VSS.
-            last_vss_pulse_us = now
-    finally:
-        enable_irq(irq_state) # 🛡️ Завершення атомарного блоку.
+        processed += count
+        if count < len(inj_width_buf):
+            break
+
+    # 4. Оновлення стану двигуна за останнім початком імпульсу.
+    # Час активності переводимо з мітки (мкс) у шкалу ticks_ms з урахуванням "віку" імпульсу.
+    if processed:
+        age_ms = time.ticks_diff(time.ticks_us(), inj_capture.last_pulse_us) // 1000
+        last_inj_activity_time_ms = time.ticks_add(time.ticks_ms(), -age_ms)
+        is_engine_running = True # Вказуємо, що двигун активно працює.
+        # Профіль запуску: мітка першого врахованого імпульсу (остання з першої партії,
+        # тож це верхня межа; партія - імпульси від запуску вимірювань до першого кадру).
+        if boot_profile.first_injection_us is None and boot_profile.injection(inj_capture.last_pulse_us):
+            print(f"⏱️ First injection counted by {inj_capture.last_pulse_us // 1000} ms after reset "
+                  f"({processed} pulses, IRQ armed at {boot_profile.irq_armed_us // 1000} ms)")
+    return processed
 
 # -------------------------------------------------------------------------
 # 7. ІНІЦІАЛІЗАЦІЯ СИСТЕМИ
@@ -777,6 +884,33 @@ def vss_irq_handler(pin):
 
 oled_status = "OFF" # Початковий статус OLED дисплея.
 oled = None         # Об'єкт OLED дисплея.
+display_compositor = None # Шар часткового оновлення дисплея (Compositor).
+splash_until_ms = None # До цього моменту (ticks_ms) на дисплеї тримається початковий екран; None - немає.
+_glyph_preload_index = 0 # Наступний набір _GLYPH_ATLAS_PRELOAD для рендерингу в атлас (по одному за кадр).
+display_frame_pending = False # Кадр намальовано у framebuffer, але ще не передано (display_task()).
+
+def show_display():
+    """
+    Передає кадр на дисплей. Через Compositor передаються лише змінені
+    сторінки; без нього - повне оновлення драйвером sh1107.
+    """
+    if display_compositor is not None:
+        display_compositor.show()
+        if Settings.COMPOSITOR_STATS_INTERVAL_FRAMES > 0 and \
+           display_compositor.frames % Settings.COMPOSITOR_STATS_INTERVAL_FRAMES == 0:
+            print(display_compositor.report())
+    elif oled is not None:
+        oled.show()
+
+def request_display():
+    """
+    Позначає намальований кадр для передачі: display_task() передає його
+    окремим кроком після поступки іншим задачам, щоб розрахунки, малювання
+    та передача по I2C не займали CPU одним шматком.
+    """
+    global display_frame_pending
+    display_frame_pending = True
+
 # Ініціалізація I2C шини.
 i2c = I2C(0, scl=Pin(Settings.PIN_I2C_SCL), sda=Pin(Settings.PIN_I2C_SDA), freq=Settings.I2C_FREQ)
 
@@ -788,77 +922,83 @@ if sh1107:
             oled = sh1107.SH1107_I2C(128, 128, i2c, address=Settings.OLED_ADDR_HEX, rotate=0)
             oled_status = "OK"
             oled.contrast(Settings.OLED_CONTRAST) # Встановлюємо контраст дисплея.
+            display_compositor = Compositor.Compositor(oled)
+            # Символи екранів рендеряться в атлас у фоні, по набору за кадр (calculate_and_display).
 
             # --- ІНІЦІАЛІЗАЦІЯ ЗГЛАДЖЕННЯ ПАЛИВА ---
             # Заповнюємо буфер рівня палива початковим значенням.
             initial_fuel_percent = get_raw_fuel_percent()
-            for i in range(Settings.FUEL_BUFFER_SIZE):
-                fuel_buffer[i] = initial_fuel_percent
+            fuel_filter.reset(initial_fuel_percent)
             last_smoothed_fuel_percent = initial_fuel_percent
 
             # --- ПЕРВИННА ПЕРЕВІРКА ПОМИЛОК ПРИ ЗАПУСКУ ---
-            initial_full_errors = check_errors() # Отримуємо всі помилки на старті.
-            # Фільтруємо критичні помилки, щоб вирішити, чи показувати екран STATUS_OK.
-            initial_critical_errors = [err for err in initial_full_errors if err['text'] in ALL_SOUND_TRIGGERING_ERROR_TEXTS]
+            initial_error_mask = check_errors() # Отримуємо всі помилки на старті.
+            # Лише критичні помилки вирішують, чи показувати екран STATUS_OK.
+            initial_critical_mask = initial_error_mask & error_rules.critical_mask
 
-            if not initial_critical_errors: # Якщо КРИТИЧНИХ помилок немає при старті.
+            if not initial_critical_mask: # Якщо КРИТИЧНИХ помилок немає при старті.
                 # Показуємо привітальний екран STATUS_OK.
                 oled.fill(0)
                 if 'STATUS_OK' in Icons.ERROR_ICONS and Icons.ERROR_ICONS['STATUS_OK']['icon'] is not None:
                      fd = Icons.ERROR_ICONS['STATUS_OK']
-                     ok_icon_fb = framebuf.FrameBuffer(fd['icon'], fd['width'], fd['height'], framebuf.MONO_HLSB)
-                     oled.blit(ok_icon_fb, fd['icon_pos'][0], fd['icon_pos'][1])
-                oled.show()
-                time.sleep(Settings.STARTUP_OK_SCREEN_DURATION_SEC)
+                     Icons.draw(oled, fd, fd['icon_pos'][0], fd['icon_pos'][1])
+                show_display()
+                # Екран тримається STARTUP_OK_SCREEN_DURATION_SEC без очікування: задачі вже працюють.
+                splash_until_ms = time.ticks_add(time.ticks_ms(), Settings.STARTUP_OK_SCREEN_DURATION_SEC * 1000)
                 # Починаємо з чистого стану, далі логіка в циклі обробить реальні помилки.
-                active_errors = [Icons.ERROR_ICONS['NONE']]
+                _set_active_errors(0)
                 current_display_mode = "MAIN" # Початковий режим відображення.
             else:
-                # Якщо є КРИТИЧНІ помилки, одразу показуємо їх.
-                active_errors = initial_critical_errors[:] # Копіюємо знайдені критичні помилки.
-                if 'WARNING' in Icons.ERROR_ICONS: # Додаємо загальну іконку попередження, якщо визначена.
-                    active_errors.append(Icons.ERROR_ICONS['WARNING'])
+                # Якщо є КРИТИЧНІ помилки, одразу показуємо їх (разом із загальною іконкою WARNING).
+                _set_active_errors(initial_critical_mask | ERROR_BIT_WARNING)
 
                 # Активуємо звуковий сигнал для критичних помилок.
-                if pwm_speaker:
+                if tone_sequencer:
                     sensor_alarm_active = True
-                    alarm_phase = 0
-                    alarm_phase_start_time_ms = 0
-                    if pwm_speaker.freq() != Settings.ALARM_SEQUENCE[0][1]:
-                         pwm_speaker.freq(Settings.ALARM_SEQUENCE[0][1])
-                    pwm_speaker.duty_u16(32768)
-                    current_speaker_freq = Settings.ALARM_SEQUENCE[0][1]
-                    current_speaker_duty = 32768
+                    manage_sensor_alarm() # Перший тон вмикається одразу, далі фази веде sound_task().
 
                 # Відображаємо першу критичну помилку зі списку на старті.
                 oled.fill(0)
                 icon_to_draw = active_errors[0]
                 if icon_to_draw['icon'] is not None:
-                    icon_fb = framebuf.FrameBuffer(icon_to_draw['icon'], icon_to_draw['width'], icon_to_draw['height'], framebuf.MONO_HLSB)
-                    oled.blit(icon_fb, icon_to_draw['icon_pos'][0], icon_to_draw['icon_pos'][1])
-                oled.show()
-                time.sleep(Settings.STARTUP_ERROR_SCREEN_DURATION_SEC)
+                    Icons.draw(oled, icon_to_draw, icon_to_draw['icon_pos'][0], icon_to_draw['icon_pos'][1])
+                show_display()
+                splash_until_ms = time.ticks_add(time.ticks_ms(), Settings.STARTUP_ERROR_SCREEN_DURATION_SEC * 1000)
                 current_display_mode = "ERROR_CYCLE" # Початковий режим відображення.
         except Exception as e:
             print(f"Помилка ініціалізації OLED: {e}")
             oled_status = "OFF"; oled = None # Вимикаємо OLED, якщо сталася помилка.
+            display_compositor = None
     else:
         print("OLED дисплей не знайдено.")
 else:
     print("Драйвер sh1107 відсутній.")
+boot_profile.mark('display')
 
-# Реєстрація обробників переривань для пінів форсунки та датчика швидкості.
-# INJ_PIN: спрацьовує на обидва фронти (RISING | FALLING) для визначення тривалості імпульсу.
-INJ_PIN.irq(trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING, handler=injector_irq_handler)
-# VSS_PIN: спрацьовує на FALLING EDGE (або RISING, залежить від датчика) для підрахунку імпульсів.
-VSS_PIN.irq(trigger=Pin.IRQ_FALLING, handler=vss_irq_handler)
+load_persistent_data() # Завантажуємо накопичені дані поїздок з журналу.
+boot_profile.mark('journal')
+print(f"💾 Trip journal: {trip_journal.seq} writes, flash endurance left ~{trip_journal.remaining_endurance() * 100:.2f}%")
+if trip_logger:
+    try:
+        trip_logger.load()
+        print(f"📈 Trip log: session {trip_logger.session}, block {trip_logger.seq}")
+    except Exception as e:
+        print(f"⚠️ Trip log load error: {e}")
+        file_error_count += 1
+    boot_profile.mark('trip log')
 
-load_persistent_data() # Завантажуємо накопичені дані поїздок з файлу.
-try: os.remove(Settings.TRIP_DATA_TEMP) # Видаляємо тимчасовий файл, якщо він залишився від попереднього запуску.
-except OSError: pass
+# Монітор падіння напруги: пороги переводяться в сирі значення ADC один раз,
+# щоб перевірка кожні BROWNOUT_SAMPLE_INTERVAL_MS не використовувала float.
+brownout_monitor = BrownoutMonitor.BrownoutMonitor(
+    adc_source.channel(Settings.PIN_ADC, Settings.ADC_DMA_BROWNOUT_AVERAGE),
+    int(Settings.BROWNOUT_THRESHOLD_V / Settings.VOLTAGE_CALIBRATION),
+    int(Settings.BROWNOUT_REARM_V / Settings.VOLTAGE_CALIBRATION),
+    Settings.BROWNOUT_CONFIRM_SAMPLES,
+    emergency_flush,
+)
 
-if oled_status == "OK" and oled:
-    oled.fill(0); oled.show() # Очищаємо дисплей після початкових екранів.
+boot_profile.done()
+print(f"⏱️ Boot: {boot_profile.report()}")
 
 # -------------------------------------------------------------------------
 # 8. ЛОГІКА ВІДОБРАЖЕННЯ ЕКРАНІВ
@@ -883,20 +1023,31 @@ def draw_main_screen(oled_obj, current_distance_km_interval, current_volume_L_in
     can_show_l100km = (current_speed_kmh >= Settings.MIN_SPEED_FOR_L100KM_KMH) and \
                       (trip_distance_travelled_km >= Settings.MIN_DISTANCE_FOR_L100KM_KM)
 
-    value_str = ""
     text_size_main = Settings.MAIN_VALUE_FONT_SIZE
 
-    # Логіка відображення: "-.--" для стаціонарного стану, "EEEE" для перевищення ліміту.
+    # Ключ кешу - значення з точністю відображення (сотні до 10, далі десяті).
     if raw_value < Settings.STATIONARY_THRESHOLD:
-        value_str = "-.--"
+        key = -1
     elif raw_value > Settings.MAX_DISPLAY_L100KM_VALUE:
-        value_str = "EEEE"
+        key = -2
+    elif raw_value < 10.0:
+        key = int(raw_value * 100 + 0.5)
     else:
-        # Стандартне форматування для значень 0.00 - 99.9.
-        if raw_value < 10.0:
-            value_str = "{: >4.2f}".format(raw_value) # Наприклад: "1.23".
+        key = 100000 + int(raw_value * 10 + 0.5)
+
+    if _main_value_text[0] != key:
+        _main_value_text[0] = key
+        # Логіка відображення: "-.--" для стаціонарного стану, "EEEE" для перевищення ліміту.
+        if key == -1:
+            _main_value_text[1] = "-.--"
+        elif key == -2:
+            _main_value_text[1] = "EEEE"
+        elif key < 100000:
+            # Стандартне форматування для значень 0.00 - 99.9.
+            _main_value_text[1] = "{: >4.2f}".format(key / 100) # Наприклад: "1.23".
         else:
-            value_str = "{: >4.1f}".format(raw_value) # Наприклад: "12.3".
+            _main_value_text[1] = "{: >4.1f}".format((key - 100000) / 10) # Наприклад: "12.3".
+    value_str = _main_value_text[1]
 
     # Розрахунок позиції та розміру основного значення для центрування.
     main_val_x_pos = (128 - len(value_str) * 8 * text_size_main) // 2 + Settings.MAIN_VALUE_X_OFFSET
@@ -946,30 +1097,36 @@ def draw_main_screen(oled_obj, current_distance_km_interval, current_volume_L_in
         # Розрахунок середньої витрати PERS.
         avg_p_val = (persistent_trip_fuel_L / persistent_trip_distance_km) * 100.0
 
-    # Форматування тексту для PERS.
-    if avg_p_val > 0.0 and avg_p_val <= Settings.MAX_DISPLAY_L100KM_VALUE:
-        pers_avg_str = "{:>{}.1f}".format(avg_p_val, Settings.PERS_L100KM_DISPLAY_WIDTH)
-    else:
-        pers_avg_str = "{:>{}}".format("----", Settings.PERS_L100KM_DISPLAY_WIDTH)
-
-    pers_txt = "{} L/100KM".format(pers_avg_str)
-    oled_obj.stretched_text(pers_txt, Settings.STAT_TEXT_X_POS, Settings.PERS_STAT_Y_POS, 1, 2)
+    # Форматування тексту для PERS (лише при зміні десятих).
+    key = int(avg_p_val * 10 + 0.5) if 0.0 < avg_p_val <= Settings.MAX_DISPLAY_L100KM_VALUE else -1
+    if _pers_text[0] != key:
+        _pers_text[0] = key
+        if key >= 0:
+            pers_avg_str = "{:>{}.1f}".format(key / 10, Settings.PERS_L100KM_DISPLAY_WIDTH)
+        else:
+            pers_avg_str = "{:>{}}".format("----", Settings.PERS_L100KM_DISPLAY_WIDTH)
+        _pers_text[1] = "{} L/100KM".format(pers_avg_str)
+    oled_obj.stretched_text(_pers_text[1], Settings.STAT_TEXT_X_POS, Settings.PERS_STAT_Y_POS,
+                           Settings.STAT_TEXT_FONT_SIZE_X, Settings.STAT_TEXT_FONT_SIZE_Y)
 
     # --- 5. Статистика TRIP (накопичені літри та кілометри) ---
-    # Форматування для палива TRIP.
-    f_str_val = trip_fuel_consumed_L if trip_fuel_consumed_L > 0.05 else None
-    f_str_display = "{:>{}.1f}".format(f_str_val, Settings.TRIP_FUEL_DISPLAY_WIDTH) if f_str_val is not None else "{:>{}}".format("----", Settings.TRIP_FUEL_DISPLAY_WIDTH)
-
-    # Форматування для відстані TRIP.
-    d_str_val = int(trip_distance_travelled_km) if trip_distance_travelled_km > 0.1 else None
-    d_str_display = "{:>{}.0f}".format(d_str_val, Settings.TRIP_DISTANCE_DISPLAY_WIDTH) if d_str_val is not None else "{:>{}}".format("---", Settings.TRIP_DISTANCE_DISPLAY_WIDTH)
-
-    trip_txt = "{}L  {}KM".format(f_str_display, d_str_display)
-    oled_obj.stretched_text(trip_txt, Settings.STAT_TEXT_X_POS, Settings.TRIP_STAT_Y_POS, 1, 2)
+    # Ключ: десяті літра та цілі кілометри (-1 - ще немає що показувати).
+    f_key = int(trip_fuel_consumed_L * 10 + 0.5) if trip_fuel_consumed_L > 0.05 else -1
+    d_key = int(trip_distance_travelled_km) if trip_distance_travelled_km > 0.1 else -1
+    key = (f_key + 1) * 2048 + d_key + 1
+    if _trip_text[0] != key:
+        _trip_text[0] = key
+        # Форматування для палива TRIP.
+        f_str_display = "{:>{}.1f}".format(f_key / 10, Settings.TRIP_FUEL_DISPLAY_WIDTH) if f_key >= 0 else "{:>{}}".format("----", Settings.TRIP_FUEL_DISPLAY_WIDTH)
+        # Форматування для відстані TRIP.
+        d_str_display = "{:>{}.0f}".format(d_key, Settings.TRIP_DISTANCE_DISPLAY_WIDTH) if d_key >= 0 else "{:>{}}".format("---", Settings.TRIP_DISTANCE_DISPLAY_WIDTH)
+        _trip_text[1] = "{}L  {}KM".format(f_str_display, d_str_display)
+    oled_obj.stretched_text(_trip_text[1], Settings.STAT_TEXT_X_POS, Settings.TRIP_STAT_Y_POS,
+                           Settings.STAT_TEXT_FONT_SIZE_X, Settings.STAT_TEXT_FONT_SIZE_Y)
 
     # --- 6. Відображення лічильника файлових помилок (якщо є) ---
     if file_error_count > 0:
-        error_display_text = f"FE:{file_error_count}" # "FE" скорочено від "File Error".
+        error_display_text = _file_error_label()
         text_w = len(error_display_text) * 8 # Стандартний шрифт 8px за шириною.
         oled_obj.text(error_display_text, 128 - text_w - 4, 0, 1) # У верхньому правому куті.
 
@@ -1037,65 +1194,154 @@ def draw_special_screen(oled_obj, speed_kmh, rpm_val, fuel_percent_val):
 
     # 6. Відображення лічильника файлових помилок (якщо є)
     if file_error_count > 0:
-        error_display_text = f"FE:{file_error_count}"
+        error_display_text = _file_error_label()
         text_w = len(error_display_text) * 8
         oled_obj.text(error_display_text, 128 - text_w - 4, 0, 1)
 
-    oled_obj.show()
+    # 7. Лічильник втрачених фронтів форсунки (переповнення кільцевого буфера), якщо є.
+    if inj_capture.overflow > 0:
+        oled_obj.text(f"OV:{inj_capture.overflow}", 0, 112, 1)
+
+    request_display()
+
 
+def _leave_special_screen(error_mask):
+    """
+    Вихід зі спеціального екрану: режим за маскою помилок (екран помилок,
+    "Мало палива" або головний) та скидання прапорців обробки кнопки.
+    """
+    global current_display_mode
+    global button_trip_reset_triggered, button_special_screen_triggered, button_special_screen_beep_played
+    global button_press_timer_start
+
+    if error_mask & error_rules.critical_mask:
+        current_display_mode = "ERROR_CYCLE"
+    elif error_mask & ERROR_BIT_LOW_FUEL:
+        current_display_mode = "LOW_FUEL_CYCLE"
+    else:
+        current_display_mode = "MAIN"
+    # Скидаємо прапорці обробки кнопки, щоб вона знову реагувала.
+    button_trip_reset_triggered = False
+    button_special_screen_triggered = False
+    button_special_screen_beep_played = False
+    # Запобігаємо повторному скиданню, якщо кнопка все ще утримується.
+    if button_press_timer_start != 0:
+        button_press_timer_start = 0
+
+def update_errors(current_time_ms):
+    """
+    Перевірка датчиків, черга та цикл показу помилок, режим дисплея і звукова тривога.
+    Викликається з calculate_and_display() та з warning_task() при зміні стану датчика.
+    """
+    global current_display_mode, sensor_alarm_active, _queued_error_mask
+    global current_error_display_index, last_error_cycle_time_ms
+    global low_fuel_display_state, low_fuel_last_state_change_time_ms
+
+    # 4.1. Перевірка всіх датчиків (рівень палива оновлює fuel_task()).
+    sensor_error_mask = check_errors()
+
+    # 4.2. Визначення критичності знайдених помилок (операції з масками).
+    has_critical_errors = sensor_error_mask & error_rules.critical_mask
+    show_mask = _errors_to_show(sensor_error_mask)
+
+    # 4.3. ЛОГІКА ФІКСАЦІЇ ТА ЧЕРГИ ПОМИЛОК
+    current_severity = error_rules.severity(active_error_mask)
+    new_severity = error_rules.severity(show_mask)
+
+    # Прибрати негайний вихід при зникненні помилок (new_severity == 0)
+    should_switch_immediately = new_severity > current_severity
+
+    if should_switch_immediately:
+        if active_error_mask != show_mask:
+            _set_active_errors(show_mask)
+            _queued_error_mask = _ERROR_QUEUE_EMPTY
+            current_error_display_index = 0
+            last_error_cycle_time_ms = current_time_ms
+            low_fuel_display_state = 0
+            low_fuel_last_state_change_time_ms = current_time_ms
+    elif active_error_mask != show_mask:
+        _queued_error_mask = show_mask
+
+    # Перевіряємо завершення циклу
+    time_since_last_switch = time.ticks_diff(current_time_ms, last_error_cycle_time_ms)
+    is_cycle_complete = (time_since_last_switch >= Settings.ERROR_DISPLAY_CYCLE_MS) and \
+                        (current_error_display_index >= len(active_errors) - 1)
+
+    # Якщо помилок більше немає, ми чекаємо завершення циклу, перш ніж поставити NONE
+    if is_cycle_complete:
+        if _queued_error_mask != _ERROR_QUEUE_EMPTY:
+            _set_active_errors(_queued_error_mask)
+            _queued_error_mask = _ERROR_QUEUE_EMPTY
+            current_error_display_index = 0
+            last_error_cycle_time_ms = current_time_ms
+        elif show_mask == 0 and active_error_mask != 0:
+            _set_active_errors(0)
+            current_error_display_index = 0
+
+    # Оновлюємо current_display_mode ТІЛЬКИ на основі АКТУАЛЬНО відображуваних (active_error_mask)
+    if active_error_mask == 0:
+        current_display_mode = "MAIN"
+        sensor_alarm_active = False
+    elif active_error_mask & ERROR_BIT_LOW_FUEL and not has_critical_errors:
+        current_display_mode = "LOW_FUEL_CYCLE"
+        sensor_alarm_active = False
+    else:
+        current_display_mode = "ERROR_CYCLE"
+        # Звук працює по активній помилці
+        if tone_sequencer:
+            if error_rules.severity(active_error_mask) == ErrorRules.SEVERITY_CRITICAL:
+                if not sensor_alarm_active:
+                    sensor_alarm_active = True
+                    manage_sensor_alarm() # Тривога перериває звуки інтерфейсу без очікування sound_task().
+            else:
+                sensor_alarm_active = False
 
 def calculate_and_display(interval_sec=1):
     """
     Основний цикл логіки, що виконується періодично:
     збір даних, розрахунки, обробка помилок та оновлення дисплея.
     """
-    global trip_fuel_consumed_L, trip_distance_travelled_km, persistent_trip_fuel_L, persistent_trip_distance_km
     global low_fuel_display_state, low_fuel_last_state_change_time_ms
     global is_engine_running_stable
-    global wdt, current_display_mode, special_screen_active_time_ms
+    global current_display_mode, special_screen_active_time_ms
 
     global button_trip_reset_triggered, button_special_screen_triggered, button_special_screen_beep_played
     global button_press_timer_start, current_error_display_index, last_error_cycle_time_ms
 
-    if wdt:
-        wdt.feed() # "Годуємо" Watchdog, щоб запобігти перезавантаженню.
-
     # Захист від переповнення лічильників TRIP.
     if trip_fuel_consumed_L > Settings.MAX_TRIP_LITERS or trip_distance_travelled_km > Settings.MAX_TRIP_DISTANCE:
-        trip_fuel_consumed_L = 0.0
-        trip_distance_travelled_km = 0.0
+        trip_counter.reset()
 
-    global total_pulse_time_us, vss_pulse_count
+    global total_pulse_time_us, last_vss_activity_time_ms
     global blink_on, last_blink_toggle_time_ms
-    global active_errors, current_error_display_index, last_error_cycle_time_ms
-    global sensor_alarm_active, alarm_phase, alarm_phase_start_time_ms
-    global current_speaker_freq, current_speaker_duty
-    global _queued_errors_for_next_cycle
-    global last_persistent_save_time_ms
+    global current_error_display_index, last_error_cycle_time_ms
+    global sensor_alarm_active
+    global _queued_error_mask
     global file_error_count
+    global splash_until_ms, _glyph_preload_index
 
     current_time_ms = time.ticks_ms()
 
-    # 1. Атомарне зчитування IRQ лічильників.
-    # Відключаємо переривання, щоб безпечно прочитати змінні, які оновлюються в IRQ.
-    state = disable_irq()
-    pulses_to_process = vss_pulse_count
+    # 1. Зчитування лічильників за інтервал.
+    # Спочатку забираємо імпульси форсунки, що надійшли під час паузи.
+    process_injector_pulses()
     pulse_time_to_process_us = total_pulse_time_us
-    vss_pulse_count = 0        # Скидаємо лічильники після зчитування.
     total_pulse_time_us = 0
-    enable_irq(state)          # Знову вмикаємо переривання.
+    # Лічильник VSS зчитується та скидається однією операцією.
+    pulses_to_process = vss_counter.take()
+    if pulses_to_process:
+        last_vss_activity_time_ms = current_time_ms # Фіксуємо останню активність VSS.
 
     # 2. Розрахунки на основі отриманих даних.
     # 2.1. Відстань, пройдена за останній інтервал.
     distance_km_current_interval = pulses_to_process / Settings.VSS_IMPULSES_PER_KM
 
-    # 2.2. Коефіцієнт перетворення часу імпульсу форсунки в літри.
-    # ML_PER_MIN -> L_PER_US
-    FUEL_RATE_L_PER_US = Settings.INJ_FLOW_RATE_ML_PER_MIN / (1000 * 60 * 1_000_000)
-
-    # 2.3. Об'єм палива, спожитий за останній інтервал.
+    # 2.2. Час відкриття форсунки, що йде в накопичення (мкс, ціле).
     # Паливо рахується лише, якщо двигун працює стабільно.
-    volume_L_current_interval = pulse_time_to_process_us * FUEL_RATE_L_PER_US if is_engine_running_stable else 0.0
+    inj_us_current_interval = pulse_time_to_process_us if is_engine_running_stable else 0
+
+    # 2.3. Об'єм палива, спожитий за останній інтервал (лише для поточної витрати).
+    volume_L_current_interval = inj_us_current_interval * FUEL_RATE_L_PER_US
 
     # 2.4. Поточна швидкість (км/год).
     current_speed_kmh = (distance_km_current_interval / (interval_sec / 3600.0)) if interval_sec > 0 else 0.0
@@ -1115,141 +1361,67 @@ def calculate_and_display(interval_sec=1):
         temp_raw_val = raw_volume_l_per_h
 
     # --- ЛОГІКА ЗГЛАДЖУВАННЯ ОСНОВНОГО ПОКАЗНИКА ---
-    global main_val_buffer, last_display_unit
+    global last_display_unit
     current_unit = "L/100KM" if can_show_l100km else "L/H"
 
     # Якщо одиниці виміру перемкнулися, очищаємо буфер згладжування, щоб уникнути "каші".
     if current_unit != last_display_unit:
-        main_val_buffer = [temp_raw_val] * Settings.MAIN_VAL_BUFFER_SIZE
+        main_val_filter.reset(temp_raw_val)
         last_display_unit = current_unit
 
-    # Додаємо нове значення до буфера та обчислюємо згладжене середнє.
-    main_val_buffer.pop(0)
-    main_val_buffer.append(temp_raw_val)
-    smoothed_val = sum(main_val_buffer) / len(main_val_buffer)
+    # Додаємо нове значення до фільтра та отримуємо згладжене.
+    smoothed_val = main_val_filter.update(temp_raw_val)
 
-    # 3. Накопичення і збереження даних поїздок.
+    # 3. Накопичення і збереження даних поїздок (цілі мкс форсунки та імпульси VSS).
     # TRIP накопичується, якщо двигун стабільний.
-    trip_fuel_consumed_L += volume_L_current_interval
-    trip_distance_travelled_km += distance_km_current_interval
+    trip_counter.add(inj_us_current_interval, pulses_to_process)
 
     # PERS накопичується лише, якщо швидкість вище певного порогу.
     if current_speed_kmh >= Settings.MIN_SPEED_FOR_PERS_COUNT_KMH:
-        persistent_trip_fuel_L += volume_L_current_interval
-        persistent_trip_distance_km += distance_km_current_interval
+        pers_counter.add(inj_us_current_interval, pulses_to_process)
+    sync_trip_values()
 
-    # Перевірка на автоматичне скидання PERS та збереження даних.
-    reset_persistent_trip()
-    save_persistent_data()
+    # Скидання PERS та збереження даних виконує persistence_task().
 
     # 4. Обробка помилок (ІГНОРУЄТЬСЯ, ЯКЩО АКТИВНИЙ СПЕЦІАЛЬНИЙ ЕКРАН).
+    # Зміну стану датчиків warning_task() обробляє одразу, тут - цикл показу та "Мало палива".
     if current_display_mode != "SPECIAL_SCREEN":
-        # 4.1. Оновлення значення палива та перевірка всіх датчиків.
-        process_fuel_smoothing()
-        real_sensor_errors = check_errors()
-
-        # 4.2. Визначення критичності знайдених помилок.
-        has_critical_errors = any(err['text'] in ALL_SOUND_TRIGGERING_ERROR_TEXTS for err in real_sensor_errors)
-        has_low_fuel_error = any(err['text'] == Icons.ERROR_ICONS['LOW_FUEL']['text'] for err in real_sensor_errors)
-
-        errors_to_show_based_on_sensors = []
-        if has_critical_errors:
-            errors_to_show_based_on_sensors = [err for err in real_sensor_errors if err['text'] in ALL_SOUND_TRIGGERING_ERROR_TEXTS]
-            if 'WARNING' in Icons.ERROR_ICONS:
-                errors_to_show_based_on_sensors.append(Icons.ERROR_ICONS['WARNING'])
-        elif has_low_fuel_error:
-            errors_to_show_based_on_sensors = [Icons.ERROR_ICONS['LOW_FUEL']]
-        else:
-            errors_to_show_based_on_sensors = [Icons.ERROR_ICONS['NONE']]
-
-        # 4.3. ЛОГІКА ФІКСАЦІЇ ТА ЧЕРГИ ПОМИЛОК
-        current_severity = _get_error_severity_level(active_errors)
-        new_severity = _get_error_severity_level(errors_to_show_based_on_sensors)
-
-        # Прибрати негайний вихід при зникненні помилок (new_severity == 0)
-        should_switch_immediately = (new_severity > current_severity) or \
-                                    (current_severity == 0 and new_severity > 0)
-
-        if should_switch_immediately:
-            if active_errors != errors_to_show_based_on_sensors:
-                active_errors = errors_to_show_based_on_sensors[:]
-                _queued_errors_for_next_cycle = []
-                current_error_display_index = 0
-                last_error_cycle_time_ms = current_time_ms
-                low_fuel_display_state = 0
-                low_fuel_last_state_change_time_ms = current_time_ms
-        elif active_errors != errors_to_show_based_on_sensors:
-            if errors_to_show_based_on_sensors != _queued_errors_for_next_cycle:
-                _queued_errors_for_next_cycle = errors_to_show_based_on_sensors[:]
-
-        # Перевіряємо завершення циклу
-        time_since_last_switch = time.ticks_diff(current_time_ms, last_error_cycle_time_ms)
-        is_cycle_complete = (time_since_last_switch >= Settings.ERROR_DISPLAY_CYCLE_MS) and \
-                            (current_error_display_index >= len(active_errors) - 1)
-
-        # Якщо помилок більше немає, ми чекаємо завершення циклу, перш ніж поставити NONE
-        if is_cycle_complete:
-            if _queued_errors_for_next_cycle:
-                active_errors = _queued_errors_for_next_cycle[:]
-                _queued_errors_for_next_cycle = []
-                current_error_display_index = 0
-                last_error_cycle_time_ms = current_time_ms
-            elif errors_to_show_based_on_sensors == [Icons.ERROR_ICONS['NONE']] and active_errors != [Icons.ERROR_ICONS['NONE']]:
-                active_errors = [Icons.ERROR_ICONS['NONE']]
-                current_error_display_index = 0
-
-        # Оновлюємо current_display_mode ТІЛЬКИ на основі АКТУАЛЬНО відображуваних (active_errors)
-        if active_errors == [Icons.ERROR_ICONS['NONE']]:
-            current_display_mode = "MAIN"
-            sensor_alarm_active = False
-        elif any(err['text'] == Icons.ERROR_ICONS['LOW_FUEL']['text'] for err in active_errors) and not has_critical_errors:
-            current_display_mode = "LOW_FUEL_CYCLE"
-            sensor_alarm_active = False
-        else:
-            current_display_mode = "ERROR_CYCLE"
-            # Звук працює по активній помилці
-            if pwm_speaker:
-                if _get_error_severity_level(active_errors) == 3:
-                    if not sensor_alarm_active:
-                        sensor_alarm_active = True
-                        alarm_phase = 0; alarm_phase_start_time_ms = 0
-                        if pwm_speaker.freq() != Settings.ALARM_SEQUENCE[0][1]:
-                             pwm_speaker.freq(Settings.ALARM_SEQUENCE[0][1])
-                        pwm_speaker.duty_u16(32768)
-                else:
-                    sensor_alarm_active = False
-    # 4.4. Керування ЗВУКОМ та БЛИМАННЯМ (за межами ігнорування спец-екрану).
-    manage_sensor_alarm() # Керуємо послідовністю звукових сигналів.
-
+        update_errors(current_time_ms)
+    # 4.4. Журнал поїздки: запис інтервалу в RAM-буфер (на Flash - з persistence_task()).
+    # Біти маски помилок збігаються з TripLogger.ERROR_KEYS.
+    if trip_logger:
+        trip_logger.log(current_time_ms, rpm, active_error_mask, current_speed_kmh, raw_volume_l_per_h,
+                        current_inj_period_us, last_smoothed_fuel_percent, current_battery_voltage)
+
+    # 4.5. БЛИМАННЯ (звукову послідовність веде sound_task()).
     # Перемикання стану блимання для візуальних ефектів.
     if time.ticks_diff(current_time_ms, last_blink_toggle_time_ms) >= Settings.BLINK_INTERVAL_MS:
         blink_on = not blink_on
         last_blink_toggle_time_ms = current_time_ms
 
-    # 4.5. Відображення на OLED дисплеї.
+    # 4.6. Відображення на OLED дисплеї.
     if oled_status != "OK" or oled is None:
         return # Якщо OLED не працює, нічого не відображаємо.
 
+    # Фоновий рендеринг символів в атлас: один набір за кадр, щоб не затримувати запуск.
+    if _glyph_atlas is not None and _glyph_preload_index < len(_GLYPH_ATLAS_PRELOAD):
+        chars, size_x, size_y = _GLYPH_ATLAS_PRELOAD[_glyph_preload_index]
+        _glyph_atlas.preload(chars, size_x, size_y)
+        _glyph_preload_index += 1
+
+    # Початковий екран (STATUS_OK або перша критична помилка) тримається до splash_until_ms;
+    # розрахунки, помилки та звук вище працюють як завжди.
+    if splash_until_ms is not None:
+        if time.ticks_diff(current_time_ms, splash_until_ms) < 0:
+            return
+        splash_until_ms = None
+
     # --- ЛОГІКА ВІДОБРАЖЕННЯ НА ОСНОВІ current_display_mode ---
     if current_display_mode == "SPECIAL_SCREEN":
         # Перевірка часу для спеціального екрану.
         if time.ticks_diff(current_time_ms, special_screen_active_time_ms) >= Settings.SPECIAL_SCREEN_DISPLAY_DURATION_MS:
             # Час спец-екрану вийшов, повертаємося до попереднього режиму.
-            # Визначаємо, чи є помилки, щоб повернутися на екран помилок або на головний.
-            temp_errors = check_errors() # Повторно перевіряємо помилки.
-            if temp_errors != [Icons.ERROR_ICONS['NONE']] and any(err['text'] in ALL_SOUND_TRIGGERING_ERROR_TEXTS for err in temp_errors):
-                current_display_mode = "ERROR_CYCLE"
-            elif any(err['text'] == Icons.ERROR_ICONS['LOW_FUEL']['text'] for err in temp_errors):
-                current_display_mode = "LOW_FUEL_CYCLE"
-            else:
-                current_display_mode = "MAIN"
-            # Скидаємо прапорці обробки кнопки, щоб вона знову реагувала.
-            button_trip_reset_triggered = False
-            button_special_screen_triggered = False
-            button_special_screen_beep_played = False
-            # Запобігаємо повторному скиданню, якщо кнопка все ще утримується.
-            if button_press_timer_start != 0:
-                button_press_timer_start = 0
+            _leave_special_screen(check_errors()) # Повторно перевіряємо помилки.
 
         else:
             # Якщо спец-екран активний, малюємо його.
@@ -1268,13 +1440,11 @@ def calculate_and_display(interval_sec=1):
             oled.fill(0) # Очищаємо дисплей.
             icon_to_draw = Icons.ERROR_ICONS['LOW_FUEL']
             if icon_to_draw['icon'] is not None:
-                icon_fb = framebuf.FrameBuffer(icon_to_draw['icon'], icon_to_draw['width'], icon_to_draw['height'], framebuf.MONO_HLSB)
-                oled.blit(icon_fb, icon_to_draw['icon_pos'][0], icon_to_draw['icon_pos'][1])
                 # Отримуємо координати
                 coords = icon_to_draw.get('icon_pos', (3, 3))
                 ix, iy = coords[0], coords[1]
                 # Малюємо іконку
-                oled.blit(icon_fb, ix, iy)
+                Icons.draw(oled, icon_to_draw, ix, iy)
                 # Розраховуємо реальні літри
                 f_L_real = (last_smoothed_fuel_percent / 100) * Settings.FUEL_TANK_CAPACITY_L
                 fuel_num = int(f_L_real)
@@ -1292,10 +1462,10 @@ def calculate_and_display(interval_sec=1):
                     text_x = ix + 29 # Для цифри з L
                 oled.large_text(fuel_txt, text_x, iy + 60, 3, 0)
             if file_error_count > 0: # Додаємо відображення помилок файлу, якщо є.
-                error_display_text = f"FE:{file_error_count}"
+                error_display_text = _file_error_label()
                 text_w = len(error_display_text) * 8
                 oled.text(error_display_text, 128 - text_w - 4, 0, 1)
-            oled.show()
+            request_display()
 
         elif low_fuel_display_state == 1:  # Стан: Показуємо головний екран.
             if time_since_low_fuel_state_change >= Settings.LOW_FUEL_MAIN_SCREEN_DURATION_MS:
@@ -1313,11 +1483,11 @@ def calculate_and_display(interval_sec=1):
             )
             # Показуємо лічильник файлових помилок також на головному екрані.
             if file_error_count > 0:
-                error_display_text = f"FE:{file_error_count}"
+                error_display_text = _file_error_label()
                 text_w = len(error_display_text) * 8
                 oled.text(error_display_text, 128 - text_w - 4, 0, 1)
 
-            oled.show()
+            request_display()
         return  # Важливо: виходимо з функції, оскільки логіка "Мало палива" вже все намалювала.
 
     elif current_display_mode == "MAIN":
@@ -1325,7 +1495,7 @@ def calculate_and_display(interval_sec=1):
         oled.fill(0)
         draw_main_screen(oled, distance_km_current_interval, volume_L_current_interval, current_speed_kmh, interval_sec,
         display_value=smoothed_val)
-        oled.show()
+        request_display()
         return
 
     elif current_display_mode == "ERROR_CYCLE":
@@ -1344,35 +1514,56 @@ def calculate_and_display(interval_sec=1):
 
         # Малюємо іконку поточної помилки.
         if error_to_display['icon'] is not None:
-            icon_fb = framebuf.FrameBuffer(error_to_display['icon'], error_to_display['width'], error_to_display['height'], framebuf.MONO_HLSB)
-            oled.blit(icon_fb, error_to_display['icon_pos'][0], error_to_display['icon_pos'][1])
+            Icons.draw(oled, error_to_display, error_to_display['icon_pos'][0], error_to_display['icon_pos'][1])
 
         # Додаємо відображення помилок файлу, якщо є.
         if file_error_count > 0:
-            error_display_text = f"FE:{file_error_count}"
+            error_display_text = _file_error_label()
             text_w = len(error_display_text) * 8
             oled.text(error_display_text, 128 - text_w - 4, 0, 1)
 
-        oled.show()
+        request_display()
 
 # -------------------------------------------------------------------------
-# 9. ГОЛОВНИЙ ЦИКЛ (MAIN LOOP)
-#    Нескінченний цикл, що безперервно виконує основні функції програми.
+# 9. ГОЛОВНИЙ ЦИКЛ (ЗАДАЧІ UASYNCIO)
+#    Замість одного циклу з паузою 1 с логіка розбита на кооперативні
+#    задачі з власними періодами (Settings, розділ 6): кнопка опитується
+#    кожні 20 мс, звукова послідовність та імпульси форсунки - кожні 50 мс,
+#    дисплей, паливо, напруга та збереження - раз на секунду.
+#    Кожна задача відмічає свою "живість"; watchdog_task() годує Watchdog,
+#    лише якщо жодна задача не зависла.
 # -------------------------------------------------------------------------
 
-print("✅ Бортовий Комп'ютер запущено: Audi 80 Mono Motronic v1.2.3")
-while True:
-    current_time_ms = time.ticks_ms()
+task_heartbeat_ms = {} # Ім'я задачі -> ticks_ms останньої ітерації.
+
+def _run_task_step(name, func):
+    """
+    Одна ітерація задачі: відмітка живості та виклик func() з перехопленням помилок.
+    Повертає результат func() або None після помилки.
+    """
+    task_heartbeat_ms[name] = time.ticks_ms()
+    try:
+        return func()
+    except Exception as e:
+        print(f"⚠️ Task {name} error: {e}")
+        return None
 
-    # Оновлюємо напругу раз на секунду
-    if time.ticks_diff(current_time_ms, last_voltage_update_time_ms) > 1000:
-        update_voltage_correction()
-        last_voltage_update_time_ms = current_time_ms
+def check_engine_stop():
+    """
+    Обробляє накопичені імпульси форсунки та перевіряє зупинку двигуна:
+    якщо від форсунки немає сигналу більше ENGINE_STOP_TIMEOUT_MS, двигун заглух.
+    """
+    global rpm, is_engine_running, is_engine_running_stable, engine_start_time_ms
 
-    # --- БЛОК ПЕРЕВІРКИ ЗУПИНКИ ДВИГУНА ---
-    # Якщо від форсунки немає сигналу більше заданого часу (ENGINE_STOP_TIMEOUT_MS),
-    # вважаємо, що двигун заглух.
-    if time.ticks_diff(current_time_ms, last_inj_activity_time_ms) > Settings.ENGINE_STOP_TIMEOUT_MS:
+    process_injector_pulses()
+
+    if time.ticks_diff(time.ticks_ms(), last_inj_activity_time_ms) > Settings.ENGINE_STOP_TIMEOUT_MS:
+        if is_engine_running:
+            # Двигун щойно заглух - імовірно, вимикається запалювання: зберігаємо дані.
+            persistence_policy.request(PersistencePolicy.REASON_ENGINE_STOP)
+            print(f"💾 Persistence: {persistence_policy.report()}")
+            if trip_logger:
+                trip_logger.flush() # Неповний блок журналу поїздки теж записується.
         rpm = 0
         is_engine_running = False
         is_engine_running_stable = False
@@ -1380,9 +1571,33 @@ while True:
         # коректно спрацювала при наступному запуску.
         engine_start_time_ms = 0
 
-    # --- БЛОК ОБРОБКИ КНОПКИ (Скидання TRIP / Спеціальний екран) ---
+def service_warning_inputs():
+    """
+    Дебаунс подій датчиків попереджень (warning_inputs) і негайна реакція на
+    прийняту зміну: критична помилка закриває спеціальний екран, черга помилок
+    і звукова тривога оновлюються без очікування кадру display_task().
+    Повертає мс до закінчення дебаунсу або -1, якщо очікувати нічого.
+    """
+    current_time_ms = time.ticks_ms()
+    changes = warning_inputs.changes
+    wait_ms = warning_inputs.service(current_time_ms)
+    if warning_inputs.changes != changes:
+        if current_display_mode == "SPECIAL_SCREEN":
+            error_mask = check_errors()
+            if not error_mask & error_rules.critical_mask:
+                return wait_ms # Спец-екран лишається; решту підхопить кадр після виходу з нього.
+            _leave_special_screen(error_mask)
+        update_errors(current_time_ms)
+    return wait_ms
+
+def poll_button():
+    """Обробка кнопки: скидання TRIP (утримання 2-5 с) та спеціальний екран (утримання 5 с)."""
+    global button_press_timer_start, button_trip_reset_candidate, button_trip_ready_beep_played
+    global button_special_screen_triggered, button_special_screen_beep_played
+    global current_display_mode, special_screen_active_time_ms
+
+    current_time_ms = time.ticks_ms()
     is_button_down = (RESET_BUTTON_PIN.value() == 0) # Читаємо поточний стан кнопки.
-    # current_time_ms вже визначена на початку циклу while True.
 
     if is_button_down:
         if button_press_timer_start == 0:
@@ -1428,8 +1643,9 @@ while True:
             # 1. `button_trip_reset_candidate` є True (означає, що кнопку тримали між 2 і 5 секундами).
             # 2. Спец-екран НЕ був активований (`button_special_screen_triggered` False).
             if button_trip_reset_candidate and not button_special_screen_triggered:
-                trip_fuel_consumed_L = 0.0
-                trip_distance_travelled_km = 0.0
+                trip_counter.reset()
+                sync_trip_values()
+                persistence_policy.request(PersistencePolicy.REASON_RESET) # Скидання має пережити вимкнення.
                 print("🔄 TRIP RESET by button")
                 play_single_beep(Settings.BUTTON_TRIP_RESET_BEEP_FREQ, Settings.BUTTON_TRIP_RESET_BEEP_DURATION_SEC)
 
@@ -1441,34 +1657,169 @@ while True:
             # Якщо спец-екран активувався по 5-секундному утриманню, він залишиться активним на 15 секунд.
             # Якщо кнопка відпущена до 5 секунд, то спец-екран не активується.
 
-    # --- ОСНОВНИЙ БЛОК ВИКОНАННЯ ЛОГІКИ ---
-    try:
-        current_time = time.ticks_ms()
-        # Розраховуємо фактичний інтервал часу, що минув з останнього оновлення.
-        actual_interval_sec = time.ticks_diff(current_time, last_display_update_time) / 1000.0
-        if actual_interval_sec == 0: # Запобігаємо діленню на нуль або дуже малим інтервалам.
-            actual_interval_sec = Settings.UPDATE_INTERVAL_SEC
-
-        calculate_and_display(actual_interval_sec) # Виконуємо всі розрахунки та оновлення дисплея.
-
-        last_display_update_time = current_time # Оновлюємо час останнього оновлення дисплея.
-        time.sleep(Settings.UPDATE_INTERVAL_SEC) # Пауза до наступного циклу.
-    except Exception as e:
-        # Обробка непередбачених помилок в головному циклі.
-        print(f"Loop Error: {e}")
-        # Відображаємо "LOOP ERR" на дисплеї.
-        if oled_status == "OK" and oled:
-            oled.fill(0)
-            oled.large_text(
-                "LOOP ERR",
-                Settings.LOOP_ERROR_X_POS,
-                Settings.LOOP_ERROR_Y_POS,
-                Settings.LOOP_ERROR_TEXT_SIZE,
-                1
-            )
-            oled.show()
-        # Вимикаємо динамік, якщо він був активний.
-        if pwm_speaker:
-            pwm_speaker.duty_u16(0)
-            current_speaker_duty = 0
-        time.sleep(5) # Пауза перед наступною спробою виконання циклу.
+def show_loop_error(e):
+    """Показує "LOOP ERR" на дисплеї та вимикає динамік після збою в display_task()."""
+    print(f"Loop Error: {e}")
+    # Відображаємо "LOOP ERR" на дисплеї.
+    if oled_status == "OK" and oled:
+        if display_compositor is not None:
+            display_compositor.invalidate() # Стан дисплея після збою невідомий.
+        oled.fill(0)
+        oled.large_text(
+            "LOOP ERR",
+            Settings.LOOP_ERROR_X_POS,
+            Settings.LOOP_ERROR_Y_POS,
+            Settings.LOOP_ERROR_TEXT_SIZE,
+            1
+        )
+        show_display()
+    # Вимикаємо динамік, якщо він був активний.
+    if tone_sequencer:
+        tone_sequencer.stop()
+
+async def engine_task():
+    while True:
+        _run_task_step('engine', check_engine_stop)
+        await asyncio.sleep_ms(Settings.ENGINE_TASK_INTERVAL_MS)
+
+async def voltage_task():
+    while True:
+        _run_task_step('voltage', update_voltage_correction)
+        await asyncio.sleep_ms(Settings.VOLTAGE_TASK_INTERVAL_MS)
+
+async def brownout_task():
+    # Порогова перевірка кожні BROWNOUT_SAMPLE_INTERVAL_MS - без _run_task_step на кожну
+    # вибірку: живість відмічається та помилки перехоплюються раз на ~1 с вибірок.
+    check = brownout_monitor.check # Зв'язаний метод створюється один раз, а не на кожну вибірку.
+    interval_ms = Settings.BROWNOUT_SAMPLE_INTERVAL_MS
+    samples = max(1, 1000 // interval_ms)
+    while True:
+        task_heartbeat_ms['brownout'] = time.ticks_ms()
+        try:
+            n = samples
+            while n:
+                check()
+                await asyncio.sleep_ms(interval_ms)
+                n -= 1
+        except Exception as e:
+            print(f"⚠️ Task brownout error: {e}")
+            await asyncio.sleep_ms(interval_ms)
+
+async def button_task():
+    while True:
+        _run_task_step('button', poll_button)
+        await asyncio.sleep_ms(Settings.BUTTON_POLL_INTERVAL_MS)
+
+async def warning_task():
+    # Спить до переривання від датчика (warning_event), а під час дебаунсу - до його закінчення.
+    # Поки чекає на подію, не відмічається в task_heartbeat_ms (очікування не є зависанням).
+    while True:
+        delay_ms = _run_task_step('warning', service_warning_inputs)
+        if delay_ms is None or delay_ms < 0:
+            task_heartbeat_ms.pop('warning', None)
+            await warning_event.wait()
+            warning_event.clear()
+        else:
+            await asyncio.sleep_ms(delay_ms)
+
+async def sound_task():
+    # Прокидається точно до наступної зміни тону, але не рідше за SOUND_TASK_INTERVAL_MS
+    # (щоб вчасно підхопити нові сигнали та зміну sensor_alarm_active).
+    while True:
+        delay_ms = _run_task_step('sound', update_sound)
+        if delay_ms is None or delay_ms < 0 or delay_ms > Settings.SOUND_TASK_INTERVAL_MS:
+            delay_ms = Settings.SOUND_TASK_INTERVAL_MS
+        await asyncio.sleep_ms(delay_ms)
+
+async def fuel_task():
+    while True:
+        _run_task_step('fuel', process_fuel_smoothing)
+        await asyncio.sleep_ms(Settings.FUEL_TASK_INTERVAL_MS)
+
+async def fuel_sample_task():
+    if fuel_sampler is None:
+        return
+    sample = fuel_sampler.sample # Зв'язаний метод створюється один раз, а не на кожну вибірку.
+    while True:
+        _run_task_step('fuel_sample', sample)
+        await asyncio.sleep_ms(Settings.FUEL_SAMPLE_INTERVAL_MS)
+
+async def persistence_task():
+    while True:
+        _run_task_step('persistence', update_persistence)
+        await asyncio.sleep_ms(Settings.PERSISTENCE_TASK_INTERVAL_MS)
+
+async def display_task():
+    """Розрахунки та оновлення дисплея раз на UPDATE_INTERVAL_SEC (без накопичення дрейфу)."""
+    global last_display_update_time, display_frame_pending
+    period_ms = int(Settings.UPDATE_INTERVAL_SEC * 1000)
+    while True:
+        task_heartbeat_ms['display'] = current_time = time.ticks_ms()
+        try:
+            # Розраховуємо фактичний інтервал часу, що минув з останнього оновлення.
+            actual_interval_sec = time.ticks_diff(current_time, last_display_update_time) / 1000.0
+            if actual_interval_sec == 0: # Запобігаємо діленню на нуль або дуже малим інтервалам.
+                actual_interval_sec = Settings.UPDATE_INTERVAL_SEC
+
+            if Settings.LOOP_PROBE_REPORT_INTERVAL_FRAMES > 0:
+                loop_probe.begin()
+            calculate_and_display(actual_interval_sec) # Розрахунки та малювання кадру у framebuffer.
+            if brownout_monitor.tripped:
+                emergency_followup() # Живлення падає: щойно накопичене теж має потрапити в журнал (раз).
+            if Settings.LOOP_PROBE_REPORT_INTERVAL_FRAMES > 0:
+                loop_probe.end()
+                if loop_probe.iterations % Settings.LOOP_PROBE_REPORT_INTERVAL_FRAMES == 0:
+                    print(f"🧹 GC: {loop_probe.report()}")
+
+            # Передача по I2C та збирання сміття - окремими кроками: між ними звук,
+            # кнопка та монітор живлення отримують CPU вчасно.
+            await asyncio.sleep_ms(0)
+            if display_frame_pending:
+                display_frame_pending = False
+                show_display()
+            if Settings.GC_AFTER_FRAME:
+                await asyncio.sleep_ms(0)
+                loop_probe.collect() # Кадр уже надіслано: збираємо сміття зараз, а не посеред наступного кадру.
+
+            last_display_update_time = current_time # Оновлюємо час останнього оновлення дисплея.
+            delay_ms = period_ms - time.ticks_diff(time.ticks_ms(), current_time)
+        except Exception as e:
+            # Обробка непередбачених помилок: "LOOP ERR" та пауза перед наступною спробою.
+            show_loop_error(e)
+            delay_ms = 5000
+        await asyncio.sleep_ms(max(0, delay_ms))
+
+async def watchdog_task():
+    """Годує Watchdog, лише якщо всі задачі відмічались не пізніше TASK_STALL_TIMEOUT_MS тому."""
+    while True:
+        now = time.ticks_ms()
+        stalled = None
+        for name in task_heartbeat_ms:
+            if time.ticks_diff(now, task_heartbeat_ms[name]) > Settings.TASK_STALL_TIMEOUT_MS:
+                stalled = name
+        if wdt:
+            if stalled is None:
+                wdt.feed() # "Годуємо" Watchdog, щоб запобігти перезавантаженню.
+            else:
+                print(f"⚠️ Task {stalled} stalled, watchdog not fed")
+        await asyncio.sleep_ms(Settings.WATCHDOG_FEED_INTERVAL_MS)
+
+async def run_tasks():
+    """Запускає всі задачі прошивки."""
+    await asyncio.gather(
+        engine_task(),
+        voltage_task(),
+        brownout_task(),
+        button_task(),
+        warning_task(),
+        sound_task(),
+        fuel_sample_task(),
+        fuel_task(),
+        persistence_task(),
+        display_task(),
+        watchdog_task(),
+    )
+
+if __name__ == "__main__":
+    print("✅ Бортовий Комп'ютер запущено: Audi 80 Mono Motronic v1.2.3")
+    asyncio.run(run_tasks())